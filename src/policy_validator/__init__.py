@@ -16,10 +16,13 @@ Usage:
     GUI Application:
         $ policy-validator
         
+    Command Line:
+        $ policy-validator-cli validate policy.pdf --standard NIST --fail-fast
+        
     Programmatic API:
         >>> from policy_validator import validate_policy
         >>> results = validate_policy("policy.pdf", standard="NIST")
-        >>> print(results.summary())
+        >>> print(results["valid"], results["issues"])
 
 Compatibility:
     - Python 3.8 or higher
@@ -36,38 +39,47 @@ Version History:
 
 __version__ = "0.1.0"
 
-# Public API exports
-from .main import main, run_application
-from .validators.base_validator import BaseValidator
-from .parsers.pdf_parser import PdfParser
-from .parsers.docx_parser import DocxParser
-
-# Standard validation function shortcuts
-from .validators import (
-    validate_policy,
-    validate_against_nist,
-    validate_against_iso,
-    validate_against_soc2,
-    validate_custom
-)
-
-__all__ = [
+from importlib import import_module
+from typing import Any, List
+
+# Public API, imported on first access (see __getattr__)
+_EXPORTS = {
     # Main application entry points
-    'main',
-    'run_application',
-    
+    'main': '.main',
+    'run_application': '.main',
+
     # Core validator classes
-    'BaseValidator',
-    
+    'BaseValidator': '.validators.base_validator',
+    'PolicyValidator': '.validators',
+
     # Parser classes
-    'PdfParser',
-    'DocxParser',
-    
+    'PdfParser': '.parsers.pdf_parser',
+    'DocxParser': '.parsers.docx_parser',
+
     # Validation functions
-    'validate_policy',
-    'validate_against_nist',
-    'validate_against_iso',
-    'validate_against_soc2',
-    'validate_custom'
-]
+    'validate_policy': '.validators',
+    'validate_against_nist': '.validators',
+    'validate_against_iso': '.validators',
+    'validate_against_soc2': '.validators',
+    'validate_custom': '.validators'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public API on first access.
+
+    The desktop application pulls in PyQt6 and the validators pull in the
+    document parsers. Neither should be loaded by code that only needs a
+    submodule, such as the daemon client, which must start in milliseconds.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
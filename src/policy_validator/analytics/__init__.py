@@ -0,0 +1,8 @@
+"""
+Corpus analytics for policy validation results.
+
+This package aggregates validation results across many documents. It
+requires NumPy, installed with the ``analytics`` extra:
+
+    pip install policy_validator[analytics]
+"""
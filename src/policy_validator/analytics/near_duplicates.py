@@ -0,0 +1,465 @@
+"""Near-duplicate detection and result reuse for template-based policies.
+
+Policy corpora are often made of per-subsidiary copies of a few templates
+with small edits. This module groups such documents into template families
+and lets a validator reuse the results of a family's representative:
+
+    - The lowercased text is cut into word shingles (runs of SHINGLE_WORDS
+      words), each hashed to 64 bits.
+    - A MinHash signature of NUM_PERM values summarizes the shingle set.
+      Signatures use one-permutation hashing: the hash space is split into
+      NUM_PERM bins and the minimum of each bin is kept, empty bins being
+      filled from their neighbours, so one sort replaces NUM_PERM hash
+      permutations.
+    - LSH banding splits signatures into BANDS bands. Documents sharing a
+      band are candidates, and the best candidate whose estimated Jaccard
+      similarity reaches the threshold gives the document's family.
+
+DeduplicatingValidator reuses a representative's section and structure
+results for a family member when no line that differs between the two is a
+heading or overlaps a section phrase or control identifier, so the edits
+cannot change the outcome of any rule. Every other document is validated
+as usual.
+
+Example:
+    >>> from policy_validator.analytics.near_duplicates import DeduplicatingValidator
+    >>> validator = DeduplicatingValidator("ISO 27001")
+    >>> results = [validator.validate_file(path) for path in policy_paths]
+    >>> results[1]['duplicate_of'], results[1]['reused_results']
+    ('policies/acme-uk/access.docx', True)
+    >>> validator.index.report()     # template families and their members
+
+Performance Considerations:
+    - Shingling and signatures are vectorized; a signature costs a fraction
+      of normalizing and matching the same text.
+    - Only representatives enter the LSH buckets and keep their lines, so
+      memory grows with the number of templates, not of documents.
+    - Lines are compared through hashes of line trigrams, and only the
+      lines around changes are normalized and matched.
+    - Extraction is not avoided: PDF and Word members still need their text
+      before they can be compared, so savings are largest for text files.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Corpus analytics require NumPy: pip install policy_validator[analytics]"
+    ) from e
+
+from ..parsers.section_index import SectionIndex, contains_heading
+from ..utils import instrumentation
+from ..utils.text_normalizer import ChunkNormalizer
+from ..validators.policy_validator import MIN_SECTION_BODY, PolicyValidator
+
+# --- Constants ---
+SHINGLE_WORDS = 5            # Words per shingle
+NUM_PERM = 128               # Signature values; a power of two
+BANDS = 16                   # LSH bands of NUM_PERM // BANDS values each
+DEFAULT_THRESHOLD = 0.8      # Estimated Jaccard similarity to join a family
+CONTEXT_LINES = 2            # Unchanged lines checked on each side of a change
+MAX_CHANGED_SHARE = 0.25     # Share of changed text above which reuse is not tried
+_SHINGLE_PRIME = np.uint64(1099511628211)
+_SHINGLE_PRIME_INVERSE = np.uint64(pow(1099511628211, -1, 2 ** 64))
+_DENSIFY_STEP = np.uint64(0x9E3779B97F4A7C15)
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[[9, 10, 11, 12, 13, 32]] = True
+
+_power_cache = (np.ones(1, dtype=np.uint64), np.ones(1, dtype=np.uint64))
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_WORDS) -> "np.ndarray":
+    """Return the sorted, unique 64-bit hashes of a text's word shingles.
+
+    Words are runs of UTF-8 bytes between ASCII whitespace. A shingle is
+    hashed as its words without the whitespace between them, with a
+    polynomial hash computed for all shingles at once from prefix sums.
+    Texts of fewer than size words form a single shingle.
+    """
+    data = np.frombuffer(text.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+    space = _WHITESPACE[data]
+    keep = ~space
+    chars = data[keep].astype(np.uint64)
+    if chars.size == 0:
+        return np.empty(0, dtype=np.uint64)
+    # Word starts, as offsets into the text without whitespace
+    after_space = np.concatenate(([True], space[:-1]))[keep]
+    bounds = np.append(np.flatnonzero(after_space), chars.size)
+
+    # prefix[i] = hash of chars[:i], as P^(i-1) * sum(chars[j] * P^-j)
+    powers, inverse_powers = _hash_powers(chars.size)
+    prefix = np.zeros(chars.size + 1, dtype=np.uint64)
+    np.cumsum(chars * inverse_powers[:chars.size], out=prefix[1:])
+    prefix[1:] *= powers[:chars.size]
+
+    size = min(size, bounds.size - 1)
+    starts, ends = bounds[:-size], bounds[size:]
+    hashes = np.sort(_mix(prefix[ends] - prefix[starts] * powers[ends - starts]))
+    return hashes[np.concatenate(([True], hashes[1:] != hashes[:-1]))]
+
+
+def minhash_signature(hashes: "np.ndarray", num_perm: int = NUM_PERM) -> "np.ndarray":
+    """Compute the one-permutation MinHash signature of a shingle set.
+
+    Args:
+        hashes: Sorted unique shingle hashes, as returned by shingle_hashes().
+        num_perm: Signature length, a power of two.
+
+    Returns:
+        np.ndarray: uint64 array of num_perm values (all zero for no shingles).
+    """
+    signature = np.zeros(num_perm, dtype=np.uint64)
+    if hashes.size == 0:
+        return signature
+    positions = np.arange(num_perm)
+    bins = (hashes >> np.uint64(65 - num_perm.bit_length())).astype(np.intp)
+    # The hashes are sorted, so the first hash of each bin is its minimum
+    first = np.searchsorted(bins, positions)
+    filled = np.flatnonzero(
+        (first < bins.size) & (bins[np.minimum(first, bins.size - 1)] == positions)
+    )
+    signature[filled] = hashes[first[filled]]
+    # Empty bins borrow the next filled bin's value, offset by the distance
+    donors = filled[np.searchsorted(filled, positions) % filled.size]
+    distance = ((donors - positions) % num_perm).astype(np.uint64)
+    return signature[donors] + distance * _DENSIFY_STEP
+
+
+def estimate_similarity(first: "np.ndarray", second: "np.ndarray") -> float:
+    """Estimate the Jaccard similarity of two shingle sets from their signatures."""
+    return float(np.count_nonzero(first == second)) / first.size
+
+
+def _hash_powers(length: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return P^i and P^-i modulo 2^64 for i up to length, from a growing cache."""
+    global _power_cache
+    if _power_cache[0].size <= length:
+        size = max(length + 1, 2 * _power_cache[0].size)
+        powers = np.full(size, _SHINGLE_PRIME, dtype=np.uint64)
+        powers[0] = 1
+        inverse_powers = np.full(size, _SHINGLE_PRIME_INVERSE, dtype=np.uint64)
+        inverse_powers[0] = 1
+        # One assignment, so concurrent callers never see mismatched arrays
+        _power_cache = (np.cumprod(powers), np.cumprod(inverse_powers))
+    return _power_cache
+
+
+def _mix(values: "np.ndarray") -> "np.ndarray":
+    """Scramble 64-bit values with the SplitMix64 finalizer."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class TemplateFamily:
+    """Near-duplicate documents, represented by the first one seen.
+
+    Attributes:
+        representative (str): Identifier of the first document of the family
+        signature (np.ndarray): MinHash signature of the representative
+        members (List[Dict[str, Any]]): Later documents, as
+            {'document': str, 'similarity': float, 'reused': bool}
+        data (Any): Payload attached by the caller, e.g. reusable results
+    """
+
+    def __init__(self, representative: str, signature: "np.ndarray", data: Any = None):
+        self.representative = representative
+        self.signature = signature
+        self.members: List[Dict[str, Any]] = []
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.members) + 1
+
+    def add_member(self, document: str, similarity: float, reused: bool = False) -> None:
+        """Record a document of the family."""
+        self.members.append({
+            'document': document,
+            'similarity': round(similarity, 3),
+            'reused': reused
+        })
+
+
+class NearDuplicateIndex:
+    """LSH index of MinHash signatures grouping documents into families.
+
+    Attributes:
+        threshold (float): Estimated Jaccard similarity to join a family
+        num_perm (int): Signature length
+        bands (int): LSH bands per signature
+        shingle_words (int): Words per shingle
+        families (List[TemplateFamily]): Families in order of creation
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM,
+                 bands: int = BANDS, shingle_words: int = SHINGLE_WORDS):
+        """Initialize an empty index.
+
+        With r = num_perm / bands values per band, documents of similarity s
+        become candidates with probability 1 - (1 - s^r)^bands; the
+        defaults find 95% of pairs at 0.8 and virtually all above 0.9.
+
+        Raises:
+            ValueError: If num_perm is not a power of two of at least 2, or
+                is not a multiple of bands.
+        """
+        if num_perm < 2 or num_perm & (num_perm - 1):
+            raise ValueError(f"num_perm must be a power of two, got {num_perm}")
+        if bands < 1 or num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_words = shingle_words
+        self.families: List[TemplateFamily] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def signature(self, text: str) -> "np.ndarray":
+        """Return the MinHash signature of a lowercased text."""
+        return minhash_signature(shingle_hashes(text, self.shingle_words), self.num_perm)
+
+    def query(self, signature: "np.ndarray") -> Tuple[Optional[TemplateFamily], float]:
+        """Find the family most similar to a signature.
+
+        Returns:
+            tuple: (family, estimated similarity), or (None, 0.0) if no
+            family reaches the threshold.
+        """
+        candidates: Set[int] = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        best: Optional[TemplateFamily] = None
+        best_similarity = 0.0
+        for position in sorted(candidates):
+            family = self.families[position]
+            similarity = estimate_similarity(signature, family.signature)
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = family, similarity
+        return best, best_similarity
+
+    def found(self, document: str, signature: "np.ndarray", data: Any = None) -> TemplateFamily:
+        """Start a new family represented by a document."""
+        family = TemplateFamily(document, signature, data)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(len(self.families))
+        self.families.append(family)
+        return family
+
+    def assign(self, document: str, text: str) -> Tuple[TemplateFamily, float]:
+        """Add a document to its family, founding one if there is none.
+
+        Args:
+            document: Document identifier, usually its path.
+            text: Lowercased document text.
+
+        Returns:
+            tuple: (family, estimated similarity to its representative;
+            1.0 for a new representative)
+        """
+        signature = self.signature(text)
+        family, similarity = self.query(signature)
+        if family is None:
+            return self.found(document, signature), 1.0
+        family.add_member(document, similarity)
+        return family, similarity
+
+    def report(self, min_size: int = 2) -> List[Dict[str, Any]]:
+        """Describe the families of at least min_size documents, largest first.
+
+        Returns:
+            list: JSON-serializable dictionaries:
+                {
+                    'representative': str,
+                    'size': int,
+                    'members': [{'document': str, 'similarity': float, 'reused': bool}]
+                }
+        """
+        families = sorted((f for f in self.families if len(f) >= min_size),
+                          key=len, reverse=True)
+        return [{
+            'representative': family.representative,
+            'size': len(family),
+            'members': [dict(member) for member in family.members]
+        } for family in families]
+
+    def _band_keys(self, signature: "np.ndarray") -> List[Tuple[int, bytes]]:
+        """Split a signature into (band number, band bytes) bucket keys."""
+        rows = signature.reshape(self.bands, -1)
+        return [(band, rows[band].tobytes()) for band in range(self.bands)]
+
+
+class DeduplicatingValidator(PolicyValidator):
+    """PolicyValidator that reuses results across near-duplicate documents.
+
+    The first document of each template family is validated and its
+    section and structure results kept. A later member reuses them when
+    its outline sections and heading presence match the representative's,
+    and no line differing between the two is a heading or overlaps a
+    section phrase or control identifier. Matches are searched with
+    CONTEXT_LINES unchanged lines around each change, so phrases broken
+    across up to that many lines are seen whole.
+
+    Members get 'duplicate_of' (the representative's path) and
+    'reused_results' in their results. Text files up to WHOLE_TEXT_MAX_SIZE
+    are read whole so they can be compared; larger ones are streamed as usual.
+
+    Attributes:
+        index (NearDuplicateIndex): Template families seen so far
+    """
+
+    stream_text = False
+
+    def __init__(self, standard: str = "Custom", sections: Optional[Iterable[str]] = None,
+                 fail_fast: bool = False, threshold: float = DEFAULT_THRESHOLD):
+        """Initialize the validator.
+
+        Args:
+            standard: Standard name or alias.
+            sections: Sections to require (default: all of the standard).
+            fail_fast: Stop at the first failing mandatory rule.
+            threshold: Estimated Jaccard similarity to join a family.
+
+        Raises:
+            ValueError: If the standard is not supported.
+        """
+        super().__init__(standard, sections, fail_fast=fail_fast)
+        self.index = NearDuplicateIndex(threshold)
+        self._lock = threading.Lock()  # Guards the index for validating threads
+
+    def check_content(self, file_info: Dict[str, Any], content: str,
+                      section_index: Optional[SectionIndex] = None,
+                      found_sections: Optional[Set[str]] = None) -> None:
+        if len(content) < self.standard["min_length"]:
+            super().check_content(file_info, content, section_index, found_sections)
+            return
+
+        with instrumentation.stage('minhash', len(content)):
+            signature = self.index.signature(content)
+        with self._lock:
+            family, similarity = self.index.query(signature)
+        lines = content.split('\n')
+        document = {
+            'lines': lines,
+            'trigrams': _line_trigrams(lines),
+            'found_sections': frozenset(found_sections or ()),
+            'index_headings': bool(section_index.headings) if section_index else None
+        }
+
+        if family is not None:
+            with instrumentation.stage('duplicate_diff', len(content)):
+                reusable = self._can_reuse(family.data, document)
+            with self._lock:
+                family.add_member(file_info['path'], similarity, reusable)
+            file_info['duplicate_of'] = family.representative
+            file_info['reused_results'] = reusable
+            if reusable:
+                outcome = family.data['outcome']
+                file_info['sections'] = dict(outcome['sections'])
+                file_info['issues'].extend(outcome['issues'])
+                if not outcome['passed']:
+                    file_info['valid'] = False
+                return
+            super().check_content(file_info, content, section_index, found_sections)
+            return
+
+        valid_before = file_info['valid']
+        issues_before = len(file_info['issues'])
+        super().check_content(file_info, content, section_index, found_sections)
+        if valid_before:
+            document['outcome'] = {
+                'passed': file_info['valid'],
+                'issues': file_info['issues'][issues_before:],
+                'sections': dict(file_info.get('sections', {}))
+            }
+            with self._lock:
+                self.index.found(file_info['path'], signature, document)
+
+    def _can_reuse(self, template: Optional[Dict[str, Any]], document: Dict[str, Any]) -> bool:
+        """Whether a member's differences from its representative are inert."""
+        if template is None or template['found_sections'] != document['found_sections'] \
+                or template['index_headings'] != document['index_headings']:
+            return False
+        # Without a parser heading index, headings come from the text itself
+        check_headings = document['index_headings'] is None and self._checks_structure()
+        budget = MAX_CHANGED_SHARE * sum(len(line) + 1 for line in document['lines'])
+        for lines, changed in (
+                (document['lines'], ~np.isin(document['trigrams'], template['trigrams'])),
+                (template['lines'], ~np.isin(template['trigrams'], document['trigrams']))):
+            for start, end, window_changed in _windows(np.flatnonzero(changed), len(lines)):
+                window = lines[start:end]
+                budget -= sum(len(line) + 1 for line in window)
+                if budget < 0 or self._edits_matter(window, window_changed, check_headings):
+                    return False
+        return True
+
+    def _edits_matter(self, lines: List[str], changed: List[int], check_headings: bool) -> bool:
+        """Whether changed lines hold a heading or touch a section match.
+
+        Args:
+            lines: A window of lines around changes.
+            changed: Positions of the changed lines within the window.
+            check_headings: Also report changed lines that are headings, or
+                that start within MIN_SECTION_BODY characters of a heading's
+                body, where they can decide whether the section is empty.
+        """
+        if check_headings and any(contains_heading(lines[i]) or _near_heading(lines, i)
+                                  for i in changed):
+            return True
+        # Normalized piece by piece, so each line's offsets are known
+        normalizer = ChunkNormalizer()
+        pieces = [normalizer.normalize(line + '\n') for line in lines]
+        offsets = [0]
+        for piece in pieces:
+            offsets.append(offsets[-1] + len(piece))
+        ranges = [(offsets[i], offsets[i + 1]) for i in changed]
+        return any(start <= range_end and end >= range_start
+                   for start, end, _ in self.matcher.iter_matches(''.join(pieces))
+                   for range_start, range_end in ranges)
+
+
+def _near_heading(lines: List[str], position: int) -> bool:
+    """Whether a line may start within MIN_SECTION_BODY characters of a body.
+
+    True if a heading is found in the lines before it first, or if the
+    window starts before MIN_SECTION_BODY characters are counted.
+    """
+    body = 0
+    for line in reversed(lines[:position]):
+        if contains_heading(line):
+            return True
+        body += len(line) + 1
+        if body >= MIN_SECTION_BODY:
+            return False
+    return True
+
+
+def _line_trigrams(lines: List[str]) -> "np.ndarray":
+    """Hash every line together with its two neighbours."""
+    hashes = np.fromiter((hash(line) for line in lines), dtype=np.int64,
+                         count=len(lines)).view(np.uint64)
+    padded = np.concatenate((np.zeros(1, np.uint64), hashes, np.zeros(1, np.uint64)))
+    combined = (padded[:-2] * _SHINGLE_PRIME + padded[1:-1]) * _SHINGLE_PRIME + padded[2:]
+    return _mix(combined)
+
+
+def _windows(changed: "np.ndarray", line_count: int) -> List[Tuple[int, int, List[int]]]:
+    """Group changed line numbers into line ranges widened by CONTEXT_LINES.
+
+    Returns:
+        list: (start, end, positions of the changed lines within the range)
+    """
+    windows: List[Tuple[int, int, List[int]]] = []
+    for line in changed.tolist():
+        start = max(line - CONTEXT_LINES, 0)
+        end = min(line + CONTEXT_LINES + 1, line_count)
+        if windows and start <= windows[-1][1]:
+            window_start, _, lines = windows[-1]
+            windows[-1] = (window_start, end, lines + [line - window_start])
+        else:
+            windows.append((start, end, [line - start]))
+    return windows
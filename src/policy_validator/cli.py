@@ -0,0 +1,797 @@
+"""Command-line interface for headless policy validation.
+
+This module provides the ``policy-validator-cli`` entry point for validating
+policy documents without the desktop application, e.g. in CI pipelines.
+
+Command-line Usage:
+    $ policy-validator-cli validate policy.pdf handbook.docx --standard ISO
+    $ policy-validator-cli validate policy.txt --standard NIST --fail-fast
+    $ policy-validator-cli validate policy.txt --section "access control"
+    $ policy-validator-cli validate policies/*.pdf --report findings.sarif
+    $ policy-validator-cli validate subsidiaries/*.docx --dedupe --families families.json
+    $ policy-validator-cli validate audit-bundle.zip evidence.tar.gz --standard SOC2
+    $ policy-validator-cli watch policies/ --standard ISO
+    $ policy-validator-cli serve --port 8765 --workers 4
+    $ policy-validator-cli bulk manifest.jsonl --output results.jsonl --store results.db
+    $ policy-validator-cli bulk manifest.jsonl -o results.jsonl --timings --trace trace.json
+    $ policy-validator-cli bulk manifest.jsonl -o results.jsonl --timeout 60 --memory-limit 1024
+    $ policy-validator-cli bulk manifest.jsonl -o results.jsonl --memory-budget 8192 \
+          --cost-model costs.json
+    $ policy-validator-cli bulk manifest.jsonl -o shard2.jsonl --shard 2/4
+    $ policy-validator-cli merge shard*.jsonl -o results.jsonl --report results.sarif \
+          --manifest manifest.jsonl
+    $ policy-validator-cli coordinate manifest.jsonl -o results.jsonl --host 0.0.0.0
+    $ policy-validator-cli work http://coordinator:8766 --workers 16
+    $ policy-validator-cli daemon --idle-timeout 0
+    $ policy-validator-cli validate slow.pdf --profile --profile-output slow
+    $ policy-validator-cli query results.db --standard ISO --section "access control" \
+          --status fail --since 7d
+
+Exit Codes:
+    0: All files passed validation
+    1: At least one file failed validation, or the command could not run
+    2: Invalid command-line arguments
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from .service.sandbox import DEFAULT_MEMORY_LIMIT, DEFAULT_TIMEOUT, ResourceLimits
+from .utils.archives import is_archive, validate_archive
+from .validators.policy_validator import PolicyValidator
+from .validators.standards import VALIDATION_STANDARDS, STANDARD_ALIASES
+
+MAX_LISTED_LINES = 20  # Missing manifest lines printed by merge
+_RELATIVE_TIME_RE = re.compile(r'^(\d+(?:\.\d+)?)([smhdw])$')
+_TIME_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def _print_result(file_info: Dict[str, Any]) -> None:
+    """Print the verdict and issues for one validated file."""
+    file_name = os.path.basename(file_info['path'])
+    if not file_info['valid']:
+        print(f"❌ {file_name} failed validation")
+    elif file_info['issues']:
+        print(f"⚠️ {file_name} validated with warnings")
+    else:
+        print(f"✅ {file_name} validated successfully")
+    for issue in file_info['issues']:
+        print(f"    - {issue}")
+
+
+def _run_validate(args: argparse.Namespace) -> int:
+    """Validate files given on the command line and return the exit code."""
+    dedupe = bool(args.dedupe or args.families)
+    if dedupe:
+        from .analytics.near_duplicates import DeduplicatingValidator
+        validator = DeduplicatingValidator(args.standard, args.sections,
+                                           fail_fast=args.fail_fast)
+    else:
+        validator = PolicyValidator(args.standard, args.sections, fail_fast=args.fail_fast)
+    sinks = _open_sinks(args)
+    recorder = _start_instrumentation(args)
+    profiler = _start_profiling(args)
+    failed = validated = 0
+    try:
+        for file_info in _validate_paths(validator, args.files, profiler):
+            validated += 1
+            for sink in sinks:
+                sink.add(file_info)
+            if not args.quiet:
+                _print_result(file_info)
+            if not file_info['valid']:
+                failed += 1
+                if args.fail_fast:
+                    break
+    finally:
+        for sink in sinks:
+            sink.close()
+    _finish_instrumentation(args, recorder)
+    _finish_profiling(args, profiler)
+    if args.families:
+        with open(args.families, 'w', encoding='utf-8') as f:
+            json.dump(validator.index.report(), f, indent=2)
+    if not args.quiet:
+        print(f"{failed} of {validated} file(s) failed validation "
+              f"against {validator.standard_name}")
+        if dedupe:
+            families = validator.index.report()
+            reused = sum(m['reused'] for family in families for m in family['members'])
+            print(f"{sum(f['size'] for f in families)} file(s) in {len(families)} "
+                  f"template families; results reused for {reused}")
+    return 1 if failed else 0
+
+
+def _validate_paths(validator: PolicyValidator, paths: List[str],
+                    profiler: Optional[Any]) -> Iterator[Dict[str, Any]]:
+    """Validate files and the members of archives among them, in order."""
+    for file_path in paths:
+        if is_archive(file_path):
+            # Members are validated in parallel, straight from the archive
+            yield from validate_archive(validator, file_path)
+        elif profiler is not None and profiler.selects(file_path):
+            with profiler.profile(file_path):
+                file_info = validator.validate_file(file_path)
+            yield file_info
+        else:
+            yield validator.validate_file(file_path)
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    """Validate a directory's policies, then revalidate them as they change."""
+    import threading
+    from .utils.file_watcher import DEFAULT_PATTERNS, FileWatcher
+    from .validators.incremental import IncrementalValidator
+
+    validator = IncrementalValidator(args.standard, args.sections, fail_fast=args.fail_fast)
+    patterns = args.patterns or DEFAULT_PATTERNS
+    sinks = _open_sinks(args)
+    lock = threading.Lock()
+
+    def revalidate(file_path: str) -> None:
+        if not os.path.exists(file_path):
+            validator.forget(file_path)
+            return
+        started = time.perf_counter()
+        file_info = validator.validate_file(file_path)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with lock:
+            for sink in sinks:
+                sink.add(file_info)
+            if not args.quiet:
+                _print_result(file_info)
+                incremental = file_info.get('incremental')
+                if incremental:
+                    start, end = incremental['changed_paragraphs']
+                    detail = f"{end - start} paragraph(s) changed at paragraph {start + 1}"
+                else:
+                    detail = "full validation"
+                print(f"    ({detail}, {elapsed_ms:.1f} ms)")
+
+    # Revalidate once a file has been quiet for the debounce delay, so a
+    # save written in several steps is read when complete
+    timers: Dict[str, threading.Timer] = {}
+
+    def changed(file_path: str) -> None:
+        with lock:
+            if file_path in timers:
+                timers[file_path].cancel()
+            timers[file_path] = timer = threading.Timer(args.debounce, revalidate, [file_path])
+            timer.daemon = True
+            timer.start()
+
+    for root, _, names in os.walk(args.directory):
+        for name in sorted(names):
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                revalidate(os.path.abspath(os.path.join(root, name)))
+
+    watcher = FileWatcher(args.directory, changed, file_patterns=patterns,
+                          debounce_delay=0, watch_deletion=True)
+    watcher.start()
+    if not args.quiet:
+        print(f"Watching {args.directory} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        for sink in sinks:
+            sink.close()
+    return 0
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    """Run the HTTP validation service until interrupted."""
+    from .service.http_server import ValidationService
+
+    service = ValidationService(
+        host=args.host, port=args.port, workers=args.workers,
+        queue_size=args.queue_size, timeout=args.timeout, instrument=args.instrument
+    )
+    service.start()
+    print(f"Serving policy validation on http://{service.host}:{service.port} "
+          f"with {service.workers} worker(s)")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_bulk(args: argparse.Namespace) -> int:
+    """Run a JSONL manifest, reporting throughput on stderr."""
+    from .service.bulk_runner import run_manifest
+    from .service.scheduler import CostModel
+
+    def report(stats: Dict[str, Any]) -> None:
+        print(f"{stats['completed']} validated, {stats['skipped']} skipped, "
+              f"{stats['failed']} failed ({stats['limited']} over limits), "
+              f"{stats['errors']} errors - "
+              f"{stats['files_per_second']} files/s, {stats['mb_per_second']} MB/s",
+              file=sys.stderr)
+
+    sinks = _open_sinks(args)
+    recorder = _start_instrumentation(args)
+    profiler = _start_profiling(args)
+
+    def record(result: Dict[str, Any]) -> None:
+        for sink in sinks:
+            sink.add(result)
+
+    cost_model = CostModel.load(args.cost_model) if args.cost_model else CostModel()
+    memory_budget = args.memory_budget * 1024 ** 2 if args.memory_budget is not None else None
+    try:
+        stats = run_manifest(args.manifest, args.output, workers=args.workers,
+                             resume=not args.restart,
+                             progress=None if args.quiet else report,
+                             on_result=record if sinks else None,
+                             recorder=recorder, profiler=profiler,
+                             dedupe=args.dedupe,
+                             limits=ResourceLimits(args.timeout, args.memory_limit * 1024 ** 2),
+                             cost_model=cost_model, memory_budget=memory_budget,
+                             shard=args.shard)
+    finally:
+        for sink in sinks:
+            sink.close()
+        if args.cost_model:
+            cost_model.save(args.cost_model)
+    _finish_instrumentation(args, recorder)
+    _finish_profiling(args, profiler)
+    return 1 if stats['failed'] or stats['errors'] else 0
+
+
+def _run_merge(args: argparse.Namespace) -> int:
+    """Merge shard results and print global statistics."""
+    from .service.sharding import merge_results
+
+    sinks = _open_sinks(args)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+
+    def record(result: Dict[str, Any]) -> None:
+        if output is not None:
+            output.write(json.dumps(result, default=str) + '\n')
+        for sink in sinks:
+            sink.add(result)
+
+    try:
+        stats = merge_results(args.inputs, record, args.manifest)
+    except OSError as e:
+        print(f"Cannot read shard results: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not None:
+            output.close()
+        for sink in sinks:
+            sink.close()
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(f"{stats['results']} results from {len(args.inputs)} input(s): "
+              f"{stats['passed']} passed, {stats['failed']} failed "
+              f"({stats['limited']} over limits), {stats['errors']} errors, "
+              f"{stats['duplicates']} duplicates dropped, {stats['bytes'] / 1e6:.1f} MB")
+        for standard, counts in stats['standards'].items():
+            print(f"    {standard}: {counts['results']} results, {counts['failed']} failed")
+        missing = stats.get('missing_lines')
+        if missing is None and args.manifest:
+            print(f"Cannot list missing manifest lines: {stats['unnumbered']} result(s) "
+                  "carry no line number", file=sys.stderr)
+        elif missing:
+            shown = ', '.join(str(line) for line in missing[:MAX_LISTED_LINES])
+            more = f", ... ({len(missing)} in total)" if len(missing) > MAX_LISTED_LINES else ""
+            print(f"Manifest lines without a result: {shown}{more}")
+    return 1 if stats['failed'] or stats.get('missing_lines') else 0
+
+
+def _run_coordinate(args: argparse.Namespace) -> int:
+    """Serve a manifest to worker nodes until every job is finished."""
+    from .service.coordinator import Coordinator
+    from .service.scheduler import CostModel
+
+    def report(stats: Dict[str, Any]) -> None:
+        print(f"{stats['results']} results from {len(stats['nodes'])} node(s), "
+              f"{stats['failed']} failed ({stats['limited']} over limits), "
+              f"{stats['errors']} errors, {stats['requeued']} requeued, "
+              f"{stats['stolen']} stolen - {stats['files_per_second']} files/s",
+              file=sys.stderr)
+
+    sinks = _open_sinks(args)
+
+    def record(result: Dict[str, Any]) -> None:
+        for sink in sinks:
+            sink.add(result)
+
+    coordinator = Coordinator(
+        args.manifest, args.output, args.queue or f"{args.output}.queue",
+        host=args.host, port=args.port, lease_seconds=args.lease_seconds,
+        max_attempts=args.max_attempts,
+        backup_after=args.backup_after if args.backup_after > 0 else None,
+        cost_model=CostModel.load(args.cost_model) if args.cost_model else None,
+        on_result=record if sinks else None,
+        progress=None if args.quiet else report
+    )
+    try:
+        coordinator.start()
+        if not args.quiet:
+            print(f"Coordinating {args.manifest} on http://{coordinator.host}:{coordinator.port}",
+                  file=sys.stderr)
+        stats = coordinator.run()
+    except KeyboardInterrupt:
+        return 1
+    finally:
+        for sink in sinks:
+            sink.close()
+    return 1 if stats['failed'] or stats['errors'] else 0
+
+
+def _run_work(args: argparse.Namespace) -> int:
+    """Validate jobs leased from a coordinator until its run is done."""
+    from .service.coordinator import WorkerNode
+
+    node = WorkerNode(args.url, workers=args.workers,
+                      limits=ResourceLimits(args.timeout, args.memory_limit * 1024 ** 2),
+                      dedupe=args.dedupe, node_id=args.node_id)
+    try:
+        stats = node.run()
+    except OSError as e:
+        print(f"Lost the coordinator: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 1
+    if not args.quiet:
+        print(f"{node.node_id}: {stats['jobs']} jobs, {stats['documents']} documents, "
+              f"{stats['failed']} failed ({stats['limited']} over limits), "
+              f"{stats['errors']} errors, {stats['dropped']} finished elsewhere",
+              file=sys.stderr)
+    return 0
+
+
+def _run_daemon(args: argparse.Namespace) -> int:
+    """Run the warm daemon for policy-validator-client, or stop it."""
+    from .client import DaemonUnavailable, UnsafeSocketDirectory, request
+    from .service.daemon import ValidationDaemon
+
+    if args.stop:
+        try:
+            return request([], args.socket, stop=True)
+        except DaemonUnavailable:
+            print("No daemon is running", file=sys.stderr)
+            return 1
+    try:
+        daemon = ValidationDaemon(args.socket, args.idle_timeout)
+    except UnsafeSocketDirectory as e:
+        print(f"Cannot place the daemon socket: {e} (use --socket)", file=sys.stderr)
+        return 1
+    try:
+        if not daemon.serve():
+            print(f"A daemon is already serving {daemon.socket_path}", file=sys.stderr)
+            return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+class _ReportSink:
+    """Adapt a report writer to the add()/close() interface of ResultsStore."""
+
+    def __init__(self, writer: Any):
+        self.add = writer.write
+        self.close = writer.close
+
+
+def _open_sinks(args: argparse.Namespace) -> List[Any]:
+    """Open the results store and report given by --store and --report."""
+    sinks: List[Any] = []
+    if args.store:
+        from .storage.results_store import ResultsStore
+        sinks.append(ResultsStore(args.store))
+    if args.report:
+        from .reports.writers import open_report
+        sinks.append(_ReportSink(open_report(args.report, args.report_format)))
+    return sinks
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --store and --report options shared by validate, bulk, coordinate and merge."""
+    from .reports.writers import REPORT_FORMATS
+
+    parser.add_argument("--store", metavar="DB", help="Also record results in a SQLite database")
+    parser.add_argument(
+        "--report", metavar="FILE",
+        help="Also write a report as results arrive ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--report-format", choices=REPORT_FORMATS,
+        help="Report format (default: from the extension: .jsonl, .json, .sarif, .xml)"
+    )
+
+
+def _add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --timeout and --memory-limit options shared by bulk and work."""
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT,
+        help=f"Seconds a document may take before its worker is killed; 0 disables "
+             f"(default: {DEFAULT_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT // 1024 ** 2, metavar="MB",
+        help=f"Address space of each worker in MB; 0 disables "
+             f"(default: {DEFAULT_MEMORY_LIMIT // 1024 ** 2})"
+    )
+
+
+def _add_instrumentation_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the per-stage timing and profiling options shared by validate and bulk."""
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="Print a table of time spent per validation stage to stderr"
+    )
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write per-stage timings as an OpenMetrics text file")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Write a Chrome trace-event JSON file of every stage")
+    parser.add_argument(
+        "--profile", nargs="?", const="sample", choices=("sample", "cprofile"),
+        help="Profile validations with a stack sampler (default) or cProfile, "
+             "plus tracemalloc"
+    )
+    parser.add_argument(
+        "--profile-select", action="append", metavar="GLOB",
+        help="Only profile files matching GLOB; repeat for several (default: all)"
+    )
+    parser.add_argument(
+        "--profile-output", default="profile", metavar="PREFIX",
+        help="Write PREFIX.collapsed (flame graph stacks) and PREFIX.txt (default: profile)"
+    )
+
+
+def _start_instrumentation(args: argparse.Namespace) -> Optional[Any]:
+    """Enable stage timing if any instrumentation output was requested."""
+    if not (args.timings or args.metrics or args.trace):
+        return None
+    from .utils import instrumentation
+    return instrumentation.enable()
+
+
+def _finish_instrumentation(args: argparse.Namespace, recorder: Optional[Any]) -> None:
+    """Write the outputs requested by --timings, --metrics and --trace.
+
+    Instrumentation is turned off afterwards, so a later run in the same
+    process (e.g. in the daemon) starts from an empty recorder.
+    """
+    if recorder is None:
+        return
+    from .utils import instrumentation
+    try:
+        if args.metrics:
+            recorder.write_openmetrics(args.metrics)
+        if args.trace:
+            recorder.write_chrome_trace(args.trace)
+        if args.timings:
+            print(recorder.summary_table(), file=sys.stderr)
+    finally:
+        instrumentation.disable()
+
+
+def _start_profiling(args: argparse.Namespace) -> Optional[Any]:
+    """Create a profile session if --profile was given."""
+    if not args.profile:
+        return None
+    from .utils.profiling import ProfileSession
+    return ProfileSession(args.profile, select=args.profile_select)
+
+
+def _finish_profiling(args: argparse.Namespace, profiler: Optional[Any]) -> None:
+    """Write the collapsed stacks and the report of a profile session."""
+    if profiler is None:
+        return
+    profiler.close()
+    collapsed_path = f"{args.profile_output}.collapsed"
+    report_path = f"{args.profile_output}.txt"
+    profiler.write_collapsed(collapsed_path)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(profiler.report() + '\n')
+    print(f"Profile of {len(profiler.files)} file(s) written to {collapsed_path} "
+          f"and {report_path}", file=sys.stderr)
+
+
+def _parse_standard(value: str) -> str:
+    """Resolve a --standard name or alias."""
+    from .validators.standards import resolve_standard
+    try:
+        return resolve_standard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _parse_shard(value: str) -> Any:
+    """Parse a --shard value such as '2/8'."""
+    from .service.sharding import parse_shard
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _parse_time(value: str) -> float:
+    """Parse an ISO date/time or a relative age such as '7d' into Unix time."""
+    match = _RELATIVE_TIME_RE.match(value)
+    if match:
+        return time.time() - float(match.group(1)) * _TIME_UNITS[match.group(2)]
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid time: {value!r} (use e.g. 2025-06-01, 2025-06-01T12:00 or 7d)")
+
+
+def _run_query(args: argparse.Namespace) -> int:
+    """Print stored per-section results matching the filters."""
+    from .storage.results_store import ResultsStore
+
+    if not os.path.exists(args.database):
+        print(f"No results database at {args.database}", file=sys.stderr)
+        return 1
+    store = ResultsStore(args.database)
+    try:
+        if args.summary:
+            summary = store.section_summary(args.standard, args.since)
+            for standard, sections in summary.items():
+                print(standard)
+                for section, counts in sections.items():
+                    print(f"    {section}: {counts['pass']} pass, {counts['fail']} fail")
+            return 0
+        rows = store.query(standard=args.standard, section=args.section,
+                           status=args.status, since=args.since, until=args.until,
+                           path=args.path, limit=args.limit)
+        for row in rows:
+            if args.json:
+                print(json.dumps(row))
+            else:
+                validated = datetime.fromtimestamp(row['validated_at'])
+                validated = validated.isoformat(timespec='seconds')
+                print(f"{validated}  {row['status']:<4}  {row['standard']}: "
+                      f"{row['section']}  {row['path']}")
+    finally:
+        store.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command-line interface.
+
+    Returns:
+        argparse.ArgumentParser: Parser with one sub-command per operation.
+    """
+    parser = argparse.ArgumentParser(
+        prog="policy-validator-cli",
+        description="Validate cybersecurity policy documents against standards."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate = subparsers.add_parser("validate", help="Validate policy documents")
+    validate.add_argument(
+        "files", nargs="+",
+        help="Policy documents to validate; members of .zip and .tar(.gz) archives are "
+             "validated without extracting them"
+    )
+    validate.add_argument(
+        "--standard", default="Custom", type=_parse_standard,
+        help=f"Standard name or alias: {', '.join(VALIDATION_STANDARDS)} "
+             f"or {', '.join(STANDARD_ALIASES)} (default: Custom)"
+    )
+    validate.add_argument(
+        "--section", dest="sections", action="append", metavar="SECTION",
+        help="Required section; repeat for several (default: all sections)"
+    )
+    validate.add_argument(
+        "--fail-fast", action="store_true",
+        help="Stop at the first failing rule and the first failing file"
+    )
+    validate.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="Print nothing; report the verdict through the exit code only"
+    )
+    validate.add_argument(
+        "--dedupe", action="store_true",
+        help="Group near-duplicate files into template families and reuse "
+             "results where edits cannot change them (requires NumPy)"
+    )
+    validate.add_argument(
+        "--families", metavar="FILE",
+        help="Write the template families found as JSON (implies --dedupe)"
+    )
+    _add_output_arguments(validate)
+    _add_instrumentation_arguments(validate)
+    validate.set_defaults(handler=_run_validate)
+
+    watch = subparsers.add_parser(
+        "watch", help="Validate a directory and revalidate policies as they change"
+    )
+    watch.add_argument("directory", help="Directory of policy documents")
+    watch.add_argument(
+        "--standard", default="Custom", type=_parse_standard,
+        help="Standard name or alias (default: Custom)"
+    )
+    watch.add_argument(
+        "--section", dest="sections", action="append", metavar="SECTION",
+        help="Required section; repeat for several (default: all sections)"
+    )
+    watch.add_argument("--fail-fast", action="store_true",
+                       help="Stop at the first failing rule")
+    watch.add_argument(
+        "--pattern", dest="patterns", action="append", metavar="GLOB",
+        help="File name pattern to watch; repeat for several (default: *.pdf, *.docx, "
+             "*.doc, *.txt)"
+    )
+    watch.add_argument(
+        "--debounce", type=float, default=1.0, metavar="SECONDS",
+        help="Seconds a changed file must stay unchanged before it is revalidated "
+             "(default: 1)"
+    )
+    watch.add_argument("-q", "--quiet", action="store_true", help="Print nothing")
+    _add_output_arguments(watch)
+    watch.set_defaults(handler=_run_watch)
+
+    serve = subparsers.add_parser("serve", help="Run the local HTTP validation service")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve.add_argument("--port", type=int, default=8765, help="Port to bind")
+    serve.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    serve.add_argument(
+        "--queue-size", type=int,
+        help="Running plus queued jobs before returning 429 (default: 8 per worker)"
+    )
+    serve.add_argument(
+        "--timeout", type=float, default=30.0,
+        help="Seconds before a request returns 504 (default: 30)"
+    )
+    serve.add_argument(
+        "--instrument", action="store_true",
+        help="Time validation stages and serve them on /metrics/stages"
+    )
+    serve.set_defaults(handler=_run_serve)
+
+    bulk = subparsers.add_parser("bulk", help="Validate a JSONL manifest of jobs")
+    bulk.add_argument("manifest",
+                      help="JSONL file with one {path, standard, sections} job per line")
+    bulk.add_argument("-o", "--output", required=True, help="JSONL file receiving results")
+    bulk.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    bulk.add_argument(
+        "--restart", action="store_true",
+        help="Overwrite the output instead of resuming from it"
+    )
+    bulk.add_argument(
+        "--dedupe", action="store_true",
+        help="Reuse results across near-duplicate files within each worker (requires NumPy)"
+    )
+    _add_limit_arguments(bulk)
+    bulk.add_argument(
+        "--memory-budget", type=int, metavar="MB",
+        help="Predicted memory of the documents validated at once, in MB; 0 disables "
+             "(default: half the physical memory)"
+    )
+    bulk.add_argument(
+        "--cost-model", metavar="FILE",
+        help="JSON file with learned job costs; read at start and updated at the end"
+    )
+    bulk.add_argument(
+        "--shard", type=_parse_shard, metavar="I/N",
+        help="Run only slice I of N of the manifest (I from 1), e.g. one per node"
+    )
+    _add_output_arguments(bulk)
+    _add_instrumentation_arguments(bulk)
+    bulk.add_argument("-q", "--quiet", action="store_true", help="Do not report progress")
+    bulk.set_defaults(handler=_run_bulk)
+
+    coordinate = subparsers.add_parser(
+        "coordinate", help="Serve a JSONL manifest to worker nodes started with 'work'"
+    )
+    coordinate.add_argument("manifest",
+                            help="JSONL file with one {path, standard, sections} job per line")
+    coordinate.add_argument("-o", "--output", required=True, help="JSONL file receiving results")
+    coordinate.add_argument(
+        "--queue", metavar="DB",
+        help="SQLite job queue; an existing queue is resumed (default: OUTPUT.queue)"
+    )
+    coordinate.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    coordinate.add_argument("--port", type=int, default=8766, help="Port to bind")
+    coordinate.add_argument(
+        "--lease-seconds", type=float, default=60.0, metavar="SECONDS",
+        help="Seconds a node may go without a heartbeat before its jobs are requeued "
+             "(default: 60)"
+    )
+    coordinate.add_argument(
+        "--max-attempts", type=int, default=3,
+        help="Lost leases before a job is recorded as an error (default: 3)"
+    )
+    coordinate.add_argument(
+        "--backup-after", type=float, default=30.0, metavar="SECONDS",
+        help="Once the queue is empty, let idle nodes also run jobs held this long; "
+             "0 disables (default: 30)"
+    )
+    coordinate.add_argument("--cost-model", metavar="FILE",
+                            help="JSON file with learned job costs, used to order the queue")
+    _add_output_arguments(coordinate)
+    coordinate.add_argument("-q", "--quiet", action="store_true", help="Do not report progress")
+    coordinate.set_defaults(handler=_run_coordinate)
+
+    work = subparsers.add_parser("work", help="Validate jobs leased from a coordinator")
+    work.add_argument("url", help="Coordinator URL, e.g. http://coordinator:8766")
+    work.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    work.add_argument("--node-id", help="Name reported to the coordinator (default: host-pid)")
+    work.add_argument(
+        "--dedupe", action="store_true",
+        help="Reuse results across near-duplicate files within each worker (requires NumPy)"
+    )
+    _add_limit_arguments(work)
+    work.add_argument("-q", "--quiet", action="store_true", help="Print nothing at the end")
+    work.set_defaults(handler=_run_work)
+
+    daemon = subparsers.add_parser(
+        "daemon", help="Run the warm daemon that policy-validator-client forwards to"
+    )
+    daemon.add_argument("--socket", help="Unix domain socket (default: per user and version)")
+    daemon.add_argument(
+        "--idle-timeout", type=float, default=600.0, metavar="SECONDS",
+        help="Exit after this long without a request; 0 never exits (default: 600)"
+    )
+    daemon.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    daemon.set_defaults(handler=_run_daemon)
+
+    merge = subparsers.add_parser("merge", help="Merge the results of sharded bulk runs")
+    merge.add_argument("inputs", nargs="+",
+                       help="JSONL outputs of bulk runs and/or SQLite databases from --store")
+    merge.add_argument("-o", "--output", help="JSONL file receiving the merged results")
+    merge.add_argument("--manifest", help="Manifest of the run, to report lines without a result")
+    merge.add_argument("--json", action="store_true", help="Print the statistics as JSON")
+    _add_output_arguments(merge)
+    merge.set_defaults(handler=_run_merge)
+
+    query = subparsers.add_parser("query", help="Query stored validation results")
+    query.add_argument("database", help="SQLite database written with --store")
+    query.add_argument("--standard", help="Standard name or alias")
+    query.add_argument("--section", help="Section name, e.g. 'access control'")
+    query.add_argument("--status", choices=("pass", "fail"), help="Section status")
+    query.add_argument("--since", type=_parse_time, help="Earliest time: ISO date or age like 7d")
+    query.add_argument("--until", type=_parse_time, help="Latest time: ISO date or age like 1h")
+    query.add_argument("--path", help="Document path")
+    query.add_argument("--limit", type=int, help="Maximum number of rows")
+    query.add_argument("--json", action="store_true", help="Print one JSON object per row")
+    query.add_argument(
+        "--summary", action="store_true",
+        help="Print pass/fail counts per section instead of rows"
+    )
+    query.set_defaults(handler=_run_query)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for headless validation.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:]).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        sys.exit(args.handler(args))
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # Arguments are checked by the parser; these come from the run itself
+        print(f"{parser.prog}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Thin command-line client for the validation daemon.
+
+``policy-validator-cli`` pays for the interpreter, the document parsers,
+the MIME detector and the compilation of every standard on each run, which
+dominates when a pre-commit hook validates one file at a time. The
+``policy-validator-client`` entry point accepts the same arguments but
+forwards them over a Unix domain socket to a daemon that keeps all of that
+loaded (see service.daemon), and streams its output back. This module
+imports only the standard library, so a forwarded run costs little more
+than the interpreter start-up and the validation itself; even the
+standard modules only auto-start needs are imported on demand.
+
+Auto-start:
+    When no daemon is listening, the client starts one in the background
+    and runs this invocation itself, so the first run is no slower than
+    ``policy-validator-cli``; later runs go to the daemon. The daemon exits
+    after DEFAULT_IDLE_TIMEOUT seconds without requests.
+
+Commands:
+    validate and query are forwarded. Other commands, and every command on
+    systems without Unix domain sockets or with POLICY_VALIDATOR_NO_DAEMON
+    set, run in the client process as with ``policy-validator-cli``.
+
+Example:
+    $ policy-validator-client validate policy.pdf --standard ISO
+
+Note:
+    Each installation version gets its own socket, in $XDG_RUNTIME_DIR or
+    a per-user directory readable only by its owner, so an upgrade starts
+    a new daemon and other users cannot connect. The directory must be a
+    real directory owned by the user and closed to everyone else, or the
+    client runs commands itself; where the system reports the peer of a
+    Unix socket (SO_PEERCRED), client and daemon also check that the other
+    end runs as the same user.
+"""
+
+import json
+import os
+import socket
+import sys
+from binascii import crc32
+from typing import List, Optional
+
+from . import __version__
+
+# --- Constants ---
+DAEMON_COMMANDS = ('validate', 'query')
+DEFAULT_IDLE_TIMEOUT = 600.0   # Seconds the daemon stays up without requests
+CONNECT_TIMEOUT = 1.0          # Seconds to wait for the daemon to accept
+NO_DAEMON_ENV = 'POLICY_VALIDATOR_NO_DAEMON'
+
+
+class DaemonUnavailable(Exception):
+    """No daemon answered, or it stopped before finishing the request."""
+
+
+class UnsafeSocketDirectory(DaemonUnavailable):
+    """No directory private to the user is available for the socket."""
+
+
+def default_socket_path() -> str:
+    """Return the daemon socket of this installation and user.
+
+    Raises:
+        UnsafeSocketDirectory: If neither $XDG_RUNTIME_DIR nor the per-user
+            directory under the temporary directory is a directory owned
+            by the user and inaccessible to others (e.g. another user
+            created the latter first).
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    name = f"{crc32(f'{__version__}:{package}'.encode('utf-8')):08x}"
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime or not _is_private_directory(runtime):
+        import tempfile
+        runtime = os.path.join(tempfile.gettempdir(), f"policy-validator-{os.getuid()}")
+        try:
+            os.mkdir(runtime, 0o700)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            raise UnsafeSocketDirectory(str(e))
+        if not _is_private_directory(runtime):
+            raise UnsafeSocketDirectory(
+                f"{runtime} is not a directory private to the current user"
+            )
+    return os.path.join(runtime, f"policy-validator-{name}.sock")
+
+
+def _is_private_directory(path: str) -> bool:
+    """Whether path is a directory, not a symlink, owned by us and closed to others."""
+    import stat
+
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid()
+            and info.st_mode & 0o077 == 0)
+
+
+def peer_uid(sock: socket.socket) -> Optional[int]:
+    """Return the user id of the process at the other end of a Unix socket.
+
+    Returns:
+        Optional[int]: The uid, or None where the system does not report
+        it (no SO_PEERCRED).
+    """
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+    import struct
+
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                  struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', credentials)
+    return uid
+
+
+def request(argv: List[str], socket_path: Optional[str] = None, stop: bool = False) -> int:
+    """Run a command in the daemon, copying its output to stdout and stderr.
+
+    Args:
+        argv: Command-line arguments, as for policy-validator-cli.
+        socket_path: Daemon socket (default: default_socket_path()).
+        stop: Ask the daemon to exit instead of running a command.
+
+    Returns:
+        int: Exit code of the command.
+
+    Raises:
+        DaemonUnavailable: If no daemon accepts the connection, the
+            daemon runs as another user, or the connection ends before any
+            output arrives. A connection that ends after some output
+            returns 1, so the command is not run twice.
+        UnsafeSocketDirectory: If no socket_path is given and there is
+            no private directory for the default one.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    received = False
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(socket_path or default_socket_path())
+            uid = peer_uid(sock)
+            if uid is not None and uid != os.getuid():
+                raise DaemonUnavailable(f"The daemon runs as user {uid}")
+            sock.settimeout(None)
+            message = {'argv': argv, 'cwd': os.getcwd(), 'stop': stop}
+            sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        except OSError as e:
+            raise DaemonUnavailable(str(e))
+        with sock.makefile('rb') as replies:
+            while True:
+                # Only failures to read from the daemon count as its
+                # failures; errors writing our own output propagate
+                try:
+                    reply = json.loads(replies.readline() or b'null')
+                except (OSError, ValueError):
+                    reply = None
+                if not isinstance(reply, dict):
+                    break
+                received = True
+                if 'out' in reply:
+                    sys.stdout.write(reply['out'])
+                    sys.stdout.flush()
+                elif 'err' in reply:
+                    sys.stderr.write(reply['err'])
+                    sys.stderr.flush()
+                elif 'exit' in reply:
+                    return reply['exit']
+    finally:
+        sock.close()
+    if not received:
+        raise DaemonUnavailable("The daemon closed the connection")
+    sys.stderr.write("The validation daemon stopped before the command finished\n")
+    return 1
+
+
+def start_daemon(socket_path: Optional[str] = None,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Start a daemon in the background, detached from this process.
+
+    Returns without waiting for it to listen. A daemon that finds another
+    one already running on the socket exits at once.
+    """
+    import subprocess
+
+    command = [sys.executable, '-m', 'policy_validator.service.daemon',
+               '--socket', socket_path or default_socket_path(),
+               '--idle-timeout', str(idle_timeout)]
+    with open(os.devnull, 'r+b') as devnull:
+        subprocess.Popen(command, stdin=devnull, stdout=devnull, stderr=devnull,
+                         close_fds=True, start_new_session=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point: forward the command to the daemon, or run it here.
+
+    Args:
+        argv: Arguments, as for policy-validator-cli (default: sys.argv[1:]).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if (argv and argv[0] in DAEMON_COMMANDS and hasattr(socket, 'AF_UNIX')
+            and not os.environ.get(NO_DAEMON_ENV)):
+        try:
+            sys.exit(request(argv))
+        except UnsafeSocketDirectory:
+            pass  # Nowhere to put a socket only we can reach
+        except DaemonUnavailable:
+            start_daemon()
+        except KeyboardInterrupt:
+            sys.exit(130)
+        except BrokenPipeError:
+            # Whoever reads our output stopped, e.g. `| head`
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+
+    from .cli import main as run_locally
+    run_locally(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Widgets and models for the desktop application.
+
+This package holds the PyQt6 components used by policy_validator.main that
+are large enough to live in their own modules.
+"""
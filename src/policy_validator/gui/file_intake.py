@@ -0,0 +1,273 @@
+"""Background intake of dropped and browsed files.
+
+Loading files checks sizes and sniffs MIME types with libmagic, which is
+slow for large folders or network shares. This module does the work off
+the GUI thread:
+
+    - Dropped directories are expanded recursively with os.scandir, whose
+      directory entries avoid a separate stat() per name where the
+      platform allows it.
+    - Files are sniffed in a thread pool; libmagic releases the GIL, so
+      sniffing overlaps with I/O on other files.
+    - Accepted files are delivered to the GUI thread in batches through a
+      queued Qt signal as soon as they are classified.
+    - Files are deduplicated by (device, inode), so the same file reached
+      through two drops, a hard link or a symlink is loaded once.
+
+Only files whose extension is in the accepted set are taken from expanded
+directories. Files dropped or selected explicitly are always sniffed, so a
+policy with a wrong extension is still reported.
+
+ZIP and TAR archives, dropped or found in directories, are expanded in
+place: members with an accepted extension are sniffed from their first
+bytes without extracting the archive, and loaded with "<archive>!<member>"
+paths (see utils.archives).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..utils.archives import PolicyArchive, identify_member, is_archive, member_path
+from ..utils.file_types import identify_file
+
+# --- Constants ---
+INTAKE_WORKERS = 8         # Threads sniffing file types
+BATCH_SIZE = 256           # Accepted files per delivered batch
+BATCH_INTERVAL = 0.1       # Seconds before a partial batch is delivered
+
+FileKey = Tuple[int, int]  # (st_dev, st_ino)
+LogCallback = Callable[[str, bool], None]
+
+
+class FileIntake(QObject):
+    """Expand, sniff and deduplicate files on background threads.
+
+    Signals:
+        files_accepted(list, int): Batch of file_info dictionaries and the
+            run's generation, delivered on the GUI thread
+        finished(dict, int): Counters of a completed intake run and its
+            generation:
+            {'accepted', 'duplicates', 'empty', 'unsupported', 'errors', 'skipped'}
+
+    Note:
+        Signals queued before reset() may still arrive afterwards; receivers
+        should drop them unless is_current(generation) is true.
+    """
+
+    files_accepted = pyqtSignal(list, int)
+    finished = pyqtSignal(dict, int)
+
+    def __init__(self, log: LogCallback, extensions: Iterable[str],
+                 workers: int = INTAKE_WORKERS, parent: Optional[QObject] = None):
+        """Initialize the intake.
+
+        Args:
+            log: Thread-safe callable taking (message, error).
+            extensions: Extensions (with dot) taken from expanded directories.
+            workers: Threads sniffing file types.
+            parent: Parent QObject.
+        """
+        super().__init__(parent)
+        self.log = log
+        self.extensions = {extension.lower() for extension in extensions}
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._seen: Set[FileKey] = set()
+        self._generation = 0
+        self._running = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether an intake run is in progress."""
+        return self._running > 0
+
+    def start(self, paths: List[str]) -> None:
+        """Start loading files and directories on a background thread."""
+        with self._lock:
+            generation = self._generation
+            self._running += 1
+        threading.Thread(target=self._run, args=(list(paths), generation),
+                         name="file-intake", daemon=True).start()
+
+    def is_current(self, generation: int) -> bool:
+        """Whether a signal's generation belongs to a run that was not reset."""
+        return not self._cancelled(generation)
+
+    def reset(self) -> None:
+        """Cancel running intakes and forget loaded files.
+
+        Batches from cancelled runs are not delivered, and previously loaded
+        files may be loaded again.
+        """
+        with self._lock:
+            self._generation += 1
+            self._seen.clear()
+
+    # --- Worker thread ---
+
+    def _cancelled(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _claim(self, key: FileKey, generation: int) -> bool:
+        """Record a file as loaded; False if it was already seen or cancelled."""
+        with self._lock:
+            if self._cancelled(generation) or key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+    def _expand(self, paths: List[str], stats: Dict[str, int],
+                generation: int) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat) for explicit files and files in directories."""
+        visited_dirs: Set[FileKey] = set()
+        for path in paths:
+            try:
+                info = os.stat(path)
+            except OSError as e:
+                stats['errors'] += 1
+                self.log(f"Error checking file size for {os.path.basename(path)}: {str(e)}", True)
+                continue
+            if not os.path.isdir(path):
+                yield path, info
+                continue
+
+            stack = [path]
+            while stack and not self._cancelled(generation):
+                directory = stack.pop()
+                try:
+                    directory_info = os.stat(directory)
+                    key = (directory_info.st_dev, directory_info.st_ino)
+                    if key in visited_dirs:
+                        continue  # Symlink cycle or repeated drop
+                    visited_dirs.add(key)
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                if is_archive(entry.name):
+                                    yield entry.path, entry.stat()
+                                    continue
+                                if os.path.splitext(entry.name)[1].lower() not in self.extensions:
+                                    stats['skipped'] += 1
+                                    continue
+                                yield entry.path, entry.stat()
+                except OSError as e:
+                    stats['errors'] += 1
+                    self.log(f"Error reading folder {directory}: {str(e)}", True)
+
+    def _sniff(self, path: str, size: int, key: FileKey) -> Tuple[str, Any, FileKey]:
+        """Classify one file; returns (outcome, file_info or message, key)."""
+        file_name = os.path.basename(path)
+        try:
+            file_info = identify_file(path, size)
+        except Exception as e:
+            return 'errors', f"Error processing {file_name}: {str(e)}", key
+        if file_info['type'] is None:
+            message = f"Unsupported file type: {file_name} ({file_info['mime']})"
+            return 'unsupported', message, key
+        return 'accepted', file_info, key
+
+    def _sniff_archive(self, path: str, key: FileKey,
+                       generation: int) -> Tuple[str, List[Tuple[str, Any]], FileKey]:
+        """Classify the members of an archive.
+
+        Returns:
+            tuple: ('archive', [(outcome, file_info or message)] per member, key)
+        """
+        outcomes: List[Tuple[str, Any]] = []
+        try:
+            with PolicyArchive(path) as archive:
+                for member in archive.members(self.extensions):
+                    if self._cancelled(generation):
+                        break
+                    label = member_path(os.path.basename(path), member.name)
+                    if member.size == 0:
+                        outcomes.append(('empty', f"Warning: {label} is empty"))
+                        continue
+                    try:
+                        file_info = identify_member(member)
+                    except Exception as e:
+                        outcomes.append(('errors', f"Error processing {label}: {str(e)}"))
+                        continue
+                    if file_info['type'] is None:
+                        outcomes.append((
+                            'unsupported', f"Unsupported file type: {label} ({file_info['mime']})"
+                        ))
+                    else:
+                        outcomes.append(('accepted', file_info))
+        except Exception as e:
+            message = f"Error reading archive {os.path.basename(path)}: {str(e)}"
+            outcomes.append(('errors', message))
+        return 'archive', outcomes, key
+
+    def _run(self, paths: List[str], generation: int) -> None:
+        stats = {'accepted': 0, 'duplicates': 0, 'empty': 0, 'unsupported': 0,
+                 'errors': 0, 'skipped': 0}
+        batch: List[Dict[str, Any]] = []
+        last_emit = time.monotonic()
+
+        def deliver(force: bool = False) -> None:
+            nonlocal batch, last_emit
+            if batch and (force or len(batch) >= BATCH_SIZE
+                          or time.monotonic() - last_emit >= BATCH_INTERVAL):
+                if not self._cancelled(generation):
+                    self.files_accepted.emit(batch, generation)
+                batch = []
+                last_emit = time.monotonic()
+
+        def collect(done: Iterable[Future]) -> None:
+            for future in done:
+                outcome, value, key = future.result()
+                outcomes = value if outcome == 'archive' else [(outcome, value)]
+                accepted = False
+                for outcome, value in outcomes:
+                    stats[outcome] += 1
+                    if outcome == 'accepted':
+                        batch.append(value)
+                        accepted = True
+                    else:
+                        self.log(value, True)
+                if not accepted:
+                    # Rejected files are reported again if dropped again
+                    with self._lock:
+                        self._seen.discard(key)
+            deliver()
+
+        try:
+            with ThreadPoolExecutor(self.workers, thread_name_prefix="file-sniff") as pool:
+                pending: Set[Future] = set()
+                for path, info in self._expand(paths, stats, generation):
+                    if self._cancelled(generation):
+                        break
+                    if info.st_size == 0:
+                        stats['empty'] += 1
+                        self.log(f"Warning: {os.path.basename(path)} is empty", True)
+                        continue
+                    key = (info.st_dev, info.st_ino)
+                    if not self._claim(key, generation):
+                        stats['duplicates'] += 1
+                        continue
+                    if is_archive(path):
+                        pending.add(pool.submit(self._sniff_archive, path, key, generation))
+                    else:
+                        pending.add(pool.submit(self._sniff, path, info.st_size, key))
+                    if len(pending) >= self.workers * 4:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                while pending:
+                    done, pending = wait(pending, timeout=BATCH_INTERVAL,
+                                         return_when=FIRST_COMPLETED)
+                    collect(done)
+                    deliver()
+            deliver(force=True)
+        finally:
+            with self._lock:
+                self._running -= 1
+            if not self._cancelled(generation):
+                self.finished.emit(stats, generation)
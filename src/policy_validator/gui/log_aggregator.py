@@ -0,0 +1,190 @@
+"""Rate-limited delivery of log messages and results to the GUI.
+
+Background workers may produce messages and results much faster than the
+GUI can draw them. This module buffers them in a lock-protected queue
+that any thread can post to. A timer on the GUI thread drains the queue
+at a fixed frame rate, so the UI cost per frame is bounded regardless of
+producer speed:
+
+    - Consecutive identical messages collapse into one line with a repeat
+      count.
+    - Each flush inserts at most max_lines_per_flush lines in a single
+      text edit. Beyond max_pending queued messages the oldest are dropped,
+      and a "messages dropped" line is shown instead.
+    - Every message is also kept in a ring-buffered history of
+      history_size entries, available through history().
+
+Example:
+    >>> aggregator = LogAggregator(status_area, result_sink=results_view.add_results)
+    >>> aggregator.post("Validating policy.pdf...")      # from any thread
+    >>> aggregator.post_result(file_info)                 # from any thread
+"""
+
+import threading
+import time
+from collections import deque
+from html import escape
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QPlainTextEdit
+
+from ..utils import instrumentation
+
+# --- Constants ---
+FRAME_INTERVAL_MS = 33        # About 30 flushes per second
+DEFAULT_HISTORY_SIZE = 10000  # Messages kept for history()
+MAX_LINES_PER_FLUSH = 200     # Lines drawn per frame
+MAX_PENDING = 20000           # Queued messages before the oldest are dropped
+
+
+class LogEntry(NamedTuple):
+    """One (possibly collapsed) log message."""
+
+    timestamp: float
+    message: str
+    error: bool
+    count: int
+
+
+class LogAggregator(QObject):
+    """Buffer messages and results from any thread and flush them per frame.
+
+    Attributes:
+        history_size (int): Capacity of the message history ring buffer
+        dropped (int): Messages dropped because the queue was full
+    """
+
+    def __init__(self, log_widget: QPlainTextEdit,
+                 result_sink: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 history_size: int = DEFAULT_HISTORY_SIZE,
+                 flush_interval_ms: int = FRAME_INTERVAL_MS,
+                 max_lines_per_flush: int = MAX_LINES_PER_FLUSH,
+                 max_pending: int = MAX_PENDING):
+        """Initialize the aggregator; must be called on the GUI thread.
+
+        Args:
+            log_widget: Plain text log receiving the messages.
+            result_sink: Called on the GUI thread with each batch of
+                posted results.
+            history_size: Messages kept in the history ring buffer.
+            flush_interval_ms: Milliseconds between flushes.
+            max_lines_per_flush: Lines inserted into the log per flush;
+                the rest wait for the next frame.
+            max_pending: Queued messages before the oldest are dropped.
+        """
+        super().__init__(log_widget)
+        self.log_widget = log_widget
+        self.result_sink = result_sink
+        self.history_size = history_size
+        self.max_lines_per_flush = max_lines_per_flush
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pending: Deque[LogEntry] = deque(maxlen=max_pending)
+        self._results: List[Dict[str, Any]] = []
+        self._history: Deque[LogEntry] = deque(maxlen=history_size)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    # --- Producers (any thread) ---
+
+    def post(self, message: str, error: bool = False) -> None:
+        """Queue a message for the log."""
+        now = time.time()
+        with self._lock:
+            pending = self._pending
+            if pending and pending[-1].message == message and pending[-1].error == error:
+                last = pending.pop()
+                pending.append(last._replace(count=last.count + 1))
+                return
+            if len(pending) == pending.maxlen:
+                self.dropped += 1
+            pending.append(LogEntry(now, message, error, 1))
+
+    def post_result(self, result: Dict[str, Any]) -> None:
+        """Queue a validation result for the result sink."""
+        with self._lock:
+            self._results.append(result)
+
+    # --- Consumer (GUI thread) ---
+
+    def flush(self) -> None:
+        """Move queued messages and results to the GUI in bulk."""
+        with self._lock:
+            results, self._results = self._results, []
+            count = min(len(self._pending), self.max_lines_per_flush)
+            entries = [self._pending.popleft() for _ in range(count)]
+            dropped, self.dropped = self.dropped, 0
+
+        if results and self.result_sink:
+            with instrumentation.stage('gui_results'):
+                self.result_sink(results)
+        if not entries and not dropped:
+            return
+
+        # Collapse repeats across flushes with the last line shown
+        if entries and self._history and self._is_repeat(self._history[-1], entries[0]):
+            self._extend_last_line(entries.pop(0))
+
+        if dropped:
+            entries.insert(0, LogEntry(time.time(), f"… {dropped} message(s) dropped", True, 1))
+        lines = []
+        for entry in entries:
+            self._history.append(entry)
+            lines.append(self._format(entry))
+        if lines:
+            with instrumentation.stage('gui_log'):
+                self._append_lines(lines)
+
+    def history(self) -> List[LogEntry]:
+        """Return the retained messages, oldest first."""
+        return list(self._history)
+
+    def clear(self) -> None:
+        """Discard queued messages, results and history."""
+        with self._lock:
+            self._pending.clear()
+            self._results = []
+            self.dropped = 0
+        self._history.clear()
+
+    @staticmethod
+    def _is_repeat(last: LogEntry, entry: LogEntry) -> bool:
+        return last.message == entry.message and last.error == entry.error
+
+    def _extend_last_line(self, entry: LogEntry) -> None:
+        """Add a repeated message's count to the last log line."""
+        last = self._history.pop()
+        merged = last._replace(count=last.count + entry.count)
+        self._history.append(merged)
+        cursor = QTextCursor(self.log_widget.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
+        cursor.removeSelectedText()
+        self._append_lines([self._format(merged)])
+
+    def _append_lines(self, lines: List[str]) -> None:
+        """Append lines as blocks in one edit, following the end if scrolled there."""
+        scroll_bar = self.log_widget.verticalScrollBar()
+        at_end = scroll_bar.value() == scroll_bar.maximum()
+        document = self.log_widget.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+        cursor.endEditBlock()
+        if at_end:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    @staticmethod
+    def _format(entry: LogEntry) -> str:
+        color = "red" if entry.error else "black"
+        suffix = f" (×{entry.count})" if entry.count > 1 else ""
+        return f'<span style="color: {color};">{escape(entry.message)}{suffix}</span>'
@@ -0,0 +1,355 @@
+"""Table view of validation results.
+
+This module replaces the per-message HTML log with a QTableView over a
+custom model, so tens of thousands of results stay responsive.
+
+Performance Considerations:
+    - The view only asks the model for visible cells, and cell text is
+      formatted on request instead of being stored per row.
+    - Rows have a fixed height, so the view never measures row contents.
+    - Sorting and filtering run in the model with Python's sort and list
+      comprehensions over slotted row objects; a proxy model would call
+      back into Python for every comparison.
+    - Results added through ResultsView.add_result() are buffered and
+      inserted in one beginInsertRows()/endInsertRows() batch per
+      INSERT_INTERVAL_MS.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (
+    QAbstractItemView, QComboBox, QHBoxLayout, QHeaderView, QLabel,
+    QTableView, QVBoxLayout, QWidget
+)
+
+from ..validators.standards import VALIDATION_STANDARDS
+
+# --- Constants ---
+INSERT_INTERVAL_MS = 50   # Delay used to batch rows added one at a time
+ROW_HEIGHT = 22           # Fixed row height in pixels
+
+COLUMNS = ['Status', 'File', 'Standard', 'Missing Sections', 'Issues', 'Time (ms)']
+STATUS_COLUMN, FILE_COLUMN, STANDARD_COLUMN, MISSING_COLUMN, ISSUES_COLUMN, TIME_COLUMN = range(6)
+
+STATUS_LABELS = {
+    'success': '✅ Passed',
+    'warning': '⚠️ Warnings',
+    'error': '❌ Failed'
+}
+STATUS_ORDER = {'error': 0, 'warning': 1, 'success': 2}
+STATUS_COLORS = {'error': QColor('red'), 'warning': QColor('darkorange')}
+
+ALL_FILTER = "All"
+
+
+def result_status(result: Dict[str, Any]) -> str:
+    """Return 'success', 'warning' or 'error' for a validation result."""
+    if not result.get('valid'):
+        return 'error'
+    return 'warning' if result.get('issues') else 'success'
+
+
+class ResultRow:
+    """Columns of one result needed for display, sorting and filtering.
+
+    Only these fields are kept, not the full result dictionary.
+    """
+
+    __slots__ = ('status', 'path', 'standard', 'missing', 'issues', 'elapsed_ms')
+
+    def __init__(self, result: Dict[str, Any]):
+        self.status = result_status(result)
+        self.path = result.get('path', '')
+        self.standard = result.get('standard', '')
+        self.missing = tuple(section for section, present
+                             in (result.get('sections') or {}).items() if not present)
+        self.issues = tuple(result.get('issues', []))
+        self.elapsed_ms = result.get('elapsed_ms')
+
+
+_SORT_KEYS: Dict[int, Callable[[ResultRow], Any]] = {
+    STATUS_COLUMN: lambda row: STATUS_ORDER[row.status],
+    FILE_COLUMN: lambda row: os.path.basename(row.path).casefold(),
+    STANDARD_COLUMN: lambda row: row.standard,
+    MISSING_COLUMN: lambda row: len(row.missing),
+    ISSUES_COLUMN: lambda row: len(row.issues),
+    TIME_COLUMN: lambda row: row.elapsed_ms if row.elapsed_ms is not None else -1.0,
+}
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Table model over validation results with in-model sort and filter.
+
+    Attributes:
+        rows (List[ResultRow]): Every result added, in insertion order
+    """
+
+    def __init__(self, parent: Optional[Any] = None):
+        super().__init__(parent)
+        self.rows: List[ResultRow] = []
+        self._visible: List[ResultRow] = []
+        self._filters: Dict[str, Optional[str]] = {'status': None, 'standard': None,
+                                                   'section': None}
+        self._sort: Optional[tuple] = None  # (column, order)
+        self._counts = {status: 0 for status in STATUS_LABELS}
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = self._visible[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == STATUS_COLUMN:
+                return STATUS_LABELS[row.status]
+            if column == FILE_COLUMN:
+                return os.path.basename(row.path)
+            if column == STANDARD_COLUMN:
+                return row.standard
+            if column == MISSING_COLUMN:
+                return ', '.join(row.missing)
+            if column == ISSUES_COLUMN:
+                if not row.issues:
+                    return ''
+                extra = f" (+{len(row.issues) - 1} more)" if len(row.issues) > 1 else ''
+                return row.issues[0] + extra
+            if column == TIME_COLUMN:
+                return '' if row.elapsed_ms is None else f"{row.elapsed_ms:.1f}"
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == FILE_COLUMN:
+                return row.path
+            if column == ISSUES_COLUMN and row.issues:
+                return '\n'.join(row.issues)
+            if column == MISSING_COLUMN and row.missing:
+                return '\n'.join(row.missing)
+        elif role == Qt.ItemDataRole.ForegroundRole and column == STATUS_COLUMN:
+            return STATUS_COLORS.get(row.status)
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == TIME_COLUMN:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the visible rows by a column (called by QTableView).
+
+        A negative column restores insertion order.
+        """
+        self.layoutAboutToBeChanged.emit()
+        if column in _SORT_KEYS:
+            self._sort = (column, order)
+            self._apply_sort(self._visible)
+        else:
+            self._sort = None
+            self._visible = [row for row in self.rows if self._accepts(row)]
+        self.layoutChanged.emit()
+
+    # --- Results ---
+
+    def add_results(self, results: List[Dict[str, Any]]) -> None:
+        """Append results, inserting the visible ones in a single batch."""
+        if not results:
+            return
+        new_rows = [ResultRow(result) for result in results]
+        self.rows.extend(new_rows)
+        for row in new_rows:
+            self._counts[row.status] += 1
+        accepted = [row for row in new_rows if self._accepts(row)]
+        if not accepted:
+            return
+        if self._sort is not None:
+            # Merging into a sorted list moves rows, so relayout once
+            self.layoutAboutToBeChanged.emit()
+            self._visible.extend(accepted)
+            self._apply_sort(self._visible)
+            self.layoutChanged.emit()
+            return
+        first = len(self._visible)
+        self.beginInsertRows(QModelIndex(), first, first + len(accepted) - 1)
+        self._visible.extend(accepted)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all results."""
+        self.beginResetModel()
+        self.rows = []
+        self._visible = []
+        self._counts = {status: 0 for status in STATUS_LABELS}
+        self.endResetModel()
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of results per status, ignoring filters."""
+        return dict(self._counts)
+
+    # --- Filtering ---
+
+    def set_filter(self, status: Optional[str] = None, standard: Optional[str] = None,
+                   section: Optional[str] = None) -> None:
+        """Show only results matching every given filter.
+
+        Args:
+            status: 'success', 'warning' or 'error'.
+            standard: Standard name.
+            section: Section name; matches results missing that section.
+        """
+        self._filters = {'status': status, 'standard': standard, 'section': section}
+        self.beginResetModel()
+        self._visible = [row for row in self.rows if self._accepts(row)]
+        self._apply_sort(self._visible)
+        self.endResetModel()
+
+    def _accepts(self, row: ResultRow) -> bool:
+        filters = self._filters
+        return ((filters['status'] is None or row.status == filters['status'])
+                and (filters['standard'] is None or row.standard == filters['standard'])
+                and (filters['section'] is None or filters['section'] in row.missing))
+
+    def _apply_sort(self, rows: List[ResultRow]) -> None:
+        if self._sort is None:
+            return
+        column, order = self._sort
+        rows.sort(key=_SORT_KEYS[column], reverse=order == Qt.SortOrder.DescendingOrder)
+
+
+class ResultsView(QWidget):
+    """Filter bar and table showing validation results.
+
+    Attributes:
+        model (ResultsTableModel): Model holding the results
+        table (QTableView): Table displaying the model
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.model = ResultsTableModel(self)
+        self._pending: List[Dict[str, Any]] = []
+        self._insert_timer = QTimer(self)
+        self._insert_timer.setSingleShot(True)
+        self._insert_timer.setInterval(INSERT_INTERVAL_MS)
+        self._insert_timer.timeout.connect(self.flush)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Filter bar
+        filters = QHBoxLayout()
+        self.status_filter = QComboBox()
+        self.status_filter.addItem(ALL_FILTER, None)
+        for status, label in STATUS_LABELS.items():
+            self.status_filter.addItem(label, status)
+        self.standard_filter = QComboBox()
+        self.standard_filter.addItem(ALL_FILTER, None)
+        for standard in VALIDATION_STANDARDS:
+            self.standard_filter.addItem(standard, standard)
+        self.section_filter = QComboBox()
+        self._update_section_filter()
+        for label, combo in (("Status:", self.status_filter),
+                             ("Standard:", self.standard_filter),
+                             ("Missing section:", self.section_filter)):
+            filters.addWidget(QLabel(label))
+            filters.addWidget(combo)
+        filters.addStretch()
+        self.summary_label = QLabel()
+        filters.addWidget(self.summary_label)
+        layout.addLayout(filters)
+
+        self.status_filter.currentIndexChanged.connect(self._apply_filters)
+        self.standard_filter.currentIndexChanged.connect(self._on_standard_filter_changed)
+        self.section_filter.currentIndexChanged.connect(self._apply_filters)
+
+        # Table
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+        self.table.setAlternatingRowColors(True)
+        vertical = self.table.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(ROW_HEIGHT)
+        vertical.hide()
+        horizontal = self.table.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        horizontal.setStretchLastSection(False)
+        horizontal.setSectionResizeMode(ISSUES_COLUMN, QHeaderView.ResizeMode.Stretch)
+        for column, width in ((STATUS_COLUMN, 110), (FILE_COLUMN, 180),
+                              (STANDARD_COLUMN, 110), (MISSING_COLUMN, 200),
+                              (TIME_COLUMN, 80)):
+            self.table.setColumnWidth(column, width)
+        layout.addWidget(self.table)
+        self._update_summary()
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """Queue one result; queued results are inserted together shortly after."""
+        self._pending.append(result)
+        if not self._insert_timer.isActive():
+            self._insert_timer.start()
+
+    def add_results(self, results: List[Dict[str, Any]]) -> None:
+        """Insert many results at once."""
+        self._pending.extend(results)
+        self.flush()
+
+    def flush(self) -> None:
+        """Insert all queued results now."""
+        self._insert_timer.stop()
+        pending, self._pending = self._pending, []
+        if pending:
+            self.model.add_results(pending)
+            self._update_summary()
+
+    def clear(self) -> None:
+        """Remove all results, including queued ones."""
+        self._insert_timer.stop()
+        self._pending = []
+        self.model.clear()
+        self._update_summary()
+
+    def _on_standard_filter_changed(self) -> None:
+        self._update_section_filter()
+        self._apply_filters()
+
+    def _update_section_filter(self) -> None:
+        """List the sections of the selected standard, or of every standard."""
+        standard = self.standard_filter.currentData()
+        sections: List[str] = []
+        for name, definition in VALIDATION_STANDARDS.items():
+            if standard is None or name == standard:
+                sections.extend(s for s in definition['sections'] if s not in sections)
+        self.section_filter.blockSignals(True)
+        self.section_filter.clear()
+        self.section_filter.addItem(ALL_FILTER, None)
+        for section in sections:
+            self.section_filter.addItem(section.title(), section)
+        self.section_filter.blockSignals(False)
+
+    def _apply_filters(self) -> None:
+        self.flush()
+        self.model.set_filter(self.status_filter.currentData(),
+                              self.standard_filter.currentData(),
+                              self.section_filter.currentData())
+        self._update_summary()
+
+    def _update_summary(self) -> None:
+        counts = self.model.counts()
+        self.summary_label.setText(
+            f"{self.model.rowCount()} of {len(self.model.rows)} shown — "
+            f"{counts['success']} passed, {counts['warning']} with warnings, "
+            f"{counts['error']} failed"
+        )
@@ -0,0 +1,93 @@
+"""Background validation for the desktop application.
+
+Validation runs on a QThreadPool thread so parsing large documents never
+freezes the window. The task reports progress and results through a
+LogAggregator, which delivers them to the GUI thread in rate-limited
+batches. Completion is signalled with a queued Qt signal. Members of
+archives are validated straight from their archive, several at a time
+(see utils.archives). The application validates with a SandboxedValidator,
+so the parsing itself happens in resource-limited worker processes.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Union
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from .log_aggregator import LogAggregator
+from ..service.sandbox import SandboxedValidator
+from ..utils.archives import split_member_path, validate_archive
+from ..validators.policy_validator import PolicyValidator
+
+
+class ValidationSignals(QObject):
+    """Signals emitted by a ValidationTask.
+
+    Signals:
+        finished(int, int): Failed and validated file counts
+    """
+
+    finished = pyqtSignal(int, int)
+
+
+class ValidationTask(QRunnable):
+    """Validate a list of files on a worker thread.
+
+    Attributes:
+        signals (ValidationSignals): Completion signal, delivered to the GUI thread
+        cancel_event (threading.Event): Set to stop before the next file
+    """
+
+    def __init__(self, files: List[Dict[str, Any]],
+                 validator: Union[PolicyValidator, SandboxedValidator],
+                 aggregator: LogAggregator):
+        """Initialize the task.
+
+        Args:
+            files: file_info dictionaries to validate; the task validates
+                copies, so the caller's dictionaries are not shared with
+                the worker thread.
+            validator: Configured validator; a SandboxedValidator keeps
+                parsing out of the application process.
+            aggregator: Receives messages and results.
+        """
+        super().__init__()
+        self.files = [dict(file_info, issues=list(file_info['issues'])) for file_info in files]
+        self.validator = validator
+        self.aggregator = aggregator
+        self.signals = ValidationSignals()
+        self.cancel_event = threading.Event()
+
+    def run(self) -> None:
+        """Validate every file, posting one result per file."""
+        failed = validated = 0
+        for file_info in self._validated_files():
+            if self.cancel_event.is_set():
+                break
+            self.aggregator.post_result(file_info)
+            validated += 1
+            if not file_info['valid']:
+                failed += 1
+                self.aggregator.post(
+                    f"❌ {os.path.basename(file_info['path'])} failed validation", error=True)
+        self.signals.finished.emit(failed, validated)
+
+    def _validated_files(self) -> Iterator[Dict[str, Any]]:
+        """Validate files, then archive members grouped by archive."""
+        archives: Dict[str, List[Dict[str, Any]]] = {}
+        for file_info in self.files:
+            member = split_member_path(file_info['path'])
+            if member is not None:
+                archives.setdefault(member[0], []).append(file_info)
+                continue
+            if self.cancel_event.is_set():
+                return
+            try:
+                self.validator.validate(file_info)
+            except Exception as e:
+                file_info['valid'] = False
+                file_info['issues'].append(f"Error validating file: {str(e)}")
+            yield file_info
+        for archive_path, members in archives.items():
+            yield from validate_archive(self.validator, archive_path, members)
@@ -15,7 +15,8 @@ GUI Components Architecture:
         - DropZone: Drag-and-drop file upload area with visual feedback
         - StandardSelector: Dropdown for selecting validation standards
         - SectionCheckboxes: Dynamic checkboxes for selecting policy sections
-        - StatusArea: Rich text area for validation results and messages
+        - ResultsView: Sortable, filterable table of validation results
+        - StatusArea: Plain text log of operation messages
         - ActionButtons: Controls for validation and clearing
 
 Event Handling System:
@@ -43,9 +44,9 @@ Validation Workflow:
        - Structure validation based on standard requirements
        
     4. Results Reporting Phase:
-       - Status area updates with validation results
-       - Success/warning/error indicators
-       - Detailed issue reporting
+       - Results table rows with success/warning/error indicators
+       - Missing sections and detailed issues per document
+       - Filtering by status, standard and missing section
        - Summary statistics
 
 Example:
@@ -88,15 +89,16 @@ Constants:
 
 Implementation Notes:
     - GUI operations run in the main thread
-    - File validation is performed synchronously
+    - File validation runs on a QThreadPool worker thread, which parses
+      documents in sandboxed worker processes with time and memory limits
+      (see service.sandbox), so a malformed file cannot hang or crash the
+      window
     - Error handling ensures application stability
-    - Thread-safety considerations in status logging
+    - Status messages and results reach the GUI through a rate-limited
+      LogAggregator, so log_status() is safe to call from any thread
     
 Future Improvements:
-    - Asynchronous file processing using QThreadPool
     - Progress bars for large files
-    - Background validation workers
-    - Real-time validation updates
     - Enhanced PDF and Word document parsing
     - Support for additional file formats
     - More detailed validation reporting
@@ -104,37 +106,49 @@ Future Improvements:
     - Integration with external validation services
 
 Performance Considerations:
-    - Large PDF files may cause UI freezes during processing
+    - Large PDF files are parsed off the GUI thread
+    - Log updates are flushed at a fixed frame rate, collapsing repeats
     - Word document parsing can be memory-intensive
-    - Status area updates are optimized for large output
+    - Results are shown in a virtualized table; rows are inserted in batches
+    - The message log is plain text with a bounded line count
     - Section checkbox creation is optimized for dynamic updates
+    - Dropped folders are expanded and sniffed on background threads
 """
 
 import sys
 import os
 import json
-import re
-import magic
+import multiprocessing
 from typing import Dict, List, Any, Union, Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget, 
-    QFrame, QScrollArea, QTextEdit, QPushButton, QHBoxLayout, QFileDialog,
+    QFrame, QScrollArea, QPlainTextEdit, QPushButton, QHBoxLayout, QFileDialog,
     QComboBox, QGroupBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, QMimeData
+from PyQt6.QtCore import Qt, QMimeData, QThreadPool
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 
+from .gui.file_intake import FileIntake
+from .gui.log_aggregator import LogAggregator
+from .gui.results_view import ResultsView
+from .gui.validation_task import ValidationTask
+from .service.sandbox import SandboxedValidator, SandboxPool
+from .service.workers import warm_worker
+from .utils.file_types import MIME_TYPE_MAPPING
+from .validators.standards import VALIDATION_STANDARDS
+
 # File validation constants
 SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt', '.text'}
 MIN_FILE_SIZE = 50  # Minimum valid file size in bytes (empty files are typically < 50 bytes)
-
-# MIME type mapping for supported file formats
-# Maps MIME types to (internal_type, expected_extension)
-MIME_TYPE_MAPPING = {
-    'application/pdf': ('pdf', '.pdf'),
-    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ('docx', '.docx'),
-    'application/msword': ('doc', '.doc'),
-    'text/plain': ('txt', '.txt')
+MAX_LOG_LINES = 5000  # Oldest status messages are discarded beyond this
+LOG_HISTORY_SIZE = 10000  # Status messages kept by the log aggregator
+
+# Labels used when reporting loaded files, keyed by internal file type
+ADDED_FILE_LABELS = {
+    'pdf': 'PDF',
+    'docx': 'DOCX',
+    'doc': 'DOC',
+    'txt': 'text file'
 }
 
 # Status indicators for validation results
@@ -294,8 +308,8 @@ class DropZone(QFrame):
         """Process dropped files.
         
         Called when files are dropped onto the widget.
-        Extracts file paths from the drop event, filters for actual files,
-        and passes valid file paths to the main application for processing.
+        Extracts local paths from the drop event and passes them to the main
+        application, which loads files and expands folders in the background.
         
         Args:
             event: The QDropEvent containing the dropped data
@@ -304,11 +318,12 @@ class DropZone(QFrame):
             1. Restore normal visual style
             2. Extract URLs from the drop data
             3. Convert URLs to local file paths
-            4. Filter to include only actual files (not directories)
-            5. Pass valid file paths to main application
+            4. Pass the paths to main application
             
         Note:
-            - Directories are ignored
+            - Directories are expanded recursively by the main application
+            - Paths are not touched here, so slow network shares cannot
+              block the GUI thread
             - Empty drops are silently handled (no files processed)
             - Processing is delegated to the main application
             - Visual state is reset regardless of drop validity
@@ -333,8 +348,8 @@ class DropZone(QFrame):
             # Extract file paths from URLs
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()  # Convert URL to local path
-                # Only include actual files, not directories
-                if os.path.isfile(file_path):
+                # Non-local URLs have no local path
+                if file_path:
                     file_paths.append(file_path)
             
             # Pass collected file paths to main application for processing
@@ -367,7 +382,10 @@ class DropZone(QFrame):
         file_dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
         
         # Set name filter to show only supported document types
-        file_dialog.setNameFilter("Documents (*.pdf *.docx *.doc *.txt)")
+        file_dialog.setNameFilters([
+            "Documents (*.pdf *.docx *.doc *.txt)",
+            "Policy bundles (*.zip *.tar *.tgz *.tar.gz *.tar.bz2 *.tar.xz)"
+        ])
         
         # Show dialog and process selected files if any
         if file_dialog.exec():
@@ -390,7 +408,10 @@ class PolicyValidatorApp(QMainWindow):
         current_standard (str): Currently selected validation standard
         section_checkboxes (Dict[str, QCheckBox]): Mapping of section names to checkbox widgets
         loaded_files (List[Dict[str, Any]]): List of files loaded for validation
-        status_area (QTextEdit): Widget displaying validation status and results
+        results_view (ResultsView): Table of validation results
+        status_area (QPlainTextEdit): Log of status messages
+        log_aggregator (LogAggregator): Rate-limited, thread-safe feed of
+            status messages and results into the GUI
         validate_button (QPushButton): Button to trigger validation
         clear_button (QPushButton): Button to clear all files and results
         drop_zone (DropZone): Widget for drag-and-drop file uploads
@@ -404,7 +425,7 @@ class PolicyValidatorApp(QMainWindow):
         
         2. Content extraction:
            - Text files: Direct reading
-           - PDF: Text extraction (TODO)
+           - PDF: Outline triage, then text extraction
            - Word: Document parsing (TODO)
         
         3. Policy validation:
@@ -449,64 +470,7 @@ class PolicyValidatorApp(QMainWindow):
         super().__init__()
 
         # Define validation standards
-        self.validation_standards = {
-            "NIST SP 800-53": {
-                "sections": [
-                    "access control",
-                    "audit and accountability",
-                    "security assessment",
-                    "configuration management",
-                    "contingency planning",
-                    "identification and authentication",
-                    "incident response",
-                    "maintenance",
-                    "media protection",
-                    "physical protection",
-                    "risk assessment",
-                    "system and communications protection",
-                ],
-                "min_length": 1000,
-                "required_structure": True
-            },
-            "ISO 27001": {
-                "sections": [
-                    "information security policies",
-                    "organization of information security",
-                    "human resource security",
-                    "asset management",
-                    "access control",
-                    "cryptography",
-                    "physical security",
-                    "operations security",
-                    "communications security",
-                    "incident management",
-                ],
-                "min_length": 800,
-                "required_structure": True
-            },
-            "SOC 2": {
-                "sections": [
-                    "security",
-                    "availability",
-                    "processing integrity",
-                    "confidentiality",
-                    "privacy",
-                ],
-                "min_length": 500,
-                "required_structure": False
-            },
-            "Custom": {
-                "sections": [
-                    "password",
-                    "data protection",
-                    "access control",
-                    "incident response",
-                    "compliance"
-                ],
-                "min_length": 50,
-                "required_structure": False
-            }
-        }
+        self.validation_standards = VALIDATION_STANDARDS
         
         # Set default validation standard
         self.current_standard = "Custom"
@@ -572,15 +536,29 @@ class PolicyValidatorApp(QMainWindow):
         self.drop_zone = DropZone(self)
         layout.addWidget(self.drop_zone)
         
-        # Add status area with scroll capability
-        status_label = QLabel("Validation Status:")
-        status_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        # Add results table
+        results_label = QLabel("Validation Results:")
+        results_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        layout.addWidget(results_label)
+        
+        self.results_view = ResultsView(self)
+        self.results_view.setMinimumHeight(200)
+        layout.addWidget(self.results_view, stretch=1)
+        
+        # Add status log for operation messages
+        status_label = QLabel("Status:")
+        status_label.setStyleSheet("font-weight: bold;")
         layout.addWidget(status_label)
         
-        self.status_area = QTextEdit()
+        self.status_area = QPlainTextEdit()
         self.status_area.setReadOnly(True)
-        self.status_area.setMinimumHeight(200)
+        self.status_area.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_area.setMaximumHeight(120)
         layout.addWidget(self.status_area)
+        self.log_aggregator = LogAggregator(
+            self.status_area, result_sink=self.results_view.add_results,
+            history_size=LOG_HISTORY_SIZE
+        )
         
         # Add action buttons
         buttons_layout = QHBoxLayout()
@@ -599,8 +577,13 @@ class PolicyValidatorApp(QMainWindow):
         # Set central widget
         self.setCentralWidget(central_widget)
         
-        # Initialize file list
+        # Initialize file list and background intake/validation state
         self.loaded_files = []
+        self.validation_task = None
+        self.sandbox_pool = None
+        self.file_intake = FileIntake(self.log_status, SUPPORTED_EXTENSIONS, parent=self)
+        self.file_intake.files_accepted.connect(self.on_files_accepted)
+        self.file_intake.finished.connect(self.on_intake_finished)
         
     def process_files(self, file_paths: List[str]) -> None:
         """Process the dropped or selected files.
@@ -608,15 +591,24 @@ class PolicyValidatorApp(QMainWindow):
         Args:
             file_paths: List of paths to files for processing
 
+        Directories are expanded recursively, and ZIP/TAR archives are
+        read in place without extracting them. Checks run on background
+        threads (see gui.file_intake.FileIntake); accepted files are added
+        in batches by on_files_accepted() as soon as they are classified,
+        so this method returns immediately.
+
         File Processing Steps:
-            1. Verify each file exists and is not empty
-            2. Detect MIME type using python-magic
-            3. Validate file extension matches content
-            4. Add valid files to loaded_files list
-            5. Enable validation if valid files were loaded
+            1. Expand directories and archives, keeping files with
+               supported extensions
+            2. Skip files already loaded (same device and inode)
+            3. Verify each file exists and is not empty
+            4. Detect MIME type using python-magic
+            5. Validate file extension matches content
+            6. Add valid files to loaded_files list
+            7. Enable validation if valid files were loaded
 
         Each processed file gets a file_info dict with:
-            path: Full path to the file
+            path: Full path to the file ("<archive>!<member>" for archive members)
             type: Internal file type (pdf, docx, doc, txt)
             mime: Detected MIME type
             size: File size in bytes
@@ -624,11 +616,6 @@ class PolicyValidatorApp(QMainWindow):
             valid: Validation status
             issues: List of validation issues
             
-        Raises:
-            OSError: If file cannot be accessed or read
-            magic.MagicException: If file type cannot be determined
-            UnicodeDecodeError: If text file has invalid encoding
-            
         Error Handling:
             - Empty files are rejected with warning
             - Invalid file types trigger error message
@@ -636,69 +623,41 @@ class PolicyValidatorApp(QMainWindow):
             - Mismatched extensions generate warnings
             - All errors are logged but don't crash application
         """
-        for file_path in file_paths:
-            file_name = os.path.basename(file_path)
-            
-            # Check if file is empty
-            try:
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    self.log_status(f"Warning: {file_name} is empty", error=True)
-                    continue
-            except Exception as e:
-                self.log_status(f"Error checking file size for {file_name}: {str(e)}", error=True)
-                continue
-            
-            # Use python-magic to detect file type
-            try:
-                mime = magic.Magic(mime=True)
-                file_type = mime.from_file(file_path)
-                
-                # Check if file extension matches content type
-                extension = os.path.splitext(file_name)[1].lower()
-                
-                file_info = {
-                    'path': file_path, 
-                    'type': None,
-                    'mime': file_type,
-                    'size': file_size,
-                    'extension': extension,
-                    'valid': True,
-                    'issues': []
-                }
-                
-                # Check if file type is supported
-                if 'pdf' in file_type:
-                    file_info['type'] = 'pdf'
-                    if extension != '.pdf':
-                        file_info['issues'].append(f"Extension {extension} doesn't match PDF content")
-                    self.loaded_files.append(file_info)
-                    self.log_status(f"Added PDF: {file_name}")
-                elif 'officedocument.wordprocessingml' in file_type:
-                    file_info['type'] = 'docx'
-                    if extension != '.docx':
-                        file_info['issues'].append(f"Extension {extension} doesn't match DOCX content")
-                    self.loaded_files.append(file_info)
-                    self.log_status(f"Added DOCX: {file_name}")
-                elif 'msword' in file_type:
-                    file_info['type'] = 'doc'
-                    if extension != '.doc':
-                        file_info['issues'].append(f"Extension {extension} doesn't match DOC content")
-                    self.loaded_files.append(file_info)
-                    self.log_status(f"Added DOC: {file_name}")
-                elif 'text/plain' in file_type:
-                    file_info['type'] = 'txt'
-                    if extension not in ('.txt', '.text'):
-                        file_info['issues'].append(f"Extension {extension} doesn't match text content")
-                    self.loaded_files.append(file_info)
-                    self.log_status(f"Added text file: {file_name}")
-                else:
-                    self.log_status(f"Unsupported file type: {file_name} ({file_type})", error=True)
-            except Exception as e:
-                self.log_status(f"Error processing {file_name}: {str(e)}", error=True)
+        self.file_intake.start(file_paths)
+    
+    def on_files_accepted(self, files: List[Dict[str, Any]], generation: int) -> None:
+        """Add a batch of files accepted by the background intake.
+
+        Args:
+            files: file_info dictionaries of the accepted files
+            generation: Intake generation the batch belongs to
+        """
+        if not self.file_intake.is_current(generation):
+            return  # Loaded before the last clear
+        self.loaded_files.extend(files)
+        for file_info in files:
+            file_name = os.path.basename(file_info['path'])
+            self.log_status(f"Added {ADDED_FILE_LABELS[file_info['type']]}: {file_name}")
         
         # Enable validate button if files are loaded
-        self.validate_button.setEnabled(len(self.loaded_files) > 0)
+        if self.validation_task is None:
+            self.validate_button.setEnabled(len(self.loaded_files) > 0)
+    
+    def on_intake_finished(self, stats: Dict[str, int], generation: int) -> None:
+        """Summarize a completed intake run when it skipped files.
+
+        Args:
+            stats: Counters reported by FileIntake
+            generation: Intake generation the run belongs to
+        """
+        if not self.file_intake.is_current(generation):
+            return
+        if stats['duplicates']:
+            self.log_status(f"Skipped {stats['duplicates']} file(s) already loaded")
+        if stats['skipped']:
+            self.log_status(
+                f"Skipped {stats['skipped']} file(s) in folders without a supported extension"
+            )
     
     def log_status(self, message: str, error: bool = False) -> None:
         """Add a message to the status area.
@@ -715,15 +674,16 @@ class PolicyValidatorApp(QMainWindow):
                 ⚠️ Warning
                 ❌ Error
 
-        The status area maintains a log of all operations and their results,
-        scrolling automatically to show the most recent messages.
+        The status area keeps the most recent MAX_LOG_LINES messages,
+        scrolling automatically to show the newest. Per-file validation
+        results are shown in the results table instead.
         
         Thread Safety:
-            This method must be called from the main GUI thread.
-            Use QMetaObject.invokeMethod for cross-thread logging.
+            Safe to call from any thread. Messages are queued and shown at
+            the aggregator's frame rate; identical consecutive messages are
+            collapsed into one line with a repeat count.
         """
-        color = "red" if error else "black"
-        self.status_area.append(f'<span style="color: {color};">{message}</span>')
+        self.log_aggregator.post(message, error)
     
     def validate_policies(self):
         """Validate the loaded policy documents."""
@@ -733,36 +693,55 @@ class PolicyValidatorApp(QMainWindow):
         
         self.log_status(f"Starting validation using {self.current_standard} standard...")
         
+        checked_sections = [
+            section for section, checkbox in self.section_checkboxes.items()
+            if checkbox.isChecked()
+        ]
+        if self.sandbox_pool is None:
+            # Spawned workers do not inherit the Qt threads of this process
+            self.sandbox_pool = SandboxPool(
+                initializer=warm_worker, mp_context=multiprocessing.get_context('spawn')
+            )
+        validator = SandboxedValidator(self.sandbox_pool, self.current_standard,
+                                       checked_sections)
+        
+        files = []
         for file_info in self.loaded_files:
-            file_name = os.path.basename(file_info['path'])
-            self.log_status(f"Validating {file_name}...")
-            
-            # Handle any pre-existing issues
-            if file_info['issues']:
-                for issue in file_info['issues']:
-                    self.log_status(f"⚠️ Warning: {issue}", error=True)
-            
             # Validate based on file type
-            if file_info['type'] == 'txt':
-                self._validate_text_policy(file_info)
-            elif file_info['type'] == 'pdf':
-                self._validate_pdf_policy(file_info)
-            elif file_info['type'] in ['doc', 'docx']:
-                self._validate_word_policy(file_info)
-            else:
+            if file_info['type'] not in ADDED_FILE_LABELS:
+                file_name = os.path.basename(file_info['path'])
                 self.log_status(f"❌ Cannot validate {file_name}: Unknown type", error=True)
                 continue
-            
-            # Report validation result
-            if file_info['valid']:
-                if not file_info['issues']:
-                    self.log_status(f"✅ {file_name} validated successfully")
-                else:
-                    self.log_status(f"⚠️ {file_name} validated with warnings")
-            else:
-                self.log_status(f"❌ {file_name} failed validation", error=True)
-        
-        self.log_status("Validation complete!")
+            files.append(file_info)
+        
+        # Parse and validate off the GUI thread; results arrive in batches
+        self.validate_button.setEnabled(False)
+        self.validation_task = ValidationTask(files, validator, self.log_aggregator)
+        self.validation_task.signals.finished.connect(self.on_validation_finished)
+        QThreadPool.globalInstance().start(self.validation_task)
+    
+    def closeEvent(self, event) -> None:
+        """Stop the sandboxed validation workers when the window closes."""
+        if self.validation_task is not None:
+            self.validation_task.cancel_event.set()
+        if self.sandbox_pool is not None:
+            self.sandbox_pool.shutdown(wait=False, cancel_futures=True)
+            self.sandbox_pool = None
+        super().closeEvent(event)
+
+    def on_validation_finished(self, failed: int, validated: int) -> None:
+        """Report the end of a background validation run.
+
+        Args:
+            failed: Number of files that failed validation
+            validated: Number of files validated
+        """
+        self.validation_task = None
+        self.validate_button.setEnabled(len(self.loaded_files) > 0)
+        self.log_status(
+            f"Validation complete! {failed} of {validated} file(s) failed.",
+            error=failed > 0
+        )
     
     def on_standard_changed(self, standard: str) -> None:
         """Handle change of validation standard.
@@ -800,225 +779,18 @@ class PolicyValidatorApp(QMainWindow):
                 self.section_checkboxes[section] = checkbox
                 self.sections_layout.addWidget(checkbox)
 
-    def _validate_text_policy(self, file_info: Dict[str, Any]) -> None:
-        """Validate a text-based policy file against the current standard.
-
-        Validates policy content length, required sections, and document structure
-        based on the currently selected validation standard.
-
-        Validation Steps:
-            1. Check document length against standard's minimum requirement
-            2. Verify presence of all checked required sections
-            3. Validate document structure if required by standard
-               - Looks for Markdown headers (# Section) or
-               - Numbered sections (1. Section)
-
-        Args:
-            file_info (dict): File information dictionary containing:
-                path (str): Path to the policy file
-                type (str): File type ('txt', 'pdf', 'doc', 'docx')
-                size (int): File size in bytes
-                valid (bool): Whether the file passes validation
-                issues (list): List of validation issues found
-
-        Updates:
-            - file_info['valid']: Set to False if validation fails
-            - file_info['issues']: Appends any validation issues found
-            
-        Standard Requirements:
-            NIST SP 800-53:
-                - Minimum 1000 characters
-                - Structured format required
-                - All checked sections must be present
-                - Headers must follow standard format
-
-            ISO 27001:
-                - Minimum 800 characters
-                - Structured format required
-                - All checked sections must be present
-                - Headers must follow standard format
-
-            SOC 2:
-                - Minimum 500 characters
-                - Free-form format allowed
-                - All checked sections must be present
-
-            Custom:
-                - Minimum 50 characters
-                - Free-form format allowed
-                - Selected sections must be present
-                
-        Extensibility:
-            Custom validation rules can be added by:
-            1. Adding new standards to validation_standards dict
-            2. Implementing standard-specific validation logic
-            3. Adding new section requirements
-            4. Creating custom validators for special formats
-        """
-        try:
-            with open(file_info['path'], 'r', encoding='utf-8') as f:
-                content = f.read().lower()
-            
-            standard = self.validation_standards[self.current_standard]
-            
-            # Check for empty or very short content
-            if len(content) < standard["min_length"]:
-                file_info['valid'] = False
-                file_info['issues'].append(
-                    f"Content length ({len(content)} chars) is below minimum requirement "
-                    f"({standard['min_length']} chars) for {self.current_standard}"
-                )
-                return
-            
-            # Check for required sections that are checked
-            missing_sections = []
-            for section, checkbox in self.section_checkboxes.items():
-                if checkbox.isChecked() and section not in content:
-                    missing_sections.append(section)
-            
-            if missing_sections:
-                file_info['valid'] = False
-                file_info['issues'].append(
-                    f"Missing required sections for {self.current_standard}: "
-                    f"{', '.join(missing_sections)}"
-                )
-            
-            # Check for policy structure if required by the standard
-            if standard["required_structure"]:
-                if not re.search(r'(^|\n)#+\s+\w+', content):  # Markdown headers
-                    if not re.search(r'(^|\n)\d+\.\s+\w+', content):  # Numbered lists
-                        file_info['issues'].append(
-                            f"{self.current_standard} requires clear section headers "
-                            "or structured format"
-                        )
-        
-        except Exception as e:
-            file_info['valid'] = False
-            file_info['issues'].append(f"Error validating file: {str(e)}")
-    
-    def _validate_pdf_policy(self, file_info: Dict[str, Any]) -> None:
-        """Validate a PDF policy file against the current standard.
-        
-        Extracts and analyzes text content from PDF files, checking for
-        compliance with the selected validation standard.
-        
-        Args:
-            file_info: Dictionary containing file information and validation state
-        
-        Implementation Details:
-            - Currently a basic implementation with size validation
-            - Falls back to text-based validation after basic checks
-            - Updates file_info with validation results and issues
-        
-        PDF Processing Workflow:
-            1. Basic file size sanity check
-            2. (Future) Text extraction using PyPDF2
-            3. (Future) Document structure analysis
-            4. (Future) Metadata extraction and validation
-            5. (Future) Table and image content analysis
-            
-        Error Handling:
-            - Catches all exceptions during validation
-            - Marks file as invalid on error
-            - Adds detailed error message to issues list
-            
-        Note:
-            Current implementation is a placeholder.
-            
-        TODO: Implement full PDF text extraction and validation:
-            - Extract text content using PyPDF2
-            - Process document structure (headers, sections)
-            - Handle text encoding and special characters
-            - Extract and validate document metadata
-            - Process embedded tables and structured content
-            - Handle password-protected PDFs with warning
-            - Support PDF/A validation for compliance
-        """
-        try:
-            # Basic size sanity check
-            # In a real implementation, we would extract text from PDF
-            # and validate it. For now, we'll just check file size.
-            if file_info['size'] < 1000:
-                file_info['issues'].append("PDF file is suspiciously small")
-            
-            # Simulate a basic validation using text validation
-            # This will be replaced with PDF-specific validation
-            self._validate_text_policy(file_info)
-            
-        except Exception as e:
-            # Mark file as invalid on any error
-            file_info['valid'] = False
-            file_info['issues'].append(f"Error validating PDF: {str(e)}")
-    
-    def _validate_word_policy(self, file_info: Dict[str, Any]) -> None:
-        """Validate a Word document policy file against the current standard.
-        
-        Extracts and analyzes content from Word documents (.doc, .docx), checking for
-        compliance with the selected validation standard.
-        
-        Args:
-            file_info: Dictionary containing file information and validation state
-                
-        Implementation Details:
-            - Currently a basic implementation with size validation
-            - Falls back to text-based validation after basic checks
-            - Updates file_info with validation results and issues
-            - Handles both .doc and .docx formats
-            
-        Word Document Processing Workflow:
-            1. Basic file size sanity check
-            2. (Future) Text extraction using python-docx
-            3. (Future) Document structure analysis using styles
-            4. (Future) Heading level extraction for section identification
-            5. (Future) Table and list content processing
-            
-        Error Handling:
-            - Catches all exceptions during validation
-            - Marks file as invalid on error
-            - Adds detailed error message to issues list
-            
-        Note:
-            Current implementation is a placeholder.
-            
-        Format Support:
-            - .docx: Full support using python-docx
-            - .doc: Limited support, may require conversion
-            
-        TODO: Implement full Word document processing:
-            - Extract text using python-docx library
-            - Process document structure (styles, headings)
-            - Handle rich text formatting and styles
-            - Extract headers and sections based on heading styles
-            - Process tables, lists, and other structured content
-            - Support for embedded images and diagrams
-            - Handle Word-specific features like comments and revisions
-        """
-        try:
-            # Basic size sanity check
-            # In a real implementation, we would extract text from Word doc
-            # and validate it. For now, we'll just check file size.
-            if file_info['size'] < 1000:
-                file_info['issues'].append("Word document is suspiciously small")
-            
-            # Simulate a basic validation using text validation
-            # This will be replaced with Word-specific validation
-            self._validate_text_policy(file_info)
-            
-        except Exception as e:
-            # Mark file as invalid on any error
-            file_info['valid'] = False
-            file_info['issues'].append(f"Error validating Word document: {str(e)}")
-    
     def clear_all(self) -> None:
         """Clear all loaded files and validation status.
         
         Resets the application state by:
+        - Cancelling a running validation
         - Clearing the list of loaded files
-        - Clearing the status area text
+        - Clearing the results table and status area text
         - Disabling the validate button
         - Logging a status message
         
         User Interface Effects:
+            - Results table is emptied
             - Status area is emptied except for the "All files cleared" message
             - Validate button becomes disabled until new files are loaded
             - No change to standard selection or section checkboxes
@@ -1032,10 +804,21 @@ class PolicyValidatorApp(QMainWindow):
             This provides a clean slate for users to start a new validation
             session without needing to restart the application.
         """
+        # Stop a running validation; its remaining results are discarded
+        if self.validation_task is not None:
+            self.validation_task.cancel_event.set()
+            self.validation_task.signals.finished.disconnect()
+            self.validation_task = None
+        
+        # Stop loading files and forget which files were loaded
+        self.file_intake.reset()
+        
         # Clear the internal file list
         self.loaded_files = []
         
-        # Clear the status display area
+        # Clear the results table and status display area
+        self.log_aggregator.clear()
+        self.results_view.clear()
         self.status_area.clear()
         
         # Disable the validate button since no files are loaded
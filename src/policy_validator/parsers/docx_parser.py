@@ -10,6 +10,9 @@ Example:
     text = content['text']
     headings = content['headings']
 
+    # From an in-memory copy, e.g. of an archive member
+    content = DocxParser("bundle.zip!policy.docx", stream=io.BytesIO(data)).parse()
+
 Note:
     Only supports .docx format (newer Word documents). For .doc files,
     convert to .docx first. Cannot process password-protected files.
@@ -17,6 +20,8 @@ Note:
 
 import docx
 
+from .section_index import SectionIndex
+
 
 class DocxParser:
     """Parser for .docx documents using python-docx.
@@ -26,6 +31,7 @@ class DocxParser:
 
     Attributes:
         file_path (str): Path to the .docx file
+        stream: Seekable file object read instead of file_path, if given
         document: python-docx Document object
 
     Parsing Capabilities:
@@ -40,14 +46,17 @@ class DocxParser:
         - Access permission issues
     """
     
-    def __init__(self, file_path):
+    def __init__(self, file_path, stream=None):
         """
         Initialize the DocxParser.
         
         Args:
             file_path (str): Path to the .docx file
+            stream: Seekable binary file object holding the document, read
+                instead of the file (file_path is then only a name)
         """
         self.file_path = file_path
+        self.stream = stream
         self.document = None
         
     def parse(self):
@@ -61,28 +70,40 @@ class DocxParser:
                 text (str): Full plain text of the document
                 headings (list): List of dictionaries with heading level and text
                 paragraphs (int): Total number of paragraphs
+                section_index (SectionIndex): Heading tree with text offsets
                 
         Raises:
             FileNotFoundError: If the document file cannot be found
             docx.exceptions.PackageNotFoundError: If file is not a valid .docx
             PermissionError: If file cannot be accessed due to permissions
         """
-        self.document = docx.Document(self.file_path)
+        if self.stream is not None:
+            self.stream.seek(0)
+        self.document = docx.Document(self.stream if self.stream is not None else self.file_path)
+        paragraphs = self.document.paragraphs
+        texts = [para.text for para in paragraphs]
+        
+        text = self._extract_text(texts)
+        headings = self._extract_headings(paragraphs, texts)
         
         content = {
-            'text': self._extract_text(),
-            'headings': self._extract_headings(),
-            'paragraphs': len(self.document.paragraphs),
+            'text': text,
+            'headings': headings,
+            'paragraphs': len(paragraphs),
+            'section_index': SectionIndex.from_headings(text, headings),
         }
         
         return content
     
-    def _extract_text(self):
+    def _extract_text(self, texts=None):
         """Extract full text from the document.
         
         Concatenates all paragraph text from the document into a single string,
         preserving paragraph breaks with newlines.
         
+        Args:
+            texts (list): Paragraph texts, if already extracted
+        
         Returns:
             str: Full text content of the document
             
@@ -90,31 +111,57 @@ class DocxParser:
             This method ignores text in tables, headers, footers, and text boxes.
             Only paragraph text is extracted.
         """
-        return '\n'.join([para.text for para in self.document.paragraphs])
+        if texts is None:
+            texts = [para.text for para in self.document.paragraphs]
+        return '\n'.join(texts)
     
-    def _extract_headings(self):
+    def _extract_headings(self, paragraphs=None, texts=None):
         """Extract headings from the document.
         
         Identifies paragraphs with Heading styles and extracts their level and text.
         Heading levels are determined by the style name (e.g., 'Heading 1', 'Heading 2').
         
+        Args:
+            paragraphs (list): Document paragraphs, if already listed
+            texts (list): Their texts, if already extracted
+        
         Returns:
             list: List of dictionaries containing:
                 level (int): Heading level (1 for Heading 1, etc.)
                 text (str): Heading text content
+                start (int): Offset of the heading in the extracted text
+                body_start (int): Offset of the first paragraph after it
                 
         Note:
             Only paragraphs with standard Word heading styles are detected.
             Custom styles or manually formatted headings may not be identified.
+            Offsets match _extract_text(), which joins paragraphs with newlines.
+            Style names are resolved once per style ID: python-docx searches
+            the whole style table on every lookup, which dominated parsing
+            time for long documents.
         """
+        if paragraphs is None:
+            paragraphs = self.document.paragraphs
+        if texts is None:
+            texts = [para.text for para in paragraphs]
         headings = []
+        offset = 0
+        style_names = {}
         
-        for para in self.document.paragraphs:
-            if para.style.name.startswith('Heading'):
+        for para, para_text in zip(paragraphs, texts):
+            style_id = para._p.style  # pStyle value, None for the default style
+            if style_id not in style_names:
+                style_names[style_id] = para.style.name if para.style is not None else ''
+            style_name = style_names[style_id]
+            level = style_name.replace('Heading ', '')
+            if style_name.startswith('Heading') and level.isdigit():
                 headings.append({
-                    'level': int(para.style.name.replace('Heading ', '')),
-                    'text': para.text
+                    'level': int(level),
+                    'text': para_text,
+                    'start': offset,
+                    'body_start': offset + len(para_text) + 1
                 })
+            offset += len(para_text) + 1
                 
         return headings
 
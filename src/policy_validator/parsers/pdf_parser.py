@@ -11,6 +11,20 @@ Example:
     metadata = content['metadata']
     structure = content['structure']
 
+    # Outline, page labels and metadata only; page content is not decoded
+    outline = PdfParser("policy.pdf").parse(structure_only=True)
+    top_level = [s['title'] for s in outline['structure']['sections']
+                 if s['level'] == 1]
+
+    # From an in-memory copy, e.g. of an archive member
+    content = PdfParser("bundle.zip!policy.pdf", stream=io.BytesIO(data)).parse()
+
+    # One reader for the outline and the text; pages decoded on demand
+    with PdfParser("policy.pdf") as parser:
+        outline = parser.parse(structure_only=True)
+        for page_text in parser.iter_pages():
+            ...
+
 Note:
     Text extraction quality depends on PDF format:
     - Searchable PDFs provide best results
@@ -19,8 +33,21 @@ Note:
     - Complex layouts may affect text ordering
 """
 
+import re
 import PyPDF2
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import BinaryIO, ContextManager, Dict, Iterator, List, Any, Optional
+
+from .section_index import SectionIndex
+
+# --- Heading detection constants ---
+HEADING_SIZE_RATIO = 1.15  # Font size relative to body text that marks a heading
+MAX_HEADING_LENGTH = 120   # Longer lines are treated as body text
+MAX_HEADING_LEVELS = 3     # Distinct heading font sizes mapped to levels
+TOC_SCAN_CHARS = 20000     # Leading text searched for a contents heading
+
+_TOC_HEADING_RE = re.compile(r'^[ \t]*(table of contents|contents)[ \t]*$', re.I | re.M)
 
 
 class PdfParser:
@@ -31,6 +58,7 @@ class PdfParser:
 
     Attributes:
         file_path (str): Path to the PDF file
+        stream (Optional[BinaryIO]): Seekable file object read instead of file_path
         pdf_reader: PyPDF2 PdfReader object
         
     Parsing Capabilities:
@@ -39,6 +67,11 @@ class PdfParser:
         - Page count and sizes
         - Basic structure analysis
         - Text statistics
+        - Structure-only mode (outline, page labels, metadata)
+        - Page-by-page text extraction that can stop early (iter_pages)
+
+    Used as a context manager, the file is opened once and the same reader
+    serves every parse() and iter_pages() call inside the with block.
 
     Error Handling:
         - Invalid PDF format
@@ -47,31 +80,52 @@ class PdfParser:
         - Access permission issues
     """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, stream: Optional[BinaryIO] = None):
         """Initialize the PDF parser.
         
         Args:
             file_path: Path to the PDF file to be parsed
+            stream: Seekable binary file object holding the PDF, read
+                instead of the file (file_path is then only a name). It
+                is rewound before each parse() and never closed.
             
         Note:
             The file is not opened until parse() is called to avoid
             holding file handles unnecessarily.
         """
         self.file_path = file_path
+        self.stream = stream
         self.pdf = None
+        self._file: Optional[BinaryIO] = None  # File held open by a with block
+        self._closing = ExitStack()
+        self._text = ""
+        self._line_sizes: Dict[str, float] = {}
+        self._size_chars: Counter = Counter()
+        self._section_index: Optional[SectionIndex] = None
+        self._page_offsets: List[int] = []
+        self._outline: Optional[List[Dict[str, Any]]] = None
         
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, structure_only: bool = False) -> Dict[str, Any]:
         """Parse the PDF document and extract its content.
         
         Opens and processes the PDF file, extracting text content, metadata,
         and structural information into a format suitable for policy validation.
         
+        Args:
+            structure_only: If True, read only the document outline, page
+                labels and metadata without decoding page content streams.
+                Useful for triaging large documents before full extraction.
+        
         Returns:
             dict: Document content containing:
                 text (str): Full plain text of the document
                 metadata (dict): PDF metadata (title, author, etc.)
                 structure (dict): Document structure information
                 page_count (int): Number of pages
+                section_index (SectionIndex): Heading tree with text offsets
+            In structure-only mode 'text' and 'section_index' are omitted and
+            'page_labels' (list), 'encrypted' (bool) and 'structure_only'
+            (True) are added.
                 
         Raises:
             FileNotFoundError: If the PDF file cannot be found
@@ -85,18 +139,79 @@ class PdfParser:
             - Non-standard fonts
             - Documents with security settings
         """
-        with open(self.file_path, 'rb') as file:
-            self.pdf = PyPDF2.PdfReader(file)
+        with self._reading():
+            if structure_only:
+                if self.pdf.is_encrypted:
+                    # Outline, pages and metadata are unreadable without a password
+                    return {
+                        'metadata': {},
+                        'structure': {'sections': [], 'has_toc': False, 'formatting': {}},
+                        'page_count': 0,
+                        'page_labels': [],
+                        'encrypted': True,
+                        'structure_only': True
+                    }
+                return {
+                    'metadata': self._extract_metadata(),
+                    'structure': self._analyze_structure(),
+                    'page_count': len(self.pdf.pages),
+                    'page_labels': self._extract_page_labels(),
+                    'encrypted': False,
+                    'structure_only': True
+                }
             
             content = {
                 'text': self._extract_text(),
                 'metadata': self._extract_metadata(),
                 'structure': self._analyze_structure(),
-                'page_count': len(self.pdf.pages)
+                'page_count': len(self.pdf.pages),
+                'section_index': self._build_section_index()
             }
             
         return content
     
+    def iter_pages(self) -> Iterator[str]:
+        """Yield the text of each page in turn, followed by a newline.
+
+        Pages are decoded only as they are requested, so a caller that
+        stops early skips the rest of the document. The pages joined give
+        the 'text' of parse(). Font sizes are not recorded.
+
+        Yields:
+            str: Text of the next page.
+        """
+        with self._reading():
+            for page in self.pdf.pages:
+                yield page.extract_text() + "\n"
+
+    def __enter__(self) -> "PdfParser":
+        self._file = self._closing.enter_context(self._open())
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._file = None
+        self.pdf = None
+        self._closing.close()
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        """Load self.pdf, reusing the reader of an enclosing with block."""
+        if self._file is not None:
+            if self.pdf is None:
+                self.pdf = PyPDF2.PdfReader(self._file)
+            yield
+            return
+        with self._open() as file:
+            self.pdf = PyPDF2.PdfReader(file)
+            yield
+
+    def _open(self) -> ContextManager[BinaryIO]:
+        """Open the PDF file, or rewind the stream given instead."""
+        if self.stream is None:
+            return open(self.file_path, 'rb')
+        self.stream.seek(0)
+        return nullcontext(self.stream)
+
     def _extract_text(self) -> str:
         """Extract full text content from the PDF.
         
@@ -111,16 +226,140 @@ class PdfParser:
             - Handles text encoding
             - Preserves basic whitespace
             - Attempts to maintain reading order
+            - Records font sizes per line for heading detection
             
         Note:
             Text extraction quality depends heavily on the PDF's internal
             structure and how it was created. Some formatting and layout
             information may be lost.
         """
-        text = ""
+        self._line_sizes = {}
+        self._size_chars = Counter()
+        self._page_offsets = []
+        pages = []
+        offset = 0
         for page in self.pdf.pages:
-            text += page.extract_text() + "\n"
-        return text
+            self._page_offsets.append(offset)
+            pages.append(page.extract_text(visitor_text=self._record_font_size) + "\n")
+            offset += len(pages[-1])
+        self._text = "".join(pages)
+        self._section_index = None
+        return self._text
+    
+    def _record_font_size(self, text: str, cm: List[float], tm: List[float],
+                          font_dict: Any, font_size: Optional[float]) -> None:
+        """Record the rendered font size of extracted text fragments.
+        
+        Used as the PyPDF2 ``visitor_text`` callback. The effective size
+        combines the font size with the vertical scale of the text matrix.
+        """
+        if not font_size:
+            return
+        scale = abs(tm[3]) if tm and tm[3] else 1.0
+        size = round(font_size * scale, 1)
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            self._size_chars[size] += len(line)
+            if len(line) <= MAX_HEADING_LENGTH:
+                self._line_sizes[line] = max(self._line_sizes.get(line, 0.0), size)
+    
+    def _heading_lines(self) -> Dict[str, int]:
+        """Map lines set in a heading-sized font to heading levels.
+        
+        The body font is the size covering the most characters. Larger
+        sizes are ranked, the largest becoming level 1.
+        """
+        if not self._size_chars:
+            return {}
+        body_size = self._size_chars.most_common(1)[0][0]
+        heading_sizes = sorted(
+            (size for size in self._size_chars if size >= body_size * HEADING_SIZE_RATIO),
+            reverse=True
+        )
+        levels = {size: min(rank + 1, MAX_HEADING_LEVELS)
+                  for rank, size in enumerate(heading_sizes)}
+        return {line: levels[size] for line, size in self._line_sizes.items()
+                if size in levels}
+    
+    def _build_section_index(self) -> SectionIndex:
+        """Build (once) the heading index for the extracted text.
+        
+        The document outline is preferred when present; each entry is placed
+        at its title within the destination page, or at the page start.
+        Otherwise headings are detected from the text and font sizes.
+        """
+        if self._section_index is None:
+            outline = self._extract_outline()
+            if outline and self._page_offsets:
+                headings = []
+                for entry in outline:
+                    headings.append(dict(entry, start=self._locate_outline_entry(entry)))
+                self._section_index = SectionIndex.from_headings(self._text, headings)
+            else:
+                self._section_index = SectionIndex.from_text(
+                    self._text, self._heading_lines()
+                )
+        return self._section_index
+    
+    def _locate_outline_entry(self, entry: Dict[str, Any]) -> int:
+        """Return the text offset of an outline entry's title."""
+        page = entry.get('page')
+        if page is None or page >= len(self._page_offsets):
+            page = 0
+        page_start = self._page_offsets[page]
+        page_end = (self._page_offsets[page + 1] if page + 1 < len(self._page_offsets)
+                    else len(self._text))
+        found = self._text.find(entry['title'], page_start, page_end)
+        return found if found >= 0 else page_start
+    
+    def _extract_outline(self) -> List[Dict[str, Any]]:
+        """Flatten the PDF outline (bookmarks) into heading entries.
+        
+        Reads the outline tree from the document catalog; no page content
+        is decoded.
+        
+        Returns:
+            list: Dictionaries with 'level' (1 for top-level bookmarks),
+                'title' and 'page' (zero-based, or None if unresolved)
+        """
+        if self._outline is None:
+            self._outline = []
+            try:
+                self._walk_outline(self.pdf.outline, 1)
+            except Exception:
+                # Malformed outlines are treated as missing
+                self._outline = []
+        return self._outline
+    
+    def _walk_outline(self, items: List[Any], level: int) -> None:
+        """Append outline items to self._outline, recursing into children."""
+        for item in items:
+            # PyPDF2 represents the children of an entry as a nested list
+            if isinstance(item, list):
+                self._walk_outline(item, level + 1)
+                continue
+            try:
+                page = self.pdf.get_destination_page_number(item)
+            except Exception:
+                page = None
+            self._outline.append({
+                'level': level,
+                'title': str(item.title).strip(),
+                'page': page
+            })
+    
+    def _extract_page_labels(self) -> List[str]:
+        """Return the page labels (e.g. "i", "ii", "1") for each page.
+        
+        Note:
+            Falls back to an empty list when labels cannot be read.
+        """
+        try:
+            return list(self.pdf.page_labels)
+        except Exception:
+            return []
     
     def _extract_metadata(self) -> Dict[str, str]:
         """Extract document metadata from the PDF.
@@ -176,9 +415,14 @@ class PdfParser:
         Note:
             Section detection is heuristic and may not identify all
             sections or may incorrectly identify some text as sections.
+            The document outline is used when present, which works in
+            structure-only mode. Otherwise numbered and Markdown-style
+            headings are detected in the text, along with lines set in a
+            larger font than the body.
         """
-        # TODO: Implement section detection
-        return []
+        if self._text:
+            return self._build_section_index().headings
+        return list(self._extract_outline())
     
     def _has_table_of_contents(self) -> bool:
         """Check if the document has a table of contents.
@@ -188,10 +432,13 @@ class PdfParser:
             
         Note:
             Detection is based on content analysis and may not be
-            100% accurate.
+            100% accurate. A document outline counts as a table of
+            contents; otherwise the leading text is searched for a
+            "Contents" heading once text has been extracted.
         """
-        # TODO: Implement TOC detection
-        return False
+        if self._extract_outline():
+            return True
+        return bool(_TOC_HEADING_RE.search(self._text[:TOC_SCAN_CHARS]))
     
     def _analyze_formatting(self) -> Dict[str, Any]:
         """Analyze document formatting characteristics.
@@ -0,0 +1,443 @@
+"""Heading index shared by all document parsers.
+
+This module builds a heading tree with character offsets once per document,
+so validators can check section presence, nesting and body length without
+rescanning the text.
+
+Each heading is stored as a dictionary:
+    {
+        'level': int,       # 1 for top-level headings
+        'title': str,       # Heading text without markers or numbering
+        'start': int,       # Offset of the heading line in the text
+        'body_start': int,  # Offset just after the heading line
+        'end': int,         # Offset where the next same-or-higher heading starts
+        'parent': int       # Index of the parent heading, or -1
+    }
+
+Supported Sources:
+    - Plain text / Markdown: ATX headers ("## Title") and numbered
+      headings ("1. Title", "2.3 Title")
+    - DOCX: Heading styles reported by DocxParser
+    - PDF: Lines set in a larger font than the body text, or the outline
+
+Example:
+    >>> index = SectionIndex.from_text("# Access Control\\nUsers must...\\n")
+    >>> index.has_section("access control", min_body_chars=5)
+    True
+    >>> index.section_at(20)['title']
+    'Access Control'
+
+Performance Considerations:
+    - Offsets are kept in a sorted list, so section_at() is a binary search.
+    - Section-name lookups resolve every heading title once per matcher and
+      then answer from a dictionary.
+    - HeadingTracker gives the same heading checks over text read in
+      chunks, keeping only the open headings rather than the whole tree.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..utils.text_normalizer import SectionMatcher, normalize_text
+
+# --- Heading patterns ---
+_MARKDOWN_HEADING_RE = re.compile(r"^(?P<marks>#{1,6})[ \t]+(?P<title>\w.*?)[ \t#]*$", re.M)
+_NUMBERED_HEADING_RE = re.compile(
+    r"^[ \t]*(?P<number>\d+\.(?:\d+\.?)*)[ \t]+(?P<title>\w.*?)[ \t]*$", re.M
+)
+# Line breaks followed by a line that can be a heading; searched for quickly
+# since the pattern starts with a literal
+_HEADING_LINE_BREAK_RE = re.compile(r"\n(?=#|[ \t]*\d)")
+MAX_TITLE_CHARS = 4096  # Characters of a line kept by HeadingTracker for its title
+
+
+class SectionIndex:
+    """Heading tree of a document with character offsets.
+
+    Attributes:
+        headings (List[Dict[str, Any]]): Headings in document order
+        text_length (int): Length of the indexed text
+    """
+
+    def __init__(self, headings: List[Dict[str, Any]], text_length: int):
+        """Initialize the index from headings sorted by offset.
+
+        Args:
+            headings: Dictionaries with 'level', 'title', 'start' and
+                'body_start' keys. 'end' and 'parent' are computed here.
+            text_length: Length of the indexed text, used as the end of the
+                last sections.
+        """
+        self.headings = sorted(headings, key=lambda h: h['start'])
+        self.text_length = text_length
+        self._starts = [h['start'] for h in self.headings]
+        self._matches: Dict[int, Dict[str, List[int]]] = {}
+        self._link_headings()
+
+    def _link_headings(self) -> None:
+        """Compute section end offsets and parent links with a level stack."""
+        stack: List[int] = []
+        for position, heading in enumerate(self.headings):
+            heading['end'] = self.text_length
+            while stack and self.headings[stack[-1]]['level'] >= heading['level']:
+                self.headings[stack.pop()]['end'] = heading['start']
+            heading['parent'] = stack[-1] if stack else -1
+            stack.append(position)
+
+    # --- Builders ---
+
+    @classmethod
+    def from_text(cls, text: str,
+                  heading_lines: Optional[Dict[str, int]] = None) -> "SectionIndex":
+        """Build an index from plain text or Markdown.
+
+        Args:
+            text: Document text.
+            heading_lines: Optional mapping of stripped line text to heading
+                level, used for headings detected outside the text itself
+                (e.g. from PDF font sizes). Matching lines are indexed.
+
+        Returns:
+            SectionIndex: Index of Markdown, numbered and supplied headings.
+        """
+        headings = _find_headings(text)
+        seen = {heading['start'] for heading in headings}
+
+        if heading_lines:
+            offset = 0
+            for line in text.splitlines(keepends=True):
+                level = heading_lines.get(line.strip())
+                if level is not None and offset not in seen:
+                    headings.append({
+                        'level': level,
+                        'title': line.strip(),
+                        'start': offset,
+                        'body_start': offset + len(line),
+                    })
+                offset += len(line)
+
+        return cls(headings, len(text))
+
+    @classmethod
+    def from_headings(cls, text: str, headings: List[Dict[str, Any]]) -> "SectionIndex":
+        """Build an index from parser-reported headings with offsets.
+
+        Args:
+            text: Document text the offsets refer to.
+            headings: Dictionaries with 'level', 'text' (or 'title'), 'start'
+                and optionally 'body_start' keys, as produced by DocxParser.
+
+        Returns:
+            SectionIndex: Index over the given headings.
+        """
+        entries = []
+        for heading in headings:
+            title = heading.get('title', heading.get('text', ''))
+            entries.append({
+                'level': heading['level'],
+                'title': title.strip(),
+                'start': heading['start'],
+                'body_start': heading.get('body_start', heading['start'] + len(title)),
+            })
+        return cls(entries, len(text))
+
+    # --- Lookups ---
+
+    def __len__(self) -> int:
+        return len(self.headings)
+
+    def section_at(self, offset: int) -> Optional[Dict[str, Any]]:
+        """Return the innermost heading whose section contains an offset.
+
+        Args:
+            offset: Character offset into the indexed text.
+
+        Returns:
+            dict: Heading entry, or None if the offset precedes all headings.
+        """
+        position = bisect_right(self._starts, offset) - 1
+        while position >= 0:
+            heading = self.headings[position]
+            if offset < heading['end']:
+                return heading
+            position = heading['parent']
+        return None
+
+    def children(self, heading: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the direct subsections of a heading.
+
+        Args:
+            heading: Heading entry from this index.
+
+        Returns:
+            list: Child heading entries in document order.
+        """
+        position = bisect_right(self._starts, heading['start']) - 1
+        return [h for h in self.headings[position + 1:]
+                if h['start'] < heading['end'] and h['parent'] == position]
+
+    def find_section(self, section: str,
+                     matcher: Optional[SectionMatcher] = None) -> Optional[Dict[str, Any]]:
+        """Find the first heading naming a section.
+
+        Args:
+            section: Section name (e.g. "access control").
+            matcher: Optional standard matcher so synonyms and control IDs
+                in heading titles are recognized. Without one, the
+                normalized section name must appear in the title.
+
+        Returns:
+            dict: First matching heading entry, or None.
+        """
+        if matcher is None:
+            needle = normalize_text(section)
+            for heading in self.headings:
+                if needle in normalize_text(heading['title']):
+                    return heading
+            return None
+
+        positions = self._section_positions(matcher).get(section)
+        return self.headings[positions[0]] if positions else None
+
+    def has_section(self, section: str, min_body_chars: int = 0,
+                    matcher: Optional[SectionMatcher] = None) -> bool:
+        """Check that a section exists as a heading with enough body text.
+
+        Args:
+            section: Section name to look for.
+            min_body_chars: Minimum characters between the heading line and
+                the end of its section, subsections included.
+            matcher: Optional standard matcher for synonym-aware lookups.
+
+        Returns:
+            bool: True if a matching heading has at least min_body_chars.
+        """
+        if matcher is None:
+            heading = self.find_section(section)
+            return heading is not None and self.body_length(heading) >= min_body_chars
+
+        for position in self._section_positions(matcher).get(section, []):
+            if self.body_length(self.headings[position]) >= min_body_chars:
+                return True
+        return False
+
+    def empty_sections(self, sections: Iterable[str], min_body_chars: int,
+                       matcher: Optional[SectionMatcher] = None) -> List[str]:
+        """List the sections that have headings, none of them with enough body.
+
+        Args:
+            sections: Section names to check, in reporting order.
+            min_body_chars: Minimum body characters, as for has_section().
+            matcher: Optional standard matcher for synonym-aware lookups.
+
+        Returns:
+            List[str]: Sections with a heading but fewer than min_body_chars
+            under every heading naming them. Sections without a heading are
+            not listed.
+        """
+        return [section for section in sections
+                if self.find_section(section, matcher) is not None
+                and not self.has_section(section, min_body_chars, matcher)]
+
+    @staticmethod
+    def body_length(heading: Dict[str, Any]) -> int:
+        """Return the number of body characters under a heading."""
+        return max(0, heading['end'] - heading['body_start'])
+
+    def _section_positions(self, matcher: SectionMatcher) -> Dict[str, List[int]]:
+        """Resolve every heading title against a matcher once and cache it."""
+        key = id(matcher)
+        if key not in self._matches:
+            positions: Dict[str, List[int]] = {}
+            for position, heading in enumerate(self.headings):
+                for section in matcher.find_sections(normalize_text(heading['title'])):
+                    positions.setdefault(section, []).append(position)
+            self._matches[key] = positions
+        return self._matches[key]
+
+
+class HeadingTracker:
+    """Heading checks of SectionIndex.from_text() over text fed in chunks.
+
+    Tracks whether the text has a heading and, for every section named by
+    a heading title, the longest body under such a heading, so
+    empty_sections() answers as SectionIndex.empty_sections() would for the
+    whole text. Only the open headings and the start of the unfinished line
+    are kept; titles are read from the first MAX_TITLE_CHARS characters of
+    their line.
+
+    Example:
+        >>> tracker = HeadingTracker(matcher, ["access control"], 20)
+        >>> for chunk in chunks:
+        ...     tracker.feed(chunk)
+        >>> tracker.finish()
+        >>> tracker.has_headings, tracker.empty_sections()
+        (True, [])
+
+    Attributes:
+        has_headings (bool): Whether a heading line was found
+    """
+
+    def __init__(self, matcher: SectionMatcher, sections: Iterable[str],
+                 min_body_chars: int = 0):
+        """Initialize the tracker.
+
+        Args:
+            matcher: Standard matcher resolving heading titles to sections.
+            sections: Sections reported by empty_sections(), in order.
+            min_body_chars: Minimum body characters, as for has_section().
+        """
+        self.matcher = matcher
+        self.sections = list(sections)
+        self.min_body_chars = min_body_chars
+        self.has_headings = False
+        self._bodies: Dict[str, int] = {}  # Longest body of each section's closed headings
+        self._open: List[Tuple[int, int, FrozenSet[str]]] = []  # (level, body_start, sections)
+        self._line = ""       # Start of the unfinished line
+        self._line_start = 0  # Offset of the unfinished line
+        self._length = 0      # Characters fed so far
+
+    def feed(self, chunk: str) -> None:
+        """Track the headings of the next piece of text."""
+        last_newline = chunk.rfind('\n')
+        if last_newline < 0:
+            self._line += chunk[:MAX_TITLE_CHARS - len(self._line)]
+            self._length += len(chunk)
+            return
+
+        # The line continued from earlier pieces, then this piece's own lines
+        first_newline = chunk.find('\n')
+        head = chunk[:min(first_newline, MAX_TITLE_CHARS - len(self._line))]
+        self._add_line(self._line + head, self._line_start, self._length + first_newline)
+        for line_break in _HEADING_LINE_BREAK_RE.finditer(chunk, first_newline, last_newline):
+            start = line_break.end()
+            end = chunk.find('\n', start)
+            self._add_line(chunk[start:end], self._length + start, self._length + end)
+
+        self._line = chunk[last_newline + 1:last_newline + 1 + MAX_TITLE_CHARS]
+        self._line_start = self._length + last_newline + 1
+        self._length += len(chunk)
+
+    def finish(self, length: Optional[int] = None) -> None:
+        """Close the headings still open at the end of the text.
+
+        Args:
+            length: Length of the text, if its headings were given to add()
+                rather than fed.
+        """
+        if self._line:
+            self._add_line(self._line, self._line_start, self._length)
+            self._line = ""
+        if length is not None:
+            self._length = length
+        while self._open:
+            self._close(self._open.pop(), self._length)
+
+    def add(self, level: int, sections: FrozenSet[str], start: int, body_start: int) -> None:
+        """Record a heading found by the caller, in document order.
+
+        Args:
+            level: Heading level, 1 for top-level headings.
+            sections: Sections the heading title names.
+            start: Offset of the heading line.
+            body_start: Offset just after the heading line.
+        """
+        self.has_headings = True
+        while self._open and self._open[-1][0] >= level:
+            self._close(self._open.pop(), start)
+        self._open.append((level, body_start, sections))
+
+    @property
+    def settled(self) -> bool:
+        """Whether more text cannot change the results.
+
+        True once a heading was found and every section has a heading with
+        at least min_body_chars of body.
+        """
+        if not self.has_headings:
+            return False
+        qualified = {section for section, body in self._bodies.items()
+                     if body >= self.min_body_chars}
+        # The unfinished line may be a heading that closes the open ones
+        for _, body_start, sections in self._open:
+            if self._line_start - body_start >= self.min_body_chars:
+                qualified |= sections
+        return all(section in qualified for section in self.sections)
+
+    def empty_sections(self) -> List[str]:
+        """List the sections with headings, none of them with enough body.
+
+        Call finish() first.
+        """
+        return [section for section in self.sections
+                if self._bodies.get(section, self.min_body_chars) < self.min_body_chars]
+
+    def _add_line(self, line: str, start: int, end: int) -> None:
+        heading = parse_heading(line)
+        if heading is not None:
+            # A heading line's match always extends to the end of the line
+            self.add(heading[0], self._sections_of(heading[1]), start, end)
+
+    def _sections_of(self, title: str) -> FrozenSet[str]:
+        return frozenset(self.matcher.find_sections(normalize_text(title)))
+
+    def _close(self, heading: Tuple[int, int, FrozenSet[str]], end: int) -> None:
+        _, body_start, sections = heading
+        body = max(0, end - body_start)
+        for section in sections:
+            self._bodies[section] = max(body, self._bodies.get(section, 0))
+
+
+def _find_headings(text: str) -> List[Dict[str, Any]]:
+    """Markdown and numbered headings of text, in document order."""
+    headings = []
+    seen = set()
+    for match in _MARKDOWN_HEADING_RE.finditer(text):
+        headings.append(_heading(len(match.group('marks')), match.group('title'), match))
+        seen.add(match.start())
+    for match in _NUMBERED_HEADING_RE.finditer(text):
+        if match.start() not in seen:
+            level = len([p for p in match.group('number').split('.') if p])
+            headings.append(_heading(level, match.group('title'), match))
+    headings.sort(key=lambda h: h['start'])
+    return headings
+
+
+def _heading(level: int, title: str, match: "re.Match") -> Dict[str, Any]:
+    """Create a heading entry from a regex match of the heading line."""
+    return {
+        'level': level,
+        'title': title.strip(),
+        'start': match.start(),
+        'body_start': match.end(),
+    }
+
+
+def parse_heading(line: str) -> Optional[Tuple[int, str]]:
+    """Return the level and title of a Markdown or numbered heading line.
+
+    Args:
+        line: One line of text, without its newline.
+
+    Returns:
+        tuple: (level, title), or None if the line is not a heading.
+    """
+    match = _MARKDOWN_HEADING_RE.match(line)
+    if match:
+        return len(match.group('marks')), match.group('title').strip()
+    match = _NUMBERED_HEADING_RE.match(line)
+    if match:
+        level = len([p for p in match.group('number').split('.') if p])
+        return level, match.group('title').strip()
+    return None
+
+
+def contains_heading(text: str) -> bool:
+    """Whether text has a Markdown or numbered heading line.
+
+    Equivalent to ``bool(SectionIndex.from_text(text).headings)`` without
+    building the index. Whether a line is a heading depends only on its
+    start, so a long line may be passed truncated.
+    """
+    return bool(_MARKDOWN_HEADING_RE.search(text) or _NUMBERED_HEADING_RE.search(text))
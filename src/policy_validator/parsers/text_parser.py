@@ -0,0 +1,201 @@
+"""Streaming reader for plain text and Markdown policies.
+
+Text policies can be exports of whole wikis, hundreds of megabytes in
+size. This module reads them through a memory map in fixed-size chunks and
+runs every content check incrementally, so memory use is bounded by the
+chunk size rather than the file size:
+
+    - The encoding is detected from a BOM or the first bytes of the map
+      (see utils.encoding), then the bytes are decoded incrementally with
+      universal newline translation, as open() in text mode would.
+    - Each chunk is lowercased and measured, then normalized by a
+      ChunkNormalizer and fed to a SectionScanner, which carry whitespace
+      runs and unfinished matches over chunk boundaries.
+    - Headings are tracked by a HeadingTracker, which sees complete lines
+      only; the start of an unfinished line is carried into the next chunk.
+
+The results equal those of checking the whole decoded, lowercased text at
+once. Scanning stops as soon as further text cannot change them. Text that
+is not a file on disk, such as an archive member, is read from a binary
+stream in the same chunks instead of a memory map.
+
+Example:
+    >>> parser = TextParser("wiki-export.md")
+    >>> scan = parser.scan(get_section_matcher("ISO 27001"), ["access control"],
+    ...                    min_length=500, check_structure=True, min_section_body=20)
+    >>> scan['length'], scan['sections'], scan['has_headings'], scan['empty_sections']
+    (182734112, {'access control'}, True, [])
+"""
+
+import io
+import mmap
+import os
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional
+
+from .section_index import HeadingTracker
+from ..utils import instrumentation
+from ..utils.encoding import PREFIX_SIZE, StreamDecoder, detect_encoding
+from ..utils.text_normalizer import ChunkNormalizer, SectionMatcher
+
+# --- Constants ---
+CHUNK_SIZE = 1024 * 1024   # Bytes decoded per step
+
+
+class TextParser:
+    """Chunked reader for text policies in any supported encoding.
+
+    Attributes:
+        file_path (str): Path to the text file
+        stream (Optional[BinaryIO]): File object read instead of file_path
+        chunk_size (int): Bytes decoded per chunk
+        encoding (Optional[str]): Encoding the text was decoded with, once read
+        replaced (bool): Whether invalid bytes were replaced while decoding
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = CHUNK_SIZE,
+                 stream: Optional[BinaryIO] = None):
+        """Initialize the parser.
+
+        Args:
+            file_path: Path to the text file.
+            chunk_size: Bytes decoded per chunk.
+            stream: Binary file object positioned at the start of the
+                text, read sequentially instead of the file (file_path is
+                then only a name). It is not closed.
+        """
+        self.file_path = file_path
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.encoding: Optional[str] = None
+        self.replaced = False
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the decoded text in consecutive chunks.
+
+        Undecodable bytes never raise; they are replaced and flagged in
+        the replaced attribute.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if self.stream is not None:
+            yield from self._iter_stream_chunks(self.stream)
+            return
+        with open(self.file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with instrumentation.stage('encoding_detection', min(size, PREFIX_SIZE)):
+                    encoding, bom_length = detect_encoding(mapped[:PREFIX_SIZE])
+                stream_decoder = StreamDecoder(encoding)
+                decoder = io.IncrementalNewlineDecoder(stream_decoder, translate=True)
+                self.encoding = encoding
+                # Chunks stay page-aligned; the BOM is cut from the first one
+                for offset in range(0, size, self.chunk_size):
+                    with instrumentation.stage('read') as stage:
+                        data = mapped[max(offset, bom_length):offset + self.chunk_size]
+                        stage.add_bytes(len(data))
+                        text = decoder.decode(data, final=offset + self.chunk_size >= size)
+                        _release(mapped, offset, min(self.chunk_size, size - offset))
+                    self.encoding = stream_decoder.encoding
+                    self.replaced = stream_decoder.replaced
+                    yield text
+
+    def _iter_stream_chunks(self, stream: BinaryIO) -> Iterator[str]:
+        """Decode a binary stream read sequentially in chunks."""
+        prefix = stream.read(PREFIX_SIZE)
+        if not prefix:
+            return
+        with instrumentation.stage('encoding_detection', len(prefix)):
+            encoding, bom_length = detect_encoding(prefix)
+        stream_decoder = StreamDecoder(encoding)
+        decoder = io.IncrementalNewlineDecoder(stream_decoder, translate=True)
+        self.encoding = encoding
+        carry = prefix[bom_length:]
+        while True:
+            with instrumentation.stage('read') as stage:
+                data = carry + stream.read(max(0, self.chunk_size - len(carry)))
+                carry = b''
+                stage.add_bytes(len(data))
+                text = decoder.decode(data, final=not data)
+            self.encoding = stream_decoder.encoding
+            self.replaced = stream_decoder.replaced
+            yield text
+            if not data:
+                return
+
+    def scan(self, matcher: SectionMatcher, sections: Iterable[str],
+             min_length: int = 0, check_structure: bool = False,
+             min_section_body: int = 0) -> Dict[str, Any]:
+        """Measure the text, find sections and detect headings in one pass.
+
+        Args:
+            matcher: Section matcher of the standard.
+            sections: Sections to look for.
+            min_length: Minimum length of the lowercased text; once reached
+                (and everything else is settled) reading stops early.
+            check_structure: Also detect Markdown or numbered headings, and
+                sections whose headings have too little body text.
+            min_section_body: Body characters a section heading needs, as
+                for SectionIndex.empty_sections().
+
+        Returns:
+            dict: Scan results:
+                length (int): Characters of the lowercased text read; at
+                    least min_length if reading stopped early
+                sections (Set[str]): Sections found
+                has_headings (Optional[bool]): Whether a heading line was
+                    found, or None if check_structure is False
+                empty_sections (Optional[List[str]]): Sections whose
+                    headings all have less than min_section_body characters
+                    of body, or None if check_structure is False
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        sections = list(sections)
+        scanner = matcher.scanner(sections)
+        normalizer = ChunkNormalizer()
+        tracker = (HeadingTracker(matcher, sections, min_section_body)
+                   if check_structure else None)
+        length = 0
+
+        for chunk in self.iter_chunks():
+            with instrumentation.stage('lowercase', len(chunk)):
+                chunk = chunk.lower()
+            length += len(chunk)
+            if tracker is not None:
+                with instrumentation.stage('structure', len(chunk)):
+                    tracker.feed(chunk)
+            if not scanner.done:
+                with instrumentation.stage('normalize', len(chunk)):
+                    normalized = normalizer.normalize(chunk)
+                with instrumentation.stage('section_match', len(normalized)):
+                    scanner.feed(normalized)
+            # The rest of the text cannot change any result
+            if scanner.done and length >= min_length \
+                    and (tracker is None or tracker.settled):
+                break
+
+        with instrumentation.stage('section_match'):
+            scanner.feed(normalizer.finish())
+            found = scanner.finish()
+        if tracker is None:
+            return {'length': length, 'sections': found, 'has_headings': None,
+                    'empty_sections': None}
+        with instrumentation.stage('structure'):
+            tracker.finish()
+        return {'length': length, 'sections': found, 'has_headings': tracker.has_headings,
+                'empty_sections': tracker.empty_sections()}
+
+
+def _release(mapped: mmap.mmap, offset: int, length: int) -> None:
+    """Drop pages already decoded from the process's resident set.
+
+    Mapped file pages count towards the resident memory of the process
+    until released, so without this a full scan would grow to the file size.
+    """
+    if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_DONTNEED') \
+            and offset % mmap.PAGESIZE == 0:
+        mapped.madvise(mmap.MADV_DONTNEED, offset, length)
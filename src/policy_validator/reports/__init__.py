@@ -0,0 +1,8 @@
+"""
+Machine-readable validation reports.
+
+This package writes validation results in formats consumed by pipelines,
+code-scanning dashboards and CI systems.
+"""
+
+from .writers import REPORT_FORMATS, ReportWriter, open_report
@@ -0,0 +1,350 @@
+"""Streaming report writers for validation results.
+
+This module writes validation results as they are produced in JSONL, JSON,
+SARIF 2.1.0 and JUnit XML. Writers never hold the run in memory: each
+result is serialized and written on arrival, and only running totals are
+kept, so a report of 100,000 findings is written at constant memory.
+
+Formats:
+    jsonl:  One result object per line.
+    json:   {"results": [...], "summary": {...}}; the array is streamed and
+            the summary is written on close.
+    sarif:  SARIF 2.1.0 log for code-scanning dashboards. Every missing
+            section and every other issue is one SARIF result located at
+            the document. Issues that do not fail validation are warnings.
+    junit:  JUnit XML with one test case per document, classed by standard;
+            failed documents carry a <failure> listing their issues.
+
+Example:
+    >>> with open_report("report.sarif") as report:
+    ...     for path in paths:
+    ...         report.write(validate_policy(path, "ISO"))
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Tuple
+from urllib.parse import quote
+from xml.sax.saxutils import escape, quoteattr
+
+from .. import __version__
+
+# --- Constants ---
+REPORT_FORMATS = ('jsonl', 'json', 'sarif', 'junit')
+FORMAT_EXTENSIONS = {
+    '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'json',
+    '.sarif': 'sarif', '.xml': 'junit'
+}
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "policy-validator"
+TOOL_URI = "https://github.com/Nishanthc08/policy-validator"
+JUNIT_SPOOL_BYTES = 4 * 1024 * 1024  # Test cases kept in memory before spooling to disk
+
+# SARIF rules: (id, issue pattern, level, description). The first matching
+# pattern classifies an issue; missing sections are reported per section.
+# Issues of a valid result are at most warnings, whatever their rule.
+SARIF_RULES: List[Tuple[str, Optional[str], str, str]] = [
+    ('missing-section', None, 'error',
+     "A section required by the validation standard is missing"),
+    ('empty-file', r'^File is empty', 'error', "The policy document is empty"),
+    ('min-length', r'below minimum requirement', 'error',
+     "The policy document is shorter than the standard requires"),
+    ('small-document', r'suspiciously small', 'warning',
+     "The document file is smaller than a policy document usually is"),
+    ('structure', r'requires clear section headers', 'warning',
+     "The policy document has no recognizable section headings"),
+    ('empty-section', r'^Section headings without body text', 'warning',
+     "Headings of a section have no body text under them"),
+    ('undecodable-text', r'undecodable bytes were replaced', 'warning',
+     "The text has bytes that are not valid in its encoding"),
+    ('extension-mismatch', r"^Extension .* doesn't match", 'warning',
+     "The file extension does not match the file content"),
+    ('unsupported-file', r'^Unsupported|not supported', 'error',
+     "The file type cannot be validated"),
+    ('unreadable-file', r'password-protected|no pages|^Could not read|^Error', 'error',
+     "The document could not be read"),
+    ('validation-issue', r'', 'error', "Other validation issue"),
+]
+_MISSING_SECTIONS_PREFIX = "Missing required sections for "
+_RULE_PATTERNS = [(rule_id, re.compile(pattern), level)
+                  for rule_id, pattern, level, _ in SARIF_RULES if pattern is not None]
+_RULE_INDEX = {rule[0]: index for index, rule in enumerate(SARIF_RULES)}
+# Characters XML 1.0 does not allow even when escaped (e.g. NUL, form feed)
+_XML_ILLEGAL_RE = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+
+class ReportWriter:
+    """Base class of streaming report writers.
+
+    Subclasses implement _write_header(), _write_result() and
+    _write_footer(). Writers are context managers; close() finishes the
+    report and closes the stream if the writer opened it.
+
+    Attributes:
+        total (int): Results written
+        failed (int): Results that failed validation
+        issues (int): Issues across all results
+    """
+
+    format = ''
+
+    def __init__(self, stream: IO[str], close_stream: bool = False):
+        """Initialize the writer and write the report header.
+
+        Args:
+            stream: Text stream receiving the report.
+            close_stream: Close the stream when the writer is closed.
+        """
+        self.stream = stream
+        self.close_stream = close_stream
+        self.total = 0
+        self.failed = 0
+        self.issues = 0
+        self._closed = False
+        self._write_header()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """Write one validation result to the report."""
+        self._write_result(result)
+        self.total += 1
+        self.issues += len(result.get('issues', []))
+        if not result.get('valid'):
+            self.failed += 1
+
+    def summary(self) -> Dict[str, int]:
+        """Return the running totals."""
+        return {'total': self.total, 'failed': self.failed,
+                'passed': self.total - self.failed, 'issues': self.issues}
+
+    def close(self) -> None:
+        """Finish the report; further writes are not allowed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._write_footer()
+        self.stream.flush()
+        if self.close_stream:
+            self.stream.close()
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _write_footer(self) -> None:
+        pass
+
+
+class JsonlReportWriter(ReportWriter):
+    """Write one JSON object per result and line."""
+
+    format = 'jsonl'
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(result, default=str) + '\n')
+
+
+class JsonReportWriter(ReportWriter):
+    """Write a JSON document with a streamed results array and a summary."""
+
+    format = 'json'
+
+    def _write_header(self) -> None:
+        self.stream.write('{"results": [')
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        self.stream.write((',\n  ' if self.total else '\n  ') + json.dumps(result, default=str))
+
+    def _write_footer(self) -> None:
+        self.stream.write('\n], "summary": ' + json.dumps(self.summary()) + '}\n')
+
+
+def _artifact_uri(path: str) -> str:
+    """Return a SARIF artifact URI for a document path.
+
+    Relative paths are percent-encoded like absolute ones, so spaces and
+    the "!" of archive member paths (see utils.archives) make valid URIs.
+    """
+    if os.path.isabs(path):
+        return Path(path).as_uri()
+    return quote(os.fsencode(Path(path).as_posix()))
+
+
+def _xml_text(value: Any) -> str:
+    """Return a value as text with the characters XML cannot represent removed."""
+    return _XML_ILLEGAL_RE.sub('', str(value))
+
+
+def classify_issue(issue: str, valid: bool = False) -> Tuple[str, str]:
+    """Return the SARIF (rule id, level) of a validation issue message.
+
+    Args:
+        issue: Issue message of a validation result.
+        valid: Whether the result passed validation, making the issue a
+            warning whatever its rule.
+    """
+    for rule_id, pattern, level in _RULE_PATTERNS:
+        if pattern.search(issue):
+            return rule_id, 'warning' if valid else level
+    return 'validation-issue', 'warning' if valid else 'error'
+
+
+class SarifReportWriter(ReportWriter):
+    """Write a SARIF 2.1.0 log with one result per finding."""
+
+    format = 'sarif'
+
+    def _write_header(self) -> None:
+        rules = [{
+            'id': rule_id,
+            'shortDescription': {'text': description},
+            'defaultConfiguration': {'level': level}
+        } for rule_id, _, level, description in SARIF_RULES]
+        driver = {'name': TOOL_NAME, 'version': __version__,
+                  'informationUri': TOOL_URI, 'rules': rules}
+        header = json.dumps({'$schema': SARIF_SCHEMA, 'version': '2.1.0'})[:-1]
+        self.stream.write(header + ', "runs": [{"tool": ' + json.dumps({'driver': driver})
+                          + ', "results": [')
+        self._findings = 0
+
+    def _findings_of(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the SARIF results for one validation result."""
+        standard = result.get('standard', 'Custom')
+        location = [{'physicalLocation': {
+            'artifactLocation': {'uri': _artifact_uri(result.get('path', ''))}
+        }}]
+        findings = []
+        sections = result.get('sections') or {}
+        for section, present in sections.items():
+            if not present:
+                findings.append(self._finding(
+                    'missing-section', 'error',
+                    f"Missing required section for {standard}: {section}",
+                    location, {'standard': standard, 'section': section}))
+        for issue in result.get('issues', []):
+            if sections and issue.startswith(_MISSING_SECTIONS_PREFIX):
+                continue  # Reported per section above
+            rule_id, level = classify_issue(issue, bool(result.get('valid')))
+            findings.append(self._finding(rule_id, level, issue, location,
+                                          {'standard': standard}))
+        return findings
+
+    @staticmethod
+    def _finding(rule_id: str, level: str, message: str,
+                 locations: List[Dict[str, Any]], properties: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'ruleId': rule_id,
+            'ruleIndex': _RULE_INDEX[rule_id],
+            'level': level,
+            'message': {'text': message},
+            'locations': locations,
+            'properties': properties
+        }
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        for finding in self._findings_of(result):
+            self.stream.write((',\n' if self._findings else '\n') + json.dumps(finding))
+            self._findings += 1
+
+    def _write_footer(self) -> None:
+        self.stream.write('\n], "properties": ' + json.dumps(self.summary()) + '}]}\n')
+
+
+class JUnitReportWriter(ReportWriter):
+    """Write JUnit XML with one test case per validated document.
+
+    The <testsuite> element carries test and failure counts, which are only
+    known at the end, so test cases are spooled to a temporary file (in
+    memory up to JUNIT_SPOOL_BYTES) and copied behind the header on close.
+    """
+
+    format = 'junit'
+
+    def _write_header(self) -> None:
+        self._spool = tempfile.SpooledTemporaryFile(
+            max_size=JUNIT_SPOOL_BYTES, mode='w+', encoding='utf-8')
+        self._elapsed = 0.0
+
+    def _write_result(self, result: Dict[str, Any]) -> None:
+        elapsed = (result.get('elapsed_ms') or 0) / 1000
+        self._elapsed += elapsed
+        issues = result.get('issues', [])
+        classname = quoteattr(_xml_text(result.get('standard', 'Custom')))
+        name = quoteattr(_xml_text(result.get('path', '')))
+        case = f'  <testcase classname={classname} name={name} time="{elapsed:.3f}"'
+        if result.get('valid') and not issues:
+            self._spool.write(case + '/>\n')
+            return
+        body = escape(_xml_text('\n'.join(issues)))
+        if result.get('valid'):
+            self._spool.write(f'{case}>\n    <system-out>{body}</system-out>\n  </testcase>\n')
+        else:
+            message = quoteattr(_xml_text(issues[0]) if issues else "Validation failed")
+            self._spool.write(f'{case}>\n    <failure message={message} type="PolicyValidation">'
+                              f'{body}</failure>\n  </testcase>\n')
+
+    def _write_footer(self) -> None:
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self.stream.write(
+            f'<testsuite name="{TOOL_NAME}" tests="{self.total}" failures="{self.failed}" '
+            f'errors="0" skipped="0" time="{self._elapsed:.3f}">\n')
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, self.stream)
+        self._spool.close()
+        self.stream.write('</testsuite>\n</testsuites>\n')
+
+
+_WRITERS = {
+    'jsonl': JsonlReportWriter,
+    'json': JsonReportWriter,
+    'sarif': SarifReportWriter,
+    'junit': JUnitReportWriter,
+}
+
+
+def resolve_report_format(path: str, report_format: Optional[str] = None) -> str:
+    """Return the report format, inferring it from the file extension if not given.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+    """
+    if report_format is None:
+        report_format = FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if report_format is None:
+            raise ValueError(f"Cannot infer report format from {path}. "
+                             f"Options are {', '.join(REPORT_FORMATS)}")
+    if report_format not in _WRITERS:
+        raise ValueError(f"Unsupported report format: {report_format}. "
+                         f"Options are {', '.join(REPORT_FORMATS)}")
+    return report_format
+
+
+def open_report(path: str, report_format: Optional[str] = None) -> ReportWriter:
+    """Open a streaming report writer on a file ("-" for standard output).
+
+    Args:
+        path: Report file path.
+        report_format: One of REPORT_FORMATS (default: from the extension).
+
+    Returns:
+        ReportWriter: Writer to pass results to; close it to finish the report.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+    """
+    if path == '-':
+        return _WRITERS[resolve_report_format(path, report_format or 'jsonl')](sys.stdout)
+    writer_class = _WRITERS[resolve_report_format(path, report_format)]
+    return writer_class(open(path, 'w', encoding='utf-8'), close_stream=True)
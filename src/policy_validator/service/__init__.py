@@ -0,0 +1,6 @@
+"""
+Long-running validation services.
+
+This package contains servers that keep parsers and compiled standards
+loaded between requests, so callers avoid per-invocation startup costs.
+"""
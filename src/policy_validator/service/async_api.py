@@ -0,0 +1,250 @@
+"""Asyncio validation API for embedding in async services.
+
+This module exposes coroutine and async-iterator versions of the validation
+API. Parsing and validation run in a shared pool of warm worker processes
+(see service.workers), so the event loop never blocks on document I/O or
+CPU-bound parsing.
+
+Concurrency:
+    A semaphore per event loop caps the jobs each loop hands to the pool at
+    once. Jobs waiting on the semaphore have not been submitted, and jobs
+    submitted but not yet started are removed from the pool when their task
+    is cancelled. A job already running in a SandboxPool worker is stopped
+    by killing the worker, which is replaced, so cancelling a caller stops
+    all the work it queued. Other executors let running jobs finish and
+    discard their results.
+
+Resource Limits:
+    The shared pool is a SandboxPool (see service.sandbox) with the default
+    time and memory budget; a document exceeding it gets a failed result
+    with 'limit_exceeded' instead of occupying a worker.
+
+Example:
+    >>> async def handler(request):
+    ...     result = await validate_policy_async("/srv/policy.pdf", "ISO")
+    ...     return web.json_response(result)
+    >>>
+    >>> async for result in validate_policies_async(paths, standard="NIST"):
+    ...     print(result['path'], result['valid'])
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set, Union
+
+from .sandbox import ResourceLimitError, SandboxPool, limit_result
+from .workers import run_job, warm_worker
+
+# --- Constants ---
+DEFAULT_CONCURRENCY_FACTOR = 2  # In-flight jobs per worker process
+
+_shared_pool: Optional[SandboxPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> SandboxPool:
+    """Return the process pool shared by the async API, creating it once."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SandboxPool(initializer=warm_worker)
+        return _shared_pool
+
+
+def shutdown_shared_pool() -> None:
+    """Shut down the shared process pool, e.g. on application cleanup."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown(wait=False)
+            _shared_pool = None
+
+
+class AsyncValidator:
+    """Validate policies from asyncio code using a process pool.
+
+    Attributes:
+        max_concurrency (int): Jobs submitted to the pool at once
+    """
+
+    def __init__(self, executor: Optional[Executor] = None,
+                 max_concurrency: Optional[int] = None):
+        """Initialize the validator.
+
+        Args:
+            executor: Pool to run jobs in (default: the shared process pool).
+            max_concurrency: Jobs in flight at once per event loop (default:
+                twice the CPU count, keeping every worker busy while results
+                are collected).
+        """
+        self._executor = executor
+        self.max_concurrency = max_concurrency or (os.cpu_count() or 1) * DEFAULT_CONCURRENCY_FACTOR
+        # A semaphore is bound to the loop it is first used in, so each
+        # running loop gets its own, dropped along with the loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one job (see service.workers) and return its result.
+
+        Raises:
+            ValueError: If the standard is not supported.
+            asyncio.CancelledError: If the calling task is cancelled.
+        """
+        executor = self._executor or get_shared_pool()
+        async with self._get_semaphore():
+            # wrap_future cancels the pool future when this task is cancelled,
+            # which stops a SandboxPool worker already running the job
+            try:
+                return await asyncio.wrap_future(executor.submit(run_job, job))
+            except ResourceLimitError as e:
+                return limit_result(job, e)
+
+    async def validate(self, file_path: str, standard: str = "Custom",
+                       sections: Optional[Iterable[str]] = None,
+                       fail_fast: bool = False) -> Dict[str, Any]:
+        """Validate a policy file without blocking the event loop."""
+        return await self.run(_job(file_path, standard, sections, fail_fast))
+
+    async def validate_bytes(self, content: bytes, filename: str,
+                             standard: str = "Custom",
+                             sections: Optional[Iterable[str]] = None,
+                             fail_fast: bool = False) -> Dict[str, Any]:
+        """Validate an uploaded document held in memory.
+
+        Args:
+            content: Document bytes.
+            filename: Name reported in the result; its extension is checked
+                against the detected type.
+        """
+        job = _job(filename, standard, sections, fail_fast)
+        job['content'] = content
+        return await self.run(job)
+
+    async def validate_many(self, jobs: Iterable[Union[str, Dict[str, Any]]],
+                            standard: str = "Custom",
+                            sections: Optional[Iterable[str]] = None,
+                            fail_fast: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Validate many policies, yielding results as they complete.
+
+        Jobs are pulled from the iterable only as capacity frees up, so very
+        large or lazy iterables are not materialized. Closing the iterator
+        early cancels the jobs still in flight.
+
+        Args:
+            jobs: File paths or job dictionaries; keyword arguments are
+                defaults for jobs that do not set them.
+            standard: Default standard name or alias.
+            sections: Default required sections.
+            fail_fast: Default fail-fast setting.
+
+        Yields:
+            dict: Validation results in completion order.
+        """
+        defaults = _job('', standard, sections, fail_fast)
+        pending: Set["asyncio.Task[Dict[str, Any]]"] = set()
+        source = iter(jobs)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrency:
+                    try:
+                        job = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    job = {'path': job} if isinstance(job, str) else job
+                    pending.add(asyncio.ensure_future(self.run(dict(defaults, **job))))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _job(file_path: str, standard: str, sections: Optional[Iterable[str]],
+         fail_fast: bool) -> Dict[str, Any]:
+    """Build a worker job dictionary."""
+    return {
+        'path': file_path,
+        'standard': standard,
+        'sections': list(sections) if sections is not None else None,
+        'fail_fast': fail_fast
+    }
+
+
+_default_validator: Optional[AsyncValidator] = None
+
+
+def _get_default_validator() -> AsyncValidator:
+    global _default_validator
+    if _default_validator is None:
+        _default_validator = AsyncValidator()
+    return _default_validator
+
+
+async def validate_policy_async(file_path: str, standard: str = "Custom",
+                                sections: Optional[Iterable[str]] = None,
+                                fail_fast: bool = False) -> Dict[str, Any]:
+    """Validate a policy document without blocking the event loop.
+
+    Args:
+        file_path: Path to the policy document file.
+        standard: Validation standard name or alias.
+        sections: Sections to require (default: all sections of the standard).
+        fail_fast: Stop at the first failing mandatory rule.
+
+    Returns:
+        dict: Validation result, as returned by validate_policy().
+
+    Raises:
+        ValueError: If the standard is not supported.
+
+    Example:
+        >>> result = await validate_policy_async("policy.pdf", "ISO")
+    """
+    return await _get_default_validator().validate(file_path, standard, sections, fail_fast)
+
+
+async def validate_policies_async(jobs: Iterable[Union[str, Dict[str, Any]]],
+                                  standard: str = "Custom",
+                                  sections: Optional[Iterable[str]] = None,
+                                  fail_fast: bool = False,
+                                  max_concurrency: Optional[int] = None
+                                  ) -> AsyncIterator[Dict[str, Any]]:
+    """Validate many policy documents, yielding results as they complete.
+
+    Args:
+        jobs: File paths or job dictionaries (see service.workers).
+        standard: Default standard name or alias.
+        sections: Default required sections.
+        fail_fast: Default fail-fast setting.
+        max_concurrency: Jobs in flight at once for this batch.
+
+    Yields:
+        dict: Validation results in completion order.
+
+    Example:
+        >>> async for result in validate_policies_async(paths, "SOC2"):
+        ...     print(result['path'], result['valid'])
+    """
+    validator = (AsyncValidator(max_concurrency=max_concurrency) if max_concurrency
+                 else _get_default_validator())
+    async for result in validator.validate_many(jobs, standard, sections, fail_fast):
+        yield result
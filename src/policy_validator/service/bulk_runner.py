@@ -0,0 +1,501 @@
+"""Resumable bulk validation driven by a JSONL manifest.
+
+This module validates large batches of policy documents listed in a JSONL
+manifest, one job per line, in a pool of warm worker processes. Results
+are streamed to an output JSONL file as they complete, so memory use does
+not grow with the size of the run.
+
+Manifest Format:
+    {"path": "policies/access.pdf", "standard": "ISO", "sections": ["access control"]}
+    {"path": "policies/handbook.docx"}
+
+    Each line is a job as accepted by service.workers; a bare JSON string
+    is a path. Blank lines and lines starting with '#' are ignored.
+    Relative paths are resolved against the manifest's directory.
+
+Archives:
+    A job whose path is a ZIP or TAR archive (see utils.archives) stands
+    for every member of the archive. Members are read here in one pass, hashed
+    and sent to the workers as content, so the archive is never extracted to
+    disk; each member gets its own output line, checkpoint key and
+    "<archive>!<member>" path.
+
+Checkpointing:
+    Every output line carries a 'job_key' derived from the document's
+    content hash and the job's configuration. Files are hashed by the
+    worker that validates them (see service.workers), so their lines also
+    carry a 'stat_key' derived from the file's size and modification time,
+    which is known before the job runs. The output file is the checkpoint:
+    on restart, files whose stat key and archive members whose job key is
+    already present are skipped, so a killed run resumes where it stopped.
+    A file that was touched but not changed is validated again but not
+    recorded twice. A partially written last line is discarded.
+
+Instrumentation:
+    With a Recorder, every job also times its stages in the worker (see
+    utils.instrumentation); the spans are merged into the recorder instead
+    of being written to the output.
+
+Profiling:
+    With a ProfileSession, jobs whose path matches the session's selection
+    are profiled in their worker, and the profile data is merged into the
+    session (see utils.profiling).
+
+Near-Duplicates:
+    With dedupe, each worker groups the documents it validates into
+    template families and reuses results where edits cannot change them
+    (see analytics.near_duplicates). Families are per worker, so a template
+    is validated in full at most once per worker.
+
+Resource Limits:
+    Workers run in a SandboxPool (see service.sandbox), so a malformed
+    document that makes a parser spin or exhaust memory costs at most its
+    time and memory budget. Such a document is recorded as a failed result
+    with 'limit_exceeded' and a job key (for a file, the stat key, since
+    its worker was killed before hashing it), so a resumed run does not
+    retry it, and the killed worker is replaced.
+
+Scheduling:
+    Jobs are not run in manifest order. A CostModel predicts the time and
+    memory of each job from cheap signals, and a BatchScheduler (see
+    service.scheduler) starts the longest of the queued jobs first, within
+    a memory budget, so a few huge documents at the end of the manifest do
+    not leave the other workers idle. Up to SCHEDULE_WINDOW jobs are read
+    ahead for ordering. Observed timings refine the model as the run goes.
+
+Sharding:
+    With a shard (i, N), only the jobs that service.sharding assigns to
+    shard i of N are run, so N nodes can split a manifest without a
+    coordinator; their outputs are combined with merge_results().
+
+Example:
+    $ policy-validator-cli bulk manifest.jsonl --output results.jsonl --workers 8
+"""
+
+import json
+import os
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from .sandbox import ResourceLimitError, ResourceLimits, SandboxPool, limit_result
+from .scheduler import BatchScheduler, CostModel, JobEstimate, default_memory_budget
+from .workers import run_job, warm_worker
+from ..utils.archives import PolicyArchive, is_archive
+from ..utils.hashing import content_digest, job_key
+from ..utils.instrumentation import Recorder
+from ..utils.profiling import ProfileSession
+from ..validators.standards import resolve_standard
+
+# --- Constants ---
+IN_FLIGHT_FACTOR = 4        # Submitted jobs per worker process
+REPORT_INTERVAL = 5.0       # Seconds between progress reports
+SYNC_INTERVAL = 2.0         # Seconds between fsync() calls on the output
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+ResultCallback = Callable[[Dict[str, Any]], None]
+Hasher = Callable[[str, int, Callable[[], str]], str]
+
+
+def read_manifest(manifest_path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line number, job) pairs from a JSONL manifest.
+
+    Lines that are not valid jobs yield a job with an 'error' message
+    instead, so they are reported rather than aborting the run.
+    """
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, {'path': '', 'error': f"Invalid manifest line: {e}"}
+                continue
+            if isinstance(job, str):
+                job = {'path': job}
+            if not isinstance(job, dict) or not isinstance(job.get('path'), str):
+                yield line_number, {'path': '', 'error': "Manifest line has no 'path'"}
+                continue
+            job['path'] = os.path.join(base, os.path.expanduser(job['path']))
+            yield line_number, job
+
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """Return the job and stat keys already recorded in an output file.
+
+    A trailing partial line left by an interrupted run is truncated away.
+    """
+    completed: Set[str] = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    valid_end = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            valid_end += len(line)
+            try:
+                record = json.loads(line)
+                keys = (record.get('job_key'), record.get('stat_key'))
+            except (ValueError, AttributeError):
+                continue
+            completed.update(key for key in keys if key)
+    if valid_end != os.path.getsize(output_path):
+        with open(output_path, 'r+b') as f:
+            f.truncate(valid_end)
+    return completed
+
+
+class BulkRunner:
+    """Run a JSONL manifest of validation jobs with checkpoint/resume.
+
+    Attributes:
+        workers (int): Number of worker processes
+        cost_model (CostModel): Job cost predictions, refined by every run
+        memory_budget (Optional[int]): Predicted bytes of memory the jobs
+            in flight may use together, or None for no limit
+        shard (Optional[Tuple[int, int]]): (index from 1, count) of the
+            manifest slice to run, or None for the whole manifest
+        stats (dict): Counters for the current run (see run())
+    """
+
+    def __init__(self, workers: Optional[int] = None, resume: bool = True,
+                 progress: Optional[ProgressCallback] = None,
+                 report_interval: float = REPORT_INTERVAL,
+                 on_result: Optional[ResultCallback] = None,
+                 recorder: Optional[Recorder] = None,
+                 profiler: Optional[ProfileSession] = None,
+                 dedupe: bool = False, limits: Optional[ResourceLimits] = None,
+                 cost_model: Optional[CostModel] = None,
+                 memory_budget: Optional[int] = None,
+                 shard: Optional[Tuple[int, int]] = None):
+        """Initialize the runner.
+
+        Args:
+            workers: Worker processes (default: CPU count).
+            resume: Skip jobs already recorded in the output file. When
+                False, the output file is overwritten.
+            progress: Called with a copy of the stats every report_interval
+                seconds and once at the end.
+            report_interval: Seconds between progress callbacks.
+            on_result: Called with every record written to the output,
+                e.g. ResultsStore.add to also keep results in a database.
+            recorder: Receives per-stage timings from the workers, their
+                hashing included, and of the archive member hashing done here.
+            profiler: Profiles the jobs it selects in the workers.
+            dedupe: Reuse results across near-duplicate documents.
+            limits: Time and memory budget of each document (default:
+                ResourceLimits()).
+            cost_model: Predicts job costs (default: a new CostModel).
+            memory_budget: Bytes of predicted memory for the jobs in
+                flight (default: half the physical memory; 0: no limit).
+            shard: Run only shard i of N, given as (i, N) with i from 1.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.resume = resume
+        self.progress = progress
+        self.report_interval = report_interval
+        self.on_result = on_result
+        self.recorder = recorder
+        self.profiler = profiler
+        self.dedupe = dedupe
+        self.limits = limits
+        self.cost_model = cost_model if cost_model is not None else CostModel()
+        self.memory_budget = (default_memory_budget() if memory_budget is None
+                              else memory_budget or None)
+        self.shard = shard
+        self.stats: Dict[str, Any] = {}
+
+    def run(self, manifest_path: str, output_path: str) -> Dict[str, Any]:
+        """Validate every job of the manifest, appending results to output_path.
+
+        Returns:
+            dict: Run statistics:
+                {
+                    'completed': int,        # Jobs validated in this run
+                    'failed': int,           # Completed jobs that failed validation
+                    'limited': int,          # Failed jobs stopped by a resource limit
+                    'errors': int,           # Jobs that could not be run
+                    'skipped': int,          # Jobs already in the checkpoint
+                    'bytes': int,            # Document bytes validated
+                    'elapsed': float,        # Seconds since the run started
+                    'files_per_second': float,
+                    'mb_per_second': float
+                }
+        """
+        completed = load_checkpoint(output_path) if self.resume else set()
+        self.stats = {'completed': 0, 'failed': 0, 'limited': 0, 'errors': 0, 'skipped': 0,
+                      'bytes': 0, 'elapsed': 0.0, 'files_per_second': 0.0,
+                      'mb_per_second': 0.0}
+        started = time.perf_counter()
+        last_report = last_sync = started
+        pending: Dict[Future, Tuple[int, Dict[str, Any], str, str, int, JobEstimate]] = {}
+        max_pending = self.workers * IN_FLIGHT_FACTOR
+        scheduler = BatchScheduler(self.memory_budget)
+        if self.shard is not None:
+            from .sharding import read_shard  # Builds on this module
+            manifest = read_shard(manifest_path, self.shard)
+        else:
+            manifest = read_manifest(manifest_path)
+
+        with open(output_path, 'a' if self.resume else 'w', encoding='utf-8') as output, \
+                SandboxPool(self.workers, self.limits, initializer=warm_worker) as pool:
+
+            def write(record: Dict[str, Any]) -> None:
+                output.write(json.dumps(record, default=str) + '\n')
+                if self.on_result:
+                    self.on_result(record)
+
+            def collect(done: Set[Future]) -> None:
+                for future in done:
+                    line_number, job, key, digest, size, estimate = pending.pop(future)
+                    scheduler.release(estimate)
+                    try:
+                        result = future.result()
+                    except ResourceLimitError as e:
+                        result = limit_result(job, e)
+                        self.stats['limited'] += 1
+                    except Exception as e:
+                        self.stats['errors'] += 1
+                        write(error_record(line_number, job, str(e)))
+                        continue
+                    stat_key = None
+                    if job.get('hash'):
+                        # Files are keyed by content once their worker has hashed them
+                        stat_key, digest = key, result.pop('file_hash', '')
+                        if digest:
+                            key = document_key(job, digest)
+                            if key in completed:
+                                self.stats['skipped'] += 1  # Touched but unchanged
+                                continue
+                            completed.add(key)
+                    if 'elapsed_ms' in result and 'profile' not in job:
+                        self.cost_model.observe(estimate, result['elapsed_ms'] / 1000)
+                    trace = result.pop('trace', None)
+                    if trace and self.recorder is not None:
+                        self.recorder.merge_spans(trace)
+                    profile = result.pop('profile', None)
+                    if profile and self.profiler is not None:
+                        self.profiler.merge(profile)
+                    result['line'] = line_number
+                    result['job_key'] = key
+                    result['file_hash'] = digest or None
+                    if stat_key:
+                        result['stat_key'] = stat_key
+                    write(result)
+                    self.stats['completed'] += 1
+                    self.stats['bytes'] += size
+                    if not result.get('valid'):
+                        self.stats['failed'] += 1
+
+            def documents() -> Iterator[Tuple[int, Dict[str, Any], int, str]]:
+                # Manifest jobs, with archives expanded into member jobs
+                for line_number, job in manifest:
+                    for document, size, digest in document_jobs(job, self._hash):
+                        yield line_number, document, size, digest
+
+            def submit_ready() -> None:
+                # Longest queued jobs first, while they fit the memory budget
+                while len(pending) < max_pending:
+                    admitted = scheduler.pop()
+                    if admitted is None:
+                        return
+                    (line_number, job, key, digest, size), estimate = admitted
+                    future = pool.submit(run_job, job)
+                    pending[future] = (line_number, job, key, digest, size, estimate)
+
+            for line_number, job, size, digest in documents():
+                if 'error' in job:
+                    self.stats['errors'] += 1
+                    write(error_record(line_number, job, job['error']))
+                    continue
+                key = document_key(job, digest)
+                if key in completed:
+                    self.stats['skipped'] += 1
+                    continue
+                completed.add(key)
+                if self.dedupe:
+                    job = dict(job, dedupe=True)
+                if self.recorder is not None:
+                    job = dict(job, instrument=True)
+                if self.profiler is not None and self.profiler.selects(job['path']):
+                    job = dict(job, profile=self.profiler.options())
+
+                scheduler.add((line_number, job, key, digest, size),
+                              self.cost_model.estimate(job, size),
+                              len(job.get('content') or b''))
+                submit_ready()
+                while scheduler.full:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                    submit_ready()
+
+                now = time.perf_counter()
+                if now - last_sync >= SYNC_INTERVAL:
+                    output.flush()
+                    os.fsync(output.fileno())
+                    last_sync = now
+                if now - last_report >= self.report_interval:
+                    self._report(started)
+                    last_report = now
+
+            submit_ready()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+                submit_ready()
+            output.flush()
+            os.fsync(output.fileno())
+
+        self._report(started)
+        return dict(self.stats)
+
+    def _hash(self, path: str, size: int, digest: Callable[[], str]) -> str:
+        """Compute a document digest, recording the time taken."""
+        hashing_started = time.perf_counter()
+        result = digest()
+        if self.recorder is not None:
+            self.recorder.set_file(path)
+            self.recorder.record('hash', time.perf_counter() - hashing_started, size)
+        return result
+
+    def _report(self, started: float) -> None:
+        """Update throughput figures and notify the progress callback."""
+        elapsed = time.perf_counter() - started
+        self.stats['elapsed'] = round(elapsed, 3)
+        if elapsed > 0:
+            self.stats['files_per_second'] = round(self.stats['completed'] / elapsed, 2)
+            self.stats['mb_per_second'] = round(self.stats['bytes'] / elapsed / 1e6, 3)
+        if self.progress:
+            self.progress(dict(self.stats))
+
+
+def document_jobs(job: Dict[str, Any], hasher: Optional[Hasher] = None
+                  ) -> Iterator[Tuple[Dict[str, Any], int, str]]:
+    """Yield (job, size, digest) for the documents of a manifest job.
+
+    A plain job yields itself with 'hash' set, for the worker to hash the
+    file as it validates it, and a signature of the file's size and
+    modification time in place of the digest. An archive job yields one
+    job per member, carrying the member content and its digest. Jobs that
+    cannot be read, including manifest errors, yield a job with an 'error'
+    message instead.
+
+    Args:
+        job: Job from read_manifest().
+        hasher: Called as hasher(path, size, digest) to compute each
+            member digest, e.g. to time it (default: digest()).
+    """
+    hasher = hasher or (lambda path, size, digest: digest())
+    if 'error' in job:
+        yield job, 0, ''
+        return
+    if is_archive(job['path']):
+        yield from _archive_jobs(job, hasher)
+        return
+    try:
+        stat = os.stat(job['path'])
+    except OSError as e:
+        yield dict(job, error=f"Could not read file: {e}"), 0, ''
+        return
+    yield dict(job, hash=True), stat.st_size, f"stat:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _archive_jobs(job: Dict[str, Any], hasher: Hasher
+                  ) -> Iterator[Tuple[Dict[str, Any], int, str]]:
+    """Yield (job, size, digest) for every member of an archive job."""
+    try:
+        with PolicyArchive(job['path']) as archive:
+            for member in archive.members():
+                member_job = dict(job, path=member.path)
+                try:
+                    with member.open() as stream:
+                        content = stream.read()
+                except (OSError, RuntimeError, zipfile.BadZipFile) as e:
+                    yield dict(member_job, error=f"Could not read archive member: {e}"), 0, ''
+                    continue
+                digest = hasher(member.path, len(content), lambda: content_digest(content))
+                member_job['content'] = content
+                yield member_job, len(content), digest
+    except (OSError, zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+        yield dict(job, error=f"Could not read archive: {e}"), 0, ''
+
+
+def document_key(job: Dict[str, Any], digest: str) -> str:
+    """Checkpoint key of a document job with the given content digest.
+
+    Given the stat signature of a file from document_jobs(), returns the
+    file's stat key instead.
+    """
+    return job_key(digest, job.get('standard', 'Custom'), job.get('sections'),
+                   job.get('fail_fast', False), job['path'])
+
+
+def error_record(line_number: int, job: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Build the output record of a job that could not be validated.
+
+    Error records carry no job key, so the job is retried on resume. The
+    standard is reported by its canonical name when it is supported.
+    """
+    standard = job.get('standard', 'Custom')
+    try:
+        standard = resolve_standard(standard)
+    except (ValueError, TypeError, AttributeError):
+        pass  # Reported as given, e.g. the unsupported name itself
+    return {
+        'path': job.get('path', ''),
+        'standard': standard,
+        'line': line_number,
+        'valid': False,
+        'issues': [message],
+        'job_key': None
+    }
+
+
+def run_manifest(manifest_path: str, output_path: str, workers: Optional[int] = None,
+                 resume: bool = True,
+                 progress: Optional[ProgressCallback] = None,
+                 on_result: Optional[ResultCallback] = None,
+                 recorder: Optional[Recorder] = None,
+                 profiler: Optional[ProfileSession] = None,
+                 dedupe: bool = False,
+                 limits: Optional[ResourceLimits] = None,
+                 cost_model: Optional[CostModel] = None,
+                 memory_budget: Optional[int] = None,
+                 shard: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """Validate a JSONL manifest, streaming results to a JSONL file.
+
+    Args:
+        manifest_path: JSONL manifest of jobs (see module docstring).
+        output_path: JSONL file receiving one result per line.
+        workers: Worker processes (default: CPU count).
+        resume: Skip jobs already recorded in output_path.
+        progress: Called periodically with run statistics.
+        on_result: Called with every record written to the output.
+        recorder: Receives per-stage timings of every job.
+        profiler: Profiles the jobs it selects.
+        dedupe: Reuse results across near-duplicate documents.
+        limits: Time and memory budget of each document.
+        cost_model: Predicts job costs; refined by the run's timings.
+        memory_budget: Bytes of predicted memory for the jobs in flight
+            (default: half the physical memory; 0: no limit).
+        shard: Run only shard i of N, given as (i, N) with i from 1.
+
+    Returns:
+        dict: Run statistics (see BulkRunner.run()).
+
+    Example:
+        >>> stats = run_manifest("manifest.jsonl", "results.jsonl", workers=8)
+        >>> print(stats['completed'], stats['files_per_second'])
+    """
+    return BulkRunner(workers, resume, progress,
+                      on_result=on_result, recorder=recorder,
+                      profiler=profiler, dedupe=dedupe,
+                      limits=limits, cost_model=cost_model,
+                      memory_budget=memory_budget, shard=shard).run(manifest_path, output_path)
@@ -0,0 +1,870 @@
+"""Work-stealing validation across nodes through a central job queue.
+
+Static sharding (see service.sharding) fixes each node's share of a
+manifest up front, so when document sizes are skewed some nodes finish
+long before others. Here a coordinator holds the manifest in a job queue
+and worker nodes pull jobs from it whenever they have capacity, so every
+node stays busy until the queue runs dry and the nodes finish at about
+the same time.
+
+Coordinator:
+    Coordinator serves the queue over HTTP and streams the results the
+    nodes send back to a JSONL output and, through on_result, to e.g. a
+    central ResultsStore. The queue is a SQLite database owned by the
+    coordinator alone, so it may live on any file system; nodes never
+    open it. Jobs are handed out longest first, as predicted by the
+    CostModel of service.scheduler, so the large documents do not all
+    start at the end.
+
+Leases:
+    A node leases jobs for lease_seconds and renews its leases with a
+    heartbeat while it works on them. A lease that is not renewed, because
+    the node crashed, hung or lost the network, expires and its job is
+    queued again, up to max_attempts times; after that the job is recorded
+    as an error, so a document that brings nodes down cannot stall the run.
+
+Work Stealing:
+    Once the queue is empty, idle nodes get a backup lease on jobs another
+    node has held for more than backup_after seconds. The first result to
+    arrive is recorded and the other copy is dropped, so a slow or
+    overloaded node does not hold up the end of the run.
+
+Resuming:
+    The queue records which jobs are done, so a coordinator restarted with
+    the same queue file continues where it stopped, appending to its
+    output. Leases held when it stopped expire and are handed out again.
+
+Endpoints:
+    POST /lease
+        {"node", "count"}: lease up to count jobs. Returns {"jobs":
+        [{"lease", "line", "job"}], "lease_seconds", "done"}; done is true
+        once every job is finished.
+    POST /heartbeat
+        {"node", "leases"}: renew leases. Returns {"leases": renewed,
+        "dropped": leases whose job was finished by another node, "done"}.
+    POST /complete
+        {"node", "lease", "line", "results"}: record the results of a
+        leased job. Returns {"accepted"}, false if the job was already
+        finished.
+    GET /status
+        Queue counts and run statistics.
+
+Example:
+    $ policy-validator-cli coordinate manifest.jsonl -o results.jsonl --store results.db \\
+          --host 0.0.0.0 --port 8766                            # on one machine
+    $ policy-validator-cli work http://coordinator:8766 --workers 16  # on every node
+
+Note:
+    Nodes validate the manifest paths as the coordinator resolved them, so
+    the documents must be visible at the same paths on every node, e.g. on
+    a shared volume. The coordinator performs no authentication; bind it
+    to a trusted network only.
+"""
+
+import json
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from .bulk_runner import (
+    SYNC_INTERVAL, ProgressCallback, ResultCallback, document_jobs,
+    document_key, error_record, read_manifest
+)
+from .sandbox import ResourceLimitError, ResourceLimits, SandboxPool, limit_result
+from .scheduler import CostModel
+from .workers import run_job, warm_worker
+
+# --- Constants ---
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+LEASE_SECONDS = 60.0        # Lease length; nodes renew every third of it
+MAX_ATTEMPTS = 3            # Expired leases before a job is recorded as an error
+BACKUP_AFTER = 30.0         # Seconds a job is held before an idle node may steal it
+MAX_LEASE_BATCH = 256       # Jobs handed out per lease request
+PREFETCH_FACTOR = 2         # Jobs a node holds per worker process
+POLL_INTERVAL = 1.0         # Seconds an idle node waits before asking again
+RETRY_WINDOW = 60.0         # Seconds a node keeps retrying an unreachable coordinator
+REQUEST_TIMEOUT = 30.0      # Seconds a node waits for a coordinator reply
+REPORT_INTERVAL = 5.0       # Seconds between progress reports
+MAX_REQUEST_BYTES = 256 * 1024 * 1024
+
+# Job states
+QUEUED = 'queued'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    line INTEGER PRIMARY KEY,
+    job TEXT NOT NULL,
+    cost REAL NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_by_cost ON jobs (state, cost DESC, line);
+CREATE TABLE IF NOT EXISTS leases (
+    id TEXT PRIMARY KEY,
+    line INTEGER NOT NULL,
+    node TEXT NOT NULL,
+    started REAL NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leases_by_line ON leases (line);
+"""
+
+
+class JobQueue:
+    """Durable queue of manifest jobs with expiring leases.
+
+    Every manifest line is one job, in one of the states queued, leased,
+    done or failed. Times are wall-clock, so leases survive a restart.
+    The queue may be used from several threads.
+    """
+
+    def __init__(self, path: str):
+        """Open or create the queue database at path."""
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def load(self, manifest_path: str, cost_model: CostModel
+             ) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+        """Queue the jobs of a manifest, unless the queue already holds it.
+
+        Args:
+            manifest_path: JSONL manifest (see service.bulk_runner).
+            cost_model: Predicts the cost each job is ordered by.
+
+        Returns:
+            list: (line number, job) of the manifest lines that are not
+                valid jobs, recorded as failed; None if the queue was
+                already loaded and is being resumed.
+
+        Raises:
+            ValueError: If the queue holds a different manifest.
+        """
+        manifest = os.path.abspath(manifest_path)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'manifest'").fetchone()
+        if row is not None:
+            if row[0] != manifest:
+                raise ValueError(f"Queue {self.path} belongs to manifest {row[0]}")
+            return None
+
+        errors = []
+        with self._transaction() as conn:
+            for line_number, job in read_manifest(manifest_path):
+                if 'error' in job:
+                    errors.append((line_number, job))
+                    state, cost = FAILED, 0.0
+                else:
+                    state, cost = QUEUED, _job_cost(cost_model, job)
+                conn.execute("INSERT INTO jobs (line, job, cost, state) VALUES (?, ?, ?, ?)",
+                             (line_number, json.dumps(job), cost, state))
+            conn.execute("INSERT INTO meta (key, value) VALUES ('manifest', ?)", (manifest,))
+        return errors
+
+    def lease(self, node: str, count: int, lease_seconds: float,
+              backup_after: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Lease up to count jobs to a node, longest first.
+
+        When no job is queued and backup_after is given, jobs held by a
+        single other node for longer than backup_after seconds are leased
+        again as backups.
+
+        Returns:
+            list: {'lease', 'line', 'job', 'backup'} for every leased job.
+        """
+        now = time.time()
+        leased = []
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT line, job FROM jobs WHERE state = ? ORDER BY cost DESC, line LIMIT ?",
+                (QUEUED, count)).fetchall()
+            backup = [False] * len(rows)
+            if len(rows) < count and backup_after is not None:
+                stolen = conn.execute(
+                    "SELECT jobs.line, jobs.job FROM jobs JOIN leases ON leases.line = jobs.line "
+                    "WHERE jobs.state = ? GROUP BY jobs.line "
+                    "HAVING COUNT(*) = 1 AND MIN(leases.started) <= ? AND MIN(leases.node) != ? "
+                    "ORDER BY MIN(leases.started) LIMIT ?",
+                    (LEASED, now - backup_after, node, count - len(rows))).fetchall()
+                rows += stolen
+                backup += [True] * len(stolen)
+            for (line_number, job), is_backup in zip(rows, backup):
+                lease_id = uuid.uuid4().hex
+                conn.execute("UPDATE jobs SET state = ? WHERE line = ?", (LEASED, line_number))
+                conn.execute("INSERT INTO leases (id, line, node, started, expires) "
+                             "VALUES (?, ?, ?, ?, ?)",
+                             (lease_id, line_number, node, now, now + lease_seconds))
+                leased.append({'lease': lease_id, 'line': line_number,
+                               'job': json.loads(job), 'backup': is_backup})
+        return leased
+
+    def renew(self, node: str, lease_ids: List[str],
+              lease_seconds: float) -> Tuple[List[str], List[str]]:
+        """Extend a node's leases.
+
+        Returns:
+            tuple: (renewed lease ids, ids of leases that are gone because
+                their job was finished).
+        """
+        renewed, dropped = [], []
+        expires = time.time() + lease_seconds
+        with self._transaction() as conn:
+            for lease_id in lease_ids:
+                cursor = conn.execute("UPDATE leases SET expires = ? WHERE id = ? AND node = ?",
+                                      (expires, lease_id, node))
+                if cursor.rowcount:
+                    renewed.append(lease_id)
+                else:
+                    dropped.append(lease_id)
+        return renewed, dropped
+
+    def is_open(self, line_number: int) -> bool:
+        """Whether a job is still waiting for its result."""
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM jobs WHERE line = ?",
+                                     (line_number,)).fetchone()
+        return row is not None and row[0] in (QUEUED, LEASED)
+
+    def complete(self, line_number: int) -> bool:
+        """Mark a job done and drop its leases.
+
+        Results are accepted even from a lease that has expired, as long
+        as no other lease finished the job first.
+
+        Returns:
+            bool: False if the job was already finished.
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("UPDATE jobs SET state = ? WHERE line = ? AND state IN (?, ?)",
+                                  (DONE, line_number, QUEUED, LEASED))
+            conn.execute("DELETE FROM leases WHERE line = ?", (line_number,))
+            return cursor.rowcount > 0
+
+    def expire(self, max_attempts: int) -> Tuple[int, List[Tuple[int, Dict[str, Any]]]]:
+        """Requeue the jobs whose every lease has expired.
+
+        Returns:
+            tuple: (number of jobs requeued, (line number, job) of the jobs
+                that have now lost max_attempts leases and are failed).
+        """
+        requeued = 0
+        failed = []
+        with self._transaction() as conn:
+            lines = [row[0] for row in conn.execute(
+                "SELECT DISTINCT line FROM leases WHERE expires < ?", (time.time(),))]
+            if not lines:
+                return 0, []
+            conn.execute("DELETE FROM leases WHERE expires < ?", (time.time(),))
+            for line_number in lines:
+                held = conn.execute("SELECT 1 FROM leases WHERE line = ?",
+                                    (line_number,)).fetchone()
+                row = conn.execute("SELECT job, state, attempts FROM jobs WHERE line = ?",
+                                   (line_number,)).fetchone()
+                if held or row is None or row[1] != LEASED:
+                    continue
+                attempts = row[2] + 1
+                state = FAILED if attempts >= max_attempts else QUEUED
+                conn.execute("UPDATE jobs SET state = ?, attempts = ? WHERE line = ?",
+                             (state, attempts, line_number))
+                if state == FAILED:
+                    failed.append((line_number, json.loads(row[0])))
+                else:
+                    requeued += 1
+        return requeued, failed
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state, plus active leases."""
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        with self._lock:
+            for state, number in self._conn.execute(
+                    "SELECT state, COUNT(*) FROM jobs GROUP BY state"):
+                counts[state] = number
+            counts['leases'] = self._conn.execute("SELECT COUNT(*) FROM leases").fetchone()[0]
+        return counts
+
+    def finished(self) -> bool:
+        """Whether every job is done or failed."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM jobs WHERE state IN (?, ?) LIMIT 1",
+                                      (QUEUED, LEASED)).fetchone() is None
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+
+def _job_cost(cost_model: CostModel, job: Dict[str, Any]) -> float:
+    """Predicted seconds of a job; unreadable files cost nothing."""
+    try:
+        size = os.path.getsize(job['path'])
+    except OSError:
+        return 0.0
+    return cost_model.estimate(job, size).seconds
+
+
+class Coordinator:
+    """Serve a manifest to worker nodes and record their results.
+
+    Attributes:
+        host (str): Interface to bind
+        port (int): TCP port to bind (0 picks a free port)
+        lease_seconds (float): Lease length
+        max_attempts (int): Expired leases before a job fails
+        backup_after (Optional[float]): Seconds before a held job may be
+            stolen by an idle node, or None to never steal
+        stats (dict): Counters for the current run (see run())
+    """
+
+    def __init__(self, manifest_path: str, output_path: str, queue_path: str,
+                 host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 lease_seconds: float = LEASE_SECONDS, max_attempts: int = MAX_ATTEMPTS,
+                 backup_after: Optional[float] = BACKUP_AFTER,
+                 cost_model: Optional[CostModel] = None,
+                 on_result: Optional[ResultCallback] = None,
+                 progress: Optional[ProgressCallback] = None,
+                 report_interval: float = REPORT_INTERVAL):
+        """Initialize the coordinator.
+
+        Args:
+            manifest_path: JSONL manifest of jobs (see service.bulk_runner).
+            output_path: JSONL file receiving one result per line.
+            queue_path: SQLite database holding the queue. An existing
+                queue of the same manifest is resumed, and the output
+                appended to; otherwise the output is overwritten.
+            host: Interface to bind.
+            port: TCP port to bind.
+            lease_seconds: Seconds a lease lasts without a heartbeat.
+            max_attempts: Expired leases before a job is recorded as an error.
+            backup_after: Seconds a job must be held before an idle node
+                may run it as well; None disables work stealing.
+            cost_model: Predicts the job costs the queue is ordered by
+                (default: a new CostModel).
+            on_result: Called with every record written to the output, on
+                the thread running run().
+            progress: Called with a copy of the stats every
+                report_interval seconds and once at the end.
+            report_interval: Seconds between progress callbacks.
+        """
+        self.manifest_path = manifest_path
+        self.output_path = output_path
+        self.queue_path = queue_path
+        self.host = host
+        self.port = port
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backup_after = backup_after
+        self.cost_model = cost_model if cost_model is not None else CostModel()
+        self.on_result = on_result
+        self.progress = progress
+        self.report_interval = report_interval
+        self.stats: Dict[str, Any] = {}
+        self._queue: Optional[JobQueue] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._serving: Optional[threading.Thread] = None
+        self._completions: "queue.Queue[Tuple[Dict[str, Any], threading.Event, List[bool]]]" = \
+            queue.Queue()
+        self._nodes: Dict[str, float] = {}   # Node -> last contact
+        self._released: Set[str] = set()      # Nodes told that the run is done
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Load the queue and bind the HTTP server."""
+        self._queue = JobQueue(self.queue_path)
+        handler = type('BoundCoordinatorHandler', (CoordinatorRequestHandler,),
+                       {'coordinator': self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+    def run(self) -> Dict[str, Any]:
+        """Serve the queue until every job is finished.
+
+        Returns:
+            dict: Run statistics:
+                {
+                    'jobs': int,             # Manifest jobs
+                    'results': int,          # Results recorded in this run
+                    'failed': int,           # Recorded results that failed validation
+                    'limited': int,          # Failed results stopped by a resource limit
+                    'errors': int,           # Jobs or documents that could not be run
+                    'requeued': int,         # Jobs queued again after a lease expired
+                    'stolen': int,           # Backup leases handed out
+                    'dropped': int,          # Completions of jobs already finished
+                    'nodes': {node: int},    # Results recorded from each node
+                    'elapsed': float,
+                    'files_per_second': float
+                }
+
+        Raises:
+            ValueError: If the queue holds a different manifest.
+        """
+        if self._server is None:
+            self.start()
+        self.stats = {'jobs': 0, 'results': 0, 'failed': 0, 'limited': 0, 'errors': 0,
+                      'requeued': 0, 'stolen': 0, 'dropped': 0, 'nodes': {}, 'elapsed': 0.0,
+                      'files_per_second': 0.0}
+        try:
+            errors = self._queue.load(self.manifest_path, self.cost_model)
+            counts = self._queue.counts()
+            self.stats['jobs'] = sum(counts[state] for state in (QUEUED, LEASED, DONE, FAILED))
+            started = time.perf_counter()
+            last_report = last_sync = last_expiry = started
+            finished_at: Optional[float] = None
+            self._serving = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._serving.start()
+
+            with open(self.output_path, 'w' if errors is not None else 'a',
+                      encoding='utf-8') as output:
+
+                def write(record: Dict[str, Any]) -> None:
+                    output.write(json.dumps(record, default=str) + '\n')
+                    if self.on_result:
+                        self.on_result(record)
+
+                for line_number, job in errors or []:
+                    self.stats['errors'] += 1
+                    write(error_record(line_number, job, job['error']))
+
+                while True:
+                    try:
+                        completion, replied, accepted = self._completions.get(
+                            timeout=POLL_INTERVAL / 4)
+                    except queue.Empty:
+                        pass
+                    else:
+                        # Results are written before the job is marked done,
+                        # so a crash in between reruns the job rather than
+                        # losing it
+                        if self._queue.is_open(completion['line']):
+                            for result in completion['results']:
+                                self._count(result, completion['node'])
+                                write(result)
+                            accepted.append(self._queue.complete(completion['line']))
+                        else:
+                            self.stats['dropped'] += 1
+                            accepted.append(False)
+                        replied.set()
+
+                    now = time.perf_counter()
+                    if now - last_expiry >= self.lease_seconds / 4:
+                        requeued, failed = self._queue.expire(self.max_attempts)
+                        self.stats['requeued'] += requeued
+                        for line_number, job in failed:
+                            self.stats['errors'] += 1
+                            write(error_record(line_number, job,
+                                               f"Lease lost {self.max_attempts} times; "
+                                               f"the node validating it may have crashed"))
+                        last_expiry = now
+                    if now - last_sync >= SYNC_INTERVAL:
+                        output.flush()
+                        os.fsync(output.fileno())
+                        last_sync = now
+                    if now - last_report >= self.report_interval:
+                        self._report(started)
+                        last_report = now
+
+                    if finished_at is None and self._queue.finished():
+                        finished_at = now
+                    if finished_at is not None and self._completions.empty() and (
+                            self._all_released() or now - finished_at >= self.lease_seconds):
+                        break
+                output.flush()
+                os.fsync(output.fileno())
+        finally:
+            self.close()
+
+        self._report(started)
+        return dict(self.stats)
+
+    def close(self) -> None:
+        """Stop serving and close the queue."""
+        if self._serving is not None:
+            self._server.shutdown()
+            self._serving = None
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        # Unblock handlers still waiting for their completion to be recorded
+        while not self._completions.empty():
+            _, replied, accepted = self._completions.get_nowait()
+            accepted.append(False)
+            replied.set()
+        if self._queue is not None:
+            self._queue.close()
+            self._queue = None
+
+    # --- Requests (called on handler threads) ---
+
+    def lease(self, node: str, count: int) -> Dict[str, Any]:
+        """Lease jobs to a node (see POST /lease)."""
+        self._seen(node)
+        count = max(0, min(count, MAX_LEASE_BATCH))
+        jobs = self._queue.lease(node, count, self.lease_seconds, self.backup_after)
+        stolen = sum(1 for job in jobs if job.pop('backup'))
+        with self._lock:
+            self.stats['stolen'] += stolen
+        return {'jobs': jobs, 'lease_seconds': self.lease_seconds, 'done': self._done(node)}
+
+    def heartbeat(self, node: str, lease_ids: List[str]) -> Dict[str, Any]:
+        """Renew a node's leases (see POST /heartbeat)."""
+        self._seen(node)
+        renewed, dropped = self._queue.renew(node, lease_ids, self.lease_seconds)
+        return {'leases': renewed, 'dropped': dropped, 'done': self._done(node)}
+
+    def complete(self, completion: Dict[str, Any]) -> bool:
+        """Hand a node's results to run() and wait until they are recorded."""
+        self._seen(completion['node'])
+        replied = threading.Event()
+        accepted: List[bool] = []
+        self._completions.put((completion, replied, accepted))
+        replied.wait()
+        return accepted[0]
+
+    def status(self) -> Dict[str, Any]:
+        """Queue counts and statistics (see GET /status)."""
+        with self._lock:
+            stats = dict(self.stats, nodes=dict(self.stats.get('nodes', {})))
+        stats['queue'] = self._queue.counts()
+        return stats
+
+    # --- Helpers ---
+
+    def _seen(self, node: str) -> None:
+        with self._lock:
+            self._nodes[node] = time.monotonic()
+
+    def _done(self, node: str) -> bool:
+        """Whether the run is finished, remembering that the node was told."""
+        if not self._queue.finished():
+            return False
+        with self._lock:
+            self._released.add(node)
+        return True
+
+    def _all_released(self) -> bool:
+        """Whether every node heard from recently was told the run is done."""
+        cutoff = time.monotonic() - self.lease_seconds
+        with self._lock:
+            return all(node in self._released
+                       for node, seen in self._nodes.items() if seen >= cutoff)
+
+    def _count(self, result: Dict[str, Any], node: str) -> None:
+        with self._lock:
+            self.stats['results'] += 1
+            self.stats['nodes'][node] = self.stats['nodes'].get(node, 0) + 1
+            if not result.get('valid'):
+                self.stats['failed'] += 1
+            if result.get('limit_exceeded'):
+                self.stats['limited'] += 1
+            if 'job_key' in result and result['job_key'] is None:
+                self.stats['errors'] += 1
+
+    def _report(self, started: float) -> None:
+        """Update throughput figures and notify the progress callback."""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.stats['elapsed'] = round(elapsed, 3)
+            if elapsed > 0:
+                self.stats['files_per_second'] = round(self.stats['results'] / elapsed, 2)
+            stats = dict(self.stats, nodes=dict(self.stats['nodes']))
+        if self.progress:
+            self.progress(stats)
+
+
+class CoordinatorRequestHandler(BaseHTTPRequestHandler):
+    """Request handler routing node requests to a Coordinator."""
+
+    coordinator: Coordinator = None
+    server_version = "PolicyValidator/0.1"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == '/status':
+            self._send_json(HTTPStatus.OK, self.coordinator.status())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {path}"})
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path
+        try:
+            body = self._read_json()
+            node = str(body['node'])
+            if path == '/lease':
+                payload = self.coordinator.lease(node, int(body.get('count', 1)))
+            elif path == '/heartbeat':
+                payload = self.coordinator.heartbeat(node, list(body.get('leases', [])))
+            elif path == '/complete':
+                if not isinstance(body.get('line'), int) or not isinstance(
+                        body.get('results'), list):
+                    raise ValueError("Completion must contain 'line' and 'results'")
+                payload = {'accepted': self.coordinator.complete(body)}
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {path}"})
+                return
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': f"Invalid request: {e}"})
+            return
+        except Exception as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+            return
+        self._send_json(HTTPStatus.OK, payload)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_REQUEST_BYTES:
+            raise ValueError(f"Body exceeds {MAX_REQUEST_BYTES} bytes")
+        body = json.loads(self.rfile.read(length) or b'{}')
+        if not isinstance(body, dict):
+            raise ValueError("Body must be a JSON object")
+        return body
+
+    def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Lease:
+    """A leased job and the results of its documents so far."""
+
+    def __init__(self, lease_id: str, line_number: int):
+        self.id = lease_id
+        self.line = line_number
+        self.results: List[Dict[str, Any]] = []
+        self.futures: Set[Future] = set()
+
+
+class WorkerNode:
+    """Pull jobs from a Coordinator and validate them in a local pool.
+
+    Attributes:
+        url (str): Base URL of the coordinator
+        node_id (str): Name the node reports to the coordinator
+        workers (int): Number of worker processes
+        stats (dict): Counters for the current run (see run())
+    """
+
+    def __init__(self, url: str, workers: Optional[int] = None,
+                 limits: Optional[ResourceLimits] = None, dedupe: bool = False,
+                 node_id: Optional[str] = None):
+        """Initialize the node.
+
+        Args:
+            url: Coordinator URL, e.g. "http://coordinator:8766".
+            workers: Worker processes (default: CPU count).
+            limits: Time and memory budget of each document (default:
+                ResourceLimits()).
+            dedupe: Reuse results across near-duplicate documents.
+            node_id: Name of the node (default: host name and process ID).
+        """
+        self.url = url.rstrip('/')
+        self.workers = workers or os.cpu_count() or 1
+        self.limits = limits
+        self.dedupe = dedupe
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.stats: Dict[str, Any] = {}
+        self._leases: Dict[str, _Lease] = {}
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def run(self) -> Dict[str, Any]:
+        """Validate leased jobs until the coordinator reports the run done.
+
+        Returns:
+            dict: Node statistics:
+                {
+                    'jobs': int,        # Jobs completed and accepted
+                    'documents': int,   # Documents validated
+                    'failed': int,      # Documents that failed validation
+                    'limited': int,     # Documents stopped by a resource limit
+                    'errors': int,      # Documents that could not be run
+                    'dropped': int      # Jobs finished first by another node
+                }
+
+        Raises:
+            OSError: If the coordinator stays unreachable for RETRY_WINDOW
+                seconds.
+        """
+        self.stats = {'jobs': 0, 'documents': 0, 'failed': 0, 'limited': 0, 'errors': 0,
+                      'dropped': 0}
+        self._leases = {}
+        self._done.clear()
+        capacity = self.workers * PREFETCH_FACTOR
+        pending: Dict[Future, Tuple[_Lease, Dict[str, Any], str, str]] = {}
+        lease_seconds = LEASE_SECONDS
+
+        with SandboxPool(self.workers, self.limits, initializer=warm_worker) as pool:
+            heartbeat = threading.Thread(target=self._heartbeat,
+                                         args=(lambda: lease_seconds,), daemon=True)
+            heartbeat.start()
+            try:
+                while True:
+                    with self._lock:
+                        free = capacity - len(self._leases)
+                    leased = []
+                    if free > 0 and not self._done.is_set():
+                        reply = self._post('/lease', {'node': self.node_id, 'count': free})
+                        lease_seconds = reply.get('lease_seconds', lease_seconds)
+                        leased = reply['jobs']
+                        if reply['done']:
+                            self._done.set()
+                    if self._done.is_set():
+                        for future in pending:
+                            future.cancel()
+                        break
+
+                    for item in leased:
+                        self._start(pool, pending, _Lease(item['lease'], item['line']),
+                                    item['job'])
+                    if not pending:
+                        if not leased:
+                            self._done.wait(POLL_INTERVAL)
+                        continue
+                    done, _ = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        lease, job, key, digest = pending.pop(future)
+                        with self._lock:
+                            if self._leases.get(lease.id) is not lease:
+                                continue  # Dropped: another node finished the job
+                        lease.futures.discard(future)
+                        lease.results.append(self._result(future, lease, job, key, digest))
+                        if not lease.futures:
+                            self._complete(lease)
+            finally:
+                self._done.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+        return dict(self.stats)
+
+    def _start(self, pool: SandboxPool, pending: Dict[Future, Any], lease: _Lease,
+               job: Dict[str, Any]) -> None:
+        """Submit the documents of a leased job."""
+        with self._lock:
+            self._leases[lease.id] = lease
+        for document, _, digest in document_jobs(job):
+            if 'error' in document:
+                self.stats['errors'] += 1
+                lease.results.append(error_record(lease.line, document, document['error']))
+                continue
+            key = document_key(document, digest)
+            if self.dedupe:
+                document = dict(document, dedupe=True)
+            future = pool.submit(run_job, document)
+            pending[future] = (lease, document, key, digest)
+            lease.futures.add(future)
+        if not lease.futures:
+            self._complete(lease)
+
+    def _result(self, future: Future, lease: _Lease, job: Dict[str, Any], key: str,
+                digest: str) -> Dict[str, Any]:
+        """Build the output record of a finished document."""
+        try:
+            result = future.result()
+        except ResourceLimitError as e:
+            result = limit_result(job, e)
+            self.stats['limited'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            return error_record(lease.line, job, str(e))
+        result.pop('trace', None)
+        if job.get('hash'):
+            # Keyed by content once the worker has hashed the file
+            digest = result.pop('file_hash', '')
+            key = document_key(job, digest) if digest else key
+        result['line'] = lease.line
+        result['job_key'] = key
+        result['file_hash'] = digest or None
+        self.stats['documents'] += 1
+        if not result.get('valid'):
+            self.stats['failed'] += 1
+        return result
+
+    def _complete(self, lease: _Lease) -> None:
+        """Send the results of a lease to the coordinator."""
+        with self._lock:
+            self._leases.pop(lease.id, None)
+        reply = self._post('/complete', {'node': self.node_id, 'lease': lease.id,
+                                         'line': lease.line, 'results': lease.results})
+        self.stats['jobs' if reply['accepted'] else 'dropped'] += 1
+
+    def _heartbeat(self, lease_seconds: Any) -> None:
+        """Renew the node's leases until the run is done (heartbeat thread)."""
+        while not self._done.wait(lease_seconds() / 3):
+            with self._lock:
+                lease_ids = list(self._leases)
+            if not lease_ids:
+                continue
+            try:
+                reply = self._post('/heartbeat', {'node': self.node_id, 'leases': lease_ids})
+            except OSError:
+                continue  # The main loop notices if the coordinator is gone
+            with self._lock:
+                for lease_id in reply['dropped']:
+                    lease = self._leases.pop(lease_id, None)
+                    if lease is not None:
+                        for future in lease.futures:
+                            future.cancel()
+            if reply['done']:
+                self._done.set()
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST JSON to the coordinator, retrying while it is unreachable.
+
+        Raises:
+            OSError: If the coordinator stays unreachable for RETRY_WINDOW
+                seconds or rejects the request.
+        """
+        body = json.dumps(payload, default=str).encode('utf-8')
+        deadline = time.monotonic() + RETRY_WINDOW
+        delay = POLL_INTERVAL / 4
+        while True:
+            request = Request(self.url + path, data=body,
+                              headers={'Content-Type': 'application/json'})
+            try:
+                with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                    return json.loads(response.read())
+            except HTTPError as e:
+                raise OSError(f"Coordinator rejected {path}: {e.read().decode(errors='replace')}")
+            except (URLError, OSError):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, POLL_INTERVAL * 4)
@@ -0,0 +1,252 @@
+"""Warm validation daemon for the thin command-line client.
+
+The daemon imports the parsers, compiles every standard's section matcher
+and opens the MIME detector once (see service.workers.warm_worker), then
+runs the commands that ``policy-validator-client`` forwards over a Unix
+domain socket (see client) in its own process. A forwarded ``validate``
+therefore costs only the validation, and its output is streamed back to
+the client as it is written.
+
+Protocol:
+    The client sends one JSON line, {"argv": [...], "cwd": str, "stop":
+    bool}. The daemon answers with JSON lines {"out": text} and {"err":
+    text} as the command writes to stdout and stderr, then {"exit": code}.
+
+Lifecycle:
+    Requests are handled one at a time, in the client's working
+    directory. Process-wide state a command may change (working directory,
+    standard streams, environment, stage instrumentation, tracemalloc and
+    profile hooks) is restored after each request, so one request's
+    options never leak into the next. The daemon exits after idle_timeout seconds without a
+    request, after max_requests requests so that a long-lived process does
+    not accumulate state, or when a client asks it to stop. A lock file
+    next to the socket keeps a second daemon from serving the same socket,
+    so clients racing to auto-start one are harmless.
+
+Example:
+    $ policy-validator-cli daemon --idle-timeout 0   # foreground, never idles out
+    $ policy-validator-client validate policy.pdf --standard ISO
+    $ policy-validator-cli daemon --stop
+
+Note:
+    The socket is created readable and writable by its owner only, in a
+    directory private to that user (see client.default_socket_path), and
+    where the system reports peer credentials, connections from other
+    users are closed unanswered. Commands run with the daemon's
+    permissions, which are those of the user who started it. Documents are
+    parsed in the daemon process itself, as with
+    ``policy-validator-cli validate``.
+"""
+
+import argparse
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import traceback
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from ..client import DAEMON_COMMANDS, DEFAULT_IDLE_TIMEOUT, default_socket_path, peer_uid
+from ..utils import instrumentation
+from .workers import warm_worker
+
+# --- Constants ---
+MAX_REQUESTS = 10000          # Requests served before the daemon exits
+REQUEST_TIMEOUT = 5.0         # Seconds a client may take to send its request
+MAX_REQUEST_BYTES = 1024 * 1024
+LISTEN_BACKLOG = 64
+
+
+class _ReplyStream(io.TextIOBase):
+    """Text stream forwarding complete lines to the client as reply frames."""
+
+    def __init__(self, connection: socket.socket, key: str):
+        super().__init__()
+        self.connection = connection
+        self.key = key
+        self._buffer: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._buffer.append(text)
+        if '\n' in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self._buffer:
+            text = ''.join(self._buffer)
+            self._buffer = []
+            _send(self.connection, {self.key: text})
+
+
+def _send(connection: socket.socket, reply: Dict[str, Any]) -> None:
+    connection.sendall(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+class ValidationDaemon:
+    """Serve forwarded command lines from a warm process.
+
+    Attributes:
+        socket_path (str): Unix domain socket to listen on
+        idle_timeout (float): Seconds without a request before exiting (0: never)
+        max_requests (int): Requests served before exiting (0: no limit)
+        requests (int): Requests served so far
+    """
+
+    def __init__(self, socket_path: Optional[str] = None,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_requests: int = MAX_REQUESTS):
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Socket to listen on (default: the socket the
+                client of this installation connects to).
+            idle_timeout: Seconds without a request before exiting; 0
+                keeps the daemon running.
+            max_requests: Requests served before exiting; 0 for no limit.
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.requests = 0
+        self._stopping = False
+
+    def serve(self) -> bool:
+        """Warm up, then serve requests until idle, stopped or recycled.
+
+        Returns:
+            bool: False if another daemon already serves the socket.
+        """
+        import fcntl
+
+        lock = open(f"{self.socket_path}.lock", 'a')
+        try:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False
+
+            warm_worker()
+            from .. import cli  # noqa: F401 - loaded before the first request
+
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # Left by a daemon that was killed
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            umask = os.umask(0o177)
+            try:
+                server.bind(self.socket_path)
+            finally:
+                os.umask(umask)
+            try:
+                server.listen(LISTEN_BACKLOG)
+                server.settimeout(self.idle_timeout or None)
+                while not self._stopping and (not self.max_requests
+                                              or self.requests < self.max_requests):
+                    try:
+                        connection, _ = server.accept()
+                    except socket.timeout:
+                        break
+                    with connection:
+                        uid = peer_uid(connection)
+                        if uid is not None and uid != os.getuid():
+                            continue
+                        try:
+                            self._handle(connection)
+                        except (OSError, ValueError):
+                            pass  # The client went away or sent garbage
+                    self.requests += 1
+            finally:
+                server.close()
+                os.unlink(self.socket_path)
+            return True
+        finally:
+            lock.close()
+
+    def _handle(self, connection: socket.socket) -> None:
+        """Read one request and run it, streaming the output back."""
+        connection.settimeout(REQUEST_TIMEOUT)
+        with connection.makefile('rb') as reader:
+            request = json.loads(reader.readline(MAX_REQUEST_BYTES))
+        connection.settimeout(None)
+
+        if request.get('stop'):
+            self._stopping = True
+            _send(connection, {'exit': 0})
+            return
+        argv = [str(arg) for arg in request.get('argv', [])]
+        if not argv or argv[0] not in DAEMON_COMMANDS:
+            _send(connection, {'err': f"The daemon runs only: {', '.join(DAEMON_COMMANDS)}\n"})
+            _send(connection, {'exit': 2})
+            return
+        _send(connection, {'exit': self._run(argv, request.get('cwd') or '/', connection)})
+
+    def _run(self, argv: List[str], cwd: str, connection: socket.socket) -> int:
+        """Run a command line as the CLI would, in the client's directory."""
+        from ..cli import main
+
+        stdout, stderr = _ReplyStream(connection, 'out'), _ReplyStream(connection, 'err')
+        saved = os.getcwd(), sys.stdout, sys.stderr
+        state = _RunState()
+        try:
+            os.chdir(cwd)
+            sys.stdout, sys.stderr = stdout, stderr
+            try:
+                main(argv)
+                code = 0
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    stderr.write(e.code + '\n')
+                code = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except Exception:
+                stderr.write(traceback.format_exc())
+                code = 1
+            stdout.flush()
+            stderr.flush()
+        finally:
+            os.chdir(saved[0])
+            sys.stdout, sys.stderr = saved[1], saved[2]
+            state.restore()
+        return code
+
+
+class _RunState:
+    """Process-wide state a command may change, saved to restore after it."""
+
+    def __init__(self) -> None:
+        self.environ = dict(os.environ)
+        self.recorder = instrumentation.get_recorder()
+        self.tracing = tracemalloc.is_tracing()
+        self.profile = sys.getprofile()
+        self.trace = sys.gettrace()
+
+    def restore(self) -> None:
+        if dict(os.environ) != self.environ:
+            os.environ.clear()
+            os.environ.update(self.environ)
+        if self.recorder is None:
+            instrumentation.disable()
+        if tracemalloc.is_tracing() and not self.tracing:
+            tracemalloc.stop()
+        sys.setprofile(self.profile)
+        sys.settrace(self.trace)
+        threading.setprofile(self.profile)
+        threading.settrace(self.trace)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a daemon in the foreground (used by the client's auto-start)."""
+    parser = argparse.ArgumentParser(prog="python -m policy_validator.service.daemon")
+    parser.add_argument("--socket", help="Unix domain socket to listen on")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    ValidationDaemon(args.socket, args.idle_timeout).serve()
+
+
+if __name__ == "__main__":
+    main()
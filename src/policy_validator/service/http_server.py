@@ -0,0 +1,426 @@
+"""Local HTTP validation service with a warm worker pool.
+
+This module implements a long-running HTTP server that validates policy
+documents in a pre-forked pool of worker processes. Workers import the
+parsers, compile every standard's section matcher and open the MIME
+detector once at startup, so a request costs only its own validation.
+
+Endpoints:
+    POST /validate
+        JSON body {"path", "standard", "sections", "fail_fast"} to validate a
+        file visible to the server, or the raw document bytes as the body
+        with ?filename=...&standard=...&section=...&fail_fast=1 query
+        parameters to validate an upload.
+    POST /validate/batch
+        JSON body {"jobs": [...], "standard", "sections", "fail_fast"}; each
+        job is a path job as above, top-level keys are defaults.
+    GET /metrics
+        Request counts and latency percentiles (p50/p95/p99) as JSON.
+    GET /metrics/stages
+        Per-stage validation timings in Prometheus text format, when the
+        service runs with ``instrument=True`` (``serve --instrument``).
+    GET /health
+        Liveness check.
+
+Overload Handling:
+    At most ``queue_size`` jobs may be running or queued at once. Requests
+    that would exceed the bound are rejected immediately with 429 and a
+    Retry-After header instead of queueing without limit. A batch larger
+    than ``queue_size`` could never be admitted, so it is rejected with 413
+    instead; split it into smaller batches. Jobs that do not finish within
+    ``timeout`` seconds return 504.
+
+Resource Limits:
+    Workers run in a SandboxPool (see service.sandbox): a job still running
+    after ``timeout`` seconds, or exceeding ``memory_limit``, has its worker
+    killed and replaced instead of occupying it for good. Timeouts still
+    return 504; jobs stopped by the memory or CPU limit, or by a worker
+    crash, return a failed result with 'limit_exceeded'.
+
+Example:
+    $ policy-validator-cli serve --port 8765 --workers 4
+    $ curl -X POST --data-binary @policy.docx \\
+        "http://127.0.0.1:8765/validate?filename=policy.docx&standard=ISO"
+
+Note:
+    The service binds to localhost by default and performs no
+    authentication; path jobs read any file the server user can read.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from ..utils.instrumentation import Recorder
+from .sandbox import (
+    DEFAULT_MEMORY_LIMIT, TIMEOUT, ResourceLimitError, ResourceLimits, SandboxPool,
+    limit_result
+)
+from .workers import run_job, warm_worker
+
+# --- Constants ---
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 30.0            # Seconds before a job returns 504
+DEFAULT_QUEUE_FACTOR = 8          # Pending jobs allowed per worker
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+LATENCY_WINDOW = 10000            # Most recent requests used for percentiles
+
+
+class AdmissionControl:
+    """Counter bounding the number of jobs running or queued in the pool.
+
+    Attributes:
+        capacity (int): Maximum number of admitted jobs
+        in_flight (int): Jobs currently admitted
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, count: int = 1) -> bool:
+        """Admit count jobs if they fit, without blocking."""
+        with self._lock:
+            if self.in_flight + count > self.capacity:
+                return False
+            self.in_flight += count
+            return True
+
+    def release(self, count: int = 1) -> None:
+        """Release admitted jobs once they have finished."""
+        with self._lock:
+            self.in_flight -= count
+
+
+class LatencyTracker:
+    """Request counters and a sliding window of request latencies.
+
+    Attributes:
+        counters (Dict[str, int]): Counts of requests by outcome
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.counters = {'requests': 0, 'jobs': 0, 'rejected': 0,
+                         'timeouts': 0, 'limited': 0, 'errors': 0}
+
+    def record(self, elapsed_ms: float, jobs: int = 1) -> None:
+        """Record a completed request and the number of jobs it carried."""
+        with self._lock:
+            self._latencies.append(elapsed_ms)
+            self.counters['requests'] += 1
+            self.counters['jobs'] += jobs
+
+    def count(self, outcome: str) -> None:
+        """Increment an outcome counter (rejected, timeouts, limited, errors)."""
+        with self._lock:
+            self.counters[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counters and latency percentiles in milliseconds."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counters = dict(self.counters)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 3)
+
+        counters['latency_ms'] = {
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'max': round(latencies[-1], 3) if latencies else None,
+            'window': len(latencies),
+        }
+        return counters
+
+
+class ServiceError(Exception):
+    """Error returned to the client with an HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ValidationService:
+    """HTTP validation server backed by a warm process pool.
+
+    Attributes:
+        host (str): Interface to bind
+        port (int): TCP port to bind (0 picks a free port)
+        workers (int): Number of worker processes
+        timeout (float): Seconds a job may take before the request returns 504
+        memory_limit (int): Bytes of address space per worker (0: unlimited)
+        admission (AdmissionControl): Bound on running and queued jobs
+        metrics (LatencyTracker): Request counters and latencies
+        stage_metrics (Optional[Recorder]): Per-stage timings merged from
+            the workers, if instrumented
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 workers: Optional[int] = None, queue_size: Optional[int] = None,
+                 timeout: float = DEFAULT_TIMEOUT, instrument: bool = False,
+                 memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        """Initialize the service.
+
+        Args:
+            host: Interface to bind.
+            port: TCP port to bind.
+            workers: Worker processes (default: CPU count).
+            queue_size: Maximum running plus queued jobs before requests
+                are rejected with 429 (default: workers * 8).
+            timeout: Seconds a request waits for its jobs.
+            instrument: Time each validation stage in the workers and
+                expose the aggregates on /metrics/stages.
+            memory_limit: Bytes of address space per worker; 0 disables
+                the limit.
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.admission = AdmissionControl(queue_size or self.workers * DEFAULT_QUEUE_FACTOR)
+        self.metrics = LatencyTracker()
+        # Aggregates only; a long-running service keeps no trace spans
+        self.stage_metrics = Recorder(max_spans=0) if instrument else None
+        self._pool: Optional[SandboxPool] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """Fork and warm the worker pool, then bind the HTTP server."""
+        limits = ResourceLimits(timeout=self.timeout, memory=self.memory_limit)
+        self._pool = SandboxPool(self.workers, limits, initializer=warm_worker)
+        # Submitting one task per worker forks them all before the first request
+        for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+        handler = type('BoundValidationHandler', (ValidationRequestHandler,),
+                       {'service': self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+    def serve_forever(self) -> None:
+        """Start if needed and handle requests until shutdown() is called."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Release the listening socket and the worker pool."""
+        if self._server is not None:
+            self._server.server_close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    # --- Job execution ---
+
+    def run_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run jobs in the pool and wait for their results.
+
+        Args:
+            jobs: Job dictionaries (see service.workers).
+
+        Returns:
+            list: Results in job order.
+
+        Raises:
+            ServiceError: 413 if there are more jobs than the queue holds,
+                429 if they do not fit in it now, 504 on timeout, 400 for
+                invalid jobs.
+        """
+        if len(jobs) > self.admission.capacity:
+            self.metrics.count('rejected')
+            raise ServiceError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Batch of {len(jobs)} jobs exceeds the queue size of "
+                f"{self.admission.capacity}; split it into smaller batches"
+            )
+        if not self.admission.try_acquire(len(jobs)):
+            self.metrics.count('rejected')
+            raise ServiceError(HTTPStatus.TOO_MANY_REQUESTS, "Server overloaded, retry later")
+
+        futures: List[Future] = []
+        for job in jobs:
+            if self.stage_metrics is not None:
+                job = dict(job, instrument=True)
+            future = self._pool.submit(run_job, job)
+            # Slots are freed when the pool finishes, not when the client gives up
+            future.add_done_callback(lambda _: self.admission.release())
+            futures.append(future)
+
+        deadline = time.monotonic() + self.timeout
+        results = []
+        try:
+            for job, future in zip(jobs, futures):
+                try:
+                    result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except ResourceLimitError as e:
+                    if e.reason == TIMEOUT:
+                        raise TimeoutError from e
+                    self.metrics.count('limited')
+                    result = limit_result(job, e)
+                trace = result.pop('trace', None)
+                if trace and self.stage_metrics is not None:
+                    self.stage_metrics.merge_spans(trace)
+                results.append(result)
+        except TimeoutError:
+            for future in futures:
+                future.cancel()
+            self.metrics.count('timeouts')
+            raise ServiceError(HTTPStatus.GATEWAY_TIMEOUT,
+                               f"Validation did not finish within {self.timeout} seconds")
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, str(e))
+        return results
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """Request handler routing HTTP requests to a ValidationService."""
+
+    service: ValidationService = None
+    server_version = "PolicyValidator/0.1"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._send_json(HTTPStatus.OK, {'status': 'ok'})
+        elif path == '/metrics':
+            snapshot = self.service.metrics.snapshot()
+            snapshot['in_flight'] = self.service.admission.in_flight
+            snapshot['queue_size'] = self.service.admission.capacity
+            self._send_json(HTTPStatus.OK, snapshot)
+        elif path == '/metrics/stages':
+            if self.service.stage_metrics is None:
+                self._send_json(HTTPStatus.NOT_FOUND,
+                                {'error': "Stage metrics require an instrumented service"})
+                return
+            body = self.service.stage_metrics.prometheus_text().encode('utf-8')
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {path}"})
+
+    def do_POST(self) -> None:
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        try:
+            if url.path == '/validate':
+                jobs = [self._single_job(parse_qs(url.query))]
+            elif url.path == '/validate/batch':
+                jobs = self._batch_jobs()
+            else:
+                raise ServiceError(HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}")
+
+            results = self.service.run_jobs(jobs)
+            payload: Any = results[0] if url.path == '/validate' else {'results': results}
+            self.service.metrics.record((time.perf_counter() - started) * 1000, len(jobs))
+            self._send_json(HTTPStatus.OK, payload)
+        except ServiceError as e:
+            headers = {'Retry-After': '1'} if e.status == HTTPStatus.TOO_MANY_REQUESTS else {}
+            self._send_json(e.status, {'error': str(e)}, headers)
+        except Exception as e:
+            self.service.metrics.count('errors')
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)})
+
+    # --- Request parsing ---
+
+    def _read_body(self) -> bytes:
+        """Read the request body, enforcing the upload size limit."""
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise ServiceError(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required")
+        if not (length.isascii() and length.isdigit()):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {length!r}")
+        if int(length) > MAX_UPLOAD_BYTES:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                               f"Body exceeds {MAX_UPLOAD_BYTES} bytes")
+        return self.rfile.read(int(length))
+
+    def _read_json(self) -> Any:
+        """Read and decode a JSON request body."""
+        try:
+            return json.loads(self._read_body() or b'{}')
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+
+    def _single_job(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Build the job for POST /validate from a JSON body or an upload."""
+        if self.headers.get_content_type() == 'application/json':
+            job = self._read_json()
+            if not isinstance(job, dict) or 'path' not in job:
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "JSON body must contain 'path'")
+            return job
+
+        job: Dict[str, Any] = {
+            'path': query.get('filename', ['upload'])[0],
+            'content': self._read_body(),
+            'fail_fast': query.get('fail_fast', ['0'])[0].lower() in ('1', 'true', 'yes'),
+        }
+        if 'standard' in query:
+            job['standard'] = query['standard'][0]
+        if 'section' in query:
+            job['sections'] = query['section']
+        return job
+
+    def _batch_jobs(self) -> List[Dict[str, Any]]:
+        """Build the jobs for POST /validate/batch."""
+        body = self._read_json()
+        if not isinstance(body, dict) or not isinstance(body.get('jobs'), list):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "JSON body must contain a 'jobs' list")
+
+        defaults = {key: body[key] for key in ('standard', 'sections', 'fail_fast')
+                    if key in body}
+        jobs = []
+        for job in body['jobs']:
+            if isinstance(job, str):
+                job = {'path': job}
+            if not isinstance(job, dict) or 'path' not in job:
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Each job must contain 'path'")
+            jobs.append(dict(defaults, **job))
+        return jobs
+
+    # --- Responses ---
+
+    def _send_json(self, status: HTTPStatus, payload: Any,
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Per-request logging to stderr would dominate small requests
+        pass
@@ -0,0 +1,579 @@
+"""Sandboxed worker processes with per-document time and memory limits.
+
+Malformed or adversarial documents can make PyPDF2 spin for minutes or
+allocate gigabytes. This module runs validations in worker processes that
+each document can only cost a bounded budget:
+
+    - Memory: the worker's address space is capped with RLIMIT_AS, so an
+      allocation beyond the budget fails with MemoryError instead of
+      exhausting the machine. The worker reports it and is replaced.
+    - CPU time: before each task the worker's RLIMIT_CPU soft limit is set
+      to its CPU time so far plus the budget; the kernel kills a worker
+      that exceeds it with SIGXCPU.
+    - Wall-clock time: the pool kills a worker whose task is still running
+      at its deadline, e.g. blocked on a slow network share. The clock
+      starts when the task is sent, so a new worker's initializer counts
+      against it and an initializer that hangs is stopped too.
+
+A worker that crashes, runs out of memory or is killed is replaced with a
+fresh one and its task fails with ResourceLimitError; the other tasks are
+not affected, unlike a ProcessPoolExecutor, which is broken for good by
+one dead worker. limit_result() turns the error into the structured
+result recorded for the offending document.
+
+Cancelling the future of a running task kills its worker, which is
+replaced, and the future raises CancelledError; a ProcessPoolExecutor
+would let the task run to the end.
+
+Example:
+    >>> from policy_validator.service.sandbox import ResourceLimits, SandboxPool
+    >>> from policy_validator.service.workers import run_job, warm_worker
+    >>> limits = ResourceLimits(timeout=60, memory=1024 ** 3)
+    >>> with SandboxPool(4, limits, initializer=warm_worker) as pool:
+    ...     future = pool.submit(run_job, {'path': 'malformed.pdf'})
+    ...     try:
+    ...         result = future.result()
+    ...     except ResourceLimitError as e:
+    ...         result = limit_result({'path': 'malformed.pdf'}, e)
+    >>> result['limit_exceeded']
+    {'reason': 'timeout', 'limit': 60.0}
+
+Note:
+    Memory and CPU limits need the Unix resource module; elsewhere only the
+    wall-clock timeout is enforced. The memory limit covers the whole
+    worker, including the interpreter and loaded libraries (about 200 MB).
+"""
+
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Executor, Future
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from ..utils.archives import split_member_path
+from ..validators.standards import resolve_standard
+
+# --- Constants ---
+DEFAULT_TIMEOUT = 120.0               # Wall-clock seconds per document
+DEFAULT_MEMORY_LIMIT = 2 * 1024 ** 3  # Bytes of address space per worker
+STOP_GRACE = 1.0                      # Seconds a stopping worker may take to exit
+
+# Failure reasons
+TIMEOUT = 'timeout'
+CPU_TIME = 'cpu_time'
+MEMORY = 'memory'
+CRASH = 'crash'
+
+
+class ResourceLimits:
+    """Budget of one document in a sandboxed worker.
+
+    Attributes:
+        timeout (Optional[float]): Wall-clock seconds per task
+        memory (Optional[int]): Address space of the worker in bytes
+        cpu_time (Optional[float]): CPU seconds per task
+    """
+
+    def __init__(self, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 memory: Optional[int] = DEFAULT_MEMORY_LIMIT,
+                 cpu_time: Optional[float] = None):
+        """Initialize the limits; None or 0 disables a limit.
+
+        Args:
+            timeout: Wall-clock seconds a task may run.
+            memory: Bytes of address space a worker may map.
+            cpu_time: CPU seconds a task may use (default: the timeout,
+                which single-threaded parsing cannot exceed anyway, but
+                the kernel enforces even if the pool cannot).
+        """
+        self.timeout = timeout or None
+        self.memory = memory or None
+        self.cpu_time = cpu_time or self.timeout
+
+    def __repr__(self) -> str:
+        return (f"ResourceLimits(timeout={self.timeout}, memory={self.memory}, "
+                f"cpu_time={self.cpu_time})")
+
+
+class ResourceLimitError(Exception):
+    """A sandboxed task exceeded its budget or its worker died.
+
+    Attributes:
+        reason (str): TIMEOUT, CPU_TIME, MEMORY or CRASH
+        limit (Optional[float]): The limit exceeded (seconds or bytes)
+        exit_code (Optional[int]): Exit code of the worker; negative for a signal
+    """
+
+    def __init__(self, reason: str, limit: Optional[float] = None,
+                 exit_code: Optional[int] = None):
+        self.reason = reason
+        self.limit = limit
+        self.exit_code = exit_code
+        super().__init__(self._describe())
+
+    def _describe(self) -> str:
+        if self.reason == TIMEOUT:
+            return f"Validation exceeded the time limit of {self.limit:g} s"
+        if self.reason == CPU_TIME:
+            return f"Validation exceeded the CPU time limit of {self.limit:g} s"
+        if self.reason == MEMORY:
+            return f"Validation exceeded the memory limit of {self.limit / 1024 ** 2:.0f} MB"
+        if self.exit_code is not None and self.exit_code < 0:
+            try:
+                name = signal.Signals(-self.exit_code).name
+            except ValueError:
+                name = f"signal {-self.exit_code}"
+            return f"Validation worker was killed by {name}"
+        return f"Validation worker exited unexpectedly (exit code {self.exit_code})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return ResourceLimitError, (self.reason, self.limit, self.exit_code)
+
+
+def limit_result(job: Dict[str, Any], error: ResourceLimitError) -> Dict[str, Any]:
+    """Build the result recorded for a job whose validation was stopped.
+
+    Args:
+        job: Job dictionary (see service.workers).
+        error: Why the validation was stopped.
+
+    Returns:
+        dict: Failed result with the error as its issue and
+        'limit_exceeded': {'reason': str, 'limit': float or None}.
+    """
+    try:
+        standard = resolve_standard(job.get('standard', 'Custom'))
+    except ValueError:
+        standard = job.get('standard', 'Custom')
+    content = job.get('content')
+    if content is not None:
+        size = len(content)
+    else:
+        try:
+            size = os.path.getsize(job.get('path', ''))
+        except OSError:
+            size = 0
+    return {
+        'path': job.get('path', ''),
+        'type': None,
+        'size': size,
+        'standard': standard,
+        'valid': False,
+        'issues': [str(error)],
+        'limit_exceeded': {'reason': error.reason, 'limit': error.limit}
+    }
+
+
+class _SandboxFuture(Future):
+    """Future whose cancel() also stops its task once it is running."""
+
+    def __init__(self, pool: "SandboxPool"):
+        super().__init__()
+        self._pool = pool
+
+    def cancel(self) -> bool:
+        """Cancel the task, killing its worker if it is running.
+
+        Returns:
+            bool: True if the task had not started. A running task returns
+            False, as for any Future, but its worker is killed and the
+            future raises CancelledError.
+        """
+        if super().cancel():
+            return True
+        if self.running():
+            self._pool._abort(self)
+        return False
+
+
+class _WorkItem:
+    """A submitted task waiting for or running in a worker."""
+
+    __slots__ = ('future', 'fn', 'args', 'kwargs')
+
+    def __init__(self, future: Future, fn: Callable[..., Any],
+                 args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+
+class _Worker:
+    """Parent-side handle of one sandboxed worker process."""
+
+    __slots__ = ('process', 'connection', 'item', 'deadline', 'retiring')
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.item: Optional[_WorkItem] = None
+        self.deadline: Optional[float] = None
+        self.retiring = False  # Replace after the current task
+
+
+class SandboxPool(Executor):
+    """Executor running tasks in resource-limited, recyclable processes.
+
+    Tasks and their results must be picklable. Tasks that exceed their
+    budget, or whose worker dies, fail with ResourceLimitError.
+
+    Attributes:
+        workers (int): Maximum number of worker processes
+        limits (ResourceLimits): Budget of every task
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 limits: Optional[ResourceLimits] = None,
+                 initializer: Optional[Callable[[], None]] = None,
+                 mp_context: Optional[Any] = None):
+        """Initialize the pool; workers are started as tasks arrive.
+
+        Args:
+            workers: Worker processes (default: CPU count).
+            limits: Budget of every task (default: ResourceLimits()).
+            initializer: Called once in every new worker, e.g. warm_worker.
+            mp_context: multiprocessing context; "spawn" is safer in
+                processes with threads, such as the GUI.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.limits = limits if limits is not None else ResourceLimits()
+        self.initializer = initializer
+        self._context = mp_context or multiprocessing.get_context()
+        self._queue: Deque[_WorkItem] = deque()
+        self._idle: List[_Worker] = []
+        self._busy: List[_Worker] = []
+        self._aborted: Set[Future] = set()  # Running tasks whose futures were cancelled
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._wakeup_reader, self._wakeup_writer = multiprocessing.Pipe(duplex=False)
+        self._manager = threading.Thread(target=self._manage, name="sandbox-manager",
+                                         daemon=True)
+        self._manager.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule fn(*args, **kwargs) in a worker and return its future.
+
+        Raises:
+            RuntimeError: If the pool was shut down.
+        """
+        future = _SandboxFuture(self)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit to a SandboxPool after shutdown")
+            self._queue.append(_WorkItem(future, fn, args, kwargs))
+        self._wake()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the workers once queued tasks are done.
+
+        Args:
+            wait: Block until the workers have exited.
+            cancel_futures: Cancel queued tasks that have not started.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft().future.cancel()
+        self._wake()
+        if wait:
+            self._manager.join()
+
+    # --- Manager thread ---
+
+    def _abort(self, future: Future) -> None:
+        """Have the manager kill the worker running a cancelled future's task."""
+        with self._lock:
+            self._aborted.add(future)
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self._wakeup_writer.send_bytes(b'')
+        except OSError:
+            pass  # Manager already exited
+
+    def _manage(self) -> None:
+        """Dispatch tasks, collect results and enforce deadlines."""
+        while True:
+            with self._lock:
+                self._dispatch()
+                if self._shutdown and not self._queue and not self._busy:
+                    break
+            now = time.monotonic()
+            deadlines = [worker.deadline for worker in self._busy if worker.deadline]
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            handles: List[Any] = [self._wakeup_reader]
+            for worker in self._busy:
+                handles += [worker.connection, worker.process.sentinel]
+            ready = set(wait(handles, timeout))
+            if self._wakeup_reader in ready:
+                while self._wakeup_reader.poll():
+                    self._wakeup_reader.recv_bytes()
+            with self._lock:
+                aborted, self._aborted = self._aborted, set()
+            for worker in list(self._busy):
+                if worker.item.future in aborted:
+                    self._kill(worker)
+                    self._finish(worker, error=CancelledError())
+                elif worker.connection in ready or worker.process.sentinel in ready:
+                    self._collect(worker)
+                elif worker.deadline and time.monotonic() >= worker.deadline:
+                    self._kill(worker)
+                    self._finish(worker, error=ResourceLimitError(TIMEOUT, self.limits.timeout))
+
+        for worker in self._idle:
+            self._stop(worker)
+        self._idle.clear()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+    def _dispatch(self) -> None:
+        """Hand queued tasks to idle workers, starting workers as needed."""
+        while self._queue:
+            if not self._idle and len(self._busy) >= self.workers:
+                return
+            item = self._queue.popleft()
+            if not item.future.set_running_or_notify_cancel():
+                continue
+            worker = self._idle_worker() or self._start_worker()
+            try:
+                worker.connection.send((item.fn, item.args, item.kwargs, self.limits.cpu_time))
+            except Exception as e:
+                # A dead idle worker, or a task that cannot be pickled
+                self._stop(worker)
+                item.future.set_exception(e)
+                continue
+            worker.item = item
+            if self.limits.timeout:
+                worker.deadline = time.monotonic() + self.limits.timeout
+            self._busy.append(worker)
+
+    def _idle_worker(self) -> Optional[_Worker]:
+        """Take a live idle worker, stopping those that died while idle.
+
+        A task sent to a dead worker would fail as a CRASH it did not cause.
+        """
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.process.is_alive():
+                return worker
+            self._stop(worker)
+        return None
+
+    def _start_worker(self) -> _Worker:
+        parent_end, child_end = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_end, self.limits.memory, self.initializer),
+            name="sandbox-worker", daemon=True
+        )
+        process.start()
+        child_end.close()
+        return _Worker(process, parent_end)
+
+    def _collect(self, worker: _Worker) -> None:
+        """Take the reply of a busy worker, or account for its death."""
+        try:
+            status, value = worker.connection.recv()
+        except (EOFError, OSError):
+            worker.process.join(STOP_GRACE)
+            exit_code = worker.process.exitcode
+            if resource is not None and exit_code == -signal.SIGXCPU:
+                error = ResourceLimitError(CPU_TIME, self.limits.cpu_time, exit_code)
+            else:
+                error = ResourceLimitError(CRASH, exit_code=exit_code)
+            self._kill(worker)
+            self._finish(worker, error=error)
+            return
+        if status == 'ready':
+            pass  # The task was sent while the worker was warming up
+        elif status == 'ok':
+            self._finish(worker, result=value)
+        elif status == MEMORY:
+            worker.retiring = True  # The heap may be fragmented or inconsistent
+            self._finish(worker, error=ResourceLimitError(MEMORY, self.limits.memory))
+        else:
+            self._finish(worker, error=value)
+
+    def _finish(self, worker: _Worker, result: Any = None,
+                error: Optional[BaseException] = None) -> None:
+        """Resolve a worker's task and return the worker to the idle list."""
+        item = worker.item
+        worker.item = worker.deadline = None
+        with self._lock:
+            self._busy.remove(worker)
+            if worker.process.is_alive() and not worker.retiring:
+                self._idle.append(worker)
+            else:
+                self._stop(worker)
+        if error is not None:
+            item.future.set_exception(error)
+        else:
+            item.future.set_result(result)
+
+    def _kill(self, worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join()
+        worker.retiring = True
+
+    def _stop(self, worker: _Worker) -> None:
+        """Ask a worker to exit, killing it if it does not."""
+        try:
+            worker.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        worker.process.join(STOP_GRACE)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.connection.close()
+
+
+def _worker_main(connection: Connection, memory: Optional[int],
+                 initializer: Optional[Callable[[], None]]) -> None:
+    """Run tasks received over the connection until told to stop."""
+    if memory and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    if initializer is not None:
+        initializer()
+    connection.send(('ready', None))
+    while True:
+        try:
+            task = connection.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        fn, args, kwargs, cpu_time = task
+        _limit_cpu_time(cpu_time)
+        try:
+            reply: Tuple[str, Any] = ('ok', fn(*args, **kwargs))
+        except MemoryError:
+            reply = (MEMORY, None)
+        except Exception as e:
+            reply = ('error', e)
+        try:
+            connection.send(reply)
+        except MemoryError:
+            connection.send((MEMORY, None))
+        except Exception as e:
+            # The result or exception could not be pickled
+            connection.send(('error', RuntimeError(f"{type(e).__name__}: {e}")))
+        if reply[0] == MEMORY:
+            return
+
+
+def _limit_cpu_time(cpu_time: Optional[float]) -> None:
+    """Let the current process use cpu_time more CPU seconds from now."""
+    if not cpu_time or resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_time)
+    hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+class SandboxedValidator:
+    """PolicyValidator stand-in that validates in a SandboxPool.
+
+    Provides validate_file(), validate_stream() and validate() like
+    PolicyValidator, so it can replace one in the GUI or in
+    utils.archives.validate_archive(). Members of ZIP archives are opened
+    by the worker itself, so they are decompressed within its limits.
+    Other streams (TAR members, uploads) are read into memory and sent as
+    job content, after checking their declared size against the memory
+    limit and reading no more than it. A document that exceeds its budget
+    gets the result of limit_result().
+
+    Attributes:
+        pool (SandboxPool): Pool running the validations
+        standard_name (str): Canonical name of the validation standard
+        sections (Optional[List[str]]): Sections required, or None for all
+        fail_fast (bool): Stop at the first failing mandatory rule
+    """
+
+    # validate_archive() need not buffer members for seeking; see _stream_job()
+    seeks_streams = False
+
+    def __init__(self, pool: SandboxPool, standard: str = "Custom",
+                 sections: Optional[Iterable[str]] = None, fail_fast: bool = False):
+        """Initialize the validator.
+
+        Raises:
+            ValueError: If the standard is not supported.
+        """
+        self.pool = pool
+        self.standard_name = resolve_standard(standard)
+        self.sections = list(sections) if sections is not None else None
+        self.fail_fast = fail_fast
+
+    def validate_file(self, file_path: str) -> Dict[str, Any]:
+        """Validate a file in a sandboxed worker."""
+        return self._run(self._job(file_path))
+
+    def validate_stream(self, file_path: str, stream: Any, size: int) -> Dict[str, Any]:
+        """Validate a document read from a binary stream in a sandboxed worker."""
+        try:
+            job = self._stream_job(file_path, stream, size)
+        except ResourceLimitError as e:
+            return dict(limit_result(self._job(file_path), e), size=size)
+        return self._run(job)
+
+    def validate(self, file_info: Dict[str, Any], stream: Any = None) -> Dict[str, Any]:
+        """Validate the document of a file information dictionary, updating it."""
+        if stream is None:
+            file_info.update(self._run(self._job(file_info['path'])))
+        else:
+            file_info.update(self.validate_stream(file_info['path'], stream,
+                                                  file_info.get('size', 0)))
+        return file_info
+
+    def _job(self, file_path: str) -> Dict[str, Any]:
+        return {'path': file_path, 'standard': self.standard_name,
+                'sections': self.sections, 'fail_fast': self.fail_fast}
+
+    def _stream_job(self, file_path: str, stream: Any, size: int) -> Dict[str, Any]:
+        """Build the job of a streamed document without buffering beyond the limit.
+
+        Raises:
+            ResourceLimitError: If the document is larger than the memory
+                limit, which the worker could not hold it in either.
+        """
+        job = self._job(file_path)
+        member = split_member_path(file_path)
+        if member is not None and member[0].lower().endswith('.zip'):
+            job['archive'], job['member'] = member
+            return job
+        limit = self.pool.limits.memory
+        if limit and size > limit:
+            raise ResourceLimitError(MEMORY, limit)
+        content = stream.read(limit + 1) if limit else stream.read()
+        if limit and len(content) > limit:
+            raise ResourceLimitError(MEMORY, limit)  # Declared size was wrong
+        job['content'] = content
+        return job
+
+    def _run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        from .workers import run_job
+
+        try:
+            result = self.pool.submit(run_job, job).result()
+        except ResourceLimitError as e:
+            return limit_result(job, e)
+        result.pop('elapsed_ms', None)
+        return result
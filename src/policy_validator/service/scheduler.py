@@ -0,0 +1,319 @@
+"""Cost-model-driven scheduling of batch validation jobs.
+
+In a parallel run, a few very large documents submitted last leave most
+workers idle while they finish, and several giant documents validated at
+once can exhaust memory. This module predicts the cost of each job from
+cheap signals and orders the work accordingly:
+
+    - CostModel predicts the CPU seconds and peak memory of a job from its
+      size and type, the page count of a PDF (read from the linearization
+      header or the page tree near the start or end of the file) and the
+      uncompressed size of a DOCX's document.xml (from the zip directory).
+      No document is parsed; at most two small windows of it are read.
+    - BatchScheduler hands out queued jobs longest-first, so large
+      documents start early and small ones fill the gaps at the end. A job
+      is admitted only while the predicted memory of the admitted jobs
+      fits the memory budget; a job that fits nowhere runs alone.
+    - CostModel.observe() refines the seconds-per-unit rate of each
+      document type from the timings reported by the workers. The learned
+      state can be saved and loaded, so later runs start calibrated.
+
+Example:
+    >>> model = CostModel.load("cost-model.json")
+    >>> scheduler = BatchScheduler(memory_budget=8 * 1024 ** 3)
+    >>> for job in jobs:
+    ...     scheduler.add(job, model.estimate(job, os.path.getsize(job['path'])))
+    >>> job, estimate = scheduler.pop()
+    >>> # ... validate the job ...
+    >>> scheduler.release(estimate)
+    >>> model.observe(estimate, elapsed_seconds)
+    >>> model.save("cost-model.json")
+
+Note:
+    Peak memory cannot be measured per job in a reused worker, so memory
+    predictions use fixed coefficients per type; only time is learned.
+"""
+
+import io
+import json
+import os
+import re
+import zipfile
+import zlib
+from bisect import insort
+from itertools import count
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+# --- Constants ---
+SCHEDULE_WINDOW = 1024             # Queued jobs ordered at once
+MAX_BUFFERED_CONTENT = 256 * 1024 ** 2  # Bytes of queued in-memory content
+MEMORY_BUDGET_FRACTION = 0.5       # Default budget as a share of physical memory
+SNIFF_WINDOW = 64 * 1024           # Bytes read at each end of a PDF
+MAX_OBJECT_STREAMS = 8             # Compressed object streams inflated per window
+MAX_INFLATED = 1024 * 1024         # Bytes inflated per object stream
+BYTES_PER_PAGE = 50 * 1024         # Page count guess when none is found
+PRIOR_WEIGHT = 3.0                 # Observations the built-in rates are worth
+
+# Cost coefficients per document type: seconds = overhead + rate * units and
+# memory = memory_base + memory_rate * memory units, where units are pages
+# for PDFs, bytes of document.xml for DOCX and file bytes otherwise, and
+# memory units are document.xml bytes for DOCX and file bytes otherwise.
+# 'typical' is the size at which the prior counts as PRIOR_WEIGHT runs.
+_PRIORS: Dict[str, Dict[str, float]] = {
+    'pdf': {'overhead': 0.05, 'rate': 0.025, 'typical': 20,
+            'memory_base': 16 * 1024 ** 2, 'memory_rate': 3.0},
+    'docx': {'overhead': 0.02, 'rate': 2.5e-7, 'typical': 100 * 1024,
+             'memory_base': 16 * 1024 ** 2, 'memory_rate': 10.0},
+    'doc': {'overhead': 0.02, 'rate': 2.5e-7, 'typical': 100 * 1024,
+            'memory_base': 16 * 1024 ** 2, 'memory_rate': 4.0},
+    'txt': {'overhead': 0.005, 'rate': 1.5e-7, 'typical': 100 * 1024,
+            'memory_base': 8 * 1024 ** 2, 'memory_rate': 0.0},
+    'other': {'overhead': 0.005, 'rate': 0.0, 'typical': 1,
+              'memory_base': 8 * 1024 ** 2, 'memory_rate': 0.0},
+}
+_KINDS = {'.pdf': 'pdf', '.docx': 'docx', '.doc': 'doc', '.txt': 'txt'}
+
+_LINEARIZED_RE = re.compile(rb'/Linearized\b[^>]*?/N\s+(\d+)')
+_PAGES_RE = re.compile(rb'/Type\s*/Pages\b')
+_COUNT_RE = re.compile(rb'/Count\s+(\d+)')
+_OBJECT_STREAM_RE = re.compile(rb'/Type\s*/ObjStm\b.*?stream\r?\n', re.S)
+
+
+class JobEstimate:
+    """Predicted cost of one job.
+
+    Attributes:
+        kind (str): Document type the coefficients were taken from
+        units (float): Size in the units of the type (see _PRIORS)
+        seconds (float): Predicted CPU seconds
+        memory (int): Predicted peak memory in bytes
+    """
+
+    __slots__ = ('kind', 'units', 'seconds', 'memory')
+
+    def __init__(self, kind: str, units: float, seconds: float, memory: int):
+        self.kind = kind
+        self.units = units
+        self.seconds = seconds
+        self.memory = memory
+
+    def __repr__(self) -> str:
+        return (f"JobEstimate(kind={self.kind!r}, units={self.units:g}, "
+                f"seconds={self.seconds:.3f}, memory={self.memory})")
+
+
+class CostModel:
+    """Predict job costs, learning seconds per unit from observed timings.
+
+    The rate of each type is the ratio of summed observed seconds (less
+    the fixed overhead) to summed units, with the built-in rate counted as
+    PRIOR_WEIGHT observations of a typical document. Large documents thus
+    weigh most, which are the ones whose order matters.
+    """
+
+    def __init__(self, state: Optional[Dict[str, Dict[str, float]]] = None):
+        """Initialize the model.
+
+        Args:
+            state: Learned state from to_dict(), e.g. of an earlier run.
+        """
+        self._observed: Dict[str, Dict[str, float]] = {
+            kind: {'units': 0.0, 'seconds': 0.0, 'jobs': 0} for kind in _PRIORS
+        }
+        for kind, observed in (state or {}).items():
+            if kind in self._observed:
+                self._observed[kind].update(
+                    (key, type(value)(observed[key]))
+                    for key, value in self._observed[kind].items() if key in observed
+                )
+
+    def rate(self, kind: str) -> float:
+        """Current seconds per unit of a document type."""
+        prior = _PRIORS[kind]
+        observed = self._observed[kind]
+        prior_units = PRIOR_WEIGHT * prior['typical']
+        return ((prior['rate'] * prior_units + observed['seconds'])
+                / (prior_units + observed['units']))
+
+    def estimate(self, job: Dict[str, Any], size: int) -> JobEstimate:
+        """Predict the cost of a job (see service.workers for the format).
+
+        Args:
+            job: Job dictionary; its 'content', if any, is inspected
+                instead of the file.
+            size: Document size in bytes.
+        """
+        kind, units, memory_units = document_units(job, size)
+        prior = _PRIORS[kind]
+        seconds = prior['overhead'] + self.rate(kind) * units
+        memory = int(prior['memory_base'] + prior['memory_rate'] * memory_units)
+        return JobEstimate(kind, units, seconds, memory)
+
+    def observe(self, estimate: JobEstimate, seconds: float) -> None:
+        """Record the time a job actually took."""
+        observed = self._observed[estimate.kind]
+        observed['units'] += estimate.units
+        observed['seconds'] += max(0.0, seconds - _PRIORS[estimate.kind]['overhead'])
+        observed['jobs'] += 1
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return the learned state as a JSON-serializable dictionary."""
+        return {kind: dict(observed) for kind, observed in self._observed.items()}
+
+    @classmethod
+    def load(cls, path: str) -> "CostModel":
+        """Load a model saved with save(); a missing or invalid file gives a new model."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return cls(state if isinstance(state, dict) else None)
+        except (OSError, ValueError, TypeError, KeyError):
+            return cls()
+
+    def save(self, path: str) -> None:
+        """Write the learned state to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class BatchScheduler:
+    """Longest-first job queue with a memory budget.
+
+    Attributes:
+        memory_budget (Optional[int]): Bytes of predicted memory that
+            admitted jobs may hold together, or None for no limit
+        reserved (int): Predicted memory of the admitted jobs
+        buffered (int): Bytes of in-memory content held by queued jobs
+    """
+
+    def __init__(self, memory_budget: Optional[int] = None):
+        self.memory_budget = memory_budget or None
+        self.reserved = 0
+        self.buffered = 0
+        self._admitted = 0
+        self._queue: List[Tuple[float, int, Any, JobEstimate, int]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def full(self) -> bool:
+        """Whether the queue holds SCHEDULE_WINDOW jobs or MAX_BUFFERED_CONTENT bytes."""
+        return len(self._queue) >= SCHEDULE_WINDOW or self.buffered >= MAX_BUFFERED_CONTENT
+
+    def add(self, item: Any, estimate: JobEstimate, nbytes: int = 0) -> None:
+        """Queue a job.
+
+        Args:
+            item: The job, or whatever the caller needs back from pop().
+            estimate: Predicted cost of the job.
+            nbytes: Bytes of content held in memory by the item.
+        """
+        # The sequence number keeps equal estimates in arrival order
+        insort(self._queue, (-estimate.seconds, next(self._sequence), item, estimate, nbytes))
+        self.buffered += nbytes
+
+    def pop(self) -> Optional[Tuple[Any, JobEstimate]]:
+        """Admit the longest queued job that fits the memory budget.
+
+        With no job admitted, the longest job is admitted even if it alone
+        exceeds the budget.
+
+        Returns:
+            Optional[tuple]: (item, estimate), or None if the queue is empty
+            or no queued job fits.
+        """
+        for position, entry in enumerate(self._queue):
+            estimate = entry[3]
+            if (self.memory_budget is None or not self._admitted
+                    or self.reserved + estimate.memory <= self.memory_budget):
+                del self._queue[position]
+                self.reserved += estimate.memory
+                self.buffered -= entry[4]
+                self._admitted += 1
+                return entry[2], estimate
+        return None
+
+    def release(self, estimate: JobEstimate) -> None:
+        """Return the memory of a finished job to the budget."""
+        self.reserved -= estimate.memory
+        self._admitted -= 1
+
+
+def default_memory_budget() -> Optional[int]:
+    """Return MEMORY_BUDGET_FRACTION of physical memory, or None if unknown."""
+    try:
+        return int(os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+                   * MEMORY_BUDGET_FRACTION)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def document_units(job: Dict[str, Any], size: int) -> Tuple[str, float, float]:
+    """Return (type, units, memory units) of a job's document.
+
+    The type is taken from the extension. Documents that cannot be read
+    are measured by their size.
+    """
+    kind = _KINDS.get(os.path.splitext(job.get('path', ''))[1].lower(), 'other')
+    if kind not in ('pdf', 'docx'):
+        return kind, float(size), float(size)
+    content = job.get('content')
+    try:
+        with (io.BytesIO(content) if content is not None else open(job['path'], 'rb')) as f:
+            if kind == 'pdf':
+                pages = pdf_page_count(f, size)
+                return kind, float(pages or max(1, size // BYTES_PER_PAGE)), float(size)
+            xml_size = float(zipfile.ZipFile(f).getinfo('word/document.xml').file_size)
+            return kind, xml_size, xml_size
+    except (OSError, KeyError, zipfile.BadZipFile, ValueError):
+        return kind, float(size), float(size)
+
+
+def pdf_page_count(f: BinaryIO, size: int) -> Optional[int]:
+    """Read the page count of a PDF without parsing it.
+
+    Looks for the page count of a linearized PDF in its header, then for
+    the root of the page tree in the first and last SNIFF_WINDOW bytes,
+    inflating compressed object streams found there.
+
+    Returns:
+        Optional[int]: Page count, or None if it was not found.
+    """
+    f.seek(0)
+    head = f.read(SNIFF_WINDOW)
+    linearized = _LINEARIZED_RE.search(head, 0, 2048)
+    if linearized:
+        return int(linearized.group(1))
+    windows = [head]
+    if size > SNIFF_WINDOW:
+        f.seek(max(SNIFF_WINDOW, size - SNIFF_WINDOW))
+        windows.insert(0, f.read(SNIFF_WINDOW))  # The page tree is usually written last
+    for data in windows:
+        pages = _page_tree_count(data)
+        if pages:
+            return pages
+        for match in list(_OBJECT_STREAM_RE.finditer(data))[-MAX_OBJECT_STREAMS:]:
+            try:
+                inflated = zlib.decompressobj().decompress(data[match.end():], MAX_INFLATED)
+            except zlib.error:
+                continue
+            pages = _page_tree_count(inflated)
+            if pages:
+                return pages
+    return None
+
+
+def _page_tree_count(data: bytes) -> Optional[int]:
+    """Largest /Count of a /Type /Pages dictionary in data, i.e. of the tree root."""
+    pages = None
+    for match in _PAGES_RE.finditer(data):
+        start = data.rfind(b'<<', 0, match.start())
+        end = data.find(b'>>', match.end())
+        if start == -1 or end == -1:
+            continue
+        found = _COUNT_RE.search(data, start, end)
+        if found:
+            pages = max(pages or 0, int(found.group(1)))
+    return pages
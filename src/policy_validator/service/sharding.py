@@ -0,0 +1,235 @@
+"""Deterministic sharding of bulk runs and merging of shard results.
+
+A manifest too large for one machine is split across N nodes without a
+coordinator: every node reads the same manifest and runs
+``bulk --shard i/N``, which keeps the jobs assigned to shard i. The
+assignment is a pure function of the manifest, so the shards are disjoint
+and together cover every job.
+
+Assignment:
+    Each job hashes its document path (relative to the manifest) to two
+    candidate shards and joins the one with fewer bytes assigned so far,
+    walking the manifest in order. Two choices keep the byte counts of the
+    shards within a few largest files of each other, where a single hash
+    leaves them to chance. Sizes are rounded up to a power of two before
+    they are counted, so an edit that changes a file's size slightly does
+    not move the jobs that follow; nodes still need the same view of the
+    document tree. Unreadable files count as empty, and archives count
+    with their file size.
+
+Merging:
+    merge_results() combines the JSONL outputs or SQLite stores of the
+    shards into one result stream with global statistics, dropping jobs
+    recorded twice (same job key, which stores keep too, so a shard's JSONL
+    output and its store can be merged together). Given the manifest, it
+    also lists the manifest lines that no shard recorded.
+
+Example:
+    $ policy-validator-cli bulk manifest.jsonl -o shard1.jsonl --shard 1/3  # node 1
+    $ policy-validator-cli bulk manifest.jsonl -o shard2.jsonl --shard 2/3  # node 2
+    $ policy-validator-cli bulk manifest.jsonl -o shard3.jsonl --shard 3/3  # node 3
+    $ policy-validator-cli merge shard*.jsonl -o results.jsonl --report results.sarif \\
+          --manifest manifest.jsonl
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .bulk_runner import read_manifest
+from ..storage.results_store import ResultsStore
+
+# --- Constants ---
+SQLITE_HEADER = b'SQLite format 3\x00'
+
+Shard = Tuple[int, int]  # (index, count), index from 1 to count
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard specification such as "2/8".
+
+    Raises:
+        ValueError: If the value is not i/N with 1 <= i <= N.
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {value!r} (use i/N, e.g. 2/8)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {value!r} (i must be between 1 and N)")
+    return index, count
+
+
+def shard_weight(size: int) -> int:
+    """Size counted for balancing: rounded up to a power of two."""
+    return 1 << size.bit_length() if size > 0 else 0
+
+
+def assign_shards(jobs: Iterable[Tuple[int, Dict[str, Any]]], count: int,
+                  base: str = '') -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """Assign manifest jobs to shards (see module docstring).
+
+    Args:
+        jobs: (line number, job) pairs, as from read_manifest().
+        count: Number of shards.
+        base: Directory the job paths are made relative to for hashing,
+            normally the manifest's.
+
+    Yields:
+        tuple: (shard index from 1, line number, job) for every job.
+    """
+    loads = [0] * count
+    for line_number, job in jobs:
+        path = job.get('path')
+        if 'error' in job or not path:
+            key = f"line {line_number}"
+            size = 0
+        else:
+            key = os.path.relpath(path, base) if base else path
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+        digest = hashlib.sha256(key.encode('utf-8', 'surrogateescape')).digest()
+        first = int.from_bytes(digest[:8], 'big') % count
+        second = int.from_bytes(digest[8:16], 'big') % count
+        shard = first if loads[first] <= loads[second] else second
+        loads[shard] += shard_weight(size)
+        yield shard + 1, line_number, job
+
+
+def read_shard(manifest_path: str, shard: Shard) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield the (line number, job) pairs of a manifest that belong to a shard."""
+    index, count = shard
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    for assigned, line_number, job in assign_shards(read_manifest(manifest_path), count, base):
+        if assigned == index:
+            yield line_number, job
+
+
+def is_results_store(path: str) -> bool:
+    """Whether a file is a SQLite results store rather than a JSONL file."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def read_results(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the results recorded in a JSONL output or a SQLite results store.
+
+    Results from a store carry their 'validated_at' time. A partial last
+    line of a JSONL file, left by an interrupted run, is skipped.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    if is_results_store(path):
+        store = ResultsStore(path)
+        try:
+            yield from store.results()
+        finally:
+            store.close()
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n') or not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+def merge_results(inputs: List[str], on_result: Callable[[Dict[str, Any]], None],
+                  manifest_path: Optional[str] = None) -> Dict[str, Any]:
+    """Combine shard results, passing each distinct result to on_result.
+
+    Results with the same job key are recorded once, whether they come
+    from JSONL outputs or stores, and error records once per manifest line.
+    Results without a job key (not from a bulk run, or in a store written
+    before job keys were stored) are recorded once per (path, file hash,
+    standard, validation time), so they never match a JSONL record.
+
+    Args:
+        inputs: JSONL outputs of bulk runs and/or SQLite results stores.
+        on_result: Called with every merged result, e.g. a report writer.
+        manifest_path: Manifest the shards were run from, to list the
+            lines no shard recorded. Missing lines are only listed if every
+            result carries its manifest line.
+
+    Returns:
+        dict: Global statistics:
+            {
+                'results': int,        # Results merged
+                'passed': int,
+                'failed': int,         # Failed, including errors
+                'errors': int,         # Jobs that could not be run
+                'limited': int,        # Jobs stopped by a resource limit
+                'duplicates': int,     # Results dropped as recorded twice
+                'bytes': int,          # Document bytes validated
+                'standards': {standard: {'results': int, 'failed': int}},
+                'inputs': {path: int}, # Results merged from each input
+                'unnumbered': int,     # Results without a manifest line
+                'missing_lines': list  # With a manifest: lines not recorded,
+                                       # None if any result is unnumbered
+            }
+
+    Raises:
+        OSError: If an input cannot be read.
+    """
+    stats: Dict[str, Any] = {'results': 0, 'passed': 0, 'failed': 0, 'errors': 0,
+                             'limited': 0, 'duplicates': 0, 'bytes': 0,
+                             'unnumbered': 0, 'standards': {}, 'inputs': {}}
+    seen: Set[Any] = set()
+    lines: Set[int] = set()
+    for path in inputs:
+        merged = 0
+        for result in read_results(path):
+            if result.get('job_key'):
+                identity: Any = result['job_key']
+            elif 'job_key' in result:
+                # Error records, written again each time a resumed run retries
+                identity = ('error', result.get('path'), result.get('line'))
+            else:
+                identity = (result.get('path'), result.get('file_hash'),
+                            result.get('standard'), result.get('validated_at'))
+            if identity in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(identity)
+            if isinstance(result.get('line'), int):
+                lines.add(result['line'])
+            else:
+                stats['unnumbered'] += 1
+
+            on_result(result)
+            merged += 1
+            stats['results'] += 1
+            stats['bytes'] += result.get('size') or 0
+            standard = stats['standards'].setdefault(
+                result.get('standard') or 'Custom', {'results': 0, 'failed': 0})
+            standard['results'] += 1
+            if result.get('valid'):
+                stats['passed'] += 1
+            else:
+                stats['failed'] += 1
+                standard['failed'] += 1
+            if 'job_key' in result and result['job_key'] is None:
+                stats['errors'] += 1
+            if result.get('limit_exceeded'):
+                stats['limited'] += 1
+        stats['inputs'][path] = merged
+
+    if manifest_path is not None:
+        # Results without a line might be for any line, so none can be listed
+        stats['missing_lines'] = None if stats['unnumbered'] else [
+            line_number for line_number, _ in read_manifest(manifest_path)
+            if line_number not in lines
+        ]
+    return stats
+
@@ -0,0 +1,153 @@
+"""Validation job execution for worker processes.
+
+This module defines the job format shared by the validation services and
+the functions that run inside pooled worker processes. Workers are warmed
+once at startup (parsers imported, section matchers compiled, MIME detector
+opened) and keep one PolicyValidator per configuration, so each job pays
+only for its own document.
+
+Job Format:
+    {
+        'path': str,            # File to validate, or display name for uploads
+        'standard': str,        # Standard name or alias (default: "Custom")
+        'sections': List[str],  # Required sections (default: all)
+        'fail_fast': bool,      # Stop at the first failing rule
+        'content': bytes,       # Optional document bytes (upload or archive member)
+        'archive': str,         # Optional ZIP archive to read 'member' from, in the
+        'member': str,          # worker, instead of sending its content
+        'instrument': bool,     # Return per-stage timings in result['trace']
+        'profile': dict,        # ProfileSession options; return result['profile']
+        'dedupe': bool,         # Reuse results across near-duplicates in this worker
+        'hash': bool            # Return the content digest in result['file_hash']
+    }
+
+Hashing:
+    A job with 'hash' set has its document hashed in the worker that
+    validates it, so the hashing of a batch is spread over the workers and
+    the file is read by one process only, while it is still in the page
+    cache. Archive members read in the worker are not hashed.
+
+Example:
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> with ProcessPoolExecutor(initializer=warm_worker) as pool:
+    ...     result = pool.submit(run_job, {'path': 'policy.txt'}).result()
+"""
+
+import io
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from ..validators.policy_validator import PolicyValidator
+from ..validators.standards import VALIDATION_STANDARDS
+from ..utils import instrumentation
+from ..utils.file_types import get_mime_detector
+from ..utils.hashing import content_digest, file_digest
+from ..utils.profiling import ProfileSession
+from ..utils.text_normalizer import get_section_matcher
+
+
+def warm_worker() -> None:
+    """Preload everything a validation needs in the current process.
+
+    Used as the initializer of worker pools so the first job in each worker
+    is as fast as the rest.
+    """
+    for standard in VALIDATION_STANDARDS:
+        get_section_matcher(standard)
+        get_validator(standard, None, False)
+    get_mime_detector()
+
+
+@lru_cache(maxsize=64)
+def get_validator(standard: str, sections: Optional[Tuple[str, ...]],
+                  fail_fast: bool, dedupe: bool = False) -> PolicyValidator:
+    """Return a cached PolicyValidator for a configuration.
+
+    Args:
+        standard: Standard name or alias.
+        sections: Required sections as a tuple, or None for all.
+        fail_fast: Whether to stop at the first failing rule.
+        dedupe: Return a DeduplicatingValidator, whose template families
+            are shared by all jobs of this configuration in the process.
+
+    Raises:
+        ValueError: If the standard is not supported.
+        ImportError: If dedupe is set and NumPy is not installed.
+    """
+    if dedupe:
+        from ..analytics.near_duplicates import DeduplicatingValidator
+        return DeduplicatingValidator(standard, sections, fail_fast=fail_fast)
+    return PolicyValidator(standard, sections, fail_fast=fail_fast)
+
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one job and return its result.
+
+    Args:
+        job: Job dictionary (see module docstring).
+
+    Returns:
+        dict: Validation result as returned by PolicyValidator, with
+        'elapsed_ms' added. Uploaded documents and archive members report
+        job['path'] as their path. Instrumented jobs also carry 'trace', the spans
+        recorded in this process (see utils.instrumentation), for the
+        caller to merge into its own recorder. Profiled jobs carry
+        'profile', the ProfileSession data of this job (see
+        ProfileSession.to_dict()). Hashed jobs carry 'file_hash', unless
+        the file could not be read.
+
+    Raises:
+        ValueError: If the standard is not supported.
+    """
+    started = time.perf_counter()
+    if job.get('instrument'):
+        instrumentation.enable()
+    sections = job.get('sections')
+    validator = get_validator(
+        job.get('standard', 'Custom'),
+        tuple(sections) if sections is not None else None,
+        bool(job.get('fail_fast', False)),
+        bool(job.get('dedupe', False))
+    )
+
+    if job.get('profile'):
+        session = ProfileSession(**job['profile'])
+        with session.profile(job.get('path', '')):
+            result = _validate_job(validator, job)
+        session.close()
+        result['profile'] = session.to_dict()
+    else:
+        result = _validate_job(validator, job)
+    if job.get('hash') and 'member' not in job:
+        _hash_job(job, result)
+
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+    recorder = instrumentation.get_recorder()
+    if job.get('instrument') and recorder is not None:
+        result['trace'] = recorder.drain_spans()
+    return result
+
+
+def _hash_job(job: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Add the digest of a job's file or content to its result."""
+    content = job.get('content')
+    with instrumentation.stage('hash', result.get('size') or 0):
+        if content is not None:
+            result['file_hash'] = content_digest(content)
+            return
+        try:
+            result['file_hash'] = file_digest(job['path'])
+        except OSError:
+            pass  # The result already reports the unreadable file
+
+
+def _validate_job(validator: PolicyValidator, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a job's file, its uploaded content, or a ZIP archive member."""
+    if 'member' in job:
+        from ..utils.archives import validate_member
+        return validate_member(validator, job['archive'], job['member'])
+    content = job.get('content')
+    if content is None:
+        return validator.validate_file(job['path'])
+    return validator.validate_stream(job.get('path', ''), io.BytesIO(content), len(content))
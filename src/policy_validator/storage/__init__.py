@@ -0,0 +1,6 @@
+"""
+Persistent storage for validation results.
+
+This package keeps validation history on disk so past results can be
+queried without re-validating documents.
+"""
@@ -0,0 +1,327 @@
+"""SQLite-backed store of validation results.
+
+This module records validation results with their file hash, standard,
+per-section status and timings, so questions such as "which policies
+failed ISO 27001 access control last week" are answered from an index
+instead of by re-running validation.
+
+Schema:
+    results(id, path, file_hash, standard, valid, issues, elapsed_ms, validated_at,
+            job_key, line, size)
+    section_results(result_id, standard, section, status, validated_at)
+
+    section_results is indexed on (standard, section, status, validated_at);
+    status is 'pass' or 'fail'. Timestamps are Unix seconds. job_key and
+    line are set for results of bulk runs (see service.bulk_runner), so a
+    store and the JSONL output of the same run identify jobs alike; they
+    are NULL for other results and in rows written by older versions.
+
+Example:
+    >>> with ResultsStore("results.db") as store:
+    ...     for path in paths:
+    ...         store.add(validate_policy(path, "ISO"))
+    >>> store = ResultsStore("results.db")
+    >>> for row in store.query(standard="ISO", section="access control",
+    ...                        status="fail", since=time.time() - 7 * 86400):
+    ...     print(row['path'], row['validated_at'])
+
+Performance Considerations:
+    - The database runs in WAL mode with synchronous=NORMAL, so readers
+      never block the writer and commits do not wait for a full fsync.
+    - add() buffers results and writes them BATCH_SIZE at a time with
+      executemany() inside one transaction; call flush() or close() to
+      write the remainder.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..validators.standards import VALIDATION_STANDARDS, resolve_standard
+
+# --- Constants ---
+BATCH_SIZE = 2000  # Results buffered before a write transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    file_hash TEXT,
+    standard TEXT NOT NULL,
+    valid INTEGER NOT NULL,
+    issues TEXT NOT NULL,
+    elapsed_ms REAL,
+    validated_at REAL NOT NULL,
+    job_key TEXT,
+    line INTEGER,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS section_results (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    standard TEXT NOT NULL,
+    section TEXT NOT NULL,
+    status TEXT NOT NULL,
+    validated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_section_status
+    ON section_results (standard, section, status, validated_at);
+CREATE INDEX IF NOT EXISTS idx_section_result ON section_results (result_id);
+CREATE INDEX IF NOT EXISTS idx_results_path ON results (path, validated_at);
+CREATE INDEX IF NOT EXISTS idx_results_hash ON results (file_hash);
+"""
+
+# Columns added after the first release, created in older databases on open
+ADDED_COLUMNS = (('job_key', 'TEXT'), ('line', 'INTEGER'), ('size', 'INTEGER'))
+
+
+def _standard_name(standard: str) -> str:
+    """Resolve an alias, keeping unknown names (e.g. imported history) as-is."""
+    try:
+        return resolve_standard(standard)
+    except ValueError:
+        return standard
+
+
+class ResultsStore:
+    """Persistent, indexed history of validation results.
+
+    Attributes:
+        path (str): Database file path
+        batch_size (int): Results buffered before they are written
+    """
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE):
+        """Open or create a results database.
+
+        Args:
+            path: SQLite database file (":memory:" for a temporary store).
+            batch_size: Results buffered by add() before a write.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[Tuple[Dict[str, Any], float]] = []
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+        for name, declaration in ADDED_COLUMNS:
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE results ADD COLUMN {name} {declaration}")
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # --- Writing ---
+
+    def add(self, result: Dict[str, Any], validated_at: Optional[float] = None) -> None:
+        """Buffer one validation result for writing.
+
+        Args:
+            result: Result dictionary as returned by PolicyValidator; the
+                optional 'file_hash', 'elapsed_ms', 'size', and for bulk
+                results 'job_key' and 'line', are stored too.
+            validated_at: Unix time of the validation (default: the
+                result's 'validated_at', as from results(), or now).
+        """
+        if validated_at is None:
+            validated_at = result.get('validated_at') or time.time()
+        self._pending.append((result, validated_at))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered results in one transaction."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Ids are assigned here so section rows can reference them
+            # without a round trip per result
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM results").fetchone()[0]
+            result_rows = []
+            section_rows = []
+            for offset, (result, validated_at) in enumerate(pending):
+                result_id = next_id + offset
+                standard = _standard_name(result.get('standard') or 'Custom')
+                line = result.get('line')
+                result_rows.append((
+                    result_id, result.get('path', ''), result.get('file_hash'), standard,
+                    1 if result.get('valid') else 0,
+                    json.dumps(result.get('issues', [])),
+                    result.get('elapsed_ms'), validated_at, result.get('job_key'),
+                    line if isinstance(line, int) else None, result.get('size')
+                ))
+                for section, present in (result.get('sections') or {}).items():
+                    section_rows.append((result_id, standard, section,
+                                         'pass' if present else 'fail', validated_at))
+            conn.executemany(
+                "INSERT INTO results (id, path, file_hash, standard, valid, issues, "
+                "elapsed_ms, validated_at, job_key, line, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", result_rows)
+            conn.executemany(
+                "INSERT INTO section_results (result_id, standard, section, status, "
+                "validated_at) VALUES (?, ?, ?, ?, ?)", section_rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Write buffered results and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    # --- Queries ---
+
+    def query(self, standard: Optional[str] = None, section: Optional[str] = None,
+              status: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, path: Optional[str] = None,
+              limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield per-section results matching all given filters, newest first.
+
+        Args:
+            standard: Standard name or alias.
+            section: Section name, as defined by the standard.
+            status: 'pass' or 'fail'.
+            since: Earliest validation time (Unix seconds, inclusive).
+            until: Latest validation time (Unix seconds, exclusive).
+            path: Document path.
+            limit: Maximum number of rows.
+
+        Yields:
+            dict: {'path', 'file_hash', 'standard', 'section', 'status',
+            'valid', 'elapsed_ms', 'validated_at'}
+
+        Raises:
+            ValueError: If status is not 'pass' or 'fail'.
+        """
+        if status is not None and status not in ('pass', 'fail'):
+            raise ValueError(f"Unknown status: {status}. Options are pass, fail")
+        clauses = []
+        params: List[Any] = []
+        for column, value in (('s.standard', _standard_name(standard) if standard else None),
+                              ('s.section', section), ('s.status', status),
+                              ('r.path', path)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("s.validated_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("s.validated_at < ?")
+            params.append(until)
+
+        sql = ("SELECT r.path, r.file_hash, s.standard, s.section, s.status, r.valid, "
+               "r.elapsed_ms, s.validated_at FROM section_results s "
+               "JOIN results r ON r.id = s.result_id")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY s.validated_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        self.flush()
+        for row in self._conn.execute(sql, params):
+            record = dict(row)
+            record['valid'] = bool(record['valid'])
+            yield record
+
+    def history(self, path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the stored results of one document, newest first.
+
+        Returns:
+            list: {'path', 'file_hash', 'standard', 'valid', 'issues',
+            'elapsed_ms', 'validated_at'} per validation.
+        """
+        self.flush()
+        sql = ("SELECT path, file_hash, standard, valid, issues, elapsed_ms, validated_at "
+               "FROM results WHERE path = ? ORDER BY validated_at DESC")
+        params: List[Any] = [path]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        records = []
+        for row in self._conn.execute(sql, params):
+            record = dict(row)
+            record['valid'] = bool(record['valid'])
+            record['issues'] = json.loads(record['issues'])
+            records.append(record)
+        return records
+
+    def results(self) -> Iterator[Dict[str, Any]]:
+        """Yield every stored result in insertion order, e.g. to merge stores.
+
+        Yields:
+            dict: {'path', 'file_hash', 'standard', 'valid', 'issues',
+            'elapsed_ms', 'validated_at', 'sections'}, where sections maps
+            each checked section to whether it was found, plus 'size' if
+            stored, and 'line' and 'job_key' for results of bulk runs (a
+            None job key marks an error record, as in the JSONL output).
+        """
+        self.flush()
+        # Walk both tables in result order, so no result is held for long
+        sections = self._conn.execute(
+            "SELECT result_id, section, status FROM section_results ORDER BY result_id, rowid")
+        section_row = sections.fetchone()
+        for row in self._conn.execute(
+                "SELECT id, path, file_hash, standard, valid, issues, elapsed_ms, validated_at, "
+                "job_key, line, size FROM results ORDER BY id"):
+            record = dict(row)
+            result_id = record.pop('id')
+            if record['line'] is None:
+                del record['line'], record['job_key']
+            if record['size'] is None:
+                del record['size']
+            record['valid'] = bool(record['valid'])
+            record['issues'] = json.loads(record['issues'])
+            record['sections'] = {}
+            while section_row is not None and section_row[0] <= result_id:
+                if section_row[0] == result_id:
+                    record['sections'][section_row[1]] = section_row[2] == 'pass'
+                section_row = sections.fetchone()
+            yield record
+
+    def section_summary(self, standard: Optional[str] = None,
+                        since: Optional[float] = None) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Count pass/fail results per standard and section.
+
+        Returns:
+            dict: {standard: {section: {'pass': int, 'fail': int}}}, with
+            sections in the order the standard defines them where known.
+        """
+        self.flush()
+        clauses = []
+        params: List[Any] = []
+        if standard:
+            clauses.append("standard = ?")
+            params.append(_standard_name(standard))
+        if since is not None:
+            clauses.append("validated_at >= ?")
+            params.append(since)
+        sql = "SELECT standard, section, status, COUNT(*) FROM section_results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " GROUP BY standard, section, status"
+
+        summary: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for standard_name, section, status, count in self._conn.execute(sql, params):
+            sections = summary.setdefault(standard_name, {})
+            sections.setdefault(section, {'pass': 0, 'fail': 0})[status] = count
+        for standard_name, sections in summary.items():
+            order = VALIDATION_STANDARDS.get(standard_name, {}).get('sections', [])
+            rank = {name: index for index, name in enumerate(order)}
+            summary[standard_name] = dict(sorted(
+                sections.items(), key=lambda item: (rank.get(item[0], len(rank)), item[0])))
+        return summary
@@ -0,0 +1,316 @@
+"""Validation of policy bundles inside ZIP and TAR archives.
+
+Auditors deliver policies as zip or tar bundles. This module reads the
+members straight from the archive file, so a bundle is validated without
+extracting it to a temporary directory first:
+
+    - ZIP members are opened from the central directory and decompressed
+      on demand; several members can be read at once.
+    - TAR archives (plain, gzip, bzip2 or xz) are read in one sequential
+      pass, as compressed tar streams do not support random access. Each
+      member is buffered in memory while its validation is pending.
+    - Member types are sniffed from their first bytes (see
+      file_types.identify_stream()); PDF and Word members are copied into
+      memory for the parsers, which seek all over them, while text members
+      are decoded as they are decompressed.
+    - Members are validated on a thread pool, in parallel with reading the
+      archive, and results are returned in archive order.
+
+Member Paths:
+    Results report members as "<archive path>!<member name>", e.g.
+    "audit/bundle.zip!policies/access.pdf". Directories, macOS resource
+    forks and other non-file entries are skipped.
+
+Example:
+    >>> from policy_validator.utils.archives import validate_archive
+    >>> for result in validate_archive(PolicyValidator("ISO"), "bundle.zip"):
+    ...     print(result['path'], result['valid'])
+    bundle.zip!policies/access.pdf True
+    bundle.zip!policies/crypto.docx False
+
+Note:
+    Nested archives are not expanded; they are reported as unsupported
+    file types.
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+)
+
+from . import instrumentation
+from .file_types import MEMBER_SEPARATOR, identify_stream
+
+# --- Constants ---
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2',
+                      '.tar.xz', '.txz')
+ARCHIVE_WORKERS = 4         # Threads validating members
+IN_FLIGHT_FACTOR = 4        # Members read ahead per worker thread
+_SKIPPED_PREFIXES = ('__MACOSX/',)
+_SEEKING_TYPES = ('pdf', 'doc', 'docx')  # Parsed from a seekable in-memory copy
+
+
+def is_archive(path: str) -> bool:
+    """Whether a path names a supported archive, judged by its extension.
+
+    Word documents are zip files too, so archives are recognized by name
+    rather than by content.
+    """
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def member_path(archive_path: str, name: str) -> str:
+    """Return the path reported for an archive member."""
+    return f"{archive_path}{MEMBER_SEPARATOR}{name}"
+
+
+def split_member_path(path: str) -> Optional[Tuple[str, str]]:
+    """Split an archive member path into (archive path, member name).
+
+    Returns:
+        Optional[tuple]: None if the path does not name an archive member.
+    """
+    position = path.find(MEMBER_SEPARATOR)
+    while position != -1:
+        if is_archive(path[:position]):
+            return path[:position], path[position + 1:]
+        position = path.find(MEMBER_SEPARATOR, position + 1)
+    return None
+
+
+class ArchiveMember:
+    """A regular file inside an archive.
+
+    Attributes:
+        archive_path (str): Path of the archive
+        name (str): Member name within the archive
+        size (int): Uncompressed size in bytes
+    """
+
+    __slots__ = ('archive_path', 'name', 'size', '_opener')
+
+    def __init__(self, archive_path: str, name: str, size: int,
+                 opener: Callable[[], BinaryIO]):
+        self.archive_path = archive_path
+        self.name = name
+        self.size = size
+        self._opener = opener
+
+    @property
+    def path(self) -> str:
+        """Path reported for the member (see module docstring)."""
+        return member_path(self.archive_path, self.name)
+
+    def open(self) -> BinaryIO:
+        """Open the member content as a new binary file object.
+
+        Only valid while the PolicyArchive it came from is open.
+        """
+        return self._opener()
+
+
+class PolicyArchive:
+    """Read-only view of a ZIP or TAR archive of policies.
+
+    Example:
+        >>> with PolicyArchive("bundle.tar.gz") as archive:
+        ...     for member in archive.members({'.pdf', '.txt'}):
+        ...         print(member.path, member.size)
+    """
+
+    def __init__(self, path: str):
+        """Open the archive.
+
+        Args:
+            path: Path of a .zip or tar archive.
+
+        Raises:
+            OSError: If the archive cannot be read.
+            zipfile.BadZipFile: If a .zip archive is corrupt.
+        """
+        self.path = path
+        self._zip: Optional[zipfile.ZipFile] = None
+        if path.lower().endswith('.zip'):
+            self._zip = zipfile.ZipFile(path)
+
+    def member(self, name: str) -> ArchiveMember:
+        """Return one member of a ZIP archive by name.
+
+        Raises:
+            KeyError: If the archive has no such member.
+            ValueError: If the archive is a TAR archive, whose members can
+                only be read in order (see members()).
+        """
+        if self._zip is None:
+            raise ValueError(f"Members of {self.path} can only be read in archive order")
+        archive = self._zip
+        info = archive.getinfo(name)
+        return ArchiveMember(self.path, info.filename, info.file_size,
+                             lambda: archive.open(info))
+
+    def members(self, extensions: Optional[Iterable[str]] = None) -> Iterator[ArchiveMember]:
+        """Yield the regular files of the archive in archive order.
+
+        TAR archives can be iterated once; their members are read into
+        memory as they are yielded.
+
+        Args:
+            extensions: Lowercase extensions (with dot) of the members to
+                yield. Default: every member.
+
+        Raises:
+            zipfile.BadZipFile, tarfile.TarError: If the archive is corrupt.
+        """
+        wanted = set(extensions) if extensions is not None else None
+
+        def selected(name: str) -> bool:
+            if name.startswith(_SKIPPED_PREFIXES) or os.path.basename(name).startswith('._'):
+                return False
+            return wanted is None or os.path.splitext(name)[1].lower() in wanted
+
+        if self._zip is not None:
+            archive = self._zip
+            for info in archive.infolist():
+                if not info.is_dir() and selected(info.filename):
+                    yield ArchiveMember(self.path, info.filename, info.file_size,
+                                        lambda info=info: archive.open(info))
+            return
+
+        # Stream mode reads a compressed tar front to back without seeking
+        with tarfile.open(self.path, 'r|*') as archive:
+            for info in archive:
+                if not info.isfile() or not selected(info.name):
+                    continue
+                extracted = archive.extractfile(info)
+                with instrumentation.stage('archive_read', info.size):
+                    data = extracted.read() if extracted is not None else b''
+                yield ArchiveMember(self.path, info.name, len(data),
+                                    lambda data=data: io.BytesIO(data))
+
+    def close(self) -> None:
+        """Close the archive file."""
+        if self._zip is not None:
+            self._zip.close()
+
+    def __enter__(self) -> "PolicyArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def identify_member(member: ArchiveMember) -> Dict[str, Any]:
+    """Build the file information dictionary of an archive member.
+
+    Raises:
+        OSError, RuntimeError, zipfile.BadZipFile: If the member cannot be
+        read (e.g. it is encrypted).
+    """
+    with member.open() as stream:
+        return identify_stream(member.path, stream, member.size)
+
+
+def validate_archive(validator: Any, archive_path: str,
+                     file_infos: Optional[Iterable[Dict[str, Any]]] = None,
+                     extensions: Optional[Iterable[str]] = None,
+                     workers: int = ARCHIVE_WORKERS) -> Iterator[Dict[str, Any]]:
+    """Validate the members of an archive, yielding results in archive order.
+
+    Closing the generator early cancels the members not yet validated.
+
+    Args:
+        validator: PolicyValidator (or subclass) to validate with. It is
+            called from several threads.
+        archive_path: Path of the archive.
+        file_infos: File information dictionaries of the members to
+            validate, as from identify_member(); they are updated in place.
+            Default: every member, identified from its first bytes.
+        extensions: Member extensions to validate when file_infos is not
+            given (see PolicyArchive.members()).
+        workers: Threads validating members.
+
+    Yields:
+        dict: One result per member, as from PolicyValidator.validate().
+        An archive that cannot be read yields one failed result for its
+        own path; members of file_infos missing from the archive yield a
+        failed result each.
+    """
+    wanted = {info['path']: info for info in file_infos} if file_infos is not None else None
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(workers, thread_name_prefix="archive-member") as pool:
+        try:
+            with PolicyArchive(archive_path) as archive:
+                for member in archive.members(extensions if wanted is None else None):
+                    file_info = None
+                    if wanted is not None:
+                        file_info = wanted.pop(member.path, None)
+                        if file_info is None:
+                            continue
+                    pending.append(pool.submit(_validate_member, validator, member, file_info))
+                    while pending and (pending[0].done() or
+                                       len(pending) >= workers * IN_FLIGHT_FACTOR):
+                        yield pending.popleft().result()
+                # Members are read until their validation completes
+                while pending:
+                    yield pending.popleft().result()
+        except (OSError, zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+            while pending:
+                yield pending.popleft().result()
+            yield _failed({'path': archive_path, 'type': None, 'size': 0},
+                          validator, f"Error reading archive: {str(e)}")
+        finally:
+            for future in pending:
+                future.cancel()
+    for file_info in (wanted or {}).values():
+        yield _failed(file_info, validator, "File no longer found in archive")
+
+
+def validate_member(validator: Any, archive_path: str, name: str) -> Dict[str, Any]:
+    """Identify and validate one member of a ZIP archive, opened by name.
+
+    Lets a worker process read a member itself instead of being sent its
+    content (see service.sandbox.SandboxedValidator).
+
+    Raises:
+        OSError, zipfile.BadZipFile: If the archive cannot be read.
+        KeyError: If the archive has no such member.
+        ValueError: If the archive is not a ZIP archive.
+    """
+    with PolicyArchive(archive_path) as archive:
+        return _validate_member(validator, archive.member(name), None)
+
+
+def _validate_member(validator: Any, member: ArchiveMember,
+                     file_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Identify (if needed) and validate one archive member."""
+    instrumentation.set_file(member.path)
+    try:
+        with member.open() as stream:
+            if file_info is None:
+                with instrumentation.stage('mime_detection'):
+                    file_info = identify_stream(member.path, stream, member.size)
+            if (file_info['type'] in _SEEKING_TYPES and not isinstance(stream, io.BytesIO)
+                    and getattr(validator, 'seeks_streams', True)):
+                # Seeking back in a compressed member means decompressing it again
+                with instrumentation.stage('archive_read', member.size):
+                    content = io.BytesIO(stream.read())
+                return validator.validate(file_info, content)
+            return validator.validate(file_info, stream)
+    except Exception as e:
+        base = file_info if file_info is not None else {
+            'path': member.path, 'type': None, 'size': member.size
+        }
+        return _failed(base, validator, f"Error processing file: {str(e)}")
+
+
+def _failed(file_info: Dict[str, Any], validator: Any, message: str) -> Dict[str, Any]:
+    """Record a member or archive that could not be validated."""
+    file_info['standard'] = validator.standard_name
+    file_info['valid'] = False
+    file_info.setdefault('issues', []).append(message)
+    return file_info
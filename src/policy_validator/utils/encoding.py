@@ -0,0 +1,155 @@
+"""Encoding detection and single-pass decoding for text policies.
+
+Text policies arrive as UTF-8, UTF-16 exports from Windows tools or legacy
+Windows-1252/Latin-1 files. This module picks the encoding from the start
+of the file and decodes the rest incrementally, so every file is read once
+whatever its encoding:
+
+    1. Byte order marks identify UTF-8, UTF-16 and UTF-32 (the BOM is skipped).
+    2. Without a BOM, NUL byte positions in the prefix reveal UTF-16/UTF-32.
+    3. A prefix that is valid UTF-8, or mostly valid with a few stray
+       bytes, is decoded as UTF-8.
+    4. Anything else is Windows-1252, or Latin-1 if the prefix holds bytes
+       Windows-1252 leaves undefined.
+
+Example:
+    >>> encoding, bom_length = detect_encoding(prefix)
+    >>> decoder = StreamDecoder(encoding)
+    >>> text = decoder.decode(data[bom_length:], final=True)
+
+Note:
+    A file that turns out not to be UTF-8 after a pure-ASCII prefix is
+    decoded as Windows-1252 from that point on, which gives the same text
+    as if that had been detected up front. Invalid bytes anywhere else are
+    replaced with U+FFFD and reported through StreamDecoder.replaced.
+"""
+
+import codecs
+from typing import Tuple
+
+# --- Constants ---
+PREFIX_SIZE = 64 * 1024      # Bytes inspected when there is no BOM
+FALLBACK_ENCODING = 'cp1252'
+# Longest BOM first, so UTF-32-LE is not taken for UTF-16-LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+_CP1252_UNDEFINED = b'\x81\x8d\x8f\x90\x9d'
+_WIDE_NUL_SHARE = 0.3        # Share of code units with a NUL in one byte position
+
+
+def detect_encoding(prefix: bytes) -> Tuple[str, int]:
+    """Detect the encoding of a text from its first bytes.
+
+    Args:
+        prefix: Start of the file, ideally PREFIX_SIZE bytes.
+
+    Returns:
+        tuple: (Python codec name, length of the BOM to skip)
+    """
+    for bom, encoding in _BOMS:
+        if prefix.startswith(bom):
+            return encoding, len(bom)
+
+    wide = _detect_wide_encoding(prefix)
+    if wide:
+        return wide, 0
+
+    # Not final: the prefix may end inside a multi-byte sequence
+    text = codecs.getincrementaldecoder('utf-8')('replace').decode(prefix, final=False)
+    invalid = text.count('\ufffd')
+    if not invalid:
+        return 'utf-8', 0
+    # Legacy 8-bit text almost never forms valid multi-byte sequences, so
+    # UTF-8 with a few stray bytes still has more valid than invalid ones
+    if sum(1 for char in text if char > '\x7f') - invalid > invalid:
+        return 'utf-8', 0
+    return _legacy_encoding(prefix), 0
+
+
+def _detect_wide_encoding(prefix: bytes) -> str:
+    """Recognize BOM-less UTF-16/UTF-32 from where NUL bytes fall."""
+    if b'\x00' not in prefix:
+        return ''
+    quads = len(prefix) // 4
+    if quads:
+        # Mostly-ASCII UTF-32 has three NULs per code unit
+        zeros = [prefix[position::4][:quads].count(0) for position in range(4)]
+        if zeros[1] == zeros[2] == zeros[3] == quads and zeros[0] < quads:
+            return 'utf-32-le'
+        if zeros[0] == zeros[1] == zeros[2] == quads and zeros[3] < quads:
+            return 'utf-32-be'
+    pairs = len(prefix) // 2
+    if pairs:
+        even_zeros = prefix[0:pairs * 2:2].count(0)
+        odd_zeros = prefix[1:pairs * 2:2].count(0)
+        if odd_zeros >= pairs * _WIDE_NUL_SHARE and even_zeros < odd_zeros / 10:
+            return 'utf-16-le'
+        if even_zeros >= pairs * _WIDE_NUL_SHARE and odd_zeros < even_zeros / 10:
+            return 'utf-16-be'
+    return ''
+
+
+def _legacy_encoding(data: bytes) -> str:
+    """Pick Windows-1252, or Latin-1 if the data uses bytes it leaves undefined."""
+    if any(byte in data for byte in _CP1252_UNDEFINED):
+        return 'latin-1'
+    return FALLBACK_ENCODING
+
+
+class StreamDecoder(codecs.IncrementalDecoder):
+    """Incremental decoder that degrades instead of failing.
+
+    Usable wherever a codecs incremental decoder is expected, e.g. wrapped
+    in io.IncrementalNewlineDecoder.
+
+    Attributes:
+        encoding (str): Codec currently decoding the input
+        replaced (bool): Whether invalid bytes were replaced with U+FFFD
+    """
+
+    def __init__(self, encoding: str, errors: str = 'strict'):
+        super().__init__(errors)
+        self.encoding = encoding
+        self.replaced = False
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self._ascii_only = True
+        self._lenient = False
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        state = self._decoder.getstate()
+        try:
+            text = self._decoder.decode(data, final)
+        except UnicodeDecodeError as e:
+            text = self._recover(data, state, final, data[:e.start].isascii())
+        if self._ascii_only and not data.isascii():
+            self._ascii_only = False
+        if self._lenient and not self.replaced and '\ufffd' in text:
+            self.replaced = True
+        return text
+
+    def _recover(self, data: bytes, state: Tuple[bytes, int], final: bool,
+                 ascii_before_error: bool) -> str:
+        """Decode a chunk that failed, switching codec or error handling."""
+        if self.encoding == 'utf-8' and self._ascii_only and ascii_before_error:
+            # Everything so far was ASCII, which every fallback decodes the same
+            self.encoding = _legacy_encoding(data)
+            self._decoder = codecs.getincrementaldecoder(self.encoding)('replace')
+        else:
+            self._decoder = codecs.getincrementaldecoder(self.encoding)('replace')
+            self._decoder.setstate(state)
+        self._lenient = True
+        return self._decoder.decode(data, final)
+
+    def reset(self) -> None:
+        self._decoder.reset()
+
+    def getstate(self) -> Tuple[bytes, int]:
+        return self._decoder.getstate()
+
+    def setstate(self, state: Tuple[bytes, int]) -> None:
+        self._decoder.setstate(state)
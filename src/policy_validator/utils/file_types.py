@@ -0,0 +1,163 @@
+"""File type detection for policy documents.
+
+This module identifies policy files by content using python-magic and
+builds the file information dictionary consumed by the validators, so the
+GUI and headless entry points classify files identically. Documents that
+are not files on disk, such as archive members and uploads, are sniffed
+from their first bytes by identify_stream().
+
+Example:
+    >>> from policy_validator.utils.file_types import identify_file
+    >>> file_info = identify_file("policy.pdf")
+    >>> file_info['type'], file_info['issues']
+    ('pdf', [])
+"""
+
+import os
+import threading
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+import magic
+
+from .encoding import detect_encoding
+
+# --- Constants ---
+# Maps MIME types to (internal_type, expected_extension)
+MIME_TYPE_MAPPING = {
+    'application/pdf': ('pdf', '.pdf'),
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ('docx', '.docx'),
+    'application/msword': ('doc', '.doc'),
+    'text/plain': ('txt', '.txt')
+}
+
+# Ordered (MIME substring, internal type, accepted extensions, label) rules
+_TYPE_RULES = [
+    ('pdf', 'pdf', ('.pdf',), 'PDF'),
+    ('officedocument.wordprocessingml', 'docx', ('.docx',), 'DOCX'),
+    ('msword', 'doc', ('.doc',), 'DOC'),
+    ('text/plain', 'txt', ('.txt', '.text'), 'text'),
+]
+
+# Human-readable labels for internal file types
+TYPE_LABELS = {rule[1]: rule[3] for rule in _TYPE_RULES}
+
+TEXT_SNIFF_SIZE = 4096  # Bytes checked for BOM-less UTF-16/UTF-32 text
+HEADER_SNIFF_SIZE = 64 * 1024  # Bytes of a stream passed to libmagic
+MEMBER_SEPARATOR = '!'  # Separates an archive path from a member name
+
+_magic_local = threading.local()
+
+
+def get_mime_detector() -> "magic.Magic":
+    """Return a per-thread python-magic detector, created on first use."""
+    detector = getattr(_magic_local, 'detector', None)
+    if detector is None:
+        detector = magic.Magic(mime=True)
+        _magic_local.detector = detector
+    return detector
+
+
+def classify_mime(mime_type: str, extension: str) -> Dict[str, Any]:
+    """Map a MIME type to an internal file type.
+
+    Args:
+        mime_type: MIME type reported by python-magic.
+        extension: Lowercase file extension including the dot.
+
+    Returns:
+        dict: 'type' (internal type or None if unsupported) and 'issues'
+        (extension mismatch warnings).
+    """
+    for needle, file_type, extensions, label in _TYPE_RULES:
+        if needle in mime_type:
+            issues = []
+            if extension not in extensions:
+                issues.append(f"Extension {extension} doesn't match {label} content")
+            return {'type': file_type, 'issues': issues}
+    return {'type': None, 'issues': []}
+
+
+def identify_file(file_path: str, file_size: Optional[int] = None) -> Dict[str, Any]:
+    """Build the file information dictionary for a policy file.
+
+    Args:
+        file_path: Path to the file.
+        file_size: Size in bytes if already known, to avoid another stat.
+
+    Returns:
+        dict: File information with the structure:
+            {
+                'path': str,      # Full path to file
+                'type': str,      # pdf, docx, doc, txt, or None if unsupported
+                'mime': str,      # MIME type from python-magic
+                'size': int,      # File size in bytes
+                'extension': str, # File extension including dot
+                'valid': bool,    # Validation status
+                'issues': List[str] # List of validation issues
+            }
+
+    Raises:
+        OSError: If the file cannot be accessed.
+        magic.MagicException: If the file type cannot be determined.
+    """
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
+    mime_type = get_mime_detector().from_file(file_path)
+
+    def read_prefix() -> bytes:
+        with open(file_path, 'rb') as f:
+            return f.read(TEXT_SNIFF_SIZE)
+
+    extension = os.path.splitext(file_path)[1].lower()
+    return _build_file_info(file_path, extension, mime_type, file_size, read_prefix)
+
+
+def identify_stream(file_path: str, stream: BinaryIO, file_size: int) -> Dict[str, Any]:
+    """Build the file information dictionary for a policy read from a stream.
+
+    The MIME type is sniffed from the first HEADER_SNIFF_SIZE bytes, e.g.
+    of an archive member or an upload, without a file on disk.
+
+    Args:
+        file_path: Path reported for the document, whose extension is
+            checked against the content. For archive members
+            ("bundle.zip!policies/a.pdf") the member name's is used.
+        stream: Binary file object positioned at the start of the content.
+            It is rewound to the start before returning.
+        file_size: Size of the content in bytes.
+
+    Returns:
+        dict: File information, as returned by identify_file().
+
+    Raises:
+        OSError: If the stream cannot be read.
+        magic.MagicException: If the file type cannot be determined.
+    """
+    header = stream.read(HEADER_SNIFF_SIZE)
+    stream.seek(0)
+    mime_type = get_mime_detector().from_buffer(header)
+    extension = os.path.splitext(file_path.rpartition(MEMBER_SEPARATOR)[2])[1].lower()
+    return _build_file_info(file_path, extension, mime_type, file_size,
+                            lambda: header[:TEXT_SNIFF_SIZE])
+
+
+def _build_file_info(file_path: str, extension: str, mime_type: str, file_size: int,
+                     read_prefix: Callable[[], bytes]) -> Dict[str, Any]:
+    """Classify sniffed content into a file information dictionary."""
+    classification = classify_mime(mime_type, extension)
+    if classification['type'] is None and extension in ('.txt', '.text'):
+        # libmagic misreads BOM-less UTF-16 text, e.g. as image/x-tga
+        encoding, _ = detect_encoding(read_prefix())
+        if encoding.startswith(('utf-16', 'utf-32')):
+            mime_type = 'text/plain'
+            classification = classify_mime(mime_type, extension)
+
+    return {
+        'path': file_path,
+        'type': classification['type'],
+        'mime': mime_type,
+        'size': file_size,
+        'extension': extension,
+        'valid': True,
+        'issues': classification['issues']
+    }
@@ -0,0 +1,59 @@
+"""Content hashing helpers.
+
+Digests identify documents by content rather than by path or modification
+time, so unchanged files can be recognized across runs and machines.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable, Optional
+
+# --- Constants ---
+HASH_CHUNK_SIZE = 1024 * 1024  # Bytes read per hashing step
+
+
+def file_digest(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Return the SHA-256 hex digest of a file's content.
+
+    The file is read in fixed-size chunks, so memory use does not depend on
+    the file size.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_digest(content: bytes) -> str:
+    """Return the SHA-256 hex digest of content already in memory.
+
+    Equals file_digest() of a file holding the same bytes.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def job_key(content_digest: str, standard: str,
+            sections: Optional[Iterable[str]], fail_fast: bool,
+            path: str = '') -> str:
+    """Return a stable identifier for validating given content one way.
+
+    Args:
+        content_digest: Digest of the document content.
+        standard: Standard name or alias.
+        sections: Required sections, or None for all; order is ignored.
+        fail_fast: Whether validation stops at the first failing rule.
+        path: Document path, for keys that should differ per location.
+
+    Returns:
+        str: SHA-256 hex digest of the canonical job description.
+    """
+    canonical: Any = [
+        content_digest, standard,
+        sorted(sections) if sections is not None else None,
+        bool(fail_fast), path
+    ]
+    return hashlib.sha256(json.dumps(canonical).encode('utf-8')).hexdigest()
@@ -0,0 +1,364 @@
+"""Built-in profiling of slow policy documents.
+
+This module profiles the validation of selected files and attributes the
+hot spots to the validation stages timed by utils.instrumentation
+(mime_detection, parse_pdf, normalize, section_match, ...). Two modes are
+supported:
+
+    - "sample": A background thread samples the validating thread's stack
+      every few milliseconds. Overhead is low and full call stacks are
+      kept.
+    - "cprofile": cProfile counts every call. Timings are exact, but call
+      stacks are reduced to the function under each stage, and the
+      overhead is high for call-heavy code such as PDF parsing.
+
+With memory profiling, tracemalloc records the peak memory of every file
+and stage and the lines allocating the most memory.
+
+Output:
+    - A collapsed-stack file ("stage:<name>;frame;frame... weight" per
+      line) for flamegraph.pl, speedscope or inferno. Weights are samples
+      in "sample" mode and microseconds in "cprofile" mode.
+    - A text report of slow files, stage shares, top functions per stage
+      and top allocation sites.
+
+Example:
+    >>> session = ProfileSession("sample")
+    >>> with session.profile("slow.pdf"):
+    ...     validator.validate_file("slow.pdf")
+    >>> session.write_collapsed("profile.collapsed")
+    >>> print(session.report())
+
+Note:
+    Only one file can be profiled at a time per session. Sessions in
+    worker processes return their data with to_dict() and the parent
+    combines them with merge().
+"""
+
+import cProfile
+import fnmatch
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional
+
+from . import instrumentation
+
+# --- Constants ---
+PROFILE_MODES = ('sample', 'cprofile')
+SAMPLE_INTERVAL = 0.002    # Seconds between stack samples
+TOP_FUNCTIONS = 10         # Functions listed per stage in the report
+TOP_ALLOCATIONS = 15       # Allocation sites listed in the report
+ROOT_STAGE = 'validate'    # Stage of code running outside any timed stage
+
+
+class ProfileSession:
+    """Profile validations and aggregate the results across files.
+
+    Attributes:
+        mode (str): "sample" or "cprofile"
+        interval (float): Seconds between samples in "sample" mode
+        memory (bool): Trace memory allocations with tracemalloc
+        select (List[str]): Glob patterns of files to profile; all if empty
+        stacks (Counter): Collapsed stack to weight
+        files (List[Dict[str, Any]]): {'path', 'seconds', 'peak_bytes'} per file
+        stage_peaks (Dict[str, int]): Peak traced bytes per stage
+        allocations (List[Dict[str, Any]]): Top allocation sites
+    """
+
+    def __init__(self, mode: str = 'sample', interval: float = SAMPLE_INTERVAL,
+                 memory: bool = True, select: Optional[Iterable[str]] = None):
+        """Initialize the session.
+
+        Args:
+            mode: "sample" or "cprofile".
+            interval: Seconds between stack samples.
+            memory: Also trace memory with tracemalloc.
+            select: Glob patterns matched against file paths and base names.
+
+        Raises:
+            ValueError: If the mode is not supported.
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode: {mode} "
+                             f"(choose from {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.interval = interval
+        self.memory = memory
+        self.select = list(select or ())
+        self.stacks: Counter = Counter()
+        self.files: List[Dict[str, Any]] = []
+        self.stage_peaks: Dict[str, int] = {}
+        self.allocations: List[Dict[str, Any]] = []
+        # Stage -> function -> self weight
+        self._functions: DefaultDict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._thread_id: Optional[int] = None
+        self._stages: List[str] = []
+        self._memory_marks: List[int] = []
+        self._file_peak = 0
+        self._base_depth = 0
+        self._profilers: Dict[str, cProfile.Profile] = {}
+        self._started_tracing = False
+
+    def selects(self, path: str) -> bool:
+        """Whether a file matches the session's selection patterns."""
+        if not self.select:
+            return True
+        name = os.path.basename(path)
+        return any(fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(name, pattern)
+                   for pattern in self.select)
+
+    def options(self) -> Dict[str, Any]:
+        """Return the constructor arguments, for sessions in worker processes."""
+        return {'mode': self.mode, 'interval': self.interval, 'memory': self.memory}
+
+    # --- Profiling ---
+
+    def profile(self, path: str) -> "_FileProfile":
+        """Return a context manager profiling the validation of one file."""
+        return _FileProfile(self, path)
+
+    def stage_started(self, name: str) -> None:
+        """Instrumentation listener: switch attribution to a new stage."""
+        if threading.get_ident() != self._thread_id:
+            return
+        if self.mode == 'cprofile':
+            self._profiler(self._stages[-1]).disable()
+            self._profiler(name).enable()
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self._file_peak = max(self._file_peak, peak)
+            self._memory_marks.append(current)
+            _reset_peak()
+        self._stages.append(name)
+
+    def stage_finished(self, name: str) -> None:
+        """Instrumentation listener: attribute the stage's peak memory."""
+        if threading.get_ident() != self._thread_id or len(self._stages) < 2:
+            return
+        self._stages.pop()
+        if self.mode == 'cprofile':
+            self._profiler(name).disable()
+            self._profiler(self._stages[-1]).enable()
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1] - self._memory_marks.pop()
+            with self._lock:
+                self.stage_peaks[name] = max(self.stage_peaks.get(name, 0), peak)
+
+    def _profiler(self, stage: str) -> cProfile.Profile:
+        profiler = self._profilers.get(stage)
+        if profiler is None:
+            profiler = self._profilers[stage] = cProfile.Profile()
+        return profiler
+
+    def _sample(self, stop: threading.Event) -> None:
+        """Sampler thread: record the profiled thread's stack until stopped."""
+        thread_id = self._thread_id
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{getattr(code, 'co_qualname', code.co_name)} "
+                             f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            names.reverse()
+            del names[:self._base_depth]
+            stages = self._stages
+            stage = stages[-1] if stages else ROOT_STAGE
+            with self._lock:
+                self.stacks[';'.join([f"stage:{stage}"] + names)] += 1
+                if names:
+                    self._functions[stage][names[-1]] += 1
+
+    def _collect_cprofile(self) -> None:
+        """Fold the per-stage cProfile data into stacks and function weights."""
+        for stage, profiler in self._profilers.items():
+            for (filename, line, function), row in pstats.Stats(profiler).stats.items():
+                tottime = row[2]
+                weight = int(tottime * 1e6)
+                if not weight:
+                    continue
+                name = f"{function} ({os.path.basename(filename)}:{line})"
+                self.stacks[f"stage:{stage};{name}"] += weight
+                self._functions[stage][name] += weight
+        self._profilers.clear()
+
+    def _snapshot_allocations(self) -> None:
+        """Record the lines holding the most traced memory."""
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        self.allocations = [{
+            'location': f"{os.path.basename(stat.traceback[0].filename)}:"
+                        f"{stat.traceback[0].lineno}",
+            'bytes': stat.size,
+            'count': stat.count
+        } for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]]
+
+    def close(self) -> None:
+        """Finish the session, recording allocation sites and stopping tracemalloc."""
+        if self.mode == 'cprofile':
+            self._collect_cprofile()
+        if self.memory:
+            self._snapshot_allocations()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    # --- Worker transfer ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the session's data as a JSON-serializable dictionary."""
+        if self.mode == 'cprofile':
+            self._collect_cprofile()
+        return {
+            'stacks': dict(self.stacks),
+            'functions': {stage: dict(weights) for stage, weights in self._functions.items()},
+            'files': list(self.files),
+            'stage_peaks': dict(self.stage_peaks),
+            'allocations': list(self.allocations)
+        }
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add data returned by to_dict() in another process."""
+        with self._lock:
+            self.stacks.update(data.get('stacks', {}))
+            for stage, weights in data.get('functions', {}).items():
+                self._functions[stage].update(weights)
+            self.files.extend(data.get('files', []))
+            for stage, peak in data.get('stage_peaks', {}).items():
+                self.stage_peaks[stage] = max(self.stage_peaks.get(stage, 0), peak)
+            by_location = {item['location']: item for item in self.allocations}
+            for item in data.get('allocations', []):
+                known = by_location.get(item['location'])
+                if known is None or item['bytes'] > known['bytes']:
+                    by_location[item['location']] = item
+            self.allocations = sorted(by_location.values(),
+                                      key=lambda item: -item['bytes'])[:TOP_ALLOCATIONS]
+
+    # --- Output ---
+
+    def write_collapsed(self, path: str) -> None:
+        """Write the collapsed stacks for flame graph tools."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, weight in sorted(self.stacks.items()):
+                f.write(f"{stack} {weight}\n")
+
+    def report(self) -> str:
+        """Return a text report of files, stages, functions and allocations."""
+        unit = "samples" if self.mode == 'sample' else "µs"
+        lines = [f"Profiled {len(self.files)} file(s) in {self.mode} mode"]
+
+        lines.append("")
+        lines.append(f"{'Seconds':>9} {'Peak MB':>9}  File")
+        for item in sorted(self.files, key=lambda item: -item['seconds']):
+            peak = f"{item['peak_bytes'] / 1e6:.2f}" if item.get('peak_bytes') is not None else "-"
+            lines.append(f"{item['seconds']:>9.3f} {peak:>9}  {item['path']}")
+
+        stage_weights = Counter()
+        for stack, weight in self.stacks.items():
+            stage_weights[stack.split(';', 1)[0][len('stage:'):]] += weight
+        total = sum(stage_weights.values()) or 1
+        lines.append("")
+        lines.append(f"{'Stage':<20} {unit:>12} {'Share':>7} {'Peak MB':>9}")
+        for stage, weight in stage_weights.most_common():
+            peak = self.stage_peaks.get(stage)
+            peak_text = f"{peak / 1e6:.2f}" if peak is not None else "-"
+            lines.append(f"{stage:<20} {weight:>12} {weight / total:>7.1%} {peak_text:>9}")
+
+        for stage, _ in stage_weights.most_common():
+            functions = self._functions.get(stage)
+            if not functions:
+                continue
+            lines.append("")
+            lines.append(f"Top functions in {stage} (self {unit}):")
+            for function, weight in functions.most_common(TOP_FUNCTIONS):
+                lines.append(f"  {weight:>10}  {function}")
+
+        if self.allocations:
+            lines.append("")
+            lines.append("Top allocation sites (live at the end of the run):")
+            for item in self.allocations:
+                lines.append(f"  {item['bytes'] / 1e6:>9.2f} MB {item['count']:>8} blocks  "
+                             f"{item['location']}")
+        return '\n'.join(lines)
+
+
+def _reset_peak() -> None:
+    """Restart peak tracking (Python 3.9+; older versions keep the run's peak)."""
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+
+
+class _FileProfile:
+    """Context manager profiling one file on the calling thread."""
+
+    def __init__(self, session: ProfileSession, path: str):
+        self.session = session
+        self.path = path
+
+    def __enter__(self) -> "_FileProfile":
+        session = self.session
+        session._thread_id = threading.get_ident()
+        session._stages = [ROOT_STAGE]
+        session._memory_marks = []
+
+        # Stages are announced by the instrumentation recorder
+        self.owns_recorder = instrumentation.get_recorder() is None
+        self.recorder = instrumentation.enable()
+        self.recorder.add_listener(session)
+
+        if session.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                session._started_tracing = True
+            self.memory_mark = tracemalloc.get_traced_memory()[0]
+            session._file_peak = 0
+            _reset_peak()
+
+        if session.mode == 'sample':
+            # Frames at and above the caller are common to every sample
+            depth, frame = 0, sys._getframe(1)
+            while frame is not None:
+                depth += 1
+                frame = frame.f_back
+            session._base_depth = depth
+            self.stop = threading.Event()
+            self.sampler = threading.Thread(target=session._sample, args=(self.stop,),
+                                            name="profile-sampler", daemon=True)
+            self.sampler.start()
+        else:
+            session._profiler(ROOT_STAGE).enable()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        session = self.session
+        seconds = time.perf_counter() - self.started
+        if session.mode == 'sample':
+            self.stop.set()
+            self.sampler.join()
+        else:
+            session._profiler(ROOT_STAGE).disable()
+
+        peak = None
+        if session.memory:
+            peak = max(session._file_peak, tracemalloc.get_traced_memory()[1]) - self.memory_mark
+        self.recorder.remove_listener(session)
+        if self.owns_recorder:
+            instrumentation.disable()
+        session._thread_id = None
+        with session._lock:
+            session.files.append({'path': self.path, 'seconds': round(seconds, 6),
+                                  'peak_bytes': peak})
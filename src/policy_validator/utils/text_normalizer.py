@@ -0,0 +1,421 @@
+"""Text normalization and alias-aware section matching.
+
+This module provides the normalization pipeline applied to policy documents
+before section matching, and a precomputed per-standard index that resolves
+section names, synonyms and control identifiers in a single scan.
+
+Normalization Pipeline:
+    1. Unicode folding (NFKD decomposition, combining marks dropped, casefold)
+    2. Hyphen, dash and underscore characters replaced by spaces, except a
+       hyphen joining a letter to a digit, as in control identifiers ("AC-2")
+    3. Whitespace runs collapsed to a single space
+
+Example:
+    >>> from policy_validator.utils.text_normalizer import (
+    ...     normalize_text, get_section_matcher
+    ... )
+    >>> matcher = get_section_matcher("NIST SP 800-53")
+    >>> text = normalize_text("Access-Control Policy\\nSee AU-6 for review.")
+    >>> sorted(matcher.find_sections(text))
+    ['access control', 'audit and accountability']
+
+Performance Considerations:
+    - The document is normalized once; section names and synonyms are then
+      found by substring search, and control identifiers are only tried
+      where their literal marker occurs, so a scan costs about as much as
+      checking each section name with ``in``.
+    - Matchers are built once per standard and cached.
+    - Pure ASCII text skips the Unicode decomposition step.
+    - Large documents can be normalized and scanned chunk by chunk with
+      ChunkNormalizer and SectionScanner, in memory bounded by the
+      chunk size.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..validators.standards import VALIDATION_STANDARDS
+
+# --- Constants ---
+# Hyphen-like code points folded to a plain hyphen; soft hyphens are dropped
+_DASH_CHARS = "-_\u2010\u2011\u2012\u2013\u2014\u2015\u2212\ufe58\ufe63\uff0d"
+_DASH_TABLE = str.maketrans({**{char: "-" for char in _DASH_CHARS}, "\u00ad": None})
+_HELD_CHARS = _DASH_CHARS + "\u00ad"
+# Every hyphen except one joining a letter to a digit ("ac-2")
+_SPACED_DASH_RE = re.compile(r"-(?!(?<=[a-z]-)\d)")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Characters kept after the scan position: one for \b context, plus a window
+# longer than any phrase or control identifier so pending matches can complete
+SCAN_CONTEXT = 1
+SCAN_LOOKAHEAD = 256
+# Characters a control identifier may start before its marker ("cc12.1")
+CONTROL_ID_REACH = 4
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for alias-aware section matching.
+
+    Args:
+        text: Raw document or section text.
+
+    Returns:
+        str: Casefolded text with accents removed, hyphens replaced by
+        spaces (unless they join a letter to a digit) and whitespace
+        collapsed.
+
+    Example:
+        >>> normalize_text("Access–Control   Policy")
+        'access control policy'
+    """
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    text = text.casefold().translate(_DASH_TABLE)
+    if "-" in text:
+        text = _SPACED_DASH_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text)
+
+
+class ChunkNormalizer:
+    """Normalize consecutive pieces of one text.
+
+    Joining the pieces returned by normalize() and finish() gives
+    normalize_text() of the joined input: every step is applied per
+    character, except whitespace collapsing, whose runs are merged across
+    chunk boundaries here, and hyphens, which depend on the characters
+    around them. Hyphens ending a piece are held back until the next one.
+    """
+
+    def __init__(self, after_space: bool = False) -> None:
+        """Initialize the normalizer.
+
+        Args:
+            after_space: Whether the text normalized before the first piece
+                ended with a space, when resuming in the middle of a text.
+        """
+        # Last character returned, the context of the next piece
+        self._last = " " if after_space else ""
+        self._pending = ""
+
+    def normalize(self, chunk: str) -> str:
+        """Normalize the next piece of the text (the result may be empty)."""
+        chunk = self._pending + chunk
+        # Hold back trailing hyphens, with the soft hyphens and combining
+        # marks that normalization drops between a hyphen and a digit
+        end = len(chunk)
+        while end and (chunk[end - 1] in _HELD_CHARS
+                       or unicodedata.combining(chunk[end - 1])):
+            end -= 1
+        self._pending = chunk[end:]
+        return self._normalize(chunk[:end])
+
+    def finish(self) -> str:
+        """Normalize the characters held back at the end of the text."""
+        chunk, self._pending = self._pending, ""
+        return self._normalize(chunk)
+
+    def _normalize(self, chunk: str) -> str:
+        if not chunk:
+            return ""
+        # A normalized character normalizes to itself, so it serves as the
+        # context for whitespace runs and hyphens at the start of the piece
+        normalized = normalize_text(self._last + chunk)[len(self._last):]
+        if normalized:
+            self._last = normalized[-1]
+        return normalized
+
+
+class SectionMatcher:
+    """Precomputed index resolving section variants in a single pass.
+
+    The matcher normalizes every section name and synonym of a standard
+    once, and finds every occurrence of each in the text by substring
+    search, so overlapping phrases are all found: "organization of
+    information security policies" names both "organization of information
+    security" and "information security policies". At each position the
+    longest variant wins; it maps to the set of sections it satisfies,
+    including sections whose variants are a prefix of it, so a longer match
+    never hides a shorter one. Control identifiers are matched by the
+    standard's regex, tried only near occurrences of its literal marker.
+
+    Attributes:
+        sections (List[str]): Canonical section names in standard order
+        control_ids (Dict[str, str]): Control identifier prefixes to sections
+    """
+
+    def __init__(self, sections: List[str],
+                 synonyms: Optional[Dict[str, List[str]]] = None,
+                 control_ids: Optional[Dict[str, str]] = None,
+                 control_id_pattern: str = "",
+                 control_id_marker: str = ""):
+        """Build the matcher index.
+
+        Args:
+            sections: Canonical section names.
+            synonyms: Alternative phrasings keyed by section name.
+            control_ids: Control identifier prefixes mapped to section names.
+            control_id_pattern: Regex with a ``prefix`` group matching control
+                identifiers in normalized text. Empty disables ID matching.
+            control_id_marker: Regex starting with a literal that matches in
+                every control identifier, no more than CONTROL_ID_REACH
+                characters after its start. The identifier pattern is then
+                only tried there; empty tries it at every position.
+        """
+        self.sections = list(sections)
+        self.control_ids = dict(control_ids or {})
+
+        # Map each normalized variant to the sections it names
+        variants: Dict[str, Set[str]] = {}
+        for section in self.sections:
+            for phrase in [section] + list((synonyms or {}).get(section, [])):
+                variant = normalize_text(phrase).strip()
+                if variant:
+                    variants.setdefault(variant, set()).add(section)
+        self._variants = {variant: frozenset(names) for variant, names in variants.items()}
+
+        # A variant also satisfies every section whose variant it contains
+        # (variants starting further in are also found at their own position)
+        self._variant_sections: Dict[str, frozenset] = {}
+        for variant in variants:
+            covered: Set[str] = set()
+            for other, other_sections in variants.items():
+                if other in variant:
+                    covered |= other_sections
+            self._variant_sections[variant] = frozenset(covered)
+
+        self._control_pattern = None
+        self._control_marker = None
+        if control_id_pattern and self.control_ids:
+            self._control_pattern = re.compile(control_id_pattern)
+            # Without a marker, a zero-width lookahead finds every start
+            self._control_marker = re.compile(control_id_marker or
+                                              f"(?={control_id_pattern})")
+            self._control_reach = CONTROL_ID_REACH if control_id_marker else 0
+        self._empty = not self._variants and self._control_pattern is None
+
+    def find_sections(self, normalized_text: str,
+                      wanted: Optional[Iterable[str]] = None) -> Set[str]:
+        """Find the sections present in normalized text.
+
+        Args:
+            normalized_text: Text already passed through normalize_text().
+            wanted: Optional sections of interest. Scanning stops as soon as
+                all of them have been found.
+
+        Returns:
+            Set[str]: Canonical names of the sections found.
+        """
+        found: Set[str] = set()
+        remaining = set(wanted) if wanted is not None else set(self.sections)
+        if self._empty or not remaining:
+            return found
+
+        # Every variant present is the longest at its position or contained
+        # in the longest, so checking each one gives the same sections
+        for variant, names in self._variants.items():
+            if remaining.isdisjoint(names) or variant not in normalized_text:
+                continue
+            found |= names
+            remaining -= names
+            if not remaining:
+                return found
+
+        for _, _, hits in self._control_matches(normalized_text, 0, len(normalized_text),
+                                                len(normalized_text)):
+            found |= hits
+            remaining -= hits
+            if not remaining:
+                break
+        return found
+
+    def iter_matches(self, normalized_text: str, position: int = 0,
+                     until: Optional[int] = None
+                     ) -> Iterator[Tuple[int, int, FrozenSet[str]]]:
+        """Yield every match in normalized text as (start, end, sections).
+
+        Matches may overlap: there is one for every position where a
+        variant or control identifier starts, in order of position; a
+        variant wins over a control identifier starting at the same place.
+        Unlike find_sections(), this also reports control identifiers whose
+        prefix maps to no section (with no sections), since they too take
+        part in matching.
+
+        A match depends only on the character before it and the
+        SCAN_LOOKAHEAD characters from its start, so a range of positions
+        can be matched again after an edit without rescanning the rest.
+
+        Args:
+            normalized_text: Text already passed through normalize_text().
+            position: Offset to start at; the text before it still counts
+                as context for word boundaries.
+            until: Only report matches starting before this offset; the
+                text is scanned no further than SCAN_LOOKAHEAD past it.
+        """
+        if self._empty:
+            return
+        endpos = len(normalized_text)
+        stop = endpos
+        if until is not None:
+            endpos = min(endpos, until + SCAN_LOOKAHEAD + 1)
+            stop = min(until, endpos)
+
+        matches: Dict[int, Tuple[int, FrozenSet[str]]] = {}
+        for variant, names in self._variant_sections.items():
+            length = len(variant)
+            start = normalized_text.find(variant, position, endpos)
+            while 0 <= start < stop:
+                previous = matches.get(start)
+                if previous is None or previous[0] < start + length:
+                    matches[start] = (start + length, names)
+                start = normalized_text.find(variant, start + 1, endpos)
+        for start, end, hits in self._control_matches(normalized_text, position,
+                                                      endpos, stop):
+            matches.setdefault(start, (end, hits))
+
+        for start in sorted(matches):
+            end, hits = matches[start]
+            yield start, end, hits
+
+    def _control_matches(self, normalized_text: str, position: int, endpos: int,
+                         stop: int) -> Iterator[Tuple[int, int, FrozenSet[str]]]:
+        """Control identifiers starting in [position, stop), in order."""
+        if self._control_pattern is None:
+            return
+        tried = position  # Starts below this have been tried
+        for marker in self._control_marker.finditer(normalized_text, position, endpos):
+            first = max(tried, marker.start() - self._control_reach)
+            tried = min(marker.start() + 1, stop)
+            for start in range(first, tried):
+                match = self._control_pattern.match(normalized_text, start, endpos)
+                if match:
+                    section = self.control_ids.get(match.group("prefix"))
+                    hits = frozenset((section,)) if section else frozenset()
+                    yield start, match.end(), hits
+            if tried >= stop:
+                return
+
+    def missing_sections(self, normalized_text: str, wanted: Iterable[str]) -> List[str]:
+        """List the wanted sections absent from normalized text.
+
+        Args:
+            normalized_text: Text already passed through normalize_text().
+            wanted: Sections to check, in reporting order.
+
+        Returns:
+            List[str]: Missing section names, preserving the order of ``wanted``.
+        """
+        wanted = list(wanted)
+        found = self.find_sections(normalized_text, wanted)
+        return [section for section in wanted if section not in found]
+
+    def scanner(self, wanted: Optional[Iterable[str]] = None) -> "SectionScanner":
+        """Return a scanner finding sections in normalized text chunk by chunk."""
+        return SectionScanner(self, wanted)
+
+
+class SectionScanner:
+    """Incremental find_sections() over a document fed in chunks.
+
+    Matches are accepted only once the text following them is known, so the
+    same matches are found as in one find_sections() call over the whole
+    text, provided no single match is longer than SCAN_LOOKAHEAD characters
+    (phrases and control identifiers are far shorter). The scanner keeps at
+    most the unscanned tail plus SCAN_LOOKAHEAD characters.
+
+    Example:
+        >>> scanner = matcher.scanner(["access control"])
+        >>> normalizer = ChunkNormalizer()
+        >>> for chunk in chunks:
+        ...     scanner.feed(normalizer.normalize(chunk))
+        ...     if scanner.done:
+        ...         break
+        >>> scanner.feed(normalizer.finish())
+        >>> found = scanner.finish()
+
+    Attributes:
+        found (Set[str]): Sections found so far
+        done (bool): All wanted sections were found; further input is ignored
+    """
+
+    def __init__(self, matcher: SectionMatcher, wanted: Optional[Iterable[str]] = None):
+        self.matcher = matcher
+        self.found: Set[str] = set()
+        self._remaining = set(wanted) if wanted is not None else set(matcher.sections)
+        self.done = matcher._empty or not self._remaining
+        self._buffer = ""
+        self._position = 0  # Next scan offset in the buffer
+
+    def feed(self, normalized_chunk: str) -> None:
+        """Scan the next piece of normalized text."""
+        if self.done:
+            return
+        self._buffer += normalized_chunk
+        self._scan(final=False)
+
+    def finish(self) -> Set[str]:
+        """Scan the remaining text and return the sections found."""
+        if not self.done:
+            self._scan(final=True)
+        self._buffer = ""
+        return self.found
+
+    def _scan(self, final: bool) -> None:
+        buffer = self._buffer
+        settled = len(buffer) if final else len(buffer) - SCAN_LOOKAHEAD
+        position = self._position
+        resume = max(position, settled)
+        for start, end, hits in self.matcher.iter_matches(buffer, position):
+            # A match near the end of the text read so far might turn out
+            # longer, or lose to another alternative, once more text arrives
+            if not final and (start >= settled or end >= len(buffer)):
+                resume = max(position, min(settled, start))
+                break
+            self.found |= hits
+            self._remaining -= hits
+            position = start + 1
+            resume = max(position, settled)
+            if not self._remaining:
+                self.done = True
+                self._buffer = ""
+                return
+        position = resume
+        # Keep context before the scan position for \b
+        keep_from = max(0, position - SCAN_CONTEXT)
+        self._buffer = buffer[keep_from:]
+        self._position = position - keep_from
+
+
+def build_section_matcher(standard: Dict[str, Any]) -> SectionMatcher:
+    """Build a SectionMatcher from a standard definition dictionary.
+
+    Args:
+        standard: Standard definition as found in VALIDATION_STANDARDS.
+
+    Returns:
+        SectionMatcher: Matcher for the standard's sections.
+    """
+    return SectionMatcher(
+        sections=standard["sections"],
+        synonyms=standard.get("synonyms"),
+        control_ids=standard.get("control_ids"),
+        control_id_pattern=standard.get("control_id_pattern", ""),
+        control_id_marker=standard.get("control_id_marker", ""),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_section_matcher(standard_name: str) -> SectionMatcher:
+    """Return the cached SectionMatcher for a named standard.
+
+    Args:
+        standard_name: Key of VALIDATION_STANDARDS (e.g. "ISO 27001").
+
+    Returns:
+        SectionMatcher: Matcher built once and reused for every document.
+
+    Raises:
+        KeyError: If the standard is not defined.
+    """
+    return build_section_matcher(VALIDATION_STANDARDS[standard_name])
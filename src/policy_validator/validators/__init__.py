@@ -3,5 +3,36 @@ Policy validation module.
 
 This package contains validators that check policy documents against
 various standards and best practices.
+
+Exports are imported on first access: the parsers and the text normalizer
+import validators.standards, which must not pull in the validators (and,
+through them, the parsers again) as a side effect.
 """
 
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    'PolicyValidator': '.policy_validator',
+    'validate_policy': '.policy_validator',
+    'validate_against_nist': '.policy_validator',
+    'validate_against_iso': '.policy_validator',
+    'validate_against_soc2': '.policy_validator',
+    'validate_custom': '.policy_validator',
+    'IncrementalValidator': '.incremental'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported validator on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
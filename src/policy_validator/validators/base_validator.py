@@ -32,6 +32,9 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Literal, Optional
 from datetime import datetime
 
+from ..parsers.section_index import SectionIndex
+from ..utils.text_normalizer import SectionMatcher
+
 
 class BaseValidator(ABC):
     """Abstract base class for policy document validators.
@@ -165,6 +168,7 @@ class BaseValidator(ABC):
                 min_length (int): Minimum document length
                 required_sections (list): Required section names
                 structure_required (bool): Whether to enforce structure
+                min_section_length (int): Minimum body characters per section
                 custom_rules (dict): Standard-specific rules
 
         Example:
@@ -212,3 +216,48 @@ class BaseValidator(ABC):
 
         return True
 
+    def _validate_section_headings(self, matcher: Optional[SectionMatcher] = None) -> bool:
+        """Validate that required sections exist as headings with body text.
+
+        Uses the document's SectionIndex (the 'section_index' entry produced
+        by the parsers, or one built from the text) so each section check is
+        a lookup rather than a rescan of the document.
+
+        Args:
+            matcher: Optional SectionMatcher so synonyms and control IDs in
+                heading titles satisfy a section.
+
+        Returns:
+            bool: True if every required section has a qualifying heading
+
+        Options Used:
+            required_sections (list): Sections that must appear as headings
+            min_section_length (int): Minimum body characters per section
+        """
+        index = self.document_content.get('section_index')
+        if index is None:
+            index = SectionIndex.from_text(self.document_content.get('text', ''))
+            self.document_content['section_index'] = index
+
+        min_body = self.validation_options.get('min_section_length', 0)
+        passed = True
+        for section in self.validation_options.get('required_sections', []):
+            if index.has_section(section, min_body_chars=min_body, matcher=matcher):
+                continue
+            passed = False
+            heading = index.find_section(section, matcher=matcher)
+            if heading is None:
+                self.add_result(
+                    section=section,
+                    status="fail",
+                    message=f"No heading found for section '{section}'"
+                )
+            else:
+                self.add_result(
+                    section=section,
+                    status="fail",
+                    message=f"Section '{section}' is shorter than {min_body} characters",
+                    details={"body_length": index.body_length(heading),
+                             "start": heading['start']}
+                )
+        return passed
@@ -0,0 +1,545 @@
+"""Headless policy file validation.
+
+This module implements validation of policy files against a standard
+without any GUI dependency. The desktop application, the command line and
+the programmatic API all delegate to PolicyValidator, so a file gets the
+same verdict wherever it is validated.
+
+Validation Steps:
+    1. Cheap pre-checks from file metadata (size from stat, PDF outline
+       triage, DOCX archive directory)
+    2. Content extraction (chunked text read, PyPDF2, python-docx)
+    3. Length requirement
+    4. Section presence (synonym and control-ID aware, one scan)
+    5. Structure requirement (warning only): headings, and a body of at
+       least MIN_SECTION_BODY characters under the headings of each section
+
+Fail-Fast Mode:
+    With ``fail_fast=True`` the checks run in the order above and stop at the
+    first failing mandatory rule. Checks that can only produce warnings are
+    skipped, since they cannot change the pass/fail verdict. Files that are
+    too small to hold the required text are rejected before being read:
+        - Text files whose byte size is below the minimum length
+        - DOCX files whose uncompressed document.xml is below the minimum
+          length, read from the zip directory without parsing the document
+        - PDFs that are encrypted or have no pages, from the outline triage
+    PDF pages are then decoded one at a time, only until the minimum length
+    is reached and every section is found.
+
+Example:
+    >>> from policy_validator.validators.policy_validator import PolicyValidator
+    >>> validator = PolicyValidator("ISO 27001", fail_fast=True)
+    >>> result = validator.validate_file("policy.txt")
+    >>> result['valid'], result['issues']
+    (False, ['Missing required sections for ISO 27001: cryptography'])
+
+Streams:
+    Documents that are not files on disk (archive members, uploads) are
+    validated from a binary file object with validate_stream(), or with
+    validate() given the stream. PDF and Word documents need a seekable
+    stream; text is read sequentially.
+"""
+
+import zipfile
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Set
+
+from ..parsers.docx_parser import DocxParser
+from ..parsers.pdf_parser import PdfParser
+from ..parsers.section_index import SectionIndex
+from ..parsers.text_parser import TextParser
+from ..utils import instrumentation
+from ..utils.text_normalizer import ChunkNormalizer, get_section_matcher, normalize_text
+from .standards import VALIDATION_STANDARDS, resolve_standard
+
+# --- Constants ---
+SMALL_DOCUMENT_SIZE = 1000  # Bytes below which PDF/Word files are suspicious
+WHOLE_TEXT_MAX_SIZE = 64 * 1024 * 1024  # Larger text files are always streamed
+MIN_SECTION_BODY = 20  # Characters under a section's headings below which it is empty
+DOCX_BODY_PART = 'word/document.xml'
+
+
+class PolicyValidator:
+    """Validate policy files against a validation standard.
+
+    Attributes:
+        standard_name (str): Canonical name of the validation standard
+        standard (Dict[str, Any]): Standard requirements from VALIDATION_STANDARDS
+        sections (List[str]): Sections required for this run
+        fail_fast (bool): Stop at the first failing mandatory rule
+        matcher (SectionMatcher): Cached section matcher for the standard
+        stream_text (bool): Check text files chunk by chunk. Subclasses that
+            need the whole text in check_content() set this to False; text
+            files above WHOLE_TEXT_MAX_SIZE are streamed regardless.
+    """
+
+    stream_text = True
+
+    def __init__(self, standard: str = "Custom",
+                 sections: Optional[Iterable[str]] = None,
+                 fail_fast: bool = False):
+        """Initialize the validator.
+
+        Args:
+            standard: Standard name or alias (e.g. "NIST SP 800-53", "NIST").
+            sections: Sections to require. Defaults to all sections of the
+                standard.
+            fail_fast: If True, order checks by cost and stop at the first
+                failing mandatory rule, skipping warning-only checks.
+
+        Raises:
+            ValueError: If the standard is not supported.
+        """
+        self.standard_name = resolve_standard(standard)
+        self.standard = VALIDATION_STANDARDS[self.standard_name]
+        self.sections = list(sections) if sections is not None else list(
+            self.standard['sections']
+        )
+        self.fail_fast = fail_fast
+        self.matcher = get_section_matcher(self.standard_name)
+
+    def validate_file(self, file_path: str) -> Dict[str, Any]:
+        """Identify and validate a policy file.
+
+        Args:
+            file_path: Path to the policy file.
+
+        Returns:
+            dict: File information dictionary (see identify_file()) updated
+            with 'standard', 'valid', 'issues' and 'sections' (section name
+            to bool for each section that was checked).
+        """
+        # Imported here so callers passing file_info never need libmagic
+        from ..utils.file_types import identify_file
+
+        instrumentation.set_file(file_path)
+        try:
+            with instrumentation.stage('mime_detection'):
+                file_info = identify_file(file_path)
+        except Exception as e:
+            return {
+                'path': file_path,
+                'type': None,
+                'size': 0,
+                'standard': self.standard_name,
+                'valid': False,
+                'issues': [f"Error processing file: {str(e)}"]
+            }
+        return self.validate(file_info)
+
+    def validate_stream(self, file_path: str, stream: BinaryIO, size: int) -> Dict[str, Any]:
+        """Identify and validate a policy read from a binary stream.
+
+        Args:
+            file_path: Path reported for the document, e.g. an archive
+                member path or the name of an upload.
+            stream: Seekable binary file object holding the document.
+            size: Size of the document in bytes.
+
+        Returns:
+            dict: File information dictionary, as from validate_file().
+        """
+        from ..utils.file_types import identify_stream
+
+        instrumentation.set_file(file_path)
+        try:
+            with instrumentation.stage('mime_detection'):
+                file_info = identify_stream(file_path, stream, size)
+        except Exception as e:
+            return {
+                'path': file_path,
+                'type': None,
+                'size': size,
+                'standard': self.standard_name,
+                'valid': False,
+                'issues': [f"Error processing file: {str(e)}"]
+            }
+        return self.validate(file_info, stream)
+
+    def validate(self, file_info: Dict[str, Any],
+                 stream: Optional[BinaryIO] = None) -> Dict[str, Any]:
+        """Validate a file described by a file information dictionary.
+
+        Args:
+            file_info: Dictionary with at least 'path', 'type' and 'size',
+                as built by identify_file() or the GUI.
+            stream: Binary file object holding the document, read instead
+                of file_info['path'] (see module docstring).
+
+        Returns:
+            dict: The same dictionary, updated in place.
+        """
+        file_info.setdefault('valid', True)
+        file_info.setdefault('issues', [])
+        file_info['standard'] = self.standard_name
+        instrumentation.set_file(file_info.get('path', ''))
+
+        if file_info.get('size', 0) == 0:
+            file_info['valid'] = False
+            file_info['issues'].append("File is empty")
+        elif file_info['type'] == 'txt':
+            self._validate_text(file_info, stream)
+        elif file_info['type'] == 'pdf':
+            self._validate_pdf(file_info, stream)
+        elif file_info['type'] in ('doc', 'docx'):
+            self._validate_word(file_info, stream)
+        else:
+            file_info['valid'] = False
+            file_info['issues'].append(
+                f"Unsupported file type: {file_info.get('mime') or file_info['type']}"
+            )
+        return file_info
+
+    # --- Type-specific validation ---
+
+    def _validate_text(self, file_info: Dict[str, Any],
+                       stream: Optional[BinaryIO] = None) -> None:
+        """Validate a text-based policy file.
+
+        The file is read once, in chunks through a memory map, with its
+        encoding detected from the first bytes. Every check runs
+        incrementally (see parsers.text_parser), so memory use does not grow
+        with the file size. The verdict is the same as check_content() on
+        the whole lowercased text, which is used instead when stream_text
+        is False. The detected encoding is recorded in file_info['encoding'].
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            stream: File object read instead of the file.
+        """
+        try:
+            # No supported encoding uses fewer bytes than characters, so a file
+            # smaller than the minimum length cannot pass and need not be read
+            if self.fail_fast and file_info['size'] < self.standard['min_length']:
+                self._fail_length(file_info, file_info['size'], unit="bytes")
+                return
+
+            parser = TextParser(file_info['path'], stream=stream)
+            if not self.stream_text and file_info['size'] <= WHOLE_TEXT_MAX_SIZE:
+                content = ''.join(parser.iter_chunks())
+                self._record_encoding(file_info, parser)
+                with instrumentation.stage('lowercase', len(content)):
+                    content = content.lower()
+                self.check_content(file_info, content)
+                return
+
+            scan = parser.scan(
+                self.matcher, self.sections,
+                min_length=self.standard['min_length'],
+                check_structure=self._checks_structure(),
+                min_section_body=MIN_SECTION_BODY
+            )
+            self._record_encoding(file_info, parser)
+            if scan['length'] < self.standard['min_length']:
+                self._fail_length(file_info, scan['length'])
+                return
+            self._record_checks(
+                file_info, [s for s in self.sections if s not in scan['sections']],
+                lambda: scan['has_headings'], lambda: scan['empty_sections']
+            )
+
+        except Exception as e:
+            file_info['valid'] = False
+            file_info['issues'].append(f"Error validating file: {str(e)}")
+
+    @staticmethod
+    def _record_encoding(file_info: Dict[str, Any], parser: TextParser) -> None:
+        """Record the encoding a text file was read with, warning about replaced bytes."""
+        file_info['encoding'] = parser.encoding
+        if parser.replaced:
+            file_info['issues'].append(
+                f"Text is not valid {parser.encoding}; undecodable bytes were replaced"
+            )
+
+    def _validate_pdf(self, file_info: Dict[str, Any],
+                      stream: Optional[BinaryIO] = None) -> None:
+        """Validate a PDF policy file.
+
+        A structure-only pass reads the outline and page tree first, so
+        password-protected and empty PDFs are rejected without decoding page
+        content, and sections named in the outline are not searched for in
+        the text. The same reader then extracts the text. Without the
+        structure warnings, pages are decoded one at a time and only until
+        every section is found and the minimum length is reached.
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            stream: Seekable file object read instead of the file.
+        """
+        try:
+            if not self.fail_fast and file_info['size'] < SMALL_DOCUMENT_SIZE:
+                file_info['issues'].append("PDF file is suspiciously small")
+
+            with PdfParser(file_info['path'], stream=stream) as parser:
+                # Triage from the outline and page tree without decoding pages
+                with instrumentation.stage('pdf_outline', file_info['size']):
+                    outline = parser.parse(structure_only=True)
+                if outline['encrypted']:
+                    file_info['valid'] = False
+                    file_info['issues'].append("PDF is password-protected")
+                    return
+                if outline['page_count'] == 0:
+                    file_info['valid'] = False
+                    file_info['issues'].append("PDF has no pages")
+                    return
+
+                outline_sections: Set[str] = set()
+                for entry in outline['structure']['sections']:
+                    outline_sections |= self.matcher.find_sections(
+                        normalize_text(entry['title'])
+                    )
+
+                if not self._checks_structure():
+                    self._scan_pdf(file_info, parser, outline_sections)
+                    return
+
+                # Headings and section bodies need the whole text
+                with instrumentation.stage('parse_pdf', file_info['size']):
+                    content = parser.parse()
+                self.check_content(
+                    file_info, content['text'].lower(),
+                    section_index=content['section_index'],
+                    found_sections=outline_sections
+                )
+
+        except Exception as e:
+            file_info['valid'] = False
+            file_info['issues'].append(f"Error validating PDF: {str(e)}")
+
+    def _scan_pdf(self, file_info: Dict[str, Any], parser: PdfParser,
+                  found_sections: Set[str]) -> None:
+        """Check the length and sections of a PDF, decoding pages as needed.
+
+        Gives the results of check_content() on the whole text when the
+        structure warnings do not apply, like TextParser.scan() for text.
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            parser: Parser of the open PDF.
+            found_sections: Sections already named in the outline.
+        """
+        min_length = self.standard['min_length']
+        scanner = self.matcher.scanner(s for s in self.sections if s not in found_sections)
+        normalizer = ChunkNormalizer()
+        length = 0
+        for page in parser.iter_pages():
+            with instrumentation.stage('parse_pdf', len(page)):
+                page = page.lower()
+            length += len(page)
+            if not scanner.done:
+                with instrumentation.stage('normalize', len(page)):
+                    normalized = normalizer.normalize(page)
+                with instrumentation.stage('section_match', len(normalized)):
+                    scanner.feed(normalized)
+            # The remaining pages cannot change any result
+            if scanner.done and length >= min_length:
+                break
+
+        if length < min_length:
+            self._fail_length(file_info, length)
+            return
+        scanner.feed(normalizer.finish())
+        found = found_sections | scanner.finish()
+        self._record_checks(file_info, [s for s in self.sections if s not in found],
+                            lambda: None)
+
+    def _validate_word(self, file_info: Dict[str, Any],
+                       stream: Optional[BinaryIO] = None) -> None:
+        """Validate a Word document policy file.
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            stream: Seekable file object read instead of the file.
+
+        Note:
+            Legacy .doc files cannot be read by python-docx and are reported
+            as needing conversion to .docx.
+        """
+        try:
+            if not self.fail_fast and file_info['size'] < SMALL_DOCUMENT_SIZE:
+                file_info['issues'].append("Word document is suspiciously small")
+
+            if file_info['type'] == 'doc':
+                file_info['valid'] = False
+                file_info['issues'].append(
+                    "Legacy .doc files are not supported; convert to .docx first"
+                )
+                return
+
+            # The body XML is longer than the text it holds, so its
+            # uncompressed size from the zip directory bounds the text length
+            if self.fail_fast:
+                source = stream if stream is not None else file_info['path']
+                with zipfile.ZipFile(source) as archive:
+                    body_size = archive.getinfo(DOCX_BODY_PART).file_size
+                if body_size < self.standard['min_length']:
+                    self._fail_length(file_info, body_size, unit="bytes of document XML")
+                    return
+
+            with instrumentation.stage('parse_docx', file_info['size']):
+                content = DocxParser(file_info['path'], stream=stream).parse()
+            self.check_content(
+                file_info, content['text'].lower(),
+                section_index=content['section_index']
+            )
+
+        except Exception as e:
+            file_info['valid'] = False
+            file_info['issues'].append(f"Error validating Word document: {str(e)}")
+
+    # --- Content checks ---
+
+    def check_content(self, file_info: Dict[str, Any], content: str,
+                      section_index: Optional[SectionIndex] = None,
+                      found_sections: Optional[Set[str]] = None) -> None:
+        """Check extracted policy text against the standard.
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            content: Lowercased document text.
+            section_index: Heading index from the parser, built from the text
+                if needed and not given.
+            found_sections: Sections already confirmed elsewhere (e.g. in a
+                PDF outline), which are not searched for again.
+
+        Standard Requirements:
+            - Content length must reach the standard's min_length (mandatory)
+            - All required sections must be present (mandatory)
+            - Standards with required_structure need Markdown headers or
+              numbered sections, and every section with a heading needs
+              MIN_SECTION_BODY characters under one of them (warnings)
+        """
+        # Check for empty or very short content
+        if len(content) < self.standard["min_length"]:
+            self._fail_length(file_info, len(content))
+            return
+
+        # Check for required sections, resolving synonyms and control IDs
+        # against the normalized text in one pass
+        found_sections = set(found_sections or ())
+        pending = [s for s in self.sections if s not in found_sections]
+        with instrumentation.stage('normalize', len(content)):
+            normalized = normalize_text(content)
+        with instrumentation.stage('section_match', len(normalized)):
+            missing_sections = self.matcher.missing_sections(normalized, pending)
+
+        indexes: List[SectionIndex] = [section_index] if section_index is not None else []
+
+        def index() -> SectionIndex:
+            # Markdown headers (# Section) or numbered sections (1. Section)
+            if not indexes:
+                with instrumentation.stage('structure', len(content)):
+                    indexes.append(SectionIndex.from_text(content))
+            return indexes[0]
+
+        def empty_sections() -> List[str]:
+            with instrumentation.stage('structure'):
+                return index().empty_sections(self.sections, MIN_SECTION_BODY,
+                                              self.matcher)
+
+        self._record_checks(file_info, missing_sections, lambda: bool(index().headings),
+                            empty_sections)
+
+    def _checks_structure(self) -> bool:
+        """Whether the structure warning applies to this run.
+
+        Structure only produces a warning, so it cannot change a fail-fast verdict.
+        """
+        return bool(self.standard["required_structure"]) and not self.fail_fast
+
+    def _record_checks(self, file_info: Dict[str, Any], missing_sections: List[str],
+                       has_headings: Callable[[], Optional[bool]],
+                       empty_sections: Optional[Callable[[], List[str]]] = None) -> None:
+        """Record the outcome of the section and structure checks.
+
+        Args:
+            file_info: File information dictionary, updated in place.
+            missing_sections: Required sections not found, in standard order.
+            has_headings: Called only if the structure warnings apply.
+            empty_sections: Called only if the structure warnings apply and
+                the document has headings; returns the required sections
+                whose headings all have less than MIN_SECTION_BODY
+                characters of body.
+        """
+        file_info['sections'] = {
+            section: section not in missing_sections for section in self.sections
+        }
+        if missing_sections:
+            file_info['valid'] = False
+            file_info['issues'].append(
+                f"Missing required sections for {self.standard_name}: "
+                f"{', '.join(missing_sections)}"
+            )
+            if self.fail_fast:
+                return
+
+        if not self._checks_structure():
+            return
+        if not has_headings():
+            file_info['issues'].append(
+                f"{self.standard_name} requires clear section headers "
+                "or structured format"
+            )
+        elif empty_sections is not None:
+            empty = empty_sections()
+            if empty:
+                file_info['issues'].append(
+                    f"Section headings without body text: {', '.join(empty)}"
+                )
+
+    def _fail_length(self, file_info: Dict[str, Any], length: int,
+                     unit: str = "chars") -> None:
+        """Record a failed minimum length requirement."""
+        file_info['valid'] = False
+        file_info['issues'].append(
+            f"Content length ({length} {unit}) is below minimum requirement "
+            f"({self.standard['min_length']} chars) for {self.standard_name}"
+        )
+
+
+def validate_policy(file_path: str, standard: str = "Custom",
+                    sections: Optional[Iterable[str]] = None,
+                    fail_fast: bool = False) -> Dict[str, Any]:
+    """Validate a policy document against the specified standard.
+
+    Args:
+        file_path: Path to the policy document file.
+        standard: Validation standard name or alias. Options are
+            "NIST", "ISO", "SOC2", "Custom" or the full standard names.
+        sections: Sections to require (default: all sections of the standard).
+        fail_fast: Stop at the first failing mandatory rule.
+
+    Returns:
+        dict: File information with 'valid' (bool), 'issues' (List[str]) and
+        'sections' (Dict[str, bool]).
+
+    Raises:
+        ValueError: If the standard is not supported.
+
+    Example:
+        >>> results = validate_policy("policy.pdf", "ISO")
+        >>> if results["valid"]:
+        ...     print("Policy is compliant!")
+        ... else:
+        ...     print("Issues found:", results["issues"])
+    """
+    return PolicyValidator(standard, sections, fail_fast).validate_file(file_path)
+
+
+def validate_against_nist(file_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """Validate a policy document against NIST SP 800-53."""
+    return validate_policy(file_path, "NIST SP 800-53", **kwargs)
+
+
+def validate_against_iso(file_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """Validate a policy document against ISO 27001."""
+    return validate_policy(file_path, "ISO 27001", **kwargs)
+
+
+def validate_against_soc2(file_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """Validate a policy document against SOC 2."""
+    return validate_policy(file_path, "SOC 2", **kwargs)
+
+
+def validate_custom(file_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """Validate a policy document against the Custom standard."""
+    return validate_policy(file_path, "Custom", **kwargs)
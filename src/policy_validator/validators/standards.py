@@ -0,0 +1,206 @@
+"""Validation standard definitions.
+
+This module holds the requirements for every supported validation standard
+so that the GUI, the validators and any headless tooling share a single
+source of truth.
+
+Each standard is described by a dictionary with the following keys:
+    sections (List[str]): Required policy sections (lowercase)
+    min_length (int): Minimum document length in characters
+    required_structure (bool): Whether headers or numbered sections are required
+    synonyms (Dict[str, List[str]]): Alternative phrasings accepted for a section
+    control_ids (Dict[str, str]): Control identifier prefixes mapped to sections
+    control_id_pattern (str): Regex matching control identifiers in normalized
+        text. It must define a ``prefix`` group whose value is a key of
+        ``control_ids``.
+    control_id_marker (str): Regex starting with a literal that matches in
+        every control identifier, at most four characters after its start;
+        the identifier pattern is only tried near its matches.
+
+Example:
+    >>> from policy_validator.validators.standards import VALIDATION_STANDARDS
+    >>> VALIDATION_STANDARDS["SOC 2"]["min_length"]
+    500
+    >>> resolve_standard("ISO")
+    'ISO 27001'
+
+Note:
+    Synonyms and control identifiers are matched against normalized text
+    (see ``policy_validator.utils.text_normalizer``), so they should be
+    written lowercase with hyphens replaced by spaces.
+"""
+
+from typing import Any, Dict
+
+# --- Standard definitions ---
+VALIDATION_STANDARDS: Dict[str, Dict[str, Any]] = {
+    "NIST SP 800-53": {
+        "sections": [
+            "access control",
+            "audit and accountability",
+            "security assessment",
+            "configuration management",
+            "contingency planning",
+            "identification and authentication",
+            "incident response",
+            "maintenance",
+            "media protection",
+            "physical protection",
+            "risk assessment",
+            "system and communications protection",
+        ],
+        "min_length": 1000,
+        "required_structure": True,
+        "synonyms": {
+            "access control": ["access management", "logical access"],
+            "audit and accountability": ["audit logging", "audit trail"],
+            "security assessment": [
+                "assessment authorization and monitoring",
+                "security assessment and authorization",
+            ],
+            "contingency planning": ["business continuity", "disaster recovery"],
+            "identification and authentication": ["authentication"],
+            "incident response": ["incident handling", "incident management"],
+            "physical protection": ["physical and environmental protection"],
+            "system and communications protection": [
+                "communications protection",
+                "network security",
+            ],
+        },
+        # NIST SP 800-53 control families, e.g. "AC-2" or "AU-6(1)". The
+        # hyphen is required: "MP3", "page ca 12" or "IA 10" are not controls
+        "control_ids": {
+            "ac": "access control",
+            "au": "audit and accountability",
+            "ca": "security assessment",
+            "cm": "configuration management",
+            "cp": "contingency planning",
+            "ia": "identification and authentication",
+            "ir": "incident response",
+            "ma": "maintenance",
+            "mp": "media protection",
+            "pe": "physical protection",
+            "ra": "risk assessment",
+            "sc": "system and communications protection",
+        },
+        "control_id_pattern": r"\b(?P<prefix>[a-z]{2})-\d{1,2}\b",
+        "control_id_marker": r"-\d",
+    },
+    "ISO 27001": {
+        "sections": [
+            "information security policies",
+            "organization of information security",
+            "human resource security",
+            "asset management",
+            "access control",
+            "cryptography",
+            "physical security",
+            "operations security",
+            "communications security",
+            "incident management",
+        ],
+        "min_length": 800,
+        "required_structure": True,
+        "synonyms": {
+            "information security policies": ["information security policy"],
+            "human resource security": ["human resources security", "personnel security"],
+            "access control": ["access management"],
+            "cryptography": ["encryption", "cryptographic controls"],
+            "physical security": ["physical and environmental security"],
+            "operations security": ["operational security"],
+            "communications security": ["network security"],
+            "incident management": ["incident response"],
+        },
+        # ISO/IEC 27001:2013 Annex A control objectives, e.g. "A.9.2.1"
+        "control_ids": {
+            "5": "information security policies",
+            "6": "organization of information security",
+            "7": "human resource security",
+            "8": "asset management",
+            "9": "access control",
+            "10": "cryptography",
+            "11": "physical security",
+            "12": "operations security",
+            "13": "communications security",
+            "16": "incident management",
+        },
+        "control_id_pattern": r"\ba\.(?P<prefix>\d{1,2})(?:\.\d+)*\b",
+        "control_id_marker": r"a\.\d",
+    },
+    "SOC 2": {
+        "sections": [
+            "security",
+            "availability",
+            "processing integrity",
+            "confidentiality",
+            "privacy",
+        ],
+        "min_length": 500,
+        "required_structure": False,
+        "synonyms": {
+            "privacy": ["personal information"],
+        },
+        # Trust Services Criteria, e.g. "CC6.1", "A1.2" or "P4.3". The point
+        # number is required: a bare letter and digit ("a1", "p2") is far
+        # more often a figure, page or option label than a criterion
+        "control_ids": {
+            "cc": "security",
+            "a": "availability",
+            "pi": "processing integrity",
+            "c": "confidentiality",
+            "p": "privacy",
+        },
+        "control_id_pattern": r"\b(?P<prefix>cc|pi|a|c|p)\d{1,2}(?:\.\d+)+\b",
+        "control_id_marker": r"\.\d",
+    },
+    "Custom": {
+        "sections": [
+            "password",
+            "data protection",
+            "access control",
+            "incident response",
+            "compliance"
+        ],
+        "min_length": 50,
+        "required_structure": False,
+        "synonyms": {
+            "password": ["passphrase"],
+            "access control": ["access management"],
+            "incident response": ["incident handling", "incident management"],
+        },
+        "control_ids": {},
+        "control_id_pattern": "",
+        "control_id_marker": "",
+    },
+}
+
+# Short names accepted by the programmatic API and command line
+STANDARD_ALIASES = {
+    "NIST": "NIST SP 800-53",
+    "ISO": "ISO 27001",
+    "SOC2": "SOC 2",
+    "CUSTOM": "Custom",
+}
+
+
+def resolve_standard(name: str) -> str:
+    """Resolve a standard name or short alias to its canonical name.
+
+    Args:
+        name: Canonical name (e.g. "ISO 27001") or alias (e.g. "ISO").
+
+    Returns:
+        str: Key of VALIDATION_STANDARDS.
+
+    Raises:
+        ValueError: If the standard is not supported.
+    """
+    if name in VALIDATION_STANDARDS:
+        return name
+    canonical = STANDARD_ALIASES.get(name.upper().replace(" ", ""))
+    if canonical is None:
+        raise ValueError(
+            f"Unsupported standard: {name}. "
+            f"Options are {', '.join(VALIDATION_STANDARDS)}"
+        )
+    return canonical
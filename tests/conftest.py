@@ -0,0 +1,12 @@
+"""Shared fixtures: a QApplication for the GUI tests, drawn offscreen."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
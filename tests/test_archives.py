@@ -0,0 +1,142 @@
+"""Archive bundles: member paths, member listing and in-order validation."""
+
+import io
+import tarfile
+import zipfile
+
+import docx
+import pytest
+
+from policy_validator.utils.archives import (
+    PolicyArchive, identify_member, is_archive, split_member_path, validate_archive,
+    validate_member
+)
+from policy_validator.validators.policy_validator import PolicyValidator
+
+POLICY = (
+    "# Password\nRotated yearly.\n# Data Protection\nEncrypted.\n# Access Control\n"
+    "By role.\n# Incident Response\nWithin an hour.\n# Compliance\nAudited yearly.\n"
+)
+
+
+def _docx(text):
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+MEMBERS = {
+    'policies/a.txt': POLICY.encode('utf-8'),
+    'policies/b.docx': _docx(POLICY),
+    'policies/c.txt': POLICY.replace("Compliance", "Audit").encode('utf-16'),
+    'notes.md': b"not a policy",
+}
+
+
+def _zip(path, members=MEMBERS):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("policies/", b"")
+        archive.writestr("__MACOSX/policies/._a.txt", b"\x00\x05")
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def _tar(path, members=MEMBERS):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+        link = tarfile.TarInfo("link.txt")
+        link.type, link.linkname = tarfile.SYMTYPE, "policies/a.txt"
+        archive.addfile(link)
+    return str(path)
+
+
+def _verdict(result):
+    return {key: result.get(key) for key in ('valid', 'issues', 'sections', 'type')}
+
+
+def test_member_paths():
+    assert is_archive("Bundle.TAR.GZ") and is_archive("a.zip")
+    assert not is_archive("policy.docx")
+    assert split_member_path("audit/bundle.zip!policies/a!b.txt") == (
+        "audit/bundle.zip", "policies/a!b.txt")
+    assert split_member_path("odd!dir/bundle.tgz!a.txt") == ("odd!dir/bundle.tgz", "a.txt")
+    assert split_member_path("why!.txt") is None
+    assert split_member_path("plain.txt") is None
+
+
+@pytest.mark.parametrize('make', [_zip, _tar])
+def test_members_skip_directories_and_resource_forks(tmp_path, make):
+    path = make(tmp_path / f"bundle.{'zip' if make is _zip else 'tar.gz'}")
+    with PolicyArchive(path) as archive:
+        members = [(m.name, m.size) for m in archive.members()]
+    assert members == [(name, len(data)) for name, data in MEMBERS.items()]
+    with PolicyArchive(path) as archive:
+        assert [m.path for m in archive.members({'.docx'})] == [f"{path}!policies/b.docx"]
+
+
+def test_zip_members_open_by_name(tmp_path):
+    path = _zip(tmp_path / "bundle.zip")
+    with PolicyArchive(path) as archive:
+        member = archive.member('policies/b.docx')
+        assert identify_member(member)['type'] == 'docx'
+        with pytest.raises(KeyError):
+            archive.member('missing.txt')
+    with PolicyArchive(_tar(tmp_path / "bundle.tgz")) as archive:
+        with pytest.raises(ValueError, match="archive order"):
+            archive.member('policies/a.txt')
+
+
+@pytest.mark.parametrize('suffix', ['zip', 'tar.gz'])
+def test_results_equal_validating_extracted_files(tmp_path, suffix):
+    path = (_zip if suffix == 'zip' else _tar)(tmp_path / f"bundle.{suffix}")
+    validator = PolicyValidator("Custom")
+    results = list(validate_archive(validator, path, extensions={'.txt', '.docx'}, workers=2))
+    assert [r['path'] for r in results] == [
+        f"{path}!{name}" for name in MEMBERS if not name.endswith('.md')]
+
+    for result, (name, data) in zip(results, MEMBERS.items()):
+        extracted = tmp_path / name.replace('/', '_')
+        extracted.write_bytes(data)
+        assert _verdict(result) == _verdict(validator.validate_file(str(extracted))), name
+    assert [r['valid'] for r in results] == [True, True, False]
+    assert validate_member(validator, _zip(tmp_path / "again.zip"), 'policies/a.txt')['valid']
+
+
+def test_selected_members_and_missing_ones(tmp_path):
+    path = _zip(tmp_path / "bundle.zip")
+    infos = [{'path': f"{path}!policies/c.txt", 'type': 'txt', 'size': 10},
+             {'path': f"{path}!gone.txt", 'type': 'txt', 'size': 10}]
+    results = list(validate_archive(PolicyValidator("Custom"), path, file_infos=infos))
+    assert [r['path'] for r in results] == [infos[0]['path'], infos[1]['path']]
+    assert results[0] is infos[0] and 'sections' in results[0]
+    assert results[1]['issues'] == ["File no longer found in archive"]
+
+
+def test_unreadable_archives_and_members(tmp_path):
+    corrupt = tmp_path / "corrupt.zip"
+    corrupt.write_bytes(b"PK\x03\x04 definitely not a zip")
+    result, = validate_archive(PolicyValidator("SOC 2"), str(corrupt))
+    assert result['path'] == str(corrupt) and result['standard'] == "SOC 2"
+    assert result['issues'][0].startswith("Error reading archive")
+
+    # A truncated tar still yields the members read before the damage
+    data = open(_tar(tmp_path / "bundle.tar.gz"), 'rb').read()
+    truncated = tmp_path / "truncated.tar.gz"
+    truncated.write_bytes(data[:len(data) // 2])
+    results = list(validate_archive(PolicyValidator("Custom"), str(truncated)))
+    assert results[-1]['path'] == str(truncated) and results[-1]['valid'] is False
+
+
+def test_closing_early_stops_reading(tmp_path):
+    members = {f"policy{number}.txt": POLICY.encode() for number in range(200)}
+    path = _zip(tmp_path / "many.zip", members)
+    results = validate_archive(PolicyValidator("Custom"), path, workers=1)
+    assert next(results)['path'] == f"{path}!policy0.txt"
+    results.close()
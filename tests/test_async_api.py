@@ -0,0 +1,167 @@
+"""Asyncio API: results, per-loop concurrency limits and cancellation.
+
+Cancellation is checked against a real SandboxPool with a job that blocks,
+so the test sees whether the worker process running it is stopped.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from policy_validator.service import async_api
+from policy_validator.service.async_api import AsyncValidator
+from policy_validator.service.sandbox import ResourceLimits, SandboxPool
+
+POLICY = (
+    "# Password\nRotated.\n# Data Protection\nEncrypted.\n# Access Control\nBy role.\n"
+    "# Incident Response\nWithin an hour.\n# Compliance\nAudited.\n"
+)
+
+
+def _blocking_job(job):
+    """Stand-in for run_job that records its process and never finishes."""
+    with open(job['pid_file'], 'w') as file:
+        file.write(str(os.getpid()))
+    time.sleep(600)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.fixture
+def policies(tmp_path):
+    paths = []
+    for number in range(6):
+        path = tmp_path / f"policy{number}.txt"
+        path.write_text(POLICY if number % 2 else POLICY.replace("Compliance", "Audit"))
+        paths.append(str(path))
+    return paths
+
+
+def test_validate_and_validate_bytes():
+    with SandboxPool(1) as pool:
+        validator = AsyncValidator(pool)
+
+        async def main():
+            return await asyncio.gather(
+                validator.validate_bytes(POLICY.encode(), "upload.md", "Custom"),
+                validator.validate_bytes(b"short", "short.txt", "ISO"),
+            )
+
+        upload, short = asyncio.run(main())
+    assert upload['valid'] is True, upload['issues']
+    assert short['valid'] is False and short['standard'] == "ISO 27001"
+
+
+def test_validate_many_yields_every_result(policies):
+    validator = AsyncValidator(ThreadPoolExecutor(4), max_concurrency=2)
+
+    async def main():
+        return [result async for result in validator.validate_many(
+            policies + [{'path': policies[0], 'standard': "SOC2"}], standard="Custom")]
+
+    results = asyncio.run(main())
+    assert sorted(r['path'] for r in results) == sorted(policies + [policies[0]])
+    assert sum(r['valid'] for r in results) == 3
+    assert {r['standard'] for r in results} == {"Custom", "SOC 2"}
+
+
+def test_each_event_loop_gets_its_own_semaphore(policies):
+    validator = AsyncValidator(ThreadPoolExecutor(4), max_concurrency=1)
+
+    async def main():
+        return await asyncio.gather(*(validator.validate(path) for path in policies))
+
+    # Contention binds a semaphore to its loop; a shared one fails in the next
+    assert len(asyncio.run(main())) == len(policies)
+    assert len(asyncio.run(main())) == len(policies)
+
+    results, errors = [], []
+
+    def in_thread():
+        try:
+            results.append(asyncio.run(main()))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=in_thread) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [] and len(results) == 3
+
+
+@pytest.fixture
+def blocking_pool(tmp_path, monkeypatch):
+    """Pool whose jobs block, each writing its worker's pid to tmp_path/*.pid."""
+    monkeypatch.setattr(async_api, 'run_job', _blocking_job)
+    pool = SandboxPool(2, ResourceLimits(timeout=None, memory=None))
+    yield pool
+    # Workers still running mean the test failed; do not wait for them
+    for pid_file in tmp_path.glob('*.pid'):
+        pid = pid_file.read_text()
+        if pid and _alive(int(pid)):
+            os.kill(int(pid), signal.SIGKILL)
+    pool.shutdown(wait=False)
+
+
+def _pids(paths):
+    """Worker pids written by _blocking_job, once all are written."""
+    while not all(os.path.exists(path) and open(path).read() for path in paths):
+        time.sleep(0.01)
+    return [int(open(path).read()) for path in paths]
+
+
+def _wait_dead(pids):
+    deadline = time.monotonic() + 10
+    while any(map(_alive, pids)) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return not any(map(_alive, pids))
+
+
+def test_cancelling_a_caller_stops_its_worker(tmp_path, blocking_pool):
+    pid_file = str(tmp_path / "job.pid")
+    validator = AsyncValidator(blocking_pool)
+
+    async def main():
+        task = asyncio.ensure_future(validator.run({'pid_file': pid_file}))
+        while not os.path.exists(pid_file):
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    pids = _pids([pid_file])
+    assert _wait_dead(pids)
+    # The pool replaced the worker and keeps serving
+    assert blocking_pool.submit(os.getpid).result(timeout=30) not in pids
+
+
+def test_closing_validate_many_stops_running_jobs(tmp_path, blocking_pool):
+    validator = AsyncValidator(blocking_pool, max_concurrency=2)
+    jobs = [{'path': str(n), 'pid_file': str(tmp_path / f"{n}.pid")} for n in range(2)]
+
+    async def main():
+        results = validator.validate_many(jobs)
+        first = asyncio.ensure_future(results.__anext__())
+        while not all(os.path.exists(job['pid_file']) for job in jobs):
+            await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await results.aclose()
+
+    asyncio.run(main())
+    assert _wait_dead(_pids([job['pid_file'] for job in jobs]))
@@ -0,0 +1,153 @@
+"""Bulk runner: manifest reading, checkpoint keys, resume and error records.
+
+Runs use real worker processes; documents are small text policies so each
+run takes well under a second once the workers are warm.
+"""
+
+import json
+import os
+import zipfile
+
+from policy_validator.service.bulk_runner import (
+    document_jobs, error_record, load_checkpoint, read_manifest, run_manifest
+)
+from policy_validator.service.workers import run_job
+from policy_validator.utils.hashing import content_digest, file_digest
+
+POLICY = (
+    "# Password\nRotated yearly.\n# Data Protection\nEncrypted.\n# Access Control\n"
+    "By role.\n# Incident Response\nWithin an hour.\n# Compliance\nAudited yearly.\n"
+)
+
+
+def _manifest(tmp_path, lines):
+    path = tmp_path / "manifest.jsonl"
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    return str(path)
+
+
+def _records(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def _run(manifest, output, **kwargs):
+    return run_manifest(manifest, output, workers=1, memory_budget=0, **kwargs)
+
+
+def test_read_manifest_resolves_paths_and_reports_bad_lines(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    path.write_text('"a.txt"\n\n# comment\n{"path": "b.txt", "standard": "ISO"}\n'
+                    '{not json\n{"standard": "ISO"}\n')
+    jobs = list(read_manifest(str(path)))
+    assert [line for line, _ in jobs] == [1, 4, 5, 6]
+    assert jobs[0][1] == {'path': str(tmp_path / "a.txt")}
+    assert jobs[1][1]['standard'] == "ISO"
+    assert "Invalid manifest line" in jobs[2][1]['error']
+    assert jobs[3][1]['error'] == "Manifest line has no 'path'"
+
+
+def test_files_are_hashed_by_their_worker(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_text(POLICY)
+    (job, size, signature), = document_jobs({'path': str(path)})
+    assert job['hash'] is True and size == len(POLICY)
+    assert signature == f"stat:{size}:{os.stat(path).st_mtime_ns}"
+
+    assert run_job(job)['file_hash'] == file_digest(str(path))
+    assert run_job(dict(job, content=b"other"))['file_hash'] == content_digest(b"other")
+    assert 'file_hash' not in run_job({'path': str(path)})
+    missing = run_job({'path': str(tmp_path / "missing.txt"), 'hash': True})
+    assert missing['valid'] is False and 'file_hash' not in missing
+
+
+def test_run_records_content_and_stat_keys(tmp_path):
+    good, bad = tmp_path / "good.txt", tmp_path / "bad.txt"
+    good.write_text(POLICY)
+    bad.write_text(POLICY.replace("Compliance", "Audit"))
+    manifest = _manifest(tmp_path, [str(good), {'path': str(bad), 'standard': "ISO"},
+                                    str(tmp_path / "missing.txt")])
+    output = str(tmp_path / "results.jsonl")
+
+    stats = _run(manifest, output)
+    assert (stats['completed'], stats['failed'], stats['errors']) == (2, 1, 1)
+    records = {os.path.basename(r['path']): r for r in _records(output)}
+    assert records['good.txt']['valid'] is True
+    assert records['good.txt']['file_hash'] == file_digest(str(good))
+    assert records['bad.txt']['standard'] == "ISO 27001"
+    assert records['missing.txt']['job_key'] is None
+    assert len({records['good.txt']['job_key'], records['good.txt']['stat_key'],
+                records['bad.txt']['job_key'], records['bad.txt']['stat_key']}) == 4
+    assert load_checkpoint(output) == {
+        records[name][key] for name in ("good.txt", "bad.txt")
+        for key in ('job_key', 'stat_key')
+    }
+
+
+def test_resume_skips_recorded_files(tmp_path):
+    paths = []
+    for number in range(3):
+        path = tmp_path / f"policy{number}.txt"
+        path.write_text(POLICY)
+        paths.append(path)
+    manifest = _manifest(tmp_path, [str(path) for path in paths])
+    output = str(tmp_path / "results.jsonl")
+    _run(manifest, output)
+
+    # An interrupted run leaves a partial line, which is dropped
+    lines = open(output).readlines()
+    with open(output, 'w') as f:
+        f.writelines(lines[:2])
+        f.write(lines[2][:10])
+    stats = _run(manifest, output)
+    assert (stats['completed'], stats['skipped']) == (1, 2)
+    assert len(_records(output)) == 3
+
+    # Touched files are validated again but recorded once; changed ones anew
+    os.utime(paths[0], ns=(1, 1))
+    paths[1].write_text(POLICY + "More.\n")
+    stats = _run(manifest, output)
+    assert (stats['completed'], stats['skipped']) == (1, 2)
+    records = _records(output)
+    assert len(records) == 4
+    assert records[-1]['file_hash'] == file_digest(str(paths[1]))
+
+    stats = _run(manifest, output, resume=False)
+    assert stats['completed'] == 3 and len(_records(output)) == 3
+
+
+def test_archive_members_are_keyed_by_content(tmp_path):
+    archive = tmp_path / "policies.zip"
+    with zipfile.ZipFile(archive, 'w') as f:
+        f.writestr("a.txt", POLICY)
+        f.writestr("b.txt", POLICY.replace("Compliance", "Audit"))
+    manifest = _manifest(tmp_path, [str(archive)])
+    output = str(tmp_path / "results.jsonl")
+
+    assert _run(manifest, output)['completed'] == 2
+    records = sorted(_records(output), key=lambda r: r['path'])
+    assert [r['path'] for r in records] == [f"{archive}!a.txt", f"{archive}!b.txt"]
+    assert records[0]['file_hash'] == content_digest(POLICY.encode())
+    assert all('stat_key' not in r for r in records)
+    assert _run(manifest, output)['skipped'] == 2
+
+
+def test_error_record_resolves_standard_aliases():
+    assert error_record(3, {'path': "a.txt", 'standard': "NIST"}, "boom") == {
+        'path': "a.txt", 'standard': "NIST SP 800-53", 'line': 3, 'valid': False,
+        'issues': ["boom"], 'job_key': None
+    }
+    assert error_record(1, {'path': "a.txt", 'standard': "HIPAA"}, "x")['standard'] == "HIPAA"
+    assert error_record(1, {'path': "a.txt", 'standard': 7}, "x")['standard'] == 7
+    assert error_record(1, {}, "x")['standard'] == "Custom"
+
+
+def test_progress_and_results_callbacks(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_text(POLICY)
+    manifest = _manifest(tmp_path, [str(path)])
+    reports, results = [], []
+    _run(manifest, str(tmp_path / "out.jsonl"), progress=reports.append,
+         on_result=results.append)
+    assert reports[-1]['completed'] == 1 and reports[-1]['bytes'] == len(POLICY)
+    assert [r['path'] for r in results] == [str(path)]
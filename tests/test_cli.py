@@ -0,0 +1,123 @@
+"""Command line: exit codes and fail-fast validation.
+
+Exit codes are 0 when every file passes, 1 when one fails or the command
+cannot run, and 2 only for invalid arguments.
+"""
+
+import io
+import json
+import os
+import socket
+import threading
+import zipfile
+
+import pytest
+
+from policy_validator import cli, client
+from policy_validator.service import coordinator
+from policy_validator.validators.policy_validator import PolicyValidator
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+POLICY = (
+    "# Password\nPasswords are rotated yearly by every member of staff.\n"
+    "# Data Protection\nData is encrypted at rest and in transit at all times.\n"
+    "# Access Control\nAccess is granted by role and reviewed each quarter.\n"
+    "# Incident Response\nIncidents are reported to security within one hour.\n"
+    "# Compliance\nCompliance is audited every year by an external firm.\n"
+)
+
+
+def _exit_code(argv) -> int:
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(argv)
+    return exit_info.value.code
+
+
+def test_validate_exit_codes(tmp_path, capsys):
+    good = tmp_path / "good.txt"
+    good.write_text(POLICY)
+    bad = tmp_path / "bad.txt"
+    bad.write_text(POLICY.replace("Compliance", "Audit"))
+    assert _exit_code(['validate', str(good)]) == 0
+    assert _exit_code(['validate', str(good), str(bad)]) == 1
+    assert _exit_code(['validate', str(good), '--standard', 'HIPAA']) == 2
+    assert "Unsupported standard" in capsys.readouterr().err
+
+
+def test_runtime_errors_exit_1(tmp_path, monkeypatch, capsys):
+    assert _exit_code(['merge', str(tmp_path / "missing.jsonl")]) == 1
+    assert "Cannot read shard results" in capsys.readouterr().err
+
+    with socket.socket() as closed:
+        closed.bind(('127.0.0.1', 0))
+        port = closed.getsockname()[1]
+    monkeypatch.setattr(coordinator, 'RETRY_WINDOW', 0.0)
+    assert _exit_code(['work', f"http://127.0.0.1:{port}", '--workers', '1']) == 1
+    assert "Lost the coordinator" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix sockets")
+def test_client_exits_1_when_the_daemon_stops_mid_command(tmp_path, capsys):
+    path = str(tmp_path / "daemon.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+
+    def serve_partly():
+        conn, _ = server.accept()
+        with conn:
+            conn.makefile('rb').readline()
+            conn.sendall(json.dumps({'out': "checking\n"}).encode() + b'\n')
+
+    thread = threading.Thread(target=serve_partly)
+    thread.start()
+    try:
+        assert client.request(['validate', 'policy.txt'], path) == 1
+    finally:
+        thread.join()
+        server.close()
+    captured = capsys.readouterr()
+    assert captured.out == "checking\n"
+    assert "stopped before the command finished" in captured.err
+
+
+def test_fail_fast_rejects_small_files_before_reading(tmp_path, monkeypatch):
+    text = tmp_path / "short.txt"
+    text.write_text("# Password\ntoo short")
+    docx = tmp_path / "short.docx"
+    with zipfile.ZipFile(docx, 'w') as archive:
+        archive.writestr('word/document.xml', "<w:document/>")
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("the document was parsed")
+
+    monkeypatch.setattr('policy_validator.validators.policy_validator.TextParser', no_parsing)
+    monkeypatch.setattr('policy_validator.validators.policy_validator.DocxParser', no_parsing)
+    validator = PolicyValidator("ISO", fail_fast=True)
+    for path, unit in ((text, "bytes"), (docx, "bytes of document XML")):
+        result = validator.validate_file(str(path))
+        assert result['valid'] is False
+        assert len(result['issues']) == 1
+        assert f"{unit}) is below minimum requirement" in result['issues'][0]
+
+
+def test_fail_fast_skips_warning_only_checks(tmp_path):
+    sections = VALIDATION_STANDARDS["ISO 27001"]['sections'][:-1]
+    path = tmp_path / "policy.txt"
+    path.write_text(". ".join(sections) + ". " + "Staff review the policy. " * 40)
+    full = PolicyValidator("ISO").validate_file(str(path))
+    fast = PolicyValidator("ISO", fail_fast=True).validate_file(str(path))
+    missing = "Missing required sections for ISO 27001: incident management"
+    assert full['valid'] is fast['valid'] is False
+    assert fast['issues'] == [missing]
+    assert full['issues'] == [missing, "ISO 27001 requires clear section headers "
+                                       "or structured format"]
+
+
+def test_fail_fast_validates_streams(tmp_path):
+    data = POLICY.encode()
+    result = PolicyValidator("Custom", fail_fast=True).validate_stream(
+        "upload.txt", io.BytesIO(data), len(data)
+    )
+    assert result['valid'] is True, result['issues']
+    assert os.path.basename(result['path']) == "upload.txt"
@@ -0,0 +1,117 @@
+"""Coordinator: lease expiry, requeueing, backups and a run with one node."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from policy_validator.service.coordinator import Coordinator, JobQueue, WorkerNode
+from policy_validator.service.scheduler import CostModel
+from policy_validator.utils.hashing import file_digest
+
+POLICY = (
+    "# Password\nRotated yearly.\n# Data Protection\nEncrypted.\n# Access Control\n"
+    "By role.\n# Incident Response\nWithin an hour.\n# Compliance\nAudited yearly.\n"
+)
+
+
+def _manifest(tmp_path, count=3):
+    lines = []
+    for number in range(count):
+        path = tmp_path / f"doc{number}.txt"
+        path.write_text(POLICY if number % 2 else POLICY.replace("Compliance", "Audit"))
+        lines.append(json.dumps({'path': str(path)}))
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text('\n'.join(lines + ["not json"]) + '\n', encoding='utf-8')
+    return str(manifest)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(str(tmp_path / "queue.db"))
+    errors = queue.load(_manifest(tmp_path), CostModel())
+    assert [line for line, _ in errors] == [4]
+    yield queue
+    queue.close()
+
+
+def test_expired_lease_is_requeued(queue):
+    leased = queue.lease('node-a', 10, lease_seconds=0.05)
+    assert sorted(item['line'] for item in leased) == [1, 2, 3]
+    assert queue.lease('node-b', 10, lease_seconds=60) == []
+
+    time.sleep(0.1)
+    assert queue.expire(max_attempts=3) == (3, [])
+    assert queue.counts()['queued'] == 3
+    assert len(queue.lease('node-b', 10, lease_seconds=60)) == 3
+
+
+def test_renewed_lease_does_not_expire(queue):
+    lease = queue.lease('node-a', 1, lease_seconds=0.05)[0]['lease']
+    assert queue.renew('node-a', [lease], lease_seconds=60) == ([lease], [])
+    assert queue.renew('node-b', [lease], lease_seconds=60) == ([], [lease])
+    time.sleep(0.1)
+    assert queue.expire(max_attempts=3) == (0, [])
+
+
+def test_job_fails_after_max_attempts(queue):
+    for attempt in range(2):
+        line = queue.lease('node-a', 1, lease_seconds=0.01)[0]['line']
+        time.sleep(0.05)
+        requeued, failed = queue.expire(max_attempts=2)
+        if attempt == 0:
+            assert (requeued, failed) == (1, [])
+        else:
+            assert requeued == 0 and [number for number, _ in failed] == [line]
+    assert queue.counts()['failed'] == 2  # The bad manifest line and this job
+
+
+def test_late_result_of_an_expired_lease_is_accepted_once(queue):
+    line = queue.lease('node-a', 1, lease_seconds=0.01)[0]['line']
+    time.sleep(0.05)
+    queue.expire(max_attempts=3)
+    assert queue.is_open(line)
+    assert queue.complete(line) is True
+    assert queue.complete(line) is False
+    assert not queue.is_open(line)
+
+
+def test_backup_lease_of_a_slow_job(queue):
+    queue.lease('node-a', 3, lease_seconds=60)
+    time.sleep(0.05)
+    backups = queue.lease('node-b', 1, lease_seconds=60, backup_after=0.01)
+    assert len(backups) == 1 and backups[0]['backup'] is True
+    # A node never backs up its own leases, and a job gets one backup at most
+    assert queue.lease('node-a', 1, lease_seconds=60, backup_after=0.01) == []
+    others = queue.lease('node-c', 3, lease_seconds=60, backup_after=0.01)
+    assert len(others) == 2
+    assert backups[0]['line'] not in {item['line'] for item in others}
+    queue.complete(backups[0]['line'])
+    assert queue.counts()['done'] == 1
+
+
+def test_run_with_one_node(tmp_path):
+    manifest = _manifest(tmp_path)
+    output = tmp_path / "results.jsonl"
+    recorded = []
+    coordinator = Coordinator(manifest, str(output), str(tmp_path / "queue.db"),
+                              host='127.0.0.1', port=0, on_result=recorded.append)
+    coordinator.start()
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(coordinator.run()))
+    thread.start()
+    node = WorkerNode(f"http://127.0.0.1:{coordinator.port}", workers=1, node_id='node-a')
+    assert node.run()['jobs'] == 3
+    thread.join(30)
+    assert not thread.is_alive()
+
+    records = sorted((json.loads(line) for line in output.read_text().splitlines()),
+                     key=lambda record: record['line'])
+    assert records == sorted(recorded, key=lambda record: record['line'])
+    assert [(r['line'], r['valid']) for r in records] == [
+        (1, False), (2, True), (3, False), (4, False)]
+    assert records[1]['file_hash'] == file_digest(str(tmp_path / "doc1.txt"))
+    assert records[3]['job_key'] is None
+    assert (outcome['results'], outcome['errors'], outcome['nodes']) == (
+        3, 1, {'node-a': 3})
@@ -0,0 +1,117 @@
+"""Coverage matrix: packed aggregations against a dense reference.
+
+Every aggregation is checked against plain NumPy on the unpacked boolean
+matrices, with CHUNK_ROWS made small so rows are unpacked in several
+blocks and the builder grows its buffer several times.
+"""
+
+import numpy as np
+import pytest
+
+from policy_validator.analytics import coverage
+from policy_validator.analytics.coverage import (
+    CoverageMatrix, CoverageMatrixBuilder, default_controls
+)
+
+
+@pytest.fixture
+def random_matrix(monkeypatch):
+    """A built matrix with its dense bits and checked mask."""
+    monkeypatch.setattr(coverage, 'CHUNK_ROWS', 7)
+    rng = np.random.default_rng(1)
+    controls = default_controls()
+    checked = rng.random((50, len(controls))) < 0.7
+    checked[3] = False  # A document checked for nothing, e.g. too short
+    bits = checked & (rng.random(checked.shape) < 0.5)
+    builder = CoverageMatrixBuilder(capacity=4)
+    for row in range(len(bits)):
+        builder.add_row(f"doc{row}", np.flatnonzero(bits[row]), np.flatnonzero(checked[row]))
+    return builder.build(), bits, checked
+
+
+def test_aggregations_match_dense_reference(random_matrix):
+    matrix, bits, checked = random_matrix
+    assert matrix.shape == bits.shape
+    assert (matrix.dense() == bits).all()
+    assert (matrix.control_counts() == bits.sum(axis=0)).all()
+    assert (matrix.checked_counts() == checked.sum(axis=0)).all()
+    with np.errstate(invalid='ignore'):
+        np.testing.assert_array_equal(matrix.coverage(), bits.sum(0) / checked.sum(0))
+        np.testing.assert_array_equal(matrix.document_coverage(),
+                                      bits.sum(1) / checked.sum(1))
+    assert np.isnan(matrix.document_coverage()[3])
+    dense = bits.astype(np.int64)
+    assert (matrix.co_occurrence() == dense.T @ dense).all()
+    standard, section = matrix.controls[10]
+    assert (matrix.column(standard, section) == bits[:, 10]).all()
+
+
+def test_gaps_count_checked_cells_only(random_matrix):
+    matrix, bits, checked = random_matrix
+    gaps = matrix.gaps()
+    assert set(gaps) == {standard for standard, _ in matrix.controls}
+    for standard, summary in gaps.items():
+        columns = [i for i, control in enumerate(matrix.controls) if control[0] == standard]
+        missing = (checked[:, columns] & ~bits[:, columns]).sum(axis=1)
+        assert summary['sections'] == [matrix.controls[i][1] for i in columns]
+        assert (summary['missing_per_document'] == missing).all()
+        assert summary['documents_checked'] == checked[:, columns].any(axis=1).sum()
+        assert summary['documents_with_gaps'] == (missing > 0).sum()
+        assert missing[3] == 0
+        order = [summary['sections'].index(s) for s in summary['least_covered']]
+        assert list(np.diff(summary['coverage'][order]) >= 0) == [True] * (len(order) - 1)
+
+
+def test_results_are_checked_for_their_standard_only():
+    builder = CoverageMatrixBuilder()
+    builder.add({'path': "a.txt", 'standard': "SOC 2",
+                 'sections': {'security': True, 'privacy': False}})
+    builder.add({'path': "short.txt", 'standard': "SOC 2", 'sections': {}})
+    builder.add({'path': "b.txt", 'standard': "SOC 2",
+                 'sections': {'security': True, 'unknown': True}}, document="b")
+    matrix = builder.build()
+    assert matrix.documents == ["a.txt", "short.txt", "b"]
+    security = matrix.controls.index(("SOC 2", "security"))
+    privacy = matrix.controls.index(("SOC 2", "privacy"))
+    assert matrix.coverage()[security] == 1.0
+    assert matrix.coverage()[privacy] == 0.0
+    assert np.isnan(matrix.coverage()[matrix.controls.index(("ISO 27001", "cryptography"))])
+    assert matrix.gaps()["SOC 2"]['documents_with_gaps'] == 1
+    assert matrix.gaps()["ISO 27001"]['documents_checked'] == 0
+
+
+def test_npz_round_trip(random_matrix, tmp_path):
+    matrix, _, _ = random_matrix
+    path = tmp_path / "coverage.npz"
+    matrix.save_npz(str(path))
+    loaded = CoverageMatrix.load_npz(str(path))
+    assert loaded.documents == matrix.documents
+    assert loaded.controls == matrix.controls
+    assert (loaded.bits == matrix.bits).all() and (loaded.checked == matrix.checked).all()
+
+
+def test_npz_without_checked_mask_loads_fully_checked(random_matrix, tmp_path):
+    matrix, _, _ = random_matrix
+    path = tmp_path / "old.npz"
+    np.savez_compressed(path, bits=matrix.bits,
+                        documents=np.array(matrix.documents, dtype=str),
+                        standards=np.array([c[0] for c in matrix.controls], dtype=str),
+                        sections=np.array([c[1] for c in matrix.controls], dtype=str))
+    loaded = CoverageMatrix.load_npz(str(path))
+    assert (loaded.checked_counts() == len(matrix.documents)).all()
+
+
+def test_shape_mismatch_is_rejected():
+    with pytest.raises(ValueError, match="Packed matrix has shape"):
+        CoverageMatrix(["a"], default_controls(), np.zeros((1, 1), dtype=np.uint8))
+
+
+def test_parquet_export_nulls_unchecked_cells(random_matrix, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    matrix, bits, checked = random_matrix
+    path = tmp_path / "coverage.parquet"
+    matrix.to_parquet(str(path))
+    table = pq.read_table(str(path))
+    standard, section = matrix.controls[0]
+    column = table.column(f"{standard}: {section}").to_pylist()
+    assert column == [bool(b) if c else None for b, c in zip(bits[:, 0], checked[:, 0])]
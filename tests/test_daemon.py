@@ -0,0 +1,110 @@
+"""Validation daemon: requests run in the client's directory and stay isolated."""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from policy_validator.client import DaemonUnavailable, request
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'),
+                                reason="The daemon needs Unix domain sockets")
+
+POLICY = "# Policy\n" + "Information security policies and access control. " * 40
+CHECKS = ["--standard", "ISO", "--section", "access control"]  # Passed by POLICY
+
+
+def _accepting(socket_path):
+    """Whether the daemon is listening; its socket file exists before it is."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+@pytest.fixture(scope='module')
+def daemon(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("daemon")
+    os.chmod(directory, 0o700)
+    socket_path = str(directory / "daemon.sock")
+    process = subprocess.Popen([sys.executable, '-m', 'policy_validator.service.daemon',
+                                '--socket', socket_path, '--idle-timeout', '60'])
+    deadline = time.monotonic() + 60
+    while not _accepting(socket_path):
+        assert process.poll() is None, "the daemon exited"
+        assert time.monotonic() < deadline, "the daemon did not start"
+        time.sleep(0.05)
+    yield socket_path
+    try:
+        request([], socket_path, stop=True)
+    except DaemonUnavailable:
+        pass
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _run(daemon, argv, directory, capsys):
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        code = request(argv, daemon)
+    finally:
+        os.chdir(cwd)
+    return code, capsys.readouterr()
+
+
+def test_requests_run_in_the_client_directory(daemon, tmp_path, capsys):
+    for name, text in (("good", POLICY), ("bad", "too short")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "policy.txt").write_text(text, encoding='utf-8')
+
+    code, output = _run(daemon, ["validate", "policy.txt"] + CHECKS, tmp_path / "good", capsys)
+    assert code == 0, output.err
+    code, output = _run(daemon, ["validate", "policy.txt"], tmp_path / "bad", capsys)
+    assert code == 1 and "failed validation" in output.out
+
+
+def test_instrumentation_does_not_accumulate(daemon, tmp_path, capsys):
+    (tmp_path / "policy.txt").write_text(POLICY, encoding='utf-8')
+    counts = []
+    for run in range(2):
+        trace = tmp_path / f"trace{run}.json"
+        code, output = _run(daemon, ["validate", "policy.txt", "--trace", str(trace)] + CHECKS,
+                            tmp_path, capsys)
+        assert code == 0, output.err
+        with open(trace, encoding='utf-8') as f:
+            events = json.load(f)
+        counts.append(len(events['traceEvents'] if isinstance(events, dict) else events))
+    assert counts[0] == counts[1]
+
+    code, output = _run(daemon, ["validate", "policy.txt", "--timings"] + CHECKS, tmp_path,
+                        capsys)
+    assert code == 0 and "Stage" in output.err
+    code, output = _run(daemon, ["validate", "policy.txt"] + CHECKS, tmp_path, capsys)
+    assert code == 0 and "Stage" not in output.err
+
+
+def test_failed_request_does_not_break_the_next(daemon, tmp_path, capsys):
+    (tmp_path / "policy.txt").write_text(POLICY, encoding='utf-8')
+    store = str(tmp_path / "missing" / "results.db")
+    code, output = _run(daemon, ["validate", "policy.txt", "--store", store], tmp_path, capsys)
+    assert code == 1 and "unable to open database" in output.err
+    code, output = _run(daemon, ["validate", "policy.txt", "--standard", "NOPE"], tmp_path,
+                        capsys)
+    assert code == 2
+    code, output = _run(daemon, ["validate", "policy.txt", "-q"] + CHECKS, tmp_path, capsys)
+    assert code == 0, output.err
+
+
+def test_only_forwarded_commands_run(daemon, tmp_path, capsys):
+    code, output = _run(daemon, ["serve"], tmp_path, capsys)
+    assert code == 2 and "runs only" in output.err
@@ -0,0 +1,148 @@
+"""Encoding detection, lenient decoding and parity across text encodings."""
+
+import codecs
+import io
+import random
+
+import pytest
+
+from policy_validator.parsers.text_parser import TextParser
+from policy_validator.utils.encoding import PREFIX_SIZE, StreamDecoder, detect_encoding
+from policy_validator.utils.text_normalizer import get_section_matcher
+from policy_validator.validators.policy_validator import PolicyValidator
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+ENCODINGS = ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be', 'utf-32', 'cp1252')
+TEXT = "Access Control Policy\nUsers are reviewed quarterly.\n"
+
+
+def _random_text(standard, rng, paragraphs=40):
+    """Lines made of the standard's own words and a few accented ones."""
+    words = ['the', 'of', 'and', '-', 'policy', 'café', 'résumé', '—', 'a.5.1', 'ac-2']
+    for section in VALIDATION_STANDARDS[standard]['sections']:
+        words += section.split()
+    lines = [' '.join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+             for _ in range(paragraphs)]
+    return '# Policy\n' + '\n'.join(lines)
+
+
+def _parsers(path, chunk_size):
+    yield TextParser(str(path), chunk_size=chunk_size)
+    yield TextParser(str(path), chunk_size=chunk_size, stream=io.BytesIO(path.read_bytes()))
+
+
+@pytest.mark.parametrize('bom, encoding', [
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+])
+def test_byte_order_marks(bom, encoding):
+    assert detect_encoding(bom + TEXT.encode(encoding)) == (encoding, len(bom))
+
+
+@pytest.mark.parametrize('encoding', ['utf-16-le', 'utf-16-be', 'utf-32-le', 'utf-32-be'])
+def test_wide_encodings_without_a_bom(encoding):
+    assert detect_encoding(TEXT.encode(encoding)) == (encoding, 0)
+    assert detect_encoding("Zürich café\n".encode(encoding) * 10) == (encoding, 0)
+
+
+@pytest.mark.parametrize('prefix, encoding', [
+    (b"", 'utf-8'),
+    (TEXT.encode('ascii'), 'utf-8'),
+    ("Zürich — 東京\n".encode('utf-8') * 10, 'utf-8'),
+    # A prefix cut inside a multi-byte sequence is still UTF-8
+    ("東京".encode('utf-8') * 10 + b"\xe6\x9d", 'utf-8'),
+    # A few stray bytes among many valid sequences
+    ("café résumé naïve\n".encode('utf-8') * 20 + b"\xff\xfe", 'utf-8'),
+    ("café “quoted” résumé\n".encode('cp1252'), 'cp1252'),
+    (b"caf\xe9 \x81 r\xe9sum\xe9\n", 'latin-1'),
+])
+def test_utf8_and_legacy_text(prefix, encoding):
+    assert detect_encoding(prefix) == (encoding, 0)
+
+
+def test_decoder_switches_to_legacy_after_an_ascii_prefix():
+    decoder = StreamDecoder('utf-8')
+    text = decoder.decode(b"plain ascii ") + decoder.decode("café ‘x’".encode('cp1252'), True)
+    assert text == "plain ascii café ‘x’"
+    assert decoder.encoding == 'cp1252' and decoder.replaced is False
+
+    decoder = StreamDecoder('utf-8')
+    assert decoder.decode(b"plain \x81\xe9", final=True) == "plain \x81é"
+    assert decoder.encoding == 'latin-1'
+
+
+def test_decoder_replaces_bytes_once_text_is_not_ascii():
+    decoder = StreamDecoder('utf-8')
+    text = decoder.decode("café ".encode('utf-8')) + decoder.decode(b"\xff end", final=True)
+    assert text == "café � end"
+    assert decoder.encoding == 'utf-8' and decoder.replaced is True
+
+    decoder = StreamDecoder('utf-16-le')
+    assert decoder.decode("ok".encode('utf-16-le') + b"x", final=True) == "ok�"
+    assert decoder.replaced is True
+
+
+def test_decoder_joins_multibyte_sequences_split_across_chunks():
+    text = "Zürich — 東京 𝔘 café\r\n" * 5
+    for encoding in ('utf-8', 'utf-16-le', 'utf-32-be'):
+        data = text.encode(encoding)
+        stream_decoder = StreamDecoder(encoding)
+        decoder = io.IncrementalNewlineDecoder(stream_decoder, translate=True)
+        decoded = ''.join(decoder.decode(data[i:i + 1]) for i in range(len(data)))
+        assert decoded + decoder.decode(b"", final=True) == text.replace('\r\n', '\n')
+        assert stream_decoder.replaced is False
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+@pytest.mark.parametrize('chunk_size', [3, 64, 4096])
+def test_text_parser_reads_every_encoding_alike(tmp_path, encoding, chunk_size):
+    standard = "ISO 27001"
+    matcher = get_section_matcher(standard)
+    sections = VALIDATION_STANDARDS[standard]['sections']
+    text = _random_text(standard, random.Random(encoding)).replace('\n', '\r\n')
+    reference = tmp_path / "reference.txt"
+    reference.write_bytes(text.encode('utf-8'))
+    path = tmp_path / "policy.txt"
+    path.write_bytes(text.encode(encoding))
+
+    expected = TextParser(str(reference)).scan(matcher, sections, min_length=len(text),
+                                               check_structure=True, min_section_body=20)
+    for parser in _parsers(path, chunk_size):
+        assert ''.join(parser.iter_chunks()) == text.replace('\r\n', '\n')
+        assert parser.replaced is False
+    for parser in _parsers(path, chunk_size):
+        assert parser.scan(matcher, sections, min_length=len(text), check_structure=True,
+                           min_section_body=20) == expected
+
+
+class _WholeTextValidator(PolicyValidator):
+    stream_text = False
+
+
+@pytest.mark.parametrize('encoding', ENCODINGS)
+def test_streamed_and_whole_text_validation_agree(tmp_path, encoding):
+    rng = random.Random(encoding)
+    for standard in VALIDATION_STANDARDS:
+        path = tmp_path / f"{standard}.txt"
+        path.write_bytes(_random_text(standard, rng, paragraphs=120).encode(encoding))
+        streamed = PolicyValidator(standard).validate_file(str(path))
+        whole = _WholeTextValidator(standard).validate_file(str(path))
+        for key in ('valid', 'issues', 'sections', 'encoding'):
+            assert streamed.get(key) == whole.get(key), (standard, key)
+
+
+def test_replaced_bytes_are_reported(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_bytes(TEXT.encode('utf-8') + "café\n".encode('utf-8') * 10 + b"\xff\n")
+    result = PolicyValidator("Custom").validate_file(str(path))
+    assert result['encoding'] == 'utf-8'
+    assert "Text is not valid utf-8; undecodable bytes were replaced" in result['issues']
+
+    # Legacy bytes after a long ASCII prefix switch encodings instead
+    path.write_bytes(b"a" * PREFIX_SIZE + "\ncafé\n".encode('cp1252'))
+    result = PolicyValidator("Custom").validate_file(str(path))
+    assert result['encoding'] == 'cp1252'
+    assert not any("undecodable" in issue for issue in result['issues'])
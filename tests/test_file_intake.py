@@ -0,0 +1,118 @@
+"""File intake: folder expansion, archives, deduplication and cancellation."""
+
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+from policy_validator.gui import file_intake
+from policy_validator.gui.file_intake import FileIntake
+from policy_validator.utils.file_types import identify_file
+
+POLICY = "# Password\nRotated yearly.\n# Access Control\nBy role.\n"
+EXTENSIONS = ['.txt', '.pdf', '.docx']
+
+
+@pytest.fixture
+def intake(qapp):
+    messages = []
+    intake = FileIntake(lambda message, error: messages.append(message), EXTENSIONS,
+                        workers=2)
+    intake.messages = messages
+    return intake
+
+
+def _load(qapp, intake, paths, timeout=30):
+    """Run an intake to the end; returns (accepted file_infos, stats)."""
+    accepted, finished = [], []
+    intake.files_accepted.connect(lambda batch, generation: accepted.extend(batch))
+    intake.finished.connect(lambda stats, generation: finished.append(stats))
+    intake.start(paths)
+    deadline = time.monotonic() + timeout
+    while not finished and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    intake.files_accepted.disconnect()
+    intake.finished.disconnect()
+    assert finished, "intake did not finish"
+    return accepted, finished[0]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.txt").write_text(POLICY)
+    (tmp_path / "nested" / "b.txt").write_text(POLICY + "More.\n")
+    (tmp_path / "nested" / "deeper" / "c.txt").write_text(POLICY + "Even more.\n")
+    (tmp_path / "nested" / "notes.md").write_text(POLICY)
+    (tmp_path / "empty.txt").write_text("")
+    (tmp_path / "image.pdf").write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(64))
+    os.link(tmp_path / "a.txt", tmp_path / "nested" / "hardlink.txt")
+    with zipfile.ZipFile(tmp_path / "bundle.zip", 'w') as archive:
+        archive.writestr("inner/d.txt", POLICY)
+        archive.writestr("inner/empty.txt", "")
+        archive.writestr("inner/readme.md", POLICY)
+    return tmp_path
+
+
+def test_folders_are_expanded_and_classified(qapp, intake, tree):
+    accepted, stats = _load(qapp, intake, [str(tree)])
+    paths = {os.path.relpath(info['path'], tree) for info in accepted}
+    # a.txt and its hard link are one file, loaded once under either name
+    assert len(paths & {"a.txt", "nested/hardlink.txt"}) == 1
+    assert paths - {"a.txt", "nested/hardlink.txt"} == {
+        "nested/b.txt", "nested/deeper/c.txt", "bundle.zip!inner/d.txt"}
+    assert stats == {'accepted': 4, 'duplicates': 1, 'empty': 2, 'unsupported': 1,
+                     'errors': 0, 'skipped': 1}
+    assert any(message.startswith("Unsupported file type: image.pdf")
+               for message in intake.messages)
+
+
+def test_loaded_files_are_not_loaded_again(qapp, intake, tree):
+    _load(qapp, intake, [str(tree / "a.txt")])
+    accepted, stats = _load(qapp, intake, [str(tree / "a.txt"), str(tree / "nested")])
+    assert sorted(os.path.basename(info['path']) for info in accepted) == ["b.txt", "c.txt"]
+    assert stats['duplicates'] == 2  # a.txt and its hard link
+    # Rejected files are reported again if dropped again
+    _, stats = _load(qapp, intake, [str(tree / "image.pdf")])
+    assert stats['unsupported'] == 1
+    _, stats = _load(qapp, intake, [str(tree / "image.pdf")])
+    assert stats['unsupported'] == 1
+
+    intake.reset()
+    accepted, _ = _load(qapp, intake, [str(tree / "a.txt")])
+    assert len(accepted) == 1
+
+
+def test_explicit_files_are_sniffed_whatever_their_extension(qapp, intake, tree):
+    accepted, stats = _load(qapp, intake, [str(tree / "nested" / "notes.md"),
+                                           str(tree / "missing.txt")])
+    assert [info['type'] for info in accepted] == ['txt']
+    assert stats['errors'] == 1
+    assert any("missing.txt" in message for message in intake.messages)
+
+
+def test_reset_cancels_the_running_intake(qapp, intake, tree, monkeypatch):
+    release = threading.Event()
+
+    def slow_identify(path, size):
+        release.wait(30)
+        return identify_file(path, size)
+
+    monkeypatch.setattr(file_intake, 'identify_file', slow_identify)
+    accepted, finished = [], []
+    intake.files_accepted.connect(lambda batch, generation: accepted.append(generation))
+    intake.finished.connect(lambda stats, generation: finished.append(generation))
+    intake.start([str(tree / "nested")])
+    assert intake.running
+    intake.reset()
+    release.set()
+    deadline = time.monotonic() + 30
+    while intake.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    qapp.processEvents()
+    assert not intake.running
+    assert accepted == [] and finished == []
+    assert not intake.is_current(0) and intake.is_current(1)
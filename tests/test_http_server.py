@@ -0,0 +1,137 @@
+"""HTTP validation service: endpoints, request validation and overload.
+
+One instrumented service with a single warm worker serves every test; the
+requests are sent with http.client so malformed headers reach the server.
+"""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from policy_validator.service.http_server import AdmissionControl, ValidationService
+
+POLICY = (
+    b"# Password\nPasswords are rotated yearly.\n# Data Protection\nEncrypted.\n"
+    b"# Access Control\nBy role.\n# Incident Response\nWithin an hour.\n"
+    b"# Compliance\nAudited yearly.\n"
+)
+QUEUE_SIZE = 3
+
+
+@pytest.fixture(scope='module')
+def service():
+    service = ValidationService(port=0, workers=1, queue_size=QUEUE_SIZE,
+                                timeout=60, instrument=True)
+    service.start()
+    thread = threading.Thread(target=service.serve_forever, daemon=True)
+    thread.start()
+    yield service
+    service.shutdown()
+    thread.join()
+
+
+def _request(service, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(service.host, service.port, timeout=60)
+    try:
+        connection.putrequest(method, path)
+        for name, value in (headers or {}).items():
+            connection.putheader(name, value)
+        if body is not None and 'Content-Length' not in (headers or {}):
+            connection.putheader('Content-Length', str(len(body)))
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, response.headers, response.read()
+    finally:
+        connection.close()
+
+
+def _json(service, method, path, payload=None, headers=None):
+    body = None if payload is None else json.dumps(payload).encode()
+    headers = dict(headers or {}, **({'Content-Type': 'application/json'} if body else {}))
+    status, _, data = _request(service, method, path, body, headers)
+    return status, json.loads(data)
+
+
+def test_health_and_unknown_paths(service):
+    assert _json(service, 'GET', '/health') == (200, {'status': 'ok'})
+    assert _json(service, 'GET', '/nowhere')[0] == 404
+    assert _json(service, 'POST', '/nowhere', {})[0] == 404
+
+
+def test_upload_and_path_jobs(service, tmp_path):
+    status, _, data = _request(service, 'POST', '/validate?filename=policy.md', POLICY)
+    result = json.loads(data)
+    assert status == 200
+    assert result['valid'] is True, result['issues']
+
+    path = tmp_path / "policy.txt"
+    path.write_bytes(POLICY.replace(b"Compliance", b"Audit"))
+    status, result = _json(service, 'POST', '/validate', {'path': str(path)})
+    assert status == 200
+    assert result['valid'] is False
+
+    status, body = _json(service, 'POST', '/validate/batch',
+                         {'jobs': [str(path), {'path': str(path), 'standard': "SOC2"}],
+                          'standard': "Custom"})
+    assert status == 200
+    assert [r['standard'] for r in body['results']] == ["Custom", "SOC 2"]
+
+
+@pytest.mark.parametrize('length', ["abc", "-1", "1e3", "²", ""])
+def test_invalid_content_length_is_a_bad_request(service, length):
+    status, _, data = _request(service, 'POST', '/validate?filename=a.txt', b"",
+                               {'Content-Length': length})
+    assert status == 400
+    assert "Invalid Content-Length" in json.loads(data)['error']
+
+
+def test_request_errors(service):
+    status, _, _ = _request(service, 'POST', '/validate?filename=a.txt')
+    assert status == 411
+    status, _, data = _request(service, 'POST', '/validate', b"{not json",
+                               {'Content-Type': 'application/json'})
+    assert status == 400 and "Invalid JSON" in json.loads(data)['error']
+    assert _json(service, 'POST', '/validate', {'file': "a.txt"})[0] == 400
+    assert _json(service, 'POST', '/validate/batch', {'jobs': [{'file': "a"}]})[0] == 400
+    status, body = _json(service, 'POST', '/validate', {'path': "a.txt", 'standard': "HIPAA"})
+    assert status == 400 and "Unsupported standard" in body['error']
+
+
+def test_batches_larger_than_the_queue_are_rejected(service):
+    status, body = _json(service, 'POST', '/validate/batch',
+                         {'jobs': ["a.txt"] * (QUEUE_SIZE + 1)})
+    assert status == 413
+    assert "split it into smaller batches" in body['error']
+
+
+def test_full_queue_returns_429(service):
+    assert service.admission.try_acquire(QUEUE_SIZE)
+    try:
+        status, headers, _ = _request(service, 'POST', '/validate?filename=a.txt', POLICY)
+    finally:
+        service.admission.release(QUEUE_SIZE)
+    assert status == 429
+    assert headers['Retry-After'] == '1'
+
+
+def test_metrics(service):
+    _request(service, 'POST', '/validate?filename=policy.md', POLICY)
+    status, metrics = _json(service, 'GET', '/metrics')
+    assert status == 200
+    assert metrics['requests'] >= 1 and metrics['rejected'] >= 1
+    assert metrics['latency_ms']['p50'] is not None
+    assert metrics['queue_size'] == QUEUE_SIZE
+    status, _, data = _request(service, 'GET', '/metrics/stages')
+    assert status == 200
+    assert b"section_match" in data
+
+
+def test_admission_control_bounds_jobs():
+    admission = AdmissionControl(3)
+    assert admission.try_acquire(2)
+    assert not admission.try_acquire(2)
+    assert admission.try_acquire()
+    admission.release(3)
+    assert admission.in_flight == 0
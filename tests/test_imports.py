@@ -0,0 +1,61 @@
+"""Import smoke tests for the public API and every module.
+
+Each module is imported first in a fresh interpreter, so an import cycle
+hidden by the order in which another module happens to load things fails
+here rather than for the user.
+"""
+
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import policy_validator
+
+# Optional dependencies: a module needing one that is not installed is skipped
+OPTIONAL_MODULES = ('PyQt6', 'numpy', 'pyarrow')
+
+
+def _modules():
+    yield 'policy_validator'
+    for module in pkgutil.walk_packages(policy_validator.__path__, 'policy_validator.'):
+        yield module.name
+
+
+def _import_first(statement: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    return subprocess.run([sys.executable, '-c', statement], env=env,
+                          capture_output=True, text=True, timeout=120)
+
+
+@pytest.mark.parametrize('module', sorted(_modules()))
+def test_module_imports_first(module):
+    result = _import_first(f"import {module}")
+    missing = [name for name in OPTIONAL_MODULES
+               if f"No module named '{name}" in result.stderr]
+    if missing:
+        pytest.skip(f"{module} needs {missing[0]}")
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize('name', sorted(set(policy_validator.__all__) - {'main',
+                                                                        'run_application'}))
+def test_public_export_imports_first(name):
+    result = _import_first(f"from policy_validator import {name}")
+    assert result.returncode == 0, result.stderr
+
+
+def test_gui_exports_resolve_lazily():
+    pytest.importorskip('PyQt6')
+    result = _import_first("from policy_validator import main, run_application; "
+                           "assert callable(main) and callable(run_application)")
+    assert result.returncode == 0, result.stderr
+
+
+def test_client_does_not_load_the_validators():
+    result = _import_first("import sys, policy_validator.client; "
+                           "assert 'policy_validator.validators' not in sys.modules; "
+                           "assert 'PyPDF2' not in sys.modules")
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,111 @@
+"""Incremental revalidation: every edit gives the result of a full validation."""
+
+import random
+
+import pytest
+
+from policy_validator.utils.text_normalizer import ChunkNormalizer, get_section_matcher
+from policy_validator.validators.incremental import (
+    IncrementalValidator, _DocumentState, _heading, _update
+)
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+
+def _words(standard):
+    words = ['the', 'of', 'and', '#', '1.', 'a1.2', 'cc6.1', 'a.5.1', 'ac-2', 'café']
+    for section in VALIDATION_STANDARDS[standard]['sections']:
+        words += section.split()
+    return words
+
+
+def _paragraph(words, rng):
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(0, 20)))
+
+
+def _edit(paragraphs, words, rng):
+    """Insert, replace or delete one random paragraph."""
+    edited = list(paragraphs)
+    position = rng.randrange(len(edited) + 1)
+    operation = rng.choice(['insert', 'replace', 'delete'])
+    if operation == 'insert' or position == len(edited):
+        edited.insert(position, _paragraph(words, rng))
+    elif operation == 'replace':
+        edited[position] = _paragraph(words, rng)
+    elif len(edited) > 1:
+        del edited[position]
+    return edited
+
+
+def _full_state(matcher, paragraphs):
+    normalizer = ChunkNormalizer()
+    pieces = [normalizer.normalize(paragraph + '\n') for paragraph in paragraphs]
+    matches = list(matcher.iter_matches(''.join(pieces)))
+    headings = [_heading(matcher, paragraph) for paragraph in paragraphs]
+    return _DocumentState([hash(p) for p in paragraphs], pieces, matches, headings)
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_update_matches_a_full_rescan(standard):
+    matcher = get_section_matcher(standard)
+    words = _words(standard)
+    rng = random.Random(standard)
+    for _ in range(20):
+        paragraphs = [_paragraph(words, rng) for _ in range(rng.randint(1, 30))]
+        state = _full_state(matcher, paragraphs)
+        for _ in range(8):
+            paragraphs = _edit(paragraphs, words, rng)
+            state, _, _ = _update(matcher, state, paragraphs, [hash(p) for p in paragraphs])
+            full = _full_state(matcher, paragraphs)
+            assert state.pieces == full.pieces
+            assert state.offsets == full.offsets
+            assert state.matches == full.matches
+            assert state.headings == full.headings
+
+
+@pytest.mark.parametrize('standard', ["ISO 27001", "Custom"])
+def test_revalidation_equals_full_validation(tmp_path, standard):
+    words = _words(standard)
+    rng = random.Random(7)
+    path = tmp_path / "policy.txt"
+    paragraphs = [_paragraph(words, rng) for _ in range(200)]
+    validator = IncrementalValidator(standard)
+
+    for round_number in range(10):
+        path.write_text('\n'.join(paragraphs), encoding='utf-8')
+        result = validator.validate_file(str(path))
+        full = IncrementalValidator(standard).validate_file(str(path))
+        assert ('incremental' in result) == (round_number > 0)
+        assert 'incremental' not in full
+        for key in ('valid', 'issues', 'sections'):
+            assert result[key] == full[key], (round_number, key)
+        paragraphs = _edit(paragraphs, words, rng)
+
+
+def test_one_paragraph_edit_rescans_little(tmp_path):
+    path = tmp_path / "policy.txt"
+    paragraphs = ["access control and information security policies apply"] * 2000
+    path.write_text('\n'.join(paragraphs), encoding='utf-8')
+    validator = IncrementalValidator("ISO 27001")
+    validator.validate_file(str(path))
+
+    paragraphs[1000] = "cryptography"
+    path.write_text('\n'.join(paragraphs), encoding='utf-8')
+    result = validator.validate_file(str(path))
+    assert result['incremental']['changed_paragraphs'] == [1000, 1001]
+    assert result['incremental']['rescanned_chars'] < 1000
+    assert result['sections']['cryptography'] is True
+
+
+def test_forgotten_and_short_documents_are_validated_in_full(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_text("password data protection access control\n" * 10, encoding='utf-8')
+    validator = IncrementalValidator("Custom")
+    validator.validate_file(str(path))
+    assert 'incremental' in validator.validate_file(str(path))
+    validator.forget(str(path))
+    assert 'incremental' not in validator.validate_file(str(path))
+
+    path.write_text("short", encoding='utf-8')
+    assert 'incremental' not in validator.validate_file(str(path))
+    path.write_text("password data protection access control\n" * 10, encoding='utf-8')
+    assert 'incremental' not in validator.validate_file(str(path))
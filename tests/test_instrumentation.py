@@ -0,0 +1,125 @@
+"""Stage instrumentation: recording, export formats, workers and forks."""
+
+import json
+import os
+
+import pytest
+
+from policy_validator.service.workers import run_job
+from policy_validator.utils import instrumentation
+from policy_validator.utils.instrumentation import LATENCY_BUCKETS, METRIC_PREFIX, Recorder
+from policy_validator.validators.policy_validator import validate_policy
+
+POLICY = "# Password\nRotated yearly.\n# Access Control\nBy role.\n" * 20
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    instrumentation.disable()
+    yield
+    instrumentation.disable()
+
+
+@pytest.fixture
+def policy(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_text(POLICY)
+    return str(path)
+
+
+def test_disabled_stages_are_shared_no_ops():
+    assert instrumentation.get_recorder() is None
+    first, second = instrumentation.stage('read'), instrumentation.stage('parse')
+    assert first is second
+    with first as stage:
+        stage.add_bytes(10)
+
+
+def test_validation_stages_are_recorded_per_file(policy):
+    recorder = instrumentation.enable()
+    assert instrumentation.enable() is recorder
+    validate_policy(policy, "Custom")
+    assert {'mime_detection', 'read', 'normalize', 'section_match'} <= set(recorder.stats)
+    assert recorder.stats['read'].bytes == len(POLICY)
+    assert {span[1] for span in recorder.spans} == {policy}
+    assert recorder.summary_table().splitlines()[0].split()[:3] == ['Stage', 'Calls', 'Total']
+
+
+def test_stage_stats_and_listeners():
+    recorder = Recorder(max_spans=2)
+    events = []
+
+    class Listener:
+        def stage_started(self, name):
+            events.append(('start', name))
+
+        def stage_finished(self, name):
+            events.append(('finish', name))
+
+    listener = Listener()
+    recorder.add_listener(listener)
+    with recorder.stage('parse', 5) as stage:
+        stage.add_bytes(7)
+    recorder.remove_listener(listener)
+    recorder.record('parse', 0.003, 1)
+    recorder.record('parse', 100.0)
+    stats = recorder.stats['parse']
+    assert events == [('start', 'parse'), ('finish', 'parse')]
+    assert (stats.count, stats.bytes, stats.max_seconds) == (3, 13, 100.0)
+    assert stats.buckets[LATENCY_BUCKETS.index(0.005)] == 1 and stats.buckets[-1] == 1
+    assert len(recorder.spans) == 2
+
+
+def test_prometheus_and_openmetrics_text():
+    recorder = Recorder()
+    recorder.record('read', 0.002, 100)
+    recorder.record('read', 0.2, 50)
+    recorder.record('quote"d', 0.001)
+    text = recorder.prometheus_text()
+    assert f'{METRIC_PREFIX}_seconds_bucket{{stage="read",le="0.0025"}} 1' in text
+    assert f'{METRIC_PREFIX}_seconds_bucket{{stage="read",le="0.25"}} 2' in text
+    assert f'{METRIC_PREFIX}_seconds_bucket{{stage="read",le="+Inf"}} 2' in text
+    assert f'{METRIC_PREFIX}_bytes_total{{stage="read"}} 150' in text
+    assert 'stage="quote\\"d"' in text
+    assert f"# TYPE {METRIC_PREFIX}_bytes_total counter" in text
+    assert not text.rstrip().endswith("# EOF")
+
+    openmetrics = recorder.prometheus_text(openmetrics=True)
+    assert f"# TYPE {METRIC_PREFIX}_bytes counter" in openmetrics
+    assert openmetrics.endswith("# EOF\n")
+
+
+def test_chrome_trace(tmp_path):
+    recorder = Recorder()
+    recorder.set_file("a.pdf")
+    recorder.record('parse_pdf', 0.5, 10, wall_started=1000.0)
+    path = tmp_path / "trace.json"
+    recorder.write_chrome_trace(str(path))
+    event, = json.loads(path.read_text())['traceEvents']
+    assert event['name'] == 'parse_pdf' and event['ph'] == 'X'
+    assert (event['ts'], event['dur']) == (1e9, 5e5)
+    assert event['args'] == {'file': "a.pdf", 'bytes': 10}
+
+
+def test_worker_spans_are_merged_by_the_parent(policy):
+    result = run_job({'path': policy, 'instrument': True})
+    trace = result['trace']
+    assert trace and all(span[1] == policy for span in trace)
+    # Draining leaves the worker's recorder empty for its next job
+    assert len(instrumentation.get_recorder().spans) == 0
+    parent = Recorder()
+    parent.merge_spans(json.loads(json.dumps(trace)))
+    assert set(parent.stats) == {span[0] for span in trace}
+    assert parent.stats['read'].bytes == len(POLICY)
+
+
+def test_forked_children_start_empty():
+    recorder = instrumentation.enable()
+    recorder.record('read', 0.1)
+    pid = os.fork()
+    if pid == 0:
+        child = instrumentation.get_recorder()
+        os._exit(0 if child is not recorder and not child.spans else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert len(recorder.spans) == 1
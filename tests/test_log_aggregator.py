@@ -0,0 +1,79 @@
+"""Log aggregator: repeats collapse, frames are bounded and drops are shown."""
+
+import threading
+
+import pytest
+from PyQt6.QtWidgets import QPlainTextEdit
+
+from policy_validator.gui.log_aggregator import LogAggregator
+
+
+@pytest.fixture
+def log(qapp):
+    widget = QPlainTextEdit()
+    results = []
+    aggregator = LogAggregator(widget, result_sink=results.append, flush_interval_ms=10000,
+                               max_lines_per_flush=3, max_pending=5, history_size=4)
+    aggregator.results = results
+    return aggregator
+
+
+def _lines(aggregator):
+    return aggregator.log_widget.toPlainText().splitlines()
+
+
+def test_repeats_collapse_within_and_across_flushes(log):
+    for message in ["a", "a", "b", "b", "b"]:
+        log.post(message)
+    log.post("b", error=True)
+    log.flush()
+    assert _lines(log) == ["a (×2)", "b (×3)", "b"]
+    log.post("b", error=True)
+    log.flush()
+    assert _lines(log) == ["a (×2)", "b (×3)", "b (×2)"]
+    assert [(entry.message, entry.count) for entry in log.history()] == [
+        ("a", 2), ("b", 3), ("b", 2)]
+
+
+def test_flushes_are_bounded_and_history_is_a_ring(log):
+    for number in range(5):
+        log.post(str(number))
+    log.flush()
+    assert _lines(log) == ["0", "1", "2"]
+    log.flush()
+    assert _lines(log) == ["0", "1", "2", "3", "4"]
+    assert [entry.message for entry in log.history()] == ["1", "2", "3", "4"]
+
+
+def test_full_queue_drops_the_oldest(log):
+    for number in range(8):
+        log.post(str(number))
+    log.flush()
+    assert _lines(log) == ["… 3 message(s) dropped", "3", "4", "5"]
+    assert log.history()[0].error is True
+    log.flush()
+    assert _lines(log)[-2:] == ["6", "7"]
+
+
+def test_results_and_posts_from_threads(log):
+    def produce(name):
+        for number in range(100):
+            log.post_result({'path': f"{name}{number}"})
+
+    threads = [threading.Thread(target=produce, args=(name,)) for name in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.flush()
+    assert len(log.results) == 1 and len(log.results[0]) == 400
+    log.flush()
+    assert len(log.results) == 1
+
+
+def test_clear(log):
+    log.post("a")
+    log.post_result({'path': "a"})
+    log.clear()
+    log.flush()
+    assert _lines(log) == [] and log.results == [] and log.history() == []
@@ -0,0 +1,148 @@
+"""Section matching: phrases, synonyms, control identifiers and overlaps."""
+
+import random
+import re
+import time
+
+import pytest
+
+from policy_validator.utils.text_normalizer import (
+    ChunkNormalizer, get_section_matcher, normalize_text
+)
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+
+def _random_text(standard: str, rng: random.Random, paragraphs: int = 40) -> str:
+    """Text made of the standard's own words, so sections match often."""
+    words = ['the', 'of', 'and', '-', 'policy', 'a1.2', 'cc6.1', 'a.5.1', 'ac-2',
+             'ac 2', 'mp3', 'cc12.1.4']
+    for section in VALIDATION_STANDARDS[standard]['sections']:
+        words += section.split()
+    return '\n'.join(' '.join(rng.choice(words) for _ in range(rng.randint(0, 25)))
+                     for _ in range(paragraphs))
+
+
+def _reference_matches(standard: str, text: str):
+    """Matches of one lookahead alternation tried at every position."""
+    definition = VALIDATION_STANDARDS[standard]
+    matcher = get_section_matcher(standard)
+    variants = sorted(matcher._variant_sections, key=len, reverse=True)
+    alternatives = ["(?P<phrase>" + "|".join(map(re.escape, variants)) + ")"]
+    if definition['control_id_pattern']:
+        alternatives.append(f"(?P<control_id>{definition['control_id_pattern']})")
+    pattern = re.compile("(?=" + "|".join(alternatives) + ")")
+    for match in pattern.finditer(text):
+        start, end = match.span(match.lastgroup)
+        if match.lastgroup == 'phrase':
+            yield start, end, matcher._variant_sections[match.group('phrase')]
+        else:
+            section = definition['control_ids'].get(match.group('prefix'))
+            yield start, end, frozenset((section,)) if section else frozenset()
+
+
+def test_overlapping_phrases_are_all_found():
+    matcher = get_section_matcher("ISO 27001")
+    found = matcher.find_sections(
+        normalize_text("Organization of Information Security Policies"))
+    assert found == {'organization of information security', 'information security policies'}
+
+
+def test_synonyms_and_accents_are_matched():
+    matcher = get_section_matcher("ISO 27001")
+    text = normalize_text("Personnel-Security and CRYPTOGRAPHIC  controls; Accès")
+    assert matcher.find_sections(text) == {'human resource security', 'cryptography'}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Criterion CC6.1 covers logical access", {'security'}),
+    ("See A1.2 and C1.1", {'availability', 'confidentiality'}),
+    ("PI1.3 and P4.2 apply", {'processing integrity', 'privacy'}),
+    ("a1 c2 p3 are not criteria", set()),
+    ("cc6 overview", set()),
+])
+def test_soc2_criteria_need_a_point_number(text, expected):
+    matcher = get_section_matcher("SOC 2")
+    assert matcher.find_sections(normalize_text(text)) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Accounts are reviewed under AC-2 and AU-6(1)",
+     {'access control', 'audit and accountability'}),
+    ("See ir–8 for escalation", {'incident response'}),
+    ("MP3 players, page ca 12, Ma 5, IA 10", set()),
+    ("ac2 and ac - 2", set()),
+])
+def test_nist_controls_need_the_hyphen(text, expected):
+    matcher = get_section_matcher("NIST SP 800-53")
+    assert matcher.find_sections(normalize_text(text)) == expected
+
+
+def test_normalization_keeps_only_control_hyphens():
+    assert normalize_text("Access-Control, AC-2 and  covid - 19") == \
+        "access control, ac-2 and covid 19"
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_iter_matches_equals_one_alternation(standard):
+    matcher = get_section_matcher(standard)
+    rng = random.Random(standard)
+    for _ in range(20):
+        text = normalize_text(_random_text(standard, rng))
+        expected = list(_reference_matches(standard, text))
+        assert list(matcher.iter_matches(text)) == expected
+        position = rng.randrange(len(text) + 1)
+        until = rng.randrange(position, len(text) + 1)
+        assert list(matcher.iter_matches(text, position, until)) == \
+            [match for match in expected if position <= match[0] < until]
+
+        found = set()
+        for _, _, hits in expected:
+            found |= hits
+        assert matcher.find_sections(text) == found
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_scanner_matches_whole_text(standard):
+    matcher = get_section_matcher(standard)
+    rng = random.Random(standard)
+    for _ in range(20):
+        text = _random_text(standard, rng)
+        expected = matcher.find_sections(normalize_text(text))
+        scanner = matcher.scanner()
+        normalizer = ChunkNormalizer()
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 50)
+            scanner.feed(normalizer.normalize(text[position:position + size]))
+            position += size
+        scanner.feed(normalizer.finish())
+        assert scanner.finish() == expected
+
+
+def test_chunk_normalizer_joins_to_the_whole_text():
+    rng = random.Random(3)
+    for _ in range(200):
+        text = ''.join(rng.choice(['a', 'C', '1', '-', '–', ' ', '\n', 'é',
+                                   '­', 'é'])
+                       for _ in range(rng.randint(0, 40)))
+        normalizer = ChunkNormalizer()
+        pieces = []
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 5)
+            pieces.append(normalizer.normalize(text[position:position + size]))
+            position += size
+        pieces.append(normalizer.finish())
+        assert ''.join(pieces) == normalize_text(text), repr(text)
+
+
+def test_find_sections_is_as_fast_as_substring_checks():
+    matcher = get_section_matcher("NIST SP 800-53")
+    text = normalize_text("Staff must review the approved data systems annually. " * 40000)
+    started = time.perf_counter()
+    for section in matcher.sections:
+        assert section not in text
+    baseline = time.perf_counter() - started
+    started = time.perf_counter()
+    assert matcher.find_sections(text) == set()
+    assert time.perf_counter() - started < 10 * baseline + 0.05
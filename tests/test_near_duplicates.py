@@ -0,0 +1,126 @@
+"""Near-duplicate detection: shingles, signatures, families and result reuse."""
+
+import numpy as np
+import pytest
+
+from policy_validator.analytics.near_duplicates import (
+    DeduplicatingValidator, NearDuplicateIndex, _mix, estimate_similarity, minhash_signature,
+    shingle_hashes
+)
+from policy_validator.validators.policy_validator import PolicyValidator
+
+HEADINGS = ["Security", "Availability", "Processing Integrity", "Confidentiality", "Privacy"]
+
+
+def _policy(company, extra="", drop=None):
+    """A SOC 2 template whose company line sits deep inside a section body."""
+    lines = []
+    for heading in HEADINGS:
+        if heading == drop:
+            continue
+        lines.append(f"# {heading}")
+        for number in range(16):
+            lines.append(f"Staff review register item {number} every quarter and file "
+                         f"the signed outcome with the board.")
+            if heading == "Availability" and number == 4:
+                lines.append(f"This copy is issued by {company} to its own staff.{extra}")
+    return '\n'.join(lines) + '\n'
+
+
+def _reference_hashes(text, size):
+    """Shingle hashes computed one word at a time with Python integers."""
+    words = [word.encode('utf-8') for word in text.split()]
+    size = min(size, len(words))
+    hashes = set()
+    for start in range(len(words) - size + 1):
+        value = 0
+        for byte in b''.join(words[start:start + size]):
+            value = (value * 1099511628211 + byte) % 2 ** 64
+        hashes.add(int(_mix(np.array([value], dtype=np.uint64))[0]))
+    return sorted(hashes)
+
+
+@pytest.mark.parametrize('text, size', [
+    ("the quick  brown\tfox\njumps over the lazy dog the quick brown fox", 3),
+    ("zürich café — 東京 policy", 2),
+    ("two words", 5),
+    ("one", 1),
+])
+def test_shingle_hashes_match_the_word_by_word_hash(text, size):
+    assert shingle_hashes(text, size).tolist() == _reference_hashes(text, size)
+
+
+def test_shingle_hashes_ignore_whitespace_and_empty_text():
+    assert np.array_equal(shingle_hashes("a b\n\nc  d e f"), shingle_hashes(" a\tb c d\re f "))
+    assert shingle_hashes("").size == 0
+    assert shingle_hashes(" \n\t").size == 0
+
+
+def test_signature_keeps_each_bins_minimum():
+    hashes = shingle_hashes(_policy("Acme"), 3)
+    signature = minhash_signature(hashes, 16)
+    bins = hashes >> np.uint64(60)
+    for position in range(16):
+        in_bin = hashes[bins == position]
+        if in_bin.size:
+            assert signature[position] == in_bin.min()
+    assert not minhash_signature(np.empty(0, dtype=np.uint64), 16).any()
+
+
+def test_similarity_estimates():
+    index = NearDuplicateIndex()
+    template = index.signature(_policy("Acme").lower())
+    assert estimate_similarity(template, template) == 1.0
+    assert estimate_similarity(template, index.signature(_policy("Acme UK").lower())) > 0.8
+    unrelated = index.signature("an unrelated memo about parking spaces and lunch " * 20)
+    assert estimate_similarity(template, unrelated) < 0.2
+
+
+def test_index_groups_documents_into_families():
+    index = NearDuplicateIndex()
+    first, similarity = index.assign("acme.txt", _policy("Acme").lower())
+    assert similarity == 1.0
+    family, similarity = index.assign("acme-uk.txt", _policy("Acme UK").lower())
+    assert family is first and similarity > 0.8
+    other, _ = index.assign("memo.txt", "an unrelated memo about parking spaces " * 20)
+    assert other is not first and len(index.families) == 2
+
+    report = index.report()
+    assert [(f['representative'], f['size']) for f in report] == [("acme.txt", 2)]
+    assert report[0]['members'][0]['document'] == "acme-uk.txt"
+    assert len(index.report(min_size=1)) == 2
+
+
+@pytest.mark.parametrize('num_perm, bands', [(100, 10), (1, 1), (128, 3)])
+def test_index_rejects_bad_parameters(num_perm, bands):
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=num_perm, bands=bands)
+
+
+def test_members_reuse_results_only_for_inert_edits(tmp_path):
+    documents = {
+        'template.txt': _policy("Acme"),
+        'renamed.txt': _policy("Acme UK"),
+        'touching.txt': _policy("Acme", extra=" Confidentiality applies."),
+        'dropped.txt': _policy("Acme", drop="Privacy"),
+    }
+    for name, text in documents.items():
+        (tmp_path / name).write_text(text)
+
+    validator = DeduplicatingValidator("SOC 2")
+    results = {name: validator.validate_file(str(tmp_path / name)) for name in documents}
+    assert 'duplicate_of' not in results['template.txt']
+    for name in ('renamed.txt', 'touching.txt', 'dropped.txt'):
+        assert results[name]['duplicate_of'] == str(tmp_path / "template.txt")
+    assert [results[name]['reused_results'] for name in documents if name != 'template.txt'] \
+        == [True, False, False]
+    assert results['dropped.txt']['valid'] is False
+
+    # Reused or not, every verdict equals validating the file on its own
+    for name in documents:
+        plain = PolicyValidator("SOC 2").validate_file(str(tmp_path / name))
+        for key in ('valid', 'issues', 'sections'):
+            assert results[name].get(key) == plain.get(key), (name, key)
+
+    members = validator.index.report()[0]['members']
+    assert [member['reused'] for member in members] == [True, False, False]
@@ -0,0 +1,164 @@
+"""PDF parsing and validation: outline triage, reader reuse and early stops.
+
+The PDFs are written here with PyPDF2, one line of Helvetica text per line
+of the page text, so no fixture files are needed.
+"""
+
+import io
+import random
+
+import PyPDF2
+import pytest
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from policy_validator.parsers.pdf_parser import PdfParser
+from policy_validator.validators.policy_validator import PolicyValidator
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+FILLER = "Staff must review the approved data systems annually and report"
+
+
+def _pdf(pages, outline=(), password=None) -> bytes:
+    """A PDF with the given page texts and (title, page) outline entries."""
+    writer = PyPDF2.PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject('/Type'): NameObject('/Font'),
+        NameObject('/Subtype'): NameObject('/Type1'),
+        NameObject('/BaseFont'): NameObject('/Helvetica'),
+    }))
+    for text in pages:
+        page = PyPDF2.PageObject.create_blank_page(None, 612, 792)
+        lines = ''.join(f"({line}) Tj 0 -14 Td " for line in text.split('\n'))
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td {lines}ET".encode())
+        page[NameObject('/Contents')] = writer._add_object(content)
+        page[NameObject('/Resources')] = DictionaryObject({
+            NameObject('/Font'): DictionaryObject({NameObject('/F1'): font})
+        })
+        writer.add_page(page)
+    for title, number in outline:
+        writer.add_outline_item(title, number)
+    if password:
+        writer.encrypt(password)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def _write(tmp_path, name, *args, **kwargs) -> str:
+    path = tmp_path / name
+    path.write_bytes(_pdf(*args, **kwargs))
+    return str(path)
+
+
+@pytest.fixture
+def decoded_pages(monkeypatch):
+    """Count the pages whose content is decoded."""
+    calls = []
+    extract_text = PyPDF2.PageObject.extract_text
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return extract_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(PyPDF2.PageObject, 'extract_text', counting)
+    return calls
+
+
+class _WholeTextValidator(PolicyValidator):
+    """Checks the fully extracted text, as before page-by-page scanning."""
+
+    def _scan_pdf(self, file_info, parser, found_sections):
+        self.check_content(file_info, parser.parse()['text'].lower(),
+                           found_sections=found_sections)
+
+
+def test_iter_pages_joins_to_the_text(tmp_path):
+    path = _write(tmp_path, "policy.pdf", ["Access Control\nUsers", "Page two"])
+    with PdfParser(path) as parser:
+        pages = list(parser.iter_pages())
+        assert ''.join(pages) == parser.parse()['text']
+    assert len(pages) == 2
+
+
+def test_one_reader_serves_triage_and_extraction(tmp_path, monkeypatch):
+    path = _write(tmp_path, "policy.pdf", ["Access Control\n" + FILLER] * 30)
+    readers = []
+    reader = PyPDF2.PdfReader
+
+    def counting(*args, **kwargs):
+        readers.append(1)
+        return reader(*args, **kwargs)
+
+    monkeypatch.setattr(PyPDF2, 'PdfReader', counting)
+    for standard in VALIDATION_STANDARDS:
+        readers.clear()
+        PolicyValidator(standard).validate_file(path)
+        assert len(readers) == 1, standard
+
+
+def test_encrypted_pdf_is_rejected_without_decoding_pages(tmp_path, decoded_pages):
+    path = _write(tmp_path, "policy.pdf", ["Access Control"], password="secret")
+    result = PolicyValidator("SOC 2").validate_file(path)
+    assert result['valid'] is False
+    assert "PDF is password-protected" in result['issues']
+    assert decoded_pages == []
+
+
+def test_scan_stops_once_sections_and_length_are_settled(tmp_path, decoded_pages):
+    sections = ', '.join(VALIDATION_STANDARDS["SOC 2"]['sections'])
+    first = '\n'.join([sections] + [FILLER] * 10)
+    path = _write(tmp_path, "policy.pdf", [first] + [FILLER] * 40)
+    result = PolicyValidator("SOC 2").validate_file(path)
+    assert result['valid'] is True, result['issues']
+    assert len(decoded_pages) == 1
+
+
+def test_outline_sections_are_not_searched_for(tmp_path, decoded_pages):
+    sections = VALIDATION_STANDARDS["ISO 27001"]['sections']
+    pages = ['\n'.join([FILLER] * 20)] * 20
+    path = _write(tmp_path, "policy.pdf", pages,
+                  outline=[(section.title(), 0) for section in sections])
+    result = PolicyValidator("ISO 27001", fail_fast=True).validate_file(path)
+    assert result['valid'] is True, result['issues']
+    assert len(decoded_pages) == 1
+
+    # The structure warnings need the whole text
+    decoded_pages.clear()
+    PolicyValidator("ISO 27001").validate_file(path)
+    assert len(decoded_pages) == len(pages)
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_page_scan_agrees_with_whole_text(tmp_path, standard):
+    rng = random.Random(standard)
+    definition = VALIDATION_STANDARDS[standard]
+    words = ['the', 'of', 'policy', 'staff'] + ' '.join(definition['sections']).split()
+    for attempt in range(6):
+        pages = ['\n'.join(' '.join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+                           for _ in range(rng.randint(1, 8)))
+                 for _ in range(rng.randint(1, 6))]
+        outline = [(rng.choice(definition['sections']).title(), 0)
+                   for _ in range(rng.randint(0, 2))]
+        path = _write(tmp_path, f"{attempt}.pdf", pages, outline=outline)
+        for fail_fast in (False, True):
+            scanned = PolicyValidator(standard, fail_fast=fail_fast).validate_file(path)
+            whole = _WholeTextValidator(standard, fail_fast=fail_fast).validate_file(path)
+            for key in ('valid', 'issues', 'sections'):
+                assert scanned.get(key) == whole.get(key), (key, pages, outline)
+
+
+def test_fail_fast_reads_pages_only_for_length_and_sections(tmp_path, decoded_pages):
+    sections = ', '.join(VALIDATION_STANDARDS["NIST SP 800-53"]['sections'])
+    first = '\n'.join([sections] + [FILLER] * 20)
+    path = _write(tmp_path, "policy.pdf", [first] + [FILLER] * 40)
+    result = PolicyValidator("NIST", fail_fast=True).validate_file(path)
+    assert result['valid'] is True, result['issues']
+    assert len(decoded_pages) == 1
+
+    decoded_pages.clear()
+    path = _write(tmp_path, "short.pdf", [sections] + [FILLER] * 3)
+    result = PolicyValidator("NIST", fail_fast=True).validate_file(path)
+    assert result['valid'] is False
+    assert result['issues'][0].startswith("Content length (")
+    assert len(decoded_pages) == 4
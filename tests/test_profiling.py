@@ -0,0 +1,106 @@
+"""Profiling sessions: stage attribution, memory peaks and worker merging."""
+
+import json
+import time
+
+import pytest
+
+from policy_validator.service.workers import run_job
+from policy_validator.utils import instrumentation
+from policy_validator.utils.profiling import ProfileSession
+
+
+def _busy(seconds):
+    """Spin on the CPU, so samples and cProfile both see this function."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def _validate(session, path="slow.pdf"):
+    """Stand-in validation with a slow, allocating section_match stage."""
+    with session.profile(path):
+        with instrumentation.stage('normalize'):
+            _busy(0.02)
+        with instrumentation.stage('section_match'):
+            block = bytearray(8_000_000)
+            _busy(0.1)
+            del block
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    instrumentation.disable()
+    yield
+    instrumentation.disable()
+
+
+def test_options_and_selection():
+    with pytest.raises(ValueError, match="Unsupported profile mode"):
+        ProfileSession('trace')
+    session = ProfileSession('cprofile', interval=0.01, memory=False,
+                             select=["*.pdf", "/srv/big/*"])
+    assert session.options() == {'mode': 'cprofile', 'interval': 0.01, 'memory': False}
+    assert session.selects("/tmp/slow.pdf") and session.selects("/srv/big/a.txt")
+    assert not session.selects("/tmp/a.txt")
+    assert ProfileSession().selects("anything")
+
+
+@pytest.mark.parametrize('mode', ['sample', 'cprofile'])
+def test_time_and_memory_are_attributed_to_stages(mode):
+    session = ProfileSession(mode)
+    _validate(session)
+    session.close()
+    assert instrumentation.get_recorder() is None  # Enabled only while profiling
+
+    weights = {}
+    for stack, weight in session.stacks.items():
+        stage = stack.split(';', 1)[0]
+        weights[stage] = weights.get(stage, 0) + weight
+    assert weights['stage:section_match'] > weights.get('stage:normalize', 0)
+    assert any('_busy' in stack for stack in session.stacks
+               if stack.startswith('stage:section_match;'))
+    assert session.stage_peaks['section_match'] >= 8_000_000
+    assert session.stage_peaks.get('normalize', 0) < 1_000_000
+    file, = session.files
+    assert file['path'] == "slow.pdf" and file['seconds'] >= 0.12
+    assert file['peak_bytes'] >= 8_000_000
+
+
+def test_an_enabled_recorder_is_kept():
+    recorder = instrumentation.enable()
+    session = ProfileSession('cprofile', memory=False)
+    _validate(session)
+    assert instrumentation.get_recorder() is recorder
+    assert recorder.listeners == []
+    assert recorder.stats['section_match'].count == 1
+
+
+def test_worker_data_merges_and_reports(tmp_path):
+    parent = ProfileSession('cprofile')
+    for path in ("a.pdf", "b.pdf"):
+        worker = ProfileSession(**parent.options())
+        _validate(worker, path)
+        worker.close()
+        parent.merge(json.loads(json.dumps(worker.to_dict())))
+    assert [file['path'] for file in parent.files] == ["a.pdf", "b.pdf"]
+    assert parent.stage_peaks['section_match'] >= 8_000_000
+
+    report = parent.report()
+    assert report.startswith("Profiled 2 file(s) in cprofile mode")
+    assert "Top functions in section_match (self µs):" in report
+    path = tmp_path / "profile.collapsed"
+    parent.write_collapsed(str(path))
+    lines = path.read_text().splitlines()
+    assert lines and all(line.startswith("stage:") for line in lines)
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+
+def test_profiled_jobs_return_their_session(tmp_path):
+    path = tmp_path / "policy.txt"
+    path.write_text("# Password\nRotated yearly.\n" * 200)
+    result = run_job({'path': str(path), 'profile': {'mode': 'cprofile', 'memory': True}})
+    profile = result['profile']
+    assert profile['files'][0]['path'] == str(path)
+    assert any(stack.startswith('stage:section_match') for stack in profile['stacks'])
+    assert 'trace' not in result
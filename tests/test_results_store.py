@@ -0,0 +1,104 @@
+"""Results store: batching, queries, history, export and old databases."""
+
+import sqlite3
+
+import pytest
+
+from policy_validator.storage.results_store import ResultsStore
+
+DAY = 86400.0
+
+
+def _result(path, valid, sections, standard="ISO", **extra):
+    return dict({'path': path, 'standard': standard, 'valid': valid,
+                 'issues': [] if valid else ["Missing sections"], 'sections': sections},
+                **extra)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(str(tmp_path / "results.db"), batch_size=3) as store:
+        store.add(_result("a.pdf", False, {'access control': False, 'cryptography': True}),
+                  validated_at=1 * DAY)
+        store.add(_result("a.pdf", True, {'access control': True, 'cryptography': True},
+                          file_hash="abc", elapsed_ms=12.5), validated_at=3 * DAY)
+        store.add(_result("b.pdf", False, {'access control': False},
+                          standard="NIST SP 800-53"), validated_at=2 * DAY)
+        store.add(_result("c.txt", True, {}, standard="Custom"), validated_at=4 * DAY)
+        yield store
+
+
+def test_results_are_written_in_batches(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultsStore(path, batch_size=2)
+    store.add(_result("a.pdf", True, {}))
+    count = "SELECT COUNT(*) FROM results"
+    with sqlite3.connect(path) as reader:
+        assert reader.execute(count).fetchone()[0] == 0
+        store.add(_result("b.pdf", True, {}))
+        assert reader.execute(count).fetchone()[0] == 2
+        store.add(_result("c.pdf", True, {}))
+        store.close()
+        assert reader.execute(count).fetchone()[0] == 3
+
+
+def test_query_filters_and_orders_newest_first(store):
+    rows = list(store.query(standard="ISO", section="access control"))
+    assert [(row['status'], row['validated_at']) for row in rows] == [
+        ('pass', 3 * DAY), ('fail', 1 * DAY)]
+    assert rows[0]['file_hash'] == "abc" and rows[0]['valid'] is True
+
+    failed = list(store.query(section="access control", status="fail"))
+    assert {(row['path'], row['standard']) for row in failed} == {
+        ("a.pdf", "ISO 27001"), ("b.pdf", "NIST SP 800-53")}
+    assert [row['path'] for row in store.query(since=2 * DAY, until=3 * DAY)] == ["b.pdf"]
+    assert len(list(store.query(path="a.pdf", limit=1))) == 1
+    with pytest.raises(ValueError):
+        list(store.query(status="unknown"))
+
+
+def test_history_and_section_summary(store):
+    history = store.history("a.pdf")
+    assert [record['valid'] for record in history] == [True, False]
+    assert history[1]['issues'] == ["Missing sections"]
+    assert store.history("a.pdf", limit=1)[0]['elapsed_ms'] == 12.5
+
+    summary = store.section_summary()
+    assert list(summary["ISO 27001"]) == ['access control', 'cryptography']
+    assert summary["ISO 27001"]['access control'] == {'pass': 1, 'fail': 1}
+    assert store.section_summary("NIST", since=3 * DAY) == {}
+
+
+def test_results_round_trip_bulk_fields(tmp_path):
+    bulk = _result("a.pdf", False, {'access control': False}, job_key="k1", line=4,
+                   size=2048, file_hash="abc")
+    error = dict(_result("b.pdf", False, {}), job_key=None, line=5)
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        store.add(bulk, validated_at=DAY)
+        store.add(error, validated_at=DAY)
+        store.add(_result("c.pdf", True, {'cryptography': True}), validated_at=DAY)
+        records = list(store.results())
+    assert records[0] == dict(bulk, standard="ISO 27001", elapsed_ms=None, validated_at=DAY)
+    assert records[1]['job_key'] is None and records[1]['line'] == 5
+    assert 'job_key' not in records[2] and 'size' not in records[2]
+    assert records[2]['sections'] == {'cryptography': True}
+
+    with ResultsStore(":memory:") as copy:
+        for record in records:
+            copy.add(record)
+        assert list(copy.results()) == records
+
+
+def test_old_databases_gain_the_added_columns(tmp_path):
+    path = str(tmp_path / "old.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY, path TEXT NOT NULL, "
+                     "file_hash TEXT, standard TEXT NOT NULL, valid INTEGER NOT NULL, "
+                     "issues TEXT NOT NULL, elapsed_ms REAL, validated_at REAL NOT NULL)")
+        conn.execute("INSERT INTO results VALUES (1, 'old.pdf', NULL, 'SOC 2', 1, '[]', "
+                     "NULL, 1.0)")
+    with ResultsStore(path) as store:
+        store.add(_result("new.pdf", True, {}, job_key="k", line=1))
+        records = list(store.results())
+    assert [record['path'] for record in records] == ["old.pdf", "new.pdf"]
+    assert 'job_key' not in records[0] and records[1]['job_key'] == "k"
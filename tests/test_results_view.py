@@ -0,0 +1,99 @@
+"""Results table: rows, sorting, filtering and batched inserts."""
+
+import pytest
+from PyQt6.QtCore import QModelIndex, Qt
+
+from policy_validator.gui.results_view import (
+    FILE_COLUMN, ISSUES_COLUMN, MISSING_COLUMN, STATUS_COLUMN, TIME_COLUMN,
+    ResultsTableModel, ResultsView, result_status
+)
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+RESULTS = [
+    {'path': "/p/b.pdf", 'standard': "ISO 27001", 'valid': False,
+     'issues': ["Missing sections", "PDF file is suspiciously small"],
+     'sections': {'access control': False, 'cryptography': True}, 'elapsed_ms': 30.0},
+    {'path': "/p/a.txt", 'standard': "Custom", 'valid': True, 'issues': [],
+     'sections': {'password': True}, 'elapsed_ms': 5.25},
+    {'path': "/p/C.docx", 'standard': "ISO 27001", 'valid': True,
+     'issues': ["Word document is suspiciously small"],
+     'sections': {'access control': True}},
+]
+
+
+def _column(model, column, role=Qt.ItemDataRole.DisplayRole):
+    return [model.data(model.index(row, column), role) for row in range(model.rowCount())]
+
+
+@pytest.fixture
+def model(qapp):
+    model = ResultsTableModel()
+    model.add_results(RESULTS)
+    return model
+
+
+def test_result_status():
+    assert [result_status(result) for result in RESULTS] == ['error', 'success', 'warning']
+
+
+def test_cells_and_tooltips(model):
+    assert model.rowCount() == 3 and model.columnCount() == 6
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert _column(model, FILE_COLUMN) == ["b.pdf", "a.txt", "C.docx"]
+    assert _column(model, MISSING_COLUMN) == ["access control", "", ""]
+    assert _column(model, ISSUES_COLUMN)[0] == "Missing sections (+1 more)"
+    assert _column(model, TIME_COLUMN) == ["30.0", "5.2", ""]
+    assert _column(model, FILE_COLUMN, Qt.ItemDataRole.ToolTipRole)[0] == "/p/b.pdf"
+    assert _column(model, ISSUES_COLUMN, Qt.ItemDataRole.ToolTipRole)[1] is None
+    assert model.data(QModelIndex()) is None
+    assert model.headerData(STATUS_COLUMN, Qt.Orientation.Horizontal) == 'Status'
+
+
+def test_sorting_and_insertion_order(model):
+    model.sort(FILE_COLUMN)
+    assert _column(model, FILE_COLUMN) == ["a.txt", "b.pdf", "C.docx"]
+    model.sort(TIME_COLUMN, Qt.SortOrder.DescendingOrder)
+    assert _column(model, FILE_COLUMN) == ["b.pdf", "a.txt", "C.docx"]
+    # New rows are merged into the sorted order
+    model.add_results([dict(RESULTS[1], path="/p/d.txt", elapsed_ms=10.0)])
+    assert _column(model, FILE_COLUMN) == ["b.pdf", "d.txt", "a.txt", "C.docx"]
+    model.sort(-1)
+    assert _column(model, FILE_COLUMN) == ["b.pdf", "a.txt", "C.docx", "d.txt"]
+
+
+def test_filters_and_counts(model):
+    model.set_filter(standard="ISO 27001")
+    assert _column(model, FILE_COLUMN) == ["b.pdf", "C.docx"]
+    model.set_filter(section="access control")
+    assert _column(model, FILE_COLUMN) == ["b.pdf"]
+    model.set_filter(status='success')
+    model.add_results([RESULTS[0], dict(RESULTS[1], path="/p/e.txt")])
+    assert _column(model, FILE_COLUMN) == ["a.txt", "e.txt"]
+    assert model.counts() == {'success': 2, 'warning': 1, 'error': 2}
+    model.clear()
+    assert model.rowCount() == 0 and model.counts()['error'] == 0
+
+
+def test_rows_inserted_in_one_batch(model):
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.add_results(RESULTS * 100)
+    assert inserted == [(3, 302)]
+
+
+def test_view_batches_single_results(qapp):
+    view = ResultsView()
+    for result in RESULTS:
+        view.add_result(result)
+    assert view.model.rowCount() == 0  # Waiting for the insert timer
+    view.flush()
+    assert view.model.rowCount() == 3
+    assert view.summary_label.text().startswith("3 of 3 shown")
+
+    view.status_filter.setCurrentIndex(view.status_filter.findData('error'))
+    assert view.model.rowCount() == 1
+    view.standard_filter.setCurrentIndex(view.standard_filter.findData("Custom"))
+    sections = [view.section_filter.itemData(i) for i in range(view.section_filter.count())]
+    assert sections == [None] + VALIDATION_STANDARDS["Custom"]['sections']
+    view.clear()
+    assert len(view.model.rows) == 0
@@ -0,0 +1,129 @@
+"""Sandboxed workers: limits, crashes, idle deaths and SandboxedValidator."""
+
+import io
+import os
+import signal
+import time
+import zipfile
+
+import pytest
+
+from policy_validator.service.sandbox import (
+    CRASH, MEMORY, TIMEOUT, ResourceLimitError, ResourceLimits, SandboxedValidator,
+    SandboxPool, limit_result
+)
+from policy_validator.utils.archives import validate_archive
+
+resource = pytest.importorskip('resource', reason="Memory limits need the resource module")
+
+MEMORY_LIMIT = 512 * 1024 ** 2
+
+
+def _allocate(size):
+    return len(bytearray(size))
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _sleep_forever():
+    time.sleep(600)
+
+
+def _crash():
+    os._exit(3)
+
+
+@pytest.fixture
+def pool():
+    with SandboxPool(1, ResourceLimits(timeout=2, memory=MEMORY_LIMIT)) as pool:
+        yield pool
+
+
+def test_memory_limit_replaces_the_worker(pool):
+    with pytest.raises(ResourceLimitError) as error:
+        pool.submit(_allocate, 2 * MEMORY_LIMIT).result()
+    assert error.value.reason == MEMORY
+    assert pool.submit(_allocate, 1024).result() == 1024
+
+
+def test_timeout_kills_the_worker(pool):
+    first = pool.submit(os.getpid).result()
+    with pytest.raises(ResourceLimitError) as error:
+        pool.submit(_sleep, 30).result()
+    assert error.value.reason == TIMEOUT
+    assert pool.submit(os.getpid).result() != first
+
+
+def test_crash_fails_only_its_task(pool):
+    with pytest.raises(ResourceLimitError) as error:
+        pool.submit(_crash).result()
+    assert error.value.reason == CRASH and error.value.exit_code == 3
+    assert pool.submit(_sleep, 0).result() == 0
+
+
+def test_worker_dying_while_idle_is_replaced(pool):
+    first = pool.submit(os.getpid).result()
+    os.kill(first, signal.SIGKILL)
+    deadline = time.monotonic() + 10
+    while any(worker.process.is_alive() for worker in pool._idle):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    # The next task goes to a fresh worker rather than failing as a crash
+    assert pool.submit(os.getpid).result() != first
+
+
+def test_initializer_counts_against_the_deadline():
+    pool = SandboxPool(1, ResourceLimits(timeout=1), initializer=_sleep_forever)
+    try:
+        with pytest.raises(ResourceLimitError) as error:
+            pool.submit(os.getpid).result(timeout=30)
+        assert error.value.reason == TIMEOUT
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_limit_result_describes_the_limit():
+    result = limit_result({'path': "big.pdf", 'standard': "ISO", 'content': b"x" * 10},
+                          ResourceLimitError(MEMORY, MEMORY_LIMIT))
+    assert result['valid'] is False and result['size'] == 10
+    assert result['standard'] == "ISO 27001"
+    assert result['limit_exceeded'] == {'reason': MEMORY, 'limit': MEMORY_LIMIT}
+
+
+class _UnreadableStream(io.BytesIO):
+    def read(self, *args):
+        raise AssertionError("the stream must not be read")
+
+
+def test_oversized_stream_is_not_read(pool):
+    validator = SandboxedValidator(pool, "ISO")
+    result = validator.validate_stream("upload.txt", _UnreadableStream(), 2 * MEMORY_LIMIT)
+    assert result['limit_exceeded']['reason'] == MEMORY
+    assert result['size'] == 2 * MEMORY_LIMIT
+
+
+def test_stream_larger_than_declared_is_cut_off(pool):
+    validator = SandboxedValidator(pool, "ISO")
+    pool.limits.memory = 1024
+    result = validator.validate_stream("upload.txt", io.BytesIO(b"x" * 4096), 10)
+    assert result['limit_exceeded']['reason'] == MEMORY
+
+
+def test_zip_members_are_read_by_the_worker(pool, tmp_path):
+    text = "Information security policies and access control. " * 40
+    archive = tmp_path / "bundle with space.zip"
+    with zipfile.ZipFile(archive, 'w') as bundle:
+        bundle.writestr("policies/access.txt", text)
+
+    class _Validator(SandboxedValidator):
+        def _stream_job(self, file_path, stream, size):
+            job = super()._stream_job(file_path, stream, size)
+            assert 'content' not in job
+            return job
+
+    results = list(validate_archive(_Validator(pool, "ISO"), str(archive)))
+    assert [r['path'] for r in results] == [f"{archive}!policies/access.txt"]
+    assert results[0]['sections']['access control'] is True
@@ -0,0 +1,123 @@
+"""Batch scheduling: document sizing, the cost model and the job queue."""
+
+import io
+import zipfile
+import zlib
+
+import PyPDF2
+import pytest
+
+from policy_validator.service import scheduler
+from policy_validator.service.scheduler import (
+    BatchScheduler, CostModel, JobEstimate, document_units, pdf_page_count
+)
+
+
+def _pdf(pages):
+    writer = PyPDF2.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(612, 792)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _page_count(data):
+    return pdf_page_count(io.BytesIO(data), len(data))
+
+
+def _estimate(seconds, memory=0):
+    return JobEstimate('txt', 0, seconds, memory)
+
+
+def test_pdf_page_counts():
+    assert _page_count(_pdf(7)) == 7
+    assert _page_count(b"%PDF-1.4\n1 0 obj <</Linearized 1 /L 9000 /N 12 /O 3>>") == 12
+
+    # The page tree root is the largest count, found in the last window too
+    tree = b"4 0 obj <</Type /Pages /Kids [5 0 R] /Count 3>>\n2 0 obj <</Count 30 /Type /Pages>>"
+    padded = b"%PDF-1.4\n" + b"%" * (3 * scheduler.SNIFF_WINDOW) + tree
+    assert _page_count(padded) == 30
+
+    stream = zlib.compress(b"3 0 <</Type/Pages/Kids[4 0 R]/Count 42>>")
+    compressed = b"%PDF-1.5\n1 0 obj <</Type /ObjStm /N 1 /Filter /FlateDecode>>stream\n"
+    assert _page_count(compressed + stream + b"\nendstream") == 42
+    assert _page_count(b"%PDF-1.4\nno page tree here") is None
+
+
+def test_document_units(tmp_path):
+    pdf = _pdf(3)
+    assert document_units({'path': "a.PDF", 'content': pdf}, len(pdf)) == ('pdf', 3.0, len(pdf))
+    assert document_units({'path': "a.pdf", 'content': b"junk" * 10}, 200 * 1024) \
+        == ('pdf', 4.0, 200 * 1024.0)
+
+    path = tmp_path / "policy.docx"
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('word/document.xml', "<w:p/>" * 1000)
+    assert document_units({'path': str(path)}, path.stat().st_size) == ('docx', 6000.0, 6000.0)
+    assert document_units({'path': str(tmp_path / "gone.docx")}, 10) == ('docx', 10.0, 10.0)
+    assert document_units({'path': "notes.md"}, 10) == ('other', 10.0, 10.0)
+    assert document_units({'path': "a.txt"}, 10) == ('txt', 10.0, 10.0)
+
+
+def test_cost_model_learns_rates_and_round_trips(tmp_path):
+    model = CostModel()
+    small = model.estimate({'path': "a.txt"}, 1000)
+    large = model.estimate({'path': "b.txt"}, 10 ** 7)
+    assert large.seconds > small.seconds and large.memory == small.memory
+
+    prior = model.rate('txt')
+    for _ in range(20):
+        model.observe(large, 10 * large.seconds)
+    assert model.rate('txt') > 5 * prior
+    assert model.rate('pdf') == CostModel().rate('pdf')
+
+    path = str(tmp_path / "model.json")
+    model.save(path)
+    assert CostModel.load(path).to_dict() == model.to_dict()
+    assert CostModel.load(path).to_dict()['txt']['jobs'] == 20
+
+    (tmp_path / "bad.json").write_text("[1, 2]")
+    for name in ("bad.json", "missing.json"):
+        assert CostModel.load(str(tmp_path / name)).rate('txt') == prior
+
+
+def test_scheduler_hands_out_longest_first():
+    queue = BatchScheduler()
+    for name, seconds in [('a', 1), ('b', 5), ('c', 1), ('d', 3)]:
+        queue.add(name, _estimate(seconds))
+    assert [queue.pop()[0] for _ in range(4)] == ['b', 'd', 'a', 'c']
+    assert queue.pop() is None
+
+
+def test_scheduler_keeps_to_the_memory_budget():
+    queue = BatchScheduler(memory_budget=100)
+    queue.add('giant', _estimate(9, memory=500))
+    queue.add('medium', _estimate(5, memory=60))
+    queue.add('small', _estimate(1, memory=30))
+
+    # A job too large for the budget runs alone
+    giant, estimate = queue.pop()
+    assert giant == 'giant' and queue.pop() is None
+    queue.release(estimate)
+    assert [queue.pop()[0] for _ in range(2)] == ['medium', 'small']
+    assert queue.reserved == 90
+
+
+def test_scheduler_counts_buffered_content(monkeypatch):
+    monkeypatch.setattr(scheduler, 'MAX_BUFFERED_CONTENT', 100)
+    queue = BatchScheduler()
+    queue.add('a', _estimate(1), nbytes=60)
+    assert not queue.full
+    queue.add('b', _estimate(2), nbytes=60)
+    assert queue.full and queue.buffered == 120
+    queue.pop()
+    assert not queue.full and queue.buffered == 60 and len(queue) == 1
+
+
+@pytest.mark.parametrize('budget', [0, None])
+def test_scheduler_without_a_budget(budget):
+    queue = BatchScheduler(memory_budget=budget)
+    for name in 'abc':
+        queue.add(name, _estimate(1, memory=10 ** 12))
+    assert [queue.pop()[0] for _ in range(3)] == ['a', 'b', 'c']
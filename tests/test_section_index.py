@@ -0,0 +1,150 @@
+"""Heading index: offsets, nesting, body lengths and the section-body check.
+
+HeadingTracker promises the heading checks of SectionIndex over text fed in
+chunks, and PolicyValidator gives the same warnings whether it reads a text
+file whole, streams it or revalidates it incrementally; these tests hold
+both to it on random heading documents.
+"""
+
+import random
+
+import pytest
+
+from policy_validator.parsers.section_index import HeadingTracker, SectionIndex
+from policy_validator.utils.text_normalizer import get_section_matcher
+from policy_validator.validators.incremental import IncrementalValidator
+from policy_validator.validators.policy_validator import MIN_SECTION_BODY, PolicyValidator
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+DOCUMENT = (
+    "# Access Control\n"
+    "Users must be approved.\n"
+    "## 1.1 Reviews\n"
+    "Quarterly.\n"
+    "# Encryption\n"
+    "\n"
+    "2. Incident Response\n"
+    "Report within one hour to the security team.\n"
+)
+
+
+def _random_document(standard: str, rng: random.Random, lines: int = 60) -> str:
+    """Headings naming the standard's sections over bodies of random length."""
+    titles = VALIDATION_STANDARDS[standard]['sections'] + ['overview', 'scope']
+    words = ['the', 'staff', 'must', 'review', 'policy', '-', '1.']
+    out = []
+    for _ in range(lines):
+        kind = rng.random()
+        if kind < 0.2:
+            out.append('#' * rng.randint(1, 3) + ' ' + rng.choice(titles).title())
+        elif kind < 0.3:
+            out.append(f"{rng.randint(1, 9)}.{rng.randint(1, 9)} {rng.choice(titles)}")
+        else:
+            out.append(' '.join(rng.choice(words) for _ in range(rng.randint(0, 8))))
+    return '\n'.join(out) + rng.choice(['', '\n'])
+
+
+def _chunks(text: str, rng: random.Random, largest: int):
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, largest)
+        yield text[position:position + size]
+        position += size
+
+
+def test_offsets_and_nesting():
+    index = SectionIndex.from_text(DOCUMENT)
+    assert [(h['level'], h['title']) for h in index.headings] == [
+        (1, 'Access Control'), (2, '1.1 Reviews'), (1, 'Encryption'),
+        (1, 'Incident Response'),
+    ]
+    access, reviews, encryption, incident = index.headings
+    assert access['end'] == encryption['start'] == DOCUMENT.index('# Encryption')
+    assert reviews['parent'] == 0 and encryption['parent'] == -1
+    assert index.children(access) == [reviews]
+    assert index.section_at(DOCUMENT.index('Quarterly'))['title'] == '1.1 Reviews'
+    assert index.section_at(DOCUMENT.index('Report')) is incident
+    assert index.section_at(0) is access
+    assert SectionIndex.body_length(encryption) == 2  # Both line breaks
+
+
+def test_has_section_and_empty_sections():
+    index = SectionIndex.from_text(DOCUMENT)
+    matcher = get_section_matcher("ISO 27001")
+    assert index.has_section('access control', min_body_chars=20)
+    assert not index.has_section('cryptography', min_body_chars=3, matcher=matcher)
+    assert index.has_section('incident management', min_body_chars=20, matcher=matcher)
+    sections = ['access control', 'cryptography', 'asset management', 'incident management']
+    assert index.empty_sections(sections, 20, matcher) == ['cryptography']
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_tracker_matches_the_index(standard):
+    matcher = get_section_matcher(standard)
+    sections = matcher.sections
+    rng = random.Random(standard)
+    for _ in range(30):
+        text = _random_document(standard, rng)
+        minimum = rng.choice([0, 1, 20, 60])
+        index = SectionIndex.from_text(text)
+        tracker = HeadingTracker(matcher, sections, minimum)
+        for chunk in _chunks(text, rng, rng.choice([1, 7, 200])):
+            tracker.feed(chunk)
+            if tracker.settled:
+                assert index.empty_sections(sections, minimum, matcher) == []
+        tracker.finish()
+        assert tracker.has_headings == bool(index.headings)
+        assert tracker.empty_sections() == index.empty_sections(sections, minimum, matcher)
+
+
+def test_tracker_fed_headings_matches_the_index():
+    matcher = get_section_matcher("NIST SP 800-53")
+    index = SectionIndex.from_text(DOCUMENT)
+    sections = ['access control', 'incident response']
+    tracker = HeadingTracker(matcher, sections, 50)
+    for heading in index.headings:
+        named = frozenset(matcher.find_sections(heading['title'].lower()))
+        tracker.add(heading['level'], named, heading['start'], heading['body_start'])
+    tracker.finish(len(DOCUMENT))
+    assert tracker.empty_sections() == ['incident response']
+    assert index.empty_sections(sections, 50, matcher) == ['incident response']
+
+
+class _WholeTextValidator(PolicyValidator):
+    stream_text = False
+
+
+def test_empty_section_warning_on_every_path(tmp_path):
+    text = "# Access Control\n" + "Users are reviewed. " * 60 + "\n# Cryptography\nTBD\n"
+    path = tmp_path / "policy.txt"
+    path.write_text(text)
+    expected = "Section headings without body text: cryptography"
+    for validator in (PolicyValidator("ISO"), _WholeTextValidator("ISO"),
+                      IncrementalValidator("ISO")):
+        assert expected in validator.validate_file(str(path))['issues']
+
+    path.write_text(text.replace("TBD", "Keys are rotated yearly by the team."))
+    assert len("Keys are rotated yearly by the team.") >= MIN_SECTION_BODY
+    for validator in (PolicyValidator("ISO"), _WholeTextValidator("ISO")):
+        issues = validator.validate_file(str(path))['issues']
+        assert not any(issue.startswith("Section headings") for issue in issues)
+
+
+@pytest.mark.parametrize('standard', ["ISO 27001", "NIST SP 800-53"])
+def test_streamed_whole_and_incremental_validation_agree(tmp_path, standard):
+    rng = random.Random(standard)
+    incremental = IncrementalValidator(standard)
+    path = tmp_path / "policy.txt"
+    text = _random_document(standard, rng, lines=400)
+    for _ in range(15):
+        path.write_text(text)
+        streamed = PolicyValidator(standard).validate_file(str(path))
+        whole = _WholeTextValidator(standard).validate_file(str(path))
+        edited = incremental.validate_file(str(path))
+        for key in ('valid', 'issues', 'sections'):
+            assert streamed[key] == whole[key] == edited[key], key
+        lines = text.split('\n')
+        position = rng.randrange(len(lines))
+        lines[position:position + rng.randint(0, 3)] = \
+            _random_document(standard, rng, lines=rng.randint(0, 3)).split('\n')
+        text = '\n'.join(lines)
@@ -0,0 +1,111 @@
+"""Sharding: deterministic assignment and the shard/merge round trip."""
+
+import json
+import shutil
+
+import pytest
+
+from policy_validator.service.bulk_runner import read_manifest, run_manifest
+from policy_validator.service.sharding import (
+    assign_shards, merge_results, parse_shard, read_shard, shard_weight
+)
+from policy_validator.storage.results_store import ResultsStore
+
+SHARDS = 3
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    root = tmp_path / "corpus"
+    root.mkdir()
+    lines = []
+    for number in range(12):
+        path = root / f"policy{number}.txt"
+        path.write_text("Information security policies and access control. "
+                        * (10 + number * 7), encoding='utf-8')
+        lines.append(json.dumps({'path': path.name, 'standard': "ISO"}))
+    lines += [json.dumps({'path': "missing.txt"}), '{"broken']
+    manifest = root / "manifest.jsonl"
+    manifest.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return manifest
+
+
+def _lines(jobs):
+    return [line for line, _ in jobs]
+
+
+@pytest.mark.parametrize('value, expected', [("1/1", (1, 1)), ("2/8", (2, 8))])
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize('value', ["0/2", "3/2", "2", "a/b", "1/2/3"])
+def test_parse_shard_rejects(value):
+    with pytest.raises(ValueError, match="Invalid shard"):
+        parse_shard(value)
+
+
+def test_shard_weight_rounds_up_to_a_power_of_two():
+    assert [shard_weight(size) for size in (0, 1, 2, 3, 1000, 1024)] == [
+        0, 2, 4, 4, 1024, 2048]
+
+
+def test_shards_are_disjoint_and_cover_the_manifest(manifest, tmp_path):
+    every = _lines(read_manifest(str(manifest)))
+    shards = [_lines(read_shard(str(manifest), (index, SHARDS)))
+              for index in range(1, SHARDS + 1)]
+    assert sorted(line for shard in shards for line in shard) == every
+    assert all(shards)
+
+    # The assignment depends on the manifest only, not where the tree lives
+    moved = shutil.copytree(manifest.parent, tmp_path / "elsewhere")
+    assert _lines(read_shard(str(moved / "manifest.jsonl"), (1, SHARDS))) == shards[0]
+    again = assign_shards(read_manifest(str(manifest)), SHARDS, str(manifest.parent))
+    assert [line for index, line, _ in again if index == 2] == shards[1]
+
+
+def _run_shards(manifest, tmp_path):
+    inputs = []
+    for index in range(1, SHARDS + 1):
+        output = tmp_path / f"shard{index}.jsonl"
+        with ResultsStore(str(tmp_path / f"shard{index}.db")) as store:
+            run_manifest(str(manifest), str(output), workers=1, memory_budget=0,
+                         on_result=store.add, shard=(index, SHARDS))
+        inputs += [str(output), store.path]
+    return inputs
+
+
+def test_merge_round_trip(manifest, tmp_path):
+    inputs = _run_shards(manifest, tmp_path)
+    merged = []
+    stats = merge_results(inputs, merged.append, str(manifest))
+
+    every = _lines(read_manifest(str(manifest)))
+    assert sorted(result['line'] for result in merged) == every
+    assert stats['results'] == len(every)
+    # Every store row is the same job as a line of its shard's JSONL output
+    assert stats['duplicates'] == len(every)
+    assert stats['errors'] == 2
+    assert (stats['missing_lines'], stats['unnumbered']) == ([], 0)
+    assert sum(stats['inputs'].values()) == len(every)
+
+
+def test_merge_lists_lines_no_shard_recorded(manifest, tmp_path):
+    outputs = [path for path in _run_shards(manifest, tmp_path) if path.endswith('.jsonl')]
+    recorded = set()
+    for path in outputs[1:]:
+        with open(path, encoding='utf-8') as f:
+            recorded |= {json.loads(line)['line'] for line in f}
+
+    stats = merge_results(outputs[1:], lambda result: None, str(manifest))
+    every = _lines(read_manifest(str(manifest)))
+    assert stats['missing_lines'] == [line for line in every if line not in recorded]
+    assert stats['missing_lines']
+
+
+def test_merge_cannot_list_missing_lines_without_line_numbers(manifest, tmp_path):
+    with ResultsStore(str(tmp_path / "validate.db")) as store:
+        store.add({'path': "policy0.txt", 'standard': "ISO", 'valid': True, 'issues': []})
+    stats = merge_results([store.path], lambda result: None, str(manifest))
+    assert stats['unnumbered'] == 1
+    assert stats['missing_lines'] is None
@@ -0,0 +1,132 @@
+"""Chunked text reading: chunks, scans and validation equal the whole text.
+
+TextParser promises the same results as checking the whole decoded,
+lowercased text at once, whatever the chunk size; these tests hold it to
+that on random text, through both the memory map and a stream.
+"""
+
+import io
+import random
+
+import pytest
+
+from policy_validator.parsers import text_parser
+from policy_validator.parsers.section_index import SectionIndex
+from policy_validator.parsers.text_parser import TextParser
+from policy_validator.utils.text_normalizer import get_section_matcher, normalize_text
+from policy_validator.validators.policy_validator import PolicyValidator
+from policy_validator.validators.standards import VALIDATION_STANDARDS
+
+
+def _random_text(standard, rng, paragraphs=40):
+    """Lines made of the standard's own words, some of them headings."""
+    words = ['the', 'of', 'and', '-', 'policy', 'a1.2', 'cc6.1', 'a.5.1', 'ac-2', 'é', '—']
+    for section in VALIDATION_STANDARDS[standard]['sections']:
+        words += section.split()
+    lines = []
+    for _ in range(paragraphs):
+        line = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        lines.append(rng.choice(['', '', '# ', '2.1 ']) + line)
+    return rng.choice(['\n', '\r\n']).join(lines)
+
+
+def _parsers(path, chunk_size):
+    yield TextParser(str(path), chunk_size=chunk_size)
+    yield TextParser(str(path), chunk_size=chunk_size, stream=io.BytesIO(path.read_bytes()))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 4096])
+def test_chunks_join_to_the_decoded_text(tmp_path, chunk_size):
+    text = "Zürich\r\npolicy — 東京\rend\r\n" * 50
+    path = tmp_path / "policy.txt"
+    path.write_bytes(text.encode('utf-8'))
+    for parser in _parsers(path, chunk_size):
+        assert ''.join(parser.iter_chunks()) == text.replace('\r\n', '\n').replace('\r', '\n')
+        assert parser.encoding == 'utf-8' and parser.replaced is False
+
+
+def test_empty_files_have_no_chunks(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    for parser in _parsers(path, 16):
+        assert list(parser.iter_chunks()) == []
+        assert parser.encoding is None
+
+
+@pytest.mark.parametrize('standard', sorted(VALIDATION_STANDARDS))
+def test_scan_equals_the_whole_text(tmp_path, standard):
+    matcher = get_section_matcher(standard)
+    sections = VALIDATION_STANDARDS[standard]['sections']
+    rng = random.Random(standard)
+    path = tmp_path / "policy.txt"
+    for _ in range(10):
+        text = _random_text(standard, rng)
+        path.write_bytes(text.encode('utf-8'))
+        whole = text.replace('\r\n', '\n').lower()
+        index = SectionIndex.from_text(whole)
+        expected = {
+            'length': len(whole),
+            'sections': matcher.find_sections(normalize_text(whole)) & set(sections),
+            'has_headings': bool(index.headings),
+            'empty_sections': index.empty_sections(sections, 20, matcher),
+        }
+        chunk_size = rng.choice([1, 5, 64, 1 << 20])
+        for parser in _parsers(path, chunk_size):
+            assert parser.scan(matcher, sections, min_length=len(whole),
+                               check_structure=True, min_section_body=20) == expected
+        # Stopping early leaves every result but the length unchanged
+        for parser in _parsers(path, chunk_size):
+            scan = parser.scan(matcher, sections, check_structure=True, min_section_body=20)
+            assert scan['length'] <= len(whole)
+            assert dict(scan, length=len(whole)) == expected
+
+
+def test_scan_stops_once_nothing_can_change(tmp_path, monkeypatch):
+    matcher = get_section_matcher("Custom")
+    sections = VALIDATION_STANDARDS["Custom"]['sections']
+    path = tmp_path / "policy.txt"
+    path.write_text(' '.join(sections) + "\n" + "filler text\n" * 10000)
+    chunks = []
+    original = TextParser.iter_chunks
+
+    def counted(self):
+        for chunk in original(self):
+            chunks.append(chunk)
+            yield chunk
+
+    monkeypatch.setattr(TextParser, 'iter_chunks', counted)
+    scan = TextParser(str(path), chunk_size=4096).scan(matcher, sections, min_length=500)
+    assert scan['sections'] == set(sections) and scan['length'] >= 500
+    assert len(chunks) == 1
+    assert scan['has_headings'] is None and scan['empty_sections'] is None
+
+    chunks.clear()
+    TextParser(str(path), chunk_size=4096).scan(matcher, sections, min_length=10 ** 6)
+    assert len(chunks) > 20
+
+
+def test_mapped_pages_are_released_as_they_are_read(tmp_path, monkeypatch):
+    released = []
+    monkeypatch.setattr(text_parser, '_release',
+                        lambda mapped, offset, length: released.append((offset, length)))
+    path = tmp_path / "policy.txt"
+    path.write_bytes(b"x" * 10000)
+    list(TextParser(str(path), chunk_size=4096).iter_chunks())
+    assert released == [(0, 4096), (4096, 4096), (8192, 1808)]
+
+
+class _WholeTextValidator(PolicyValidator):
+    stream_text = False
+
+
+@pytest.mark.parametrize('fail_fast', [False, True])
+def test_streamed_and_whole_text_validation_agree(tmp_path, fail_fast):
+    rng = random.Random(fail_fast)
+    for standard in VALIDATION_STANDARDS:
+        for number in range(5):
+            path = tmp_path / f"{standard}{number}.txt"
+            path.write_text(_random_text(standard, rng, paragraphs=rng.randint(5, 150)))
+            streamed = PolicyValidator(standard, fail_fast=fail_fast).validate_file(str(path))
+            whole = _WholeTextValidator(standard, fail_fast=fail_fast).validate_file(str(path))
+            for key in ('valid', 'issues', 'sections', 'encoding'):
+                assert streamed.get(key) == whole.get(key), (standard, key)
@@ -0,0 +1,104 @@
+"""Report writers: every format parses, counts add up and SARIF levels."""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from policy_validator.reports.writers import (
+    REPORT_FORMATS, SARIF_RULES, classify_issue, open_report, resolve_report_format
+)
+
+RESULTS = [
+    {'path': "/srv/policies/access control.pdf", 'standard': "ISO 27001", 'valid': False,
+     'issues': ["Missing required sections for ISO 27001: cryptography, access control",
+                "PDF file is suspiciously small"],
+     'sections': {'cryptography': False, 'access control': False, 'risk': True},
+     'elapsed_ms': 250.0},
+    {'path': "archive.zip!policy.txt", 'standard': "Custom", 'valid': True,
+     'issues': ["Text is not valid utf-8; undecodable bytes were replaced",
+                "Section headings without body text: compliance",
+                "Something new\x0c"],
+     'elapsed_ms': 1500.0},
+    {'path': "clean.docx", 'standard': "SOC 2", 'valid': True, 'issues': []},
+    {'path': "broken.docx", 'standard': "SOC 2", 'valid': False,
+     'issues': ["worker crashed"]},
+]
+
+
+@pytest.fixture
+def report(tmp_path):
+    def write(report_format):
+        path = tmp_path / f"report.{report_format}"
+        with open_report(str(path), report_format) as writer:
+            for result in RESULTS:
+                writer.write(result)
+        assert writer.summary() == {'total': 4, 'failed': 2, 'passed': 2, 'issues': 6}
+        return path.read_text(encoding='utf-8')
+    return write
+
+
+def test_jsonl_and_json(report):
+    assert [json.loads(line) for line in report('jsonl').splitlines()] == RESULTS
+    document = json.loads(report('json'))
+    assert document['results'] == RESULTS
+    assert document['summary']['failed'] == 2
+
+
+def test_sarif_findings_and_levels(report):
+    log = json.loads(report('sarif'))
+    run, = log['runs']
+    rules = [rule['id'] for rule in run['tool']['driver']['rules']]
+    assert rules == [rule[0] for rule in SARIF_RULES]
+    findings = [(f['ruleId'], f['level'], f['locations'][0]['physicalLocation']
+                 ['artifactLocation']['uri']) for f in run['results']]
+    assert findings == [
+        ('missing-section', 'error', "file:///srv/policies/access%20control.pdf"),
+        ('missing-section', 'error', "file:///srv/policies/access%20control.pdf"),
+        ('small-document', 'warning', "file:///srv/policies/access%20control.pdf"),
+        ('undecodable-text', 'warning', "archive.zip%21policy.txt"),
+        ('empty-section', 'warning', "archive.zip%21policy.txt"),
+        ('validation-issue', 'warning', "archive.zip%21policy.txt"),
+        ('validation-issue', 'error', "broken.docx"),
+    ]
+    for finding in run['results']:
+        assert rules[finding['ruleIndex']] == finding['ruleId']
+    assert run['properties']['issues'] == 6
+
+
+@pytest.mark.parametrize('issue, rule', [
+    ("File is empty", 'empty-file'),
+    ("Content length (10 chars) is below minimum requirement (500 chars) for SOC 2",
+     'min-length'),
+    ("ISO 27001 requires clear section headers or structured format", 'structure'),
+    ("Extension .txt doesn't match PDF content", 'extension-mismatch'),
+    ("Unsupported file type: image/png", 'unsupported-file'),
+    ("Legacy .doc files are not supported; convert to .docx first", 'unsupported-file'),
+    ("PDF is password-protected", 'unreadable-file'),
+    ("Error validating PDF: EOF marker not found", 'unreadable-file'),
+])
+def test_classify_issue(issue, rule):
+    level = {r[0]: r[2] for r in SARIF_RULES}[rule]
+    assert classify_issue(issue) == (rule, level)
+    assert classify_issue(issue, valid=True) == (rule, 'warning')
+
+
+def test_junit(report):
+    suite = ET.fromstring(report('junit')).find('testsuite')
+    assert (suite.get('tests'), suite.get('failures'), suite.get('time')) == ('4', '2', '1.750')
+    cases = suite.findall('testcase')
+    assert [case.get('classname') for case in cases] == [r['standard'] for r in RESULTS]
+    assert cases[0].find('failure').get('message').startswith("Missing required sections")
+    assert "Something new" in cases[1].find('system-out').text
+    assert list(cases[2]) == []
+
+
+def test_resolve_report_format():
+    assert resolve_report_format("out.SARIF") == 'sarif'
+    assert resolve_report_format("out.ndjson") == 'jsonl'
+    assert resolve_report_format("out.txt", 'junit') == 'junit'
+    assert set(REPORT_FORMATS) == {'jsonl', 'json', 'sarif', 'junit'}
+    with pytest.raises(ValueError, match="Cannot infer"):
+        resolve_report_format("out.txt")
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        resolve_report_format("out.json", 'html')